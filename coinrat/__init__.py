@@ -1,3 +1,8 @@
-from .coinrat import cli
+from os.path import join, dirname
 
-__all__ = ['cli']
+from dotenv import load_dotenv
+
+# Plugins read their configuration from the environment when they are imported (also without CLI, e.g. in tests
+# or spawned worker processes). CLI (coinrat.coinrat:cli) is not imported here, so importing any coinrat module
+# does not import all services of the CLI.
+load_dotenv(join(dirname(__file__), '../.env'))
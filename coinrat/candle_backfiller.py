@@ -0,0 +1,120 @@
+import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List
+
+from coinrat.domain import DateTimeInterval, MarketStateSynchronizer
+from coinrat.domain.candle import CandleStorage
+from coinrat.domain.candle.candle_coverage import CandleCoverage, CandleGap, calculate_candle_coverage
+from coinrat.domain.pair import Pair
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_MINUTES_PER_REQUEST = 24 * 60
+
+
+class CandleBackfiller:
+    """
+    Finds gaps in minute candles of the storage and fills them from the history of the synchronizer (see:
+    MarketStateSynchronizer.get_candles). Gaps are split into chunks of max_minutes_per_request minutes, chunks
+    are downloaded concurrently by max_workers threads and written into the storage by the calling thread.
+    Failed chunk does not stop the others, it stays as a gap in the next coverage. Synchronizers which always
+    download the whole history (see: MarketStateSynchronizer.is_candle_history_paged) are asked only once for
+    the range of all gaps. No events are emitted, backfilled candles are history.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_minutes_per_request: int = DEFAULT_MAX_MINUTES_PER_REQUEST
+    ) -> None:
+        assert max_workers > 0, 'At least one worker is needed, {} given.'.format(max_workers)
+        assert max_minutes_per_request > 0, 'Chunk must have at least one minute, {} given.'.format(
+            max_minutes_per_request
+        )
+
+        self._max_workers = max_workers
+        self._max_minutes_per_request = max_minutes_per_request
+
+    def get_coverage(
+        self,
+        candle_storage: CandleStorage,
+        market_name: str,
+        pair: Pair,
+        interval: DateTimeInterval
+    ) -> CandleCoverage:
+        # Storages exclude both sides of the interval, the first minute is expected to be present
+        search_interval = interval.with_since(interval.since - datetime.timedelta(seconds=1))
+        candles = candle_storage.find_by(market_name, pair, search_interval)
+
+        return calculate_candle_coverage(market_name, pair, interval, [candle.time for candle in candles])
+
+    def backfill(
+        self,
+        synchronizer: MarketStateSynchronizer,
+        candle_storage: CandleStorage,
+        coverage: CandleCoverage
+    ) -> int:
+        """
+        Returns number of written candles. Raises NotImplementedError when synchronizer has no access to
+        the history.
+        """
+        if not coverage.gaps:
+            return 0
+
+        if synchronizer.is_candle_history_paged:
+            chunks = self._split_into_chunks(coverage.gaps)
+            gaps_of_chunks = {chunk: [chunk] for chunk in chunks}
+        else:
+            chunk = CandleGap(coverage.gaps[0].since, coverage.gaps[-1].till)
+            chunks = [chunk]
+            gaps_of_chunks = {chunk: coverage.gaps}  # Candles between the gaps are already in the storage
+
+        number_of_written_candles = 0
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(
+                    synchronizer.get_candles,
+                    coverage.market_name,
+                    coverage.pair,
+                    DateTimeInterval(chunk.since, chunk.till)
+                ): chunk for chunk in chunks
+            }
+
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    candles = future.result()
+                except NotImplementedError:
+                    for other_future in futures:
+                        other_future.cancel()
+                    raise
+                except Exception as e:
+                    logger.warning('Backfill of {} failed: {}'.format(chunk, str(e)))
+                    continue
+
+                candles = [
+                    candle for candle in candles
+                    if any(gap.since <= candle.time < gap.till for gap in gaps_of_chunks[chunk])
+                ]
+                if candles:
+                    candle_storage.write_candles(candles)
+                    number_of_written_candles += len(candles)
+
+                logger.info('Backfill of {}: {} candles written.'.format(chunk, len(candles)))
+
+        return number_of_written_candles
+
+    def _split_into_chunks(self, gaps: List[CandleGap]) -> List[CandleGap]:
+        chunk_size = datetime.timedelta(minutes=self._max_minutes_per_request)
+        chunks = []
+        for gap in gaps:
+            since = gap.since
+            while since < gap.till:
+                till = min(since + chunk_size, gap.till)
+                chunks.append(CandleGap(since, till))
+                since = till
+
+        return chunks
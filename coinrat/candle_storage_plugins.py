@@ -1,7 +1,7 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 from .domain.candle import CandleStorage
 
 get_available_candle_storages_spec = pluggy.HookspecMarker('coinrat_plugins')
@@ -24,18 +24,20 @@ class CandleStorageNotProvidedByAnyPluginException(Exception):
 
 
 class CandleStoragePlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[CandleStoragePluginSpecification],
-            plugins_loader('coinrat_candle_storage_plugins', CandleStoragePluginSpecification)
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        self._plugins = LazyPlugins(
+            'coinrat_candle_storage_plugins',
+            CandleStoragePluginSpecification,
+            lambda plugin: plugin.get_available_candle_storages(),
+            metadata_cache
         )
 
     def get_available_candle_storages(self) -> List[str]:
-        return [storage_name for plugin in self._plugins for storage_name in plugin.get_available_candle_storages()]
+        return self._plugins.get_provided_names()
 
     def get_candle_storage(self, name: str) -> CandleStorage:
-        for plugin in self._plugins:
-            if name in plugin.get_available_candle_storages():
-                return plugin.get_candle_storage(name)
+        plugin = self._plugins.find_plugin_providing(name)
+        if plugin is None:
+            raise CandleStorageNotProvidedByAnyPluginException('Candle storage "{}" not found.'.format(name))
 
-        raise CandleStorageNotProvidedByAnyPluginException('Candle storage "{}" not found.'.format(name))
+        return cast(CandleStoragePluginSpecification, plugin).get_candle_storage(name)
@@ -6,49 +6,56 @@ import uuid
 import dateutil.parser
 import click
 import sys
-from typing import Tuple, Dict, NoReturn, Union
-from os.path import join, dirname
+from typing import Tuple, Dict, List, NoReturn, Sequence, Union
 
 from click import Context
-from dotenv import load_dotenv
 
 from coinrat.domain import ForEndUserException, DateTimeInterval
 from coinrat.domain.candle import CandleExporter
+from coinrat.domain.candle.candle_coverage import CandleCoverage
 from coinrat.domain.candle.null_candle_storage import NullCandleStorage
 from coinrat.domain.market import Market
 from coinrat.domain.order import OrderExporter
-from coinrat.domain.pair import Pair
+from coinrat.domain.pair import Pair, deserialize_pair
 from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
 from coinrat.event.null_event_emitter import NullEventEmitter
 from coinrat.market_plugins import MarketNotProvidedByPluginException, MarketPluginSpecification, \
     MarketPluginDoesNotExistsException
 from coinrat.strategy_plugins import StrategyNotProvidedByAnyPluginException
+from coinrat.synchronizer_multi_runner import deserialize_synchronization_targets
+from coinrat.strategy_configuration_search import OBJECTIVES, OBJECTIVE_PROFIT, DEFAULT_ETA
+from coinrat.strategy_monte_carlo import DEFAULT_NUMBER_OF_PATHS
+from coinrat.domain.candle.candle_path_generator import PATH_METHODS, PATH_METHOD_BLOCK_BOOTSTRAP
+from coinrat.domain.configuration_structure import create_configuration_search_space, iterate_configurations
 from coinrat.thread_watcher import ThreadWatcher
 from .db_migrations import run_db_migrations
 from .di_container_coinrat import DiContainerCoinrat
 
-dotenv_path = join(dirname(__file__), '../.env')
-load_dotenv(dotenv_path)
-
-logging.basicConfig(level=logging.DEBUG)
-logging.getLogger("requests").setLevel(logging.WARNING)
-logging.getLogger("werkzeug").setLevel(logging.WARNING)
-logging.getLogger("pika").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("engineio").setLevel(logging.WARNING)
-logging.getLogger("socketio").setLevel(logging.WARNING)
-
 logger = logging.getLogger(__name__)
 
 di_container = DiContainerCoinrat()
 
 
+def configure_environment() -> None:
+    """
+    Configures logging. Called when CLI command is executed (not on import), so importing this module (e.g. in
+    spawned worker processes) does not change logging of the process. The .env file is loaded by the coinrat package.
+    """
+    logging.basicConfig(level=logging.DEBUG)
+    logging.getLogger("requests").setLevel(logging.WARNING)
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    logging.getLogger("pika").setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("engineio").setLevel(logging.WARNING)
+    logging.getLogger("socketio").setLevel(logging.WARNING)
+
+
 @click.group('coinrat')
 @click.version_option(version='0.1')
 @click.help_option()
 @click.pass_context
 def cli(ctx: Context) -> None:
-    pass
+    configure_environment()
 
 
 @cli.command(help='Shows available markets.')
@@ -225,6 +232,135 @@ def synchronize(ctx: Context, synchronizer_name: str, market: str, pair: Tuple[s
     synchronizer.synchronize(market, pair_obj)
 
 
+@cli.command(help="""
+Synchronizes many pairs of the market in one process. Missing candles (since the last stored candle of every pair)
+are backfilled on startup and after errors. Only some synchronizers support it (e.g. cryptocompare).
+
+Example:
+    python -m coinrat synchronize_pairs cryptocompare bittrex USD_BTC USD_ETH USD_LTC --candle_storage influx_db
+""")
+@click.argument('synchronizer_name', nargs=1)
+@click.argument('market', nargs=1)
+@click.argument('pairs', nargs=-1, required=True)
+@click.option('--candle_storage', help='Specify candle storage to be synced into.', required=True)
+@click.pass_context
+def synchronize_pairs(
+    ctx: Context,
+    synchronizer_name: str,
+    market: str,
+    pairs: Tuple[str],
+    candle_storage: str
+) -> None:
+    synchronizer = di_container.synchronizer_plugins.get_synchronizer(
+        synchronizer_name,
+        di_container.candle_storage_plugins.get_candle_storage(candle_storage),
+        di_container.event_emitter
+    )
+
+    available_markets = synchronizer.get_supported_markets()
+    if market not in available_markets:
+        print_error_and_terminate('Market "{}" is not supported by plugin "{}".'.format(market, synchronizer_name))
+
+    try:
+        synchronizer.synchronize_pairs(market, [deserialize_pair(pair) for pair in pairs])
+    except NotImplementedError:
+        print_error_and_terminate('Synchronizer "{}" does not support many pairs.'.format(synchronizer_name))
+
+
+@cli.command(help="""
+Runs many synchronizations in one process (instead of one process per synchronizer, market and pair). Targets file
+is JSON list of objects with keys: synchronizer, market and pair (e.g. "USD_BTC"). Pairs of the same synchronizer
+and market share one synchronizer (when it supports many pairs), all targets share candle storage and event emitter.
+Failed synchronization is restarted with exponential backoff, the others keep running.
+
+Example:
+    python -m coinrat synchronize_many targets.json --candle_storage influx_db
+""")
+@click.argument('targets_file', nargs=1)
+@click.option('--candle_storage', help='Specify candle storage to be synced into.', required=True)
+@click.pass_context
+def synchronize_many(ctx: Context, targets_file: str, candle_storage: str) -> None:
+    targets = deserialize_synchronization_targets(load_list_from_file(targets_file))
+    if not targets:
+        print_error_and_terminate('No synchronization targets in "{}".'.format(targets_file))
+
+    try:
+        di_container.synchronizer_multi_runner.run(
+            targets,
+            di_container.candle_storage_plugins.get_candle_storage(candle_storage),
+            di_container.event_emitter
+        )
+    except ValueError as e:
+        print_error_and_terminate(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command(help="""
+Reports coverage of minute candles in the storage: how many candles of the interval are missing and where are the
+gaps. With --backfill_with gaps are downloaded (in parallel) by the synchronizer which supports history
+(eg. cryptocompare, bittrex) and coverage is reported again. Interval must be in UTC.
+
+Example:
+    python -m coinrat candle_coverage bittrex USD BTC \'2017-12-01T00:00:00\' \'2017-12-08T00:00:00\' --candle_storage influx_db
+""")
+@click.argument('market_name', nargs=1)
+@click.argument('pair', nargs=2)
+@click.argument('interval', nargs=2)
+@click.option('--candle_storage', help='Specify candle storage to be checked.', required=True)
+@click.option('--backfill_with', help='Synchronizer to download missing candles by.', default=None)
+@click.option('--top', help='Number of the biggest gaps to be shown.', type=int, default=10)
+@click.pass_context
+def candle_coverage(
+    ctx: Context,
+    market_name: str,
+    pair: Tuple[str, str],
+    interval: Tuple[str, str],
+    candle_storage: str,
+    backfill_with: Union[str, None],
+    top: int
+) -> None:
+    storage = di_container.candle_storage_plugins.get_candle_storage(candle_storage)
+    pair_obj = Pair(pair[0], pair[1])
+    interval_obj = DateTimeInterval(
+        dateutil.parser.parse(interval[0]).replace(tzinfo=datetime.timezone.utc),
+        dateutil.parser.parse(interval[1]).replace(tzinfo=datetime.timezone.utc)
+    )
+    backfiller = di_container.candle_backfiller
+
+    coverage = backfiller.get_coverage(storage, market_name, pair_obj, interval_obj)
+    _print_candle_coverage(coverage, top)
+
+    if backfill_with is None or not coverage.gaps:
+        return
+
+    synchronizer = di_container.synchronizer_plugins.get_synchronizer(backfill_with, storage, NullEventEmitter())
+    if market_name not in synchronizer.get_supported_markets():
+        print_error_and_terminate('Market "{}" is not supported by plugin "{}".'.format(market_name, backfill_with))
+
+    try:
+        number_of_candles = backfiller.backfill(synchronizer, storage, coverage)
+    except NotImplementedError:
+        print_error_and_terminate('Synchronizer "{}" does not support history.'.format(backfill_with))
+
+    click.echo('Backfilled {} candles.'.format(number_of_candles))
+    _print_candle_coverage(backfiller.get_coverage(storage, market_name, pair_obj, interval_obj), top)
+
+
+def _print_candle_coverage(coverage: CandleCoverage, top: int) -> None:
+    click.echo(str(coverage))
+    if not coverage.gaps:
+        return
+
+    click.echo('Biggest gaps:')
+    for gap in sorted(coverage.gaps, key=lambda gap: gap.number_of_missing_candles, reverse=True)[:top]:
+        click.echo('  - {} - {} ({} candles)'.format(
+            gap.since.isoformat(),
+            gap.till.isoformat(),
+            gap.number_of_missing_candles
+        ))
+
+
 @cli.command(help="""
 Starts trading with given strategy.
 
@@ -260,26 +396,19 @@ def run_strategy(
     order_storage: str,
     market_plugin: str
 ) -> None:
-    pair_obj = Pair(pair[0], pair[1])
     strategy_configuration: Dict = {}
     if configuration_file is not None:
         strategy_configuration = load_configuration_from_file(configuration_file)
 
-    strategy_run_at = di_container.datetime_factory.now()
-
-    strategy_run = StrategyRun(
-        uuid.uuid4(),
-        strategy_run_at,
-        pair_obj,
-        [StrategyRunMarket(market_plugin, market_name, {}) for market_name in market_names],
+    strategy_run = _create_strategy_run(
         strategy_name,
+        Pair(pair[0], pair[1]),
+        market_names,
         strategy_configuration,
-        DateTimeInterval(strategy_run_at, None),
         candle_storage,
-        order_storage
+        order_storage,
+        market_plugin
     )
-    di_container.strategy_run_storage.insert(strategy_run)
-    di_container.event_emitter.emit_new_strategy_run(strategy_run)
 
     try:
         di_container.strategy_standard_runner.run(strategy_run)
@@ -297,6 +426,85 @@ def run_strategy(
         pass
 
 
+@cli.command(help="""
+Starts trading with many strategies in one process (strategies share plugins, storages and market clients).
+Strategies file is JSON list of objects with keys: strategy_name, pair (e.g. ["USD", "BTC"]), market_names
+and configuration (optional).
+
+Example:
+    python -m coinrat run_strategies strategies.json --candle_storage influx_db --order_storage influx_db \\
+        --market_plugin coinrat_bittrex
+""")
+@click.argument('strategies_file', nargs=1)
+@click.option('--candle_storage', help='Specify candle storage to be used in these runs.', required=True)
+@click.option('--order_storage', help='Specify order storage to be used in these runs.', required=True)
+@click.option(
+    '--market_plugin',
+    help='Specify the name of plugin used for communication with stockmarket.',
+    required=True
+)
+@click.pass_context
+def run_strategies(
+    ctx: Context,
+    strategies_file: str,
+    candle_storage: str,
+    order_storage: str,
+    market_plugin: str
+) -> None:
+    strategy_runs = [
+        _create_strategy_run(
+            definition['strategy_name'],
+            Pair(definition['pair'][0], definition['pair'][1]),
+            definition['market_names'],
+            definition.get('configuration', {}),
+            candle_storage,
+            order_storage,
+            market_plugin
+        )
+        for definition in load_list_from_file(strategies_file)
+    ]
+
+    def on_strategy_run_failed(strategy_run: StrategyRun, exception: Exception) -> None:
+        _terminate_strategy_run(strategy_run)
+        strategy_runs.remove(strategy_run)
+        click.echo(click.style('ERROR: {}\n'.format(exception), fg='red'), err=True)
+
+    try:
+        di_container.strategy_multi_runner.run(list(strategy_runs), on_strategy_run_failed)
+
+    except KeyboardInterrupt:
+        for strategy_run in strategy_runs:
+            _terminate_strategy_run(strategy_run)
+
+
+def _create_strategy_run(
+    strategy_name: str,
+    pair: Pair,
+    market_names: Sequence[str],
+    strategy_configuration: Dict,
+    candle_storage: str,
+    order_storage: str,
+    market_plugin: str
+) -> StrategyRun:
+    strategy_run_at = di_container.datetime_factory.now()
+
+    strategy_run = StrategyRun(
+        uuid.uuid4(),
+        strategy_run_at,
+        pair,
+        [StrategyRunMarket(market_plugin, market_name, {}) for market_name in market_names],
+        strategy_name,
+        strategy_configuration,
+        DateTimeInterval(strategy_run_at, None),
+        candle_storage,
+        order_storage
+    )
+    di_container.strategy_run_storage.insert(strategy_run)
+    di_container.event_emitter.emit_new_strategy_run(strategy_run)
+
+    return strategy_run
+
+
 def _terminate_strategy_run(strategy_run: StrategyRun) -> None:
     closed_interval = strategy_run.interval.with_till(di_container.datetime_factory.now())
     strategy_run.interval = closed_interval
@@ -308,6 +516,180 @@ def load_configuration_from_file(configuration_file: str) -> Dict:
         return json.load(json_file)
 
 
+def load_list_from_file(list_file: str) -> List[Dict]:
+    with open(list_file) as json_file:
+        data = json.load(json_file)
+
+    if not isinstance(data, list):
+        print_error_and_terminate('File "{}" must contain JSON list.'.format(list_file))
+
+    return data
+
+
+@cli.command(help="""
+Searches for the best strategy configuration. Candidates are derived from strategy configuration structure
+and evaluated by successive halving: all are replayed on short beginning of the interval, the worst are dropped
+and only survivors are replayed on longer part of the interval. Interval must be in UTC.
+
+Example:
+    python -m coinrat search_strategy_configuration double_crossover USD BTC bittrex \'2017-12-01T00:00:00\' \'2017-12-08T00:00:00\' --candle_storage influx_db
+""")
+@click.argument('strategy_name', nargs=1)
+@click.argument('pair', nargs=2)
+@click.argument('market_name', nargs=1)
+@click.argument('interval', nargs=2)
+@click.option('--candle_storage', help='Specify candle storage to load candles from.', required=True)
+@click.option(
+    '--objective',
+    help='Candidates are compared by profit (PnL) or by maximal drawdown.',
+    type=click.Choice(OBJECTIVES),
+    default=OBJECTIVE_PROFIT
+)
+@click.option('--eta', help='Only 1/eta of candidates survives each round.', type=int, default=DEFAULT_ETA)
+@click.option(
+    '--market_configuration_file',
+    help='JSON file with configuration for mocked market (see: `python -m coinrat market`).',
+    default=None
+)
+@click.option('--top', help='Number of best configurations to be shown.', type=int, default=10)
+@click.pass_context
+def search_strategy_configuration(
+    ctx: Context,
+    strategy_name: str,
+    pair: Tuple[str, str],
+    market_name: str,
+    interval: Tuple[str, str],
+    candle_storage: str,
+    objective: str,
+    eta: int,
+    market_configuration_file: Union[str, None],
+    top: int
+) -> None:
+    try:
+        strategy_class = di_container.strategy_plugins.get_strategy_class(strategy_name)
+    except StrategyNotProvidedByAnyPluginException as e:
+        print_error_and_terminate(str(e))
+
+    market_configuration: Dict = {}
+    if market_configuration_file is not None:
+        market_configuration = load_configuration_from_file(market_configuration_file)
+
+    interval_obj = DateTimeInterval(
+        dateutil.parser.parse(interval[0]).replace(tzinfo=datetime.timezone.utc),
+        dateutil.parser.parse(interval[1]).replace(tzinfo=datetime.timezone.utc)
+    )
+    configurations = iterate_configurations(
+        create_configuration_search_space(strategy_class.get_configuration_structure())
+    )
+    click.echo('Searching through {} configurations.'.format(len(configurations)))
+
+    results = di_container.strategy_configuration_search.search(
+        strategy_name,
+        Pair(pair[0], pair[1]),
+        market_name,
+        interval_obj,
+        di_container.candle_storage_plugins.get_candle_storage(candle_storage),
+        configurations,
+        market_configuration,
+        objective,
+        eta
+    )
+
+    click.echo('Best configurations:')
+    for result in results[:top]:
+        click.echo('  - {}'.format(result))
+
+
+@cli.command(help="""
+Tests robustness of the strategy by Monte-Carlo simulation. Many synthetic price paths are generated from the candles
+in given interval (by block bootstrap or by noise injection) and strategy is replayed over each of them.
+Shows distribution of final balance and drawdown. Interval must be in UTC.
+
+Example:
+    python -m coinrat simulate_strategy_robustness double_crossover USD BTC bittrex \'2017-12-01T00:00:00\' \'2017-12-08T00:00:00\' --candle_storage influx_db
+""")
+@click.argument('strategy_name', nargs=1)
+@click.argument('pair', nargs=2)
+@click.argument('market_name', nargs=1)
+@click.argument('interval', nargs=2)
+@click.option('--candle_storage', help='Specify candle storage to load candles from.', required=True)
+@click.option(
+    '-c',
+    '--configuration_file',
+    help='Configuration file with JSON configuration for strategy.',
+    default=None
+)
+@click.option(
+    '--market_configuration_file',
+    help='JSON file with configuration for mocked market (see: `python -m coinrat market`).',
+    default=None
+)
+@click.option('--paths', help='Number of simulated price paths.', type=int, default=DEFAULT_NUMBER_OF_PATHS)
+@click.option(
+    '--method',
+    help='How are paths generated from the history.',
+    type=click.Choice(PATH_METHODS),
+    default=PATH_METHOD_BLOCK_BOOTSTRAP
+)
+@click.option('--block_size', help='Number of candles in one block (block_bootstrap).', type=int, default=60)
+@click.option('--noise', help='Noise relative to volatility of the history (noise).', type=float, default=0.5)
+@click.option('--processes', help='Number of processes, number of CPUs by default.', type=int, default=None)
+@click.option('--seed', help='Seed for random generator (to reproduce the results).', type=int, default=None)
+@click.pass_context
+def simulate_strategy_robustness(
+    ctx: Context,
+    strategy_name: str,
+    pair: Tuple[str, str],
+    market_name: str,
+    interval: Tuple[str, str],
+    candle_storage: str,
+    configuration_file: Union[str, None],
+    market_configuration_file: Union[str, None],
+    paths: int,
+    method: str,
+    block_size: int,
+    noise: float,
+    processes: Union[int, None],
+    seed: Union[int, None]
+) -> None:
+    strategy_configuration: Dict = {}
+    if configuration_file is not None:
+        strategy_configuration = load_configuration_from_file(configuration_file)
+
+    market_configuration: Dict = {}
+    if market_configuration_file is not None:
+        market_configuration = load_configuration_from_file(market_configuration_file)
+
+    interval_obj = DateTimeInterval(
+        dateutil.parser.parse(interval[0]).replace(tzinfo=datetime.timezone.utc),
+        dateutil.parser.parse(interval[1]).replace(tzinfo=datetime.timezone.utc)
+    )
+
+    try:
+        result = di_container.strategy_monte_carlo_simulation.run(
+            strategy_name,
+            Pair(pair[0], pair[1]),
+            market_name,
+            interval_obj,
+            di_container.candle_storage_plugins.get_candle_storage(candle_storage),
+            strategy_configuration,
+            market_configuration,
+            paths,
+            method,
+            block_size,
+            noise,
+            processes,
+            seed
+        )
+    except StrategyNotProvidedByAnyPluginException as e:
+        print_error_and_terminate(str(e))
+
+    click.echo('Simulated paths: {}'.format(len(result.path_results)))
+    click.echo('Final balance: {}'.format(result.final_balance))
+    click.echo('Drawdown: {}'.format(result.max_drawdown))
+    click.echo('Probability of loss: {0:.4f}'.format(result.probability_of_loss))
+
+
 @cli.command(help="Starts an socket server for communication with frontend.")
 @click.pass_context
 def start_server(ctx: Context):
@@ -1,7 +1,10 @@
 import logging
 
-import MySQLdb
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    import MySQLdb
 
 logger = logging.getLogger(__name__)
 current_directory = os.path.dirname(__file__)
@@ -27,13 +30,13 @@ yml_file_template = """databases:
 """
 
 
-def run_db_migrations(mysql_connection: MySQLdb.Connection, tag='coinrat'):
+def run_db_migrations(mysql_connection: 'MySQLdb.Connection', tag='coinrat'):
     create_yml_file_for_migration_lib()
     create_migrations_table_if_not_exists(mysql_connection)
     os.system("dbschema --config " + get_yml_filename() + " --tag " + tag)
 
 
-def create_migrations_table_if_not_exists(mysql_connection: MySQLdb.Connection):
+def create_migrations_table_if_not_exists(mysql_connection: 'MySQLdb.Connection'):
     cursor = mysql_connection.cursor()
     cursor.execute("SHOW TABLES LIKE 'migrations_applied'")
     if cursor.fetchone() is None:
@@ -1,32 +1,44 @@
 import logging
 import os
-import MySQLdb
-import pika
 
-from typing import Callable, Set, cast
+from typing import Callable, Set, Union, cast, TYPE_CHECKING
 
-import coinrat_mock
 from coinrat.event.null_event_emitter import NullEventEmitter
-from coinrat.event.rabbit_event_emitter import RabbitEventEmitter
-
 from coinrat.portfolio_snapshot_storage_plugins import PortfolioSnapshotStoragePlugins
 from .di_container import DiContainer
-from coinrat.strategy_standard_runner import StrategyStandardRunner
 from coinrat.candle_storage_plugins import CandleStoragePlugins
 from coinrat.event.event_emitter import EventEmitter
 from coinrat.market_plugins import MarketPlugins
 from coinrat.order_storage_plugins import OrderStoragePlugins
-from coinrat.event.rabbit_event_consumer import RabbitEventConsumer
-from coinrat.server.socket_server import SocketServer
+from coinrat.plugins import PluginMetadataCache
 from coinrat.strategy_plugins import StrategyPlugins
 from coinrat.synchronizer_plugins import SynchronizerPlugins
 from coinrat.domain import CurrentUtcDateTimeFactory, DateTimeFactory
-from coinrat.domain.strategy import StrategyRunStorage
-from coinrat.task.task_planner import TaskPlanner
-from coinrat.task.task_consumer import TaskConsumer
-from coinrat.strategy_replayer import StrategyReplayer
-from coinrat.server.subscription_storage import SubscriptionStorage
-from coinrat.thread_watcher import ThreadWatcher
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL
+from coinrat.domain.pair import serialize_pair
+from coinrat.tick_scheduler import TICK_POLICY_SKIP
+
+# Services (and their heavy dependencies: MySQL client, RabbitMQ client, Flask, Socket.IO, ...) are imported
+# in factories, so short CLI commands and spawned workers import only what they really use.
+if TYPE_CHECKING:  # pragma: no cover
+    import MySQLdb
+    import pika
+    from coinrat.candle_backfiller import CandleBackfiller
+    from coinrat.domain.strategy import StrategyRun, StrategyRunStorage
+    from coinrat.event.candle_event_listener import CandleEventListener
+    from coinrat.event.rabbit_event_consumer import RabbitEventConsumer
+    from coinrat.server.socket_server import SocketServer
+    from coinrat.server.subscription_storage import SubscriptionStorage
+    from coinrat.strategy_configuration_search import StrategyConfigurationSearch
+    from coinrat.strategy_monte_carlo import StrategyMonteCarloSimulation
+    from coinrat.strategy_multi_runner import StrategyMultiRunner
+    from coinrat.strategy_replayer import StrategyReplayer
+    from coinrat.strategy_standard_runner import StrategyStandardRunner
+    from coinrat.synchronizer_multi_runner import SynchronizerMultiRunner
+    from coinrat.task.task_consumer import TaskConsumer
+    from coinrat.task.task_planner import TaskPlanner
+    from coinrat.thread_watcher import ThreadWatcher
+    from coinrat.tick_profiler import TickProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +49,17 @@ class DiContainerCoinrat(DiContainer):
         super().__init__()
 
         self._storage = {
+            'plugin_metadata_cache': {
+                'instance': None,
+                'factory': self._create_plugin_metadata_cache,
+            },
             'candle_storage_plugins': {
                 'instance': None,
-                'factory': lambda: CandleStoragePlugins(),
+                'factory': lambda: CandleStoragePlugins(self._get('plugin_metadata_cache')),
             },
             'order_storage_plugins': {
                 'instance': None,
-                'factory': lambda: OrderStoragePlugins(),
+                'factory': lambda: OrderStoragePlugins(self._get('plugin_metadata_cache')),
             },
             'market_plugins': {
                 'instance': None,
@@ -51,15 +67,15 @@ class DiContainerCoinrat(DiContainer):
             },
             'synchronizer_plugins': {
                 'instance': None,
-                'factory': lambda: SynchronizerPlugins(),
+                'factory': lambda: SynchronizerPlugins(self._get('plugin_metadata_cache')),
             },
             'strategy_plugins': {
                 'instance': None,
-                'factory': lambda: StrategyPlugins(),
+                'factory': lambda: StrategyPlugins(self._get('plugin_metadata_cache')),
             },
             'portfolio_snapshot_storage_plugins': {
                 'instance': None,
-                'factory': lambda: PortfolioSnapshotStoragePlugins(),
+                'factory': lambda: PortfolioSnapshotStoragePlugins(self._get('plugin_metadata_cache')),
             },
             'rabbit_connection': {
                 'instance': None,
@@ -71,7 +87,7 @@ class DiContainerCoinrat(DiContainer):
             },
             'task_planner': {
                 'instance': None,
-                'factory': lambda: TaskPlanner(self._get_factory('rabbit_connection')),
+                'factory': self._create_task_planner,
             },
             'datetime_factory': {
                 'instance': None,
@@ -79,67 +95,56 @@ class DiContainerCoinrat(DiContainer):
             },
             'socket_server': {
                 'instance': None,
-                'factory': lambda: SocketServer(
-                    self.task_planner,
-                    self.datetime_factory,
-                    self.candle_storage_plugins,
-                    self.order_storage_plugins,
-                    self.market_plugins,
-                    self.strategy_plugins,
-                    self.strategy_run_storage,
-                    self.portfolio_snapshot_storage_plugins
-                ),
+                'factory': self._create_socket_server,
             },
             'strategy_replayer': {
                 'instance': None,
-                'factory': lambda: StrategyReplayer(
-                    self.candle_storage_plugins,
-                    self.order_storage_plugins,
-                    self.strategy_plugins,
-                    self.market_plugins,
-                    self.portfolio_snapshot_storage_plugins,
-                    self.event_emitter
-                )
+                'factory': self._create_strategy_replayer,
+            },
+            'simulation_strategy_replayer': {
+                'instance': None,
+                'factory': self._create_simulation_strategy_replayer,
+            },
+            'strategy_configuration_search': {
+                'instance': None,
+                'factory': self._create_strategy_configuration_search,
+            },
+            'strategy_monte_carlo_simulation': {
+                'instance': None,
+                'factory': self._create_strategy_monte_carlo_simulation,
             },
             'task_consumer': {
                 'instance': None,
-                'factory': lambda: TaskConsumer(
-                    self.rabbit_connection,
-                    self.strategy_replayer,
-                    self.datetime_factory,
-                    self.strategy_run_storage,
-                    self.event_emitter
-                ),
+                'factory': self._create_task_consumer,
             },
             'subscription_storage': {
                 'instance': None,
-                'factory': lambda: SubscriptionStorage(),
+                'factory': self._create_subscription_storage,
             },
             'mysql_connection': {
                 'instance': None,
-                'factory': lambda: MySQLdb.connect(
-                    host=os.environ.get('MYSQL_HOST'),
-                    database=os.environ.get('MYSQL_DATABASE'),
-                    user=os.environ.get('MYSQL_USER'),
-                    password=os.environ.get('MYSQL_PASSWORD'),
-                ),
+                'factory': self._create_mysql_connection,
             },
             'strategy_run_storage': {
                 'instance': None,
-                'factory': lambda: StrategyRunStorage(self.mysql_connection),
+                'factory': self._create_strategy_run_storage,
             },
             'strategy_standard_runner': {
                 'instance': None,
-                'factory': lambda: StrategyStandardRunner(
-                    self.candle_storage_plugins,
-                    self.order_storage_plugins,
-                    self.strategy_plugins,
-                    self.market_plugins,
-                    self.portfolio_snapshot_storage_plugins,
-                    self.event_emitter,
-                    self.datetime_factory,
-                ),
-            }
+                'factory': self._create_strategy_standard_runner,
+            },
+            'strategy_multi_runner': {
+                'instance': None,
+                'factory': self._create_strategy_multi_runner,
+            },
+            'candle_backfiller': {
+                'instance': None,
+                'factory': self._create_candle_backfiller,
+            },
+            'synchronizer_multi_runner': {
+                'instance': None,
+                'factory': self._create_synchronizer_multi_runner,
+            },
         }
 
     def _create_event_emitter(self) -> EventEmitter:
@@ -148,12 +153,29 @@ class DiContainerCoinrat(DiContainer):
         assert event_emitter in ['rabbit', 'null'], 'Event-emitter must be configured to "rabbit" or "null".'
 
         if event_emitter == 'rabbit':
-            return RabbitEventEmitter(self.rabbit_connection)
+            from coinrat.event.rabbit_event_emitter import RabbitEventEmitter
+            return RabbitEventEmitter(
+                self.rabbit_connection,
+                os.environ.get('EVENT_EMITTER_LATEST_CANDLE_ONLY') == 'on'
+            )
 
         return NullEventEmitter()
 
     @staticmethod
-    def _create_rabbit_connection() -> pika.BlockingConnection:
+    def _create_tick_profiler() -> Union['TickProfiler', None]:
+        if os.environ.get('TICK_PROFILER') != 'on':
+            return None
+
+        from coinrat.tick_profiler import TickProfiler
+
+        summary_interval = os.environ.get('TICK_PROFILER_SUMMARY_INTERVAL')
+
+        return TickProfiler(float(summary_interval) if summary_interval else None)
+
+    @staticmethod
+    def _create_rabbit_connection() -> 'pika.BlockingConnection':
+        import pika
+
         host = os.environ.get('RABBITMQ_SERVER_HOST')
         username = os.environ.get('RABBITMQ_USERNAME')
 
@@ -164,19 +186,153 @@ class DiContainerCoinrat(DiContainer):
         return pika.BlockingConnection(pika.ConnectionParameters(host=host, credentials=credentials))
 
     @staticmethod
-    def _create_market_plugins() -> MarketPlugins:
-        market_plugins_service = MarketPlugins()
+    def _create_plugin_metadata_cache() -> Union[PluginMetadataCache, None]:
+        cache_file = os.environ.get('PLUGIN_METADATA_CACHE_FILE')
+        return PluginMetadataCache(cache_file) if cache_file else None
+
+    def _create_market_plugins(self) -> MarketPlugins:
+        market_plugins_service = MarketPlugins(self._get('plugin_metadata_cache'))
 
         markets: Set = set()
         for market_plugin in market_plugins_service.get_available_market_plugins():
             if market_plugin.get_name() != 'coinrat_mock':
                 markets = markets.union(set(market_plugin.get_available_markets()))
 
+        import coinrat_mock
         mock_plugin = cast(coinrat_mock.plugin.MarketPlugin, market_plugins_service.get_plugin('coinrat_mock'))
         mock_plugin.set_available_markets(list(markets))
 
         return market_plugins_service
 
+    @staticmethod
+    def _create_mysql_connection() -> 'MySQLdb.Connection':
+        import MySQLdb
+
+        return MySQLdb.connect(
+            host=os.environ.get('MYSQL_HOST'),
+            database=os.environ.get('MYSQL_DATABASE'),
+            user=os.environ.get('MYSQL_USER'),
+            password=os.environ.get('MYSQL_PASSWORD'),
+        )
+
+    def _create_strategy_run_storage(self) -> 'StrategyRunStorage':
+        from coinrat.domain.strategy import StrategyRunStorage
+        return StrategyRunStorage(self.mysql_connection)
+
+    def _create_task_planner(self) -> 'TaskPlanner':
+        from coinrat.task.task_planner import TaskPlanner
+        return TaskPlanner(self._get_factory('rabbit_connection'))
+
+    def _create_task_consumer(self) -> 'TaskConsumer':
+        from coinrat.task.task_consumer import TaskConsumer
+        return TaskConsumer(
+            self.rabbit_connection,
+            self.strategy_replayer,
+            self.datetime_factory,
+            self.strategy_run_storage,
+            self.event_emitter
+        )
+
+    def _create_socket_server(self) -> 'SocketServer':
+        from coinrat.server.socket_server import SocketServer
+        return SocketServer(
+            self.task_planner,
+            self.datetime_factory,
+            self.candle_storage_plugins,
+            self.order_storage_plugins,
+            self.market_plugins,
+            self.strategy_plugins,
+            self.strategy_run_storage,
+            self.portfolio_snapshot_storage_plugins
+        )
+
+    @staticmethod
+    def _create_subscription_storage() -> 'SubscriptionStorage':
+        from coinrat.server.subscription_storage import SubscriptionStorage
+        return SubscriptionStorage()
+
+    def _create_strategy_replayer(self) -> 'StrategyReplayer':
+        from coinrat.strategy_replayer import StrategyReplayer
+        return StrategyReplayer(
+            self.candle_storage_plugins,
+            self.order_storage_plugins,
+            self.strategy_plugins,
+            self.market_plugins,
+            self.portfolio_snapshot_storage_plugins,
+            self.event_emitter,
+            self._create_tick_profiler()
+        )
+
+    def _create_simulation_strategy_replayer(self) -> 'StrategyReplayer':
+        from coinrat.strategy_replayer import StrategyReplayer
+        return StrategyReplayer(
+            self.candle_storage_plugins,
+            self.order_storage_plugins,
+            self.strategy_plugins,
+            self.market_plugins,
+            self.portfolio_snapshot_storage_plugins,
+            NullEventEmitter(),
+            numeric_backend=os.environ.get('SIMULATION_NUMERIC_BACKEND', NUMERIC_BACKEND_DECIMAL)
+        )
+
+    def _create_strategy_configuration_search(self) -> 'StrategyConfigurationSearch':
+        from coinrat.strategy_configuration_search import StrategyConfigurationSearch
+        return StrategyConfigurationSearch(self._get('simulation_strategy_replayer'))
+
+    def _create_strategy_monte_carlo_simulation(self) -> 'StrategyMonteCarloSimulation':
+        from coinrat.strategy_monte_carlo import StrategyMonteCarloSimulation
+        return StrategyMonteCarloSimulation(self._get('simulation_strategy_replayer'))
+
+    def _create_strategy_standard_runner(self) -> 'StrategyStandardRunner':
+        from coinrat.strategy_standard_runner import StrategyStandardRunner, DEFAULT_FALLBACK_POLL_INTERVAL
+        from coinrat.domain.market.balance_caching_market import DEFAULT_BALANCE_CACHE_TTL
+
+        tick_mode = os.environ.get('TICK_MODE', 'schedule')
+        assert tick_mode in ['schedule', 'candle_event'], \
+            'Tick mode must be configured to "schedule" or "candle_event".'
+
+        return StrategyStandardRunner(
+            self.candle_storage_plugins,
+            self.order_storage_plugins,
+            self.strategy_plugins,
+            self.market_plugins,
+            self.portfolio_snapshot_storage_plugins,
+            self.event_emitter,
+            self.datetime_factory,
+            self._create_tick_profiler(),
+            float(os.environ.get('TICK_SCHEDULER_OFFSET', '0')),
+            os.environ.get('TICK_SCHEDULER_POLICY', TICK_POLICY_SKIP),
+            self._create_candle_event_listener if tick_mode == 'candle_event' else None,
+            float(os.environ.get('TICK_FALLBACK_POLL_INTERVAL', DEFAULT_FALLBACK_POLL_INTERVAL)),
+            float(os.environ.get('MARKET_BALANCE_CACHE_TTL', DEFAULT_BALANCE_CACHE_TTL))
+        )
+
+    def _create_candle_event_listener(self, strategy_run: 'StrategyRun') -> 'CandleEventListener':
+        from coinrat.event.rabbit_candle_event_listener import RabbitCandleEventListener
+        return RabbitCandleEventListener(
+            self.create_service('rabbit_connection'),
+            strategy_run.candle_storage_name,
+            [strategy_run_market.market_name for strategy_run_market in strategy_run.markets],
+            serialize_pair(strategy_run.pair)
+        )
+
+    def _create_strategy_multi_runner(self) -> 'StrategyMultiRunner':
+        from coinrat.strategy_multi_runner import StrategyMultiRunner, DEFAULT_MAX_WORKERS
+        return StrategyMultiRunner(
+            self.strategy_standard_runner,
+            int(os.environ.get('MULTI_STRATEGY_RUNNER_MAX_WORKERS', DEFAULT_MAX_WORKERS)),
+            float(os.environ.get('TICK_SCHEDULER_OFFSET', '0')),
+            os.environ.get('TICK_SCHEDULER_POLICY', TICK_POLICY_SKIP)
+        )
+
+    def _create_candle_backfiller(self) -> 'CandleBackfiller':
+        from coinrat.candle_backfiller import CandleBackfiller, DEFAULT_MAX_WORKERS
+        return CandleBackfiller(int(os.environ.get('CANDLE_BACKFILL_MAX_WORKERS', DEFAULT_MAX_WORKERS)))
+
+    def _create_synchronizer_multi_runner(self) -> 'SynchronizerMultiRunner':
+        from coinrat.synchronizer_multi_runner import SynchronizerMultiRunner
+        return SynchronizerMultiRunner(self.synchronizer_plugins)
+
     def _get_factory(self, name: str) -> Callable:
         return self._storage[name]['factory']
 
@@ -205,11 +361,11 @@ class DiContainerCoinrat(DiContainer):
         return self._get('portfolio_snapshot_storage_plugins')
 
     @property
-    def socket_server(self) -> SocketServer:
+    def socket_server(self) -> 'SocketServer':
         return self._get('socket_server')
 
     @property
-    def rabbit_connection(self) -> pika.BlockingConnection:
+    def rabbit_connection(self) -> 'pika.BlockingConnection':
         return self._get('rabbit_connection')
 
     @property
@@ -217,15 +373,17 @@ class DiContainerCoinrat(DiContainer):
         return self._get('event_emitter')
 
     @property
-    def task_planner(self) -> TaskPlanner:
+    def task_planner(self) -> 'TaskPlanner':
         return self._get('task_planner')
 
     @property
     def datetime_factory(self) -> DateTimeFactory:
         return self._get('datetime_factory')
 
-    def create_rabbit_consumer(self, thread_watcher: ThreadWatcher) -> RabbitEventConsumer:
-        connection: pika.BlockingConnection = self.create_service('rabbit_connection')
+    def create_rabbit_consumer(self, thread_watcher: 'ThreadWatcher') -> 'RabbitEventConsumer':
+        from coinrat.event.rabbit_event_consumer import RabbitEventConsumer
+
+        connection: 'pika.BlockingConnection' = self.create_service('rabbit_connection')
         return RabbitEventConsumer(
             thread_watcher,
             connection,
@@ -236,25 +394,45 @@ class DiContainerCoinrat(DiContainer):
         )
 
     @property
-    def task_consumer(self) -> TaskConsumer:
+    def task_consumer(self) -> 'TaskConsumer':
         return self._get('task_consumer')
 
     @property
-    def strategy_replayer(self) -> StrategyReplayer:
+    def strategy_replayer(self) -> 'StrategyReplayer':
         return self._get('strategy_replayer')
 
     @property
-    def subscription_storage(self) -> SubscriptionStorage:
+    def strategy_configuration_search(self) -> 'StrategyConfigurationSearch':
+        return self._get('strategy_configuration_search')
+
+    @property
+    def strategy_monte_carlo_simulation(self) -> 'StrategyMonteCarloSimulation':
+        return self._get('strategy_monte_carlo_simulation')
+
+    @property
+    def subscription_storage(self) -> 'SubscriptionStorage':
         return self._get('subscription_storage')
 
     @property
-    def mysql_connection(self) -> MySQLdb.Connection:
+    def mysql_connection(self) -> 'MySQLdb.Connection':
         return self._get('mysql_connection')
 
     @property
-    def strategy_run_storage(self) -> StrategyRunStorage:
+    def strategy_run_storage(self) -> 'StrategyRunStorage':
         return self._get('strategy_run_storage')
 
     @property
-    def strategy_standard_runner(self) -> StrategyStandardRunner:
+    def strategy_standard_runner(self) -> 'StrategyStandardRunner':
         return self._get('strategy_standard_runner')
+
+    @property
+    def strategy_multi_runner(self) -> 'StrategyMultiRunner':
+        return self._get('strategy_multi_runner')
+
+    @property
+    def candle_backfiller(self) -> 'CandleBackfiller':
+        return self._get('candle_backfiller')
+
+    @property
+    def synchronizer_multi_runner(self) -> 'SynchronizerMultiRunner':
+        return self._get('synchronizer_multi_runner')
@@ -3,6 +3,7 @@ from .coinrat import ForEndUserException
 from .synchronizer import MarketStateSynchronizer
 from .datetime_factory import DateTimeFactory, CurrentUtcDateTimeFactory, FrozenDateTimeFactory
 from .datetime_interval import DateTimeInterval, deserialize_datetime_interval, serialize_datetime_interval
+from .datetime_parser import parse_utc_datetime
 
 __all__ = [
     'Balance', 'serialize_balance', 'serialize_balances',
@@ -10,4 +11,5 @@ __all__ = [
     'MarketStateSynchronizer',
     'DateTimeFactory', 'CurrentUtcDateTimeFactory', 'FrozenDateTimeFactory',
     'DateTimeInterval', 'deserialize_datetime_interval', 'serialize_datetime_interval',
+    'parse_utc_datetime',
 ]
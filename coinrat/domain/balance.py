@@ -1,14 +1,17 @@
 from decimal import Decimal
 from typing import Dict, List
 
+from coinrat.domain.number import NUMBER_TYPES
+
 
 class Balance:
     """
     Amount of given Currency available on the given Market.
     """
+    __slots__ = ('_market_name', '_currency', '_available_amount')
 
     def __init__(self, market_name: str, currency: str, available_amount: Decimal) -> None:
-        assert isinstance(available_amount, Decimal)
+        assert isinstance(available_amount, NUMBER_TYPES)
 
         self._market_name = market_name
         self._currency = currency
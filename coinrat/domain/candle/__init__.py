@@ -1,14 +1,17 @@
-from .candle import Candle, serialize_candle, deserialize_candle, serialize_candles, deserialize_candles, \
+from .candle import Candle, create_trusted_candle, serialize_candle, deserialize_candle, serialize_candles, \
+    deserialize_candles, \
     CANDLE_STORAGE_FIELD_OPEN, CANDLE_STORAGE_FIELD_CLOSE, CANDLE_STORAGE_FIELD_LOW, CANDLE_STORAGE_FIELD_HIGH, \
     CANDLE_STORAGE_FIELD_MARKET, CANDLE_STORAGE_FIELD_PAIR, CANDLE_STORAGE_FIELD_SIZE
 
 from .candle_storage import CandleStorage, NoCandlesForMarketInStorageException
 from .candle_exporter import CandleExporter
+from .candle_resampler import CandleResampler, get_candle_bucket_start
 from .candle_size import serialize_candle_size, deserialize_candle_size, CandleSize, \
     CANDLE_SIZE_UNIT_MINUTE, CANDLE_SIZE_UNIT_HOUR, CANDLE_SIZE_UNIT_DAY
 
 __all__ = [
-    'Candle', 'CandleStorage', 'NoCandlesForMarketInStorageException', 'CandleExporter', 'CandleSize',
+    'Candle', 'create_trusted_candle', 'CandleStorage', 'NoCandlesForMarketInStorageException', 'CandleExporter', 'CandleSize',
+    'CandleResampler', 'get_candle_bucket_start',
     'serialize_candle', 'deserialize_candle', 'serialize_candles', 'deserialize_candles',
     'CANDLE_STORAGE_FIELD_OPEN', 'CANDLE_STORAGE_FIELD_CLOSE', 'CANDLE_STORAGE_FIELD_LOW', 'CANDLE_STORAGE_FIELD_HIGH',
     'CANDLE_STORAGE_FIELD_MARKET', 'CANDLE_STORAGE_FIELD_PAIR', 'CANDLE_STORAGE_FIELD_SIZE',
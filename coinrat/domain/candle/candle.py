@@ -1,10 +1,11 @@
 import datetime
+import sys
 from decimal import Decimal
-from typing import Dict, List
-import dateutil.parser
+from typing import Any, Dict, List, Union
 
+from coinrat.domain.datetime_parser import parse_utc_datetime
 from coinrat.domain.pair import Pair, serialize_pair, deserialize_pair
-from coinrat.domain.number import to_decimal
+from coinrat.domain.number import to_decimal, NUMBER_TYPES, Number
 from .candle_size import CandleSize, CANDLE_SIZE_UNIT_MINUTE, serialize_candle_size, deserialize_candle_size
 
 CANDLE_STORAGE_FIELD_OPEN = 'open'
@@ -24,22 +25,30 @@ class Candle:
     LOW, HIGH: The high price is the highest price reached during a specific time period. The low price is the lowest
     price reached during a specific period (minute).
     """
+    __slots__ = ('_market_name', '_pair', '_time', '_open', '_high', '_low', '_close', '_candle_size')
+
+    # Prices are Numbers (floats in simulations with float numeric backend), but never mixed within one process,
+    # so code using candles is typed (and does arithmetic) as with Decimals.
+    _open: Any
+    _high: Any
+    _low: Any
+    _close: Any
 
     def __init__(
         self,
         market_name: str,
         pair: Pair,
         time: datetime.datetime,
-        open_price: Decimal,
-        high_price: Decimal,
-        low_price: Decimal,
-        close_price: Decimal,
+        open_price: Number,
+        high_price: Number,
+        low_price: Number,
+        close_price: Number,
         candle_size: CandleSize = CandleSize(CANDLE_SIZE_UNIT_MINUTE, 1)
     ) -> None:
-        assert isinstance(open_price, Decimal)
-        assert isinstance(high_price, Decimal)
-        assert isinstance(low_price, Decimal)
-        assert isinstance(close_price, Decimal)
+        assert isinstance(open_price, NUMBER_TYPES)
+        assert isinstance(high_price, NUMBER_TYPES)
+        assert isinstance(low_price, NUMBER_TYPES)
+        assert isinstance(close_price, NUMBER_TYPES)
 
         candle_size.assert_candle_time(time)
 
@@ -120,6 +129,33 @@ class Candle:
             .format(self._time.isoformat(), self._open, self._high, self._low, self._close, self._candle_size)
 
 
+def create_trusted_candle(
+    market_name: str,
+    pair: Pair,
+    time: datetime.datetime,
+    open_price: Number,
+    high_price: Number,
+    low_price: Number,
+    close_price: Number,
+    candle_size: CandleSize
+) -> Candle:
+    """
+    Creates candle without validation of its data (types, UTC time aligned to the candle size). Use only for
+    data that were validated before, typically candles loaded from storage.
+    """
+    candle = Candle.__new__(Candle)
+    candle._market_name = market_name
+    candle._pair = pair
+    candle._time = time
+    candle._open = open_price
+    candle._high = high_price
+    candle._low = low_price
+    candle._close = close_price
+    candle._candle_size = candle_size
+
+    return candle
+
+
 def serialize_candle(candle: Candle) -> Dict[str, str]:
     return {
         CANDLE_STORAGE_FIELD_MARKET: candle.market_name,
@@ -134,7 +170,36 @@ def serialize_candle(candle: Candle) -> Dict[str, str]:
 
 
 def serialize_candles(candles: List[Candle]) -> List[Dict[str, str]]:
-    return list(map(serialize_candle, candles))
+    """
+    The same output as serialize_candle() for every candle, but pairs and candle sizes (usually shared by all
+    candles) are serialized only once and per-candle overhead (property calls, str.format parsing) is avoided.
+    """
+    serialized_pairs: Dict[int, str] = {}
+    serialized_candle_sizes: Dict[int, str] = {}
+    result = []
+
+    for candle in candles:
+        serialized_pair = serialized_pairs.get(id(candle._pair))
+        if serialized_pair is None:
+            serialized_pair = serialized_pairs[id(candle._pair)] = serialize_pair(candle._pair)
+
+        serialized_candle_size = serialized_candle_sizes.get(id(candle._candle_size))
+        if serialized_candle_size is None:
+            serialized_candle_size = serialized_candle_sizes[id(candle._candle_size)] = \
+                serialize_candle_size(candle._candle_size)
+
+        result.append({
+            CANDLE_STORAGE_FIELD_MARKET: candle._market_name,
+            CANDLE_STORAGE_FIELD_PAIR: serialized_pair,
+            CANDLE_STORAGE_FIELD_TIME: candle._time.isoformat(),
+            CANDLE_STORAGE_FIELD_OPEN: format(candle._open, '.8f'),
+            CANDLE_STORAGE_FIELD_HIGH: format(candle._high, '.8f'),
+            CANDLE_STORAGE_FIELD_LOW: format(candle._low, '.8f'),
+            CANDLE_STORAGE_FIELD_CLOSE: format(candle._close, '.8f'),
+            CANDLE_STORAGE_FIELD_SIZE: serialized_candle_size,
+        })
+
+    return result
 
 
 def deserialize_candle(row: Dict) -> Candle:
@@ -146,7 +211,7 @@ def deserialize_candle(row: Dict) -> Candle:
     return Candle(
         row[CANDLE_STORAGE_FIELD_MARKET],
         deserialize_pair(row[CANDLE_STORAGE_FIELD_PAIR]),
-        dateutil.parser.parse(row[CANDLE_STORAGE_FIELD_TIME]).replace(tzinfo=datetime.timezone.utc),
+        parse_utc_datetime(row[CANDLE_STORAGE_FIELD_TIME]),
         to_decimal(row[CANDLE_STORAGE_FIELD_OPEN]),
         to_decimal(row[CANDLE_STORAGE_FIELD_HIGH]),
         to_decimal(row[CANDLE_STORAGE_FIELD_LOW]),
@@ -155,5 +220,43 @@ def deserialize_candle(row: Dict) -> Candle:
     )
 
 
-def deserialize_candles(serialized_candles: List[Dict[str, str]]) -> List[Candle]:
-    return list(map(deserialize_candle, serialized_candles))
+class _DecimalCache(dict):
+    """Prices repeat a lot (open is usually previous close), Decimal is immutable so one instance can be shared."""
+
+    def __missing__(self, key) -> Decimal:
+        value = self[key] = to_decimal(key)
+        return value
+
+
+def deserialize_candles(serialized_candles: List[Dict], is_trusted: bool = False) -> List[Candle]:
+    """
+    The same as deserialize_candle() for every row, but pairs, candle sizes and equal prices are deserialized only
+    once. Trusted rows (coming from candle storage) are not validated again.
+    """
+    create_candle = create_trusted_candle if is_trusted else Candle
+    prices = _DecimalCache()
+    pairs: Dict[str, Pair] = {}
+    candle_sizes: Dict[Union[str, None], CandleSize] = {None: CandleSize(CANDLE_SIZE_UNIT_MINUTE, 1)}
+    result = []
+
+    for row in serialized_candles:
+        serialized_pair = row[CANDLE_STORAGE_FIELD_PAIR]
+        if serialized_pair not in pairs:
+            pairs[serialized_pair] = deserialize_pair(serialized_pair)
+
+        serialized_candle_size = row.get(CANDLE_STORAGE_FIELD_SIZE)
+        if serialized_candle_size not in candle_sizes:
+            candle_sizes[serialized_candle_size] = deserialize_candle_size(serialized_candle_size)
+
+        result.append(create_candle(
+            sys.intern(row[CANDLE_STORAGE_FIELD_MARKET]),
+            pairs[serialized_pair],
+            parse_utc_datetime(row[CANDLE_STORAGE_FIELD_TIME]),
+            prices[row[CANDLE_STORAGE_FIELD_OPEN]],
+            prices[row[CANDLE_STORAGE_FIELD_HIGH]],
+            prices[row[CANDLE_STORAGE_FIELD_LOW]],
+            prices[row[CANDLE_STORAGE_FIELD_CLOSE]],
+            candle_sizes[serialized_candle_size]
+        ))
+
+    return result
@@ -0,0 +1,130 @@
+import datetime
+from typing import List
+
+import numpy
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.pair import Pair, serialize_pair
+
+SECONDS_IN_MINUTE = 60
+
+
+class CandleGap:
+    """Missing minute candles: since is the first missing minute, till is the first minute after the gap."""
+
+    def __init__(self, since: datetime.datetime, till: datetime.datetime) -> None:
+        self._since = since
+        self._till = till
+
+    @property
+    def since(self) -> datetime.datetime:
+        return self._since
+
+    @property
+    def till(self) -> datetime.datetime:
+        return self._till
+
+    @property
+    def number_of_missing_candles(self) -> int:
+        return int((self._till - self._since).total_seconds()) // SECONDS_IN_MINUTE
+
+    def __repr__(self) -> str:
+        return 'CandleGap({}, {}, missing: {})'.format(
+            self._since.isoformat(),
+            self._till.isoformat(),
+            self.number_of_missing_candles
+        )
+
+
+class CandleCoverage:
+    def __init__(
+        self,
+        market_name: str,
+        pair: Pair,
+        interval: DateTimeInterval,
+        number_of_expected_candles: int,
+        gaps: List[CandleGap]
+    ) -> None:
+        self._market_name = market_name
+        self._pair = pair
+        self._interval = interval
+        self._number_of_expected_candles = number_of_expected_candles
+        self._gaps = gaps
+
+    @property
+    def market_name(self) -> str:
+        return self._market_name
+
+    @property
+    def pair(self) -> Pair:
+        return self._pair
+
+    @property
+    def interval(self) -> DateTimeInterval:
+        return self._interval
+
+    @property
+    def gaps(self) -> List[CandleGap]:
+        return self._gaps
+
+    @property
+    def number_of_expected_candles(self) -> int:
+        return self._number_of_expected_candles
+
+    @property
+    def number_of_missing_candles(self) -> int:
+        return sum(gap.number_of_missing_candles for gap in self._gaps)
+
+    @property
+    def ratio(self) -> float:
+        """Ratio of present minute candles, 1.0 means complete data."""
+        if self._number_of_expected_candles == 0:
+            return 1.0
+
+        return 1 - self.number_of_missing_candles / self._number_of_expected_candles
+
+    def __str__(self) -> str:
+        return '{} {} {}: {:.2%} of {} minute candles present, {} missing in {} gaps'.format(
+            self._market_name,
+            serialize_pair(self._pair),
+            self._interval,
+            self.ratio,
+            self._number_of_expected_candles,
+            self.number_of_missing_candles,
+            len(self._gaps)
+        )
+
+
+def calculate_candle_coverage(
+    market_name: str,
+    pair: Pair,
+    interval: DateTimeInterval,
+    candle_times: List[datetime.datetime]
+) -> CandleCoverage:
+    """
+    One minute candle is expected for every minute starting in the closed interval [since, till), candle times
+    out of it are ignored. Gaps are found in one vectorized pass: minute numbers (since the epoch) are sorted,
+    bounded by the minute before the interval and the first minute after it and every difference bigger than 1
+    is a gap.
+    """
+    assert interval.is_closed(), 'Coverage can be calculated for closed interval only, {} given.'.format(interval)
+
+    first_minute = -(-int(interval.since.timestamp()) // SECONDS_IN_MINUTE)  # Minute not aligned to since is skipped
+    end_minute = max(first_minute, -(-int(interval.till.timestamp()) // SECONDS_IN_MINUTE))
+
+    minutes = numpy.array([int(time.timestamp()) // SECONDS_IN_MINUTE for time in candle_times], dtype=numpy.int64)
+    minutes = numpy.unique(minutes[(minutes >= first_minute) & (minutes < end_minute)])
+
+    bounds = numpy.concatenate(([first_minute - 1], minutes, [end_minute]))
+    gap_indexes = numpy.flatnonzero(numpy.diff(bounds) > 1)
+
+    gaps = [
+        CandleGap(_minute_to_datetime(int(bounds[index]) + 1), _minute_to_datetime(int(bounds[index + 1])))
+        for index in gap_indexes
+    ]
+
+    return CandleCoverage(market_name, pair, interval, end_minute - first_minute, gaps)
+
+
+def _minute_to_datetime(minute: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(minute * SECONDS_IN_MINUTE, tz=datetime.timezone.utc)
@@ -0,0 +1,123 @@
+import math
+from typing import List, Union
+
+import numpy
+
+from coinrat.domain.number import to_decimal
+from .candle import Candle
+
+PATH_METHOD_BLOCK_BOOTSTRAP = 'block_bootstrap'
+PATH_METHOD_NOISE = 'noise'
+PATH_METHODS = [PATH_METHOD_BLOCK_BOOTSTRAP, PATH_METHOD_NOISE]
+
+OPEN_INDEX = 0
+HIGH_INDEX = 1
+LOW_INDEX = 2
+CLOSE_INDEX = 3
+
+
+class CandlePathGenerator:
+    """
+    Generates synthetic price paths from the history of (minute) candles.
+
+    Every candle is described by log-ratios of its OPEN, HIGH, LOW and CLOSE to the CLOSE of previous candle.
+    Synthetic paths are then built from these ratios:
+        * block bootstrap: ratios are resampled in blocks of consecutive candles (keeps short-term
+          autocorrelation and volatility clustering of the history),
+        * noise: gaussian noise (scaled by volatility of the history) is added to the original ratios.
+
+    All paths are generated at once by numpy, result has shape (number of paths, number of candles, 4)
+    and columns are OPEN, HIGH, LOW, CLOSE.
+    """
+
+    def __init__(self, candles: List[Candle], start_price: Union[float, None] = None) -> None:
+        assert len(candles) > 1, 'At least two candles are needed to generate paths.'
+
+        prices = numpy.array(
+            [[float(candle.open), float(candle.high), float(candle.low), float(candle.close)] for candle in candles]
+        )
+        previous_close = numpy.concatenate(([prices[0, OPEN_INDEX]], prices[:-1, CLOSE_INDEX]))
+
+        self._log_ratios = numpy.log(prices / previous_close[:, None])
+        self._start_price = float(start_price) if start_price is not None else float(prices[0, OPEN_INDEX])
+
+    @property
+    def number_of_candles(self) -> int:
+        return self._log_ratios.shape[0]
+
+    def generate(
+        self,
+        number_of_paths: int,
+        method: str = PATH_METHOD_BLOCK_BOOTSTRAP,
+        block_size: int = 60,
+        noise: float = 0.5,
+        random_state: Union[numpy.random.RandomState, None] = None
+    ) -> numpy.ndarray:
+        assert method in PATH_METHODS, 'Unknown method: "{}".'.format(method)
+        random_state = random_state if random_state is not None else numpy.random.RandomState()
+
+        if method == PATH_METHOD_BLOCK_BOOTSTRAP:
+            log_ratios = self._block_bootstrap(number_of_paths, block_size, random_state)
+        else:
+            log_ratios = self._inject_noise(number_of_paths, noise, random_state)
+
+        return self._build_prices(log_ratios)
+
+    def _block_bootstrap(
+        self,
+        number_of_paths: int,
+        block_size: int,
+        random_state: numpy.random.RandomState
+    ) -> numpy.ndarray:
+        number_of_candles = self.number_of_candles
+        block_size = max(1, min(block_size, number_of_candles))
+        number_of_blocks = int(math.ceil(number_of_candles / block_size))
+
+        starts = random_state.randint(0, number_of_candles - block_size + 1, size=(number_of_paths, number_of_blocks))
+        indexes = (starts[:, :, None] + numpy.arange(block_size)).reshape(number_of_paths, -1)[:, :number_of_candles]
+
+        return self._log_ratios[indexes]
+
+    def _inject_noise(
+        self,
+        number_of_paths: int,
+        noise: float,
+        random_state: numpy.random.RandomState
+    ) -> numpy.ndarray:
+        scale = noise * float(numpy.std(self._log_ratios[:, CLOSE_INDEX]))
+        shape = (number_of_paths,) + self._log_ratios.shape
+
+        return self._log_ratios[None, :, :] + random_state.normal(0, scale, size=shape)
+
+    def _build_prices(self, log_ratios: numpy.ndarray) -> numpy.ndarray:
+        log_close = math.log(self._start_price) + numpy.cumsum(log_ratios[:, :, CLOSE_INDEX], axis=1)
+        log_previous_close = numpy.concatenate(
+            (numpy.full((log_close.shape[0], 1), math.log(self._start_price)), log_close[:, :-1]),
+            axis=1
+        )
+        prices = numpy.exp(log_previous_close[:, :, None] + log_ratios)
+
+        open_close = prices[:, :, [OPEN_INDEX, CLOSE_INDEX]]
+        prices[:, :, HIGH_INDEX] = numpy.maximum(prices[:, :, HIGH_INDEX], open_close.max(axis=2))
+        prices[:, :, LOW_INDEX] = numpy.minimum(prices[:, :, LOW_INDEX], open_close.min(axis=2))
+
+        return prices
+
+
+def create_candles_from_path(candles: List[Candle], path: numpy.ndarray) -> List[Candle]:
+    """Synthetic candles with prices from the path and times (market, pair, size) from the original candles."""
+    assert len(candles) == path.shape[0], 'Path must have the same length as the candles.'
+
+    return [
+        Candle(
+            candle.market_name,
+            candle.pair,
+            candle.time,
+            to_decimal(prices[OPEN_INDEX]),
+            to_decimal(prices[HIGH_INDEX]),
+            to_decimal(prices[LOW_INDEX]),
+            to_decimal(prices[CLOSE_INDEX]),
+            candle.candle_size
+        )
+        for candle, prices in zip(candles, path.tolist())
+    ]
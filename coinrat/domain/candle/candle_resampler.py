@@ -0,0 +1,93 @@
+import datetime
+from decimal import Decimal
+from typing import List, Union
+
+from .candle import Candle
+from .candle_size import CandleSize
+
+
+def get_candle_bucket_start(candle_size: CandleSize, time: datetime.datetime) -> datetime.datetime:
+    """Buckets are aligned to the Unix epoch, the same way as InfluxDB's GROUP BY time() does it."""
+    bucket_seconds = candle_size.get_as_time_delta().total_seconds()
+    bucket_timestamp = time.timestamp() // bucket_seconds * bucket_seconds
+
+    return datetime.datetime.fromtimestamp(bucket_timestamp, tz=datetime.timezone.utc)
+
+
+class CandleResampler:
+    """
+    Incrementally aggregates minute candles (ordered by time) into bigger candles of given size.
+
+    Finished candles are returned as soon as first minute candle of the next bucket arrives, the unfinished one
+    is available in current_candle. The last consumed minute candle can be replaced by its newer version
+    (candle of currently running minute changes in time), older candles are ignored.
+    """
+
+    def __init__(self, candle_size: CandleSize) -> None:
+        self._candle_size = candle_size
+        self._bucket_start: Union[datetime.datetime, None] = None
+
+        # Aggregates of the current bucket WITHOUT the last minute candle, so last candle can be replaced.
+        self._open: Union[Decimal, None] = None
+        self._high: Union[Decimal, None] = None
+        self._low: Union[Decimal, None] = None
+        self._last_candle: Union[Candle, None] = None
+
+    @property
+    def last_candle_time(self) -> Union[datetime.datetime, None]:
+        return self._last_candle.time if self._last_candle is not None else None
+
+    @property
+    def current_candle(self) -> Union[Candle, None]:
+        if self._last_candle is None:
+            return None
+
+        last = self._last_candle
+        return Candle(
+            last.market_name,
+            last.pair,
+            self._bucket_start,
+            self._open if self._open is not None else last.open,
+            max(self._high, last.high) if self._high is not None else last.high,
+            min(self._low, last.low) if self._low is not None else last.low,
+            last.close,
+            self._candle_size
+        )
+
+    def add_candles(self, candles: List[Candle]) -> List[Candle]:
+        finished_candles = []
+        for candle in candles:
+            finished_candles += self.add_candle(candle)
+
+        return finished_candles
+
+    def add_candle(self, candle: Candle) -> List[Candle]:
+        assert candle.candle_size.is_one_minute(), 'Only minute candles can be resampled.'
+
+        if self._last_candle is not None and candle.time <= self._last_candle.time:
+            if candle.time == self._last_candle.time:
+                self._last_candle = candle
+            return []
+
+        bucket_start = get_candle_bucket_start(self._candle_size, candle.time)
+        finished_candles = []
+
+        if self._bucket_start is not None and bucket_start != self._bucket_start:
+            finished_candles.append(self.current_candle)
+            self._open, self._high, self._low = None, None, None
+
+        elif self._last_candle is not None:
+            self._fold_last_candle()
+
+        self._bucket_start = bucket_start
+        self._last_candle = candle
+
+        return finished_candles
+
+    def _fold_last_candle(self) -> None:
+        last = self._last_candle
+        if self._open is None:
+            self._open, self._high, self._low = last.open, last.high, last.low
+        else:
+            self._high = max(self._high, last.high)
+            self._low = min(self._low, last.low)
@@ -1,5 +1,4 @@
 import datetime
-from decimal import Decimal
 from typing import List
 
 from coinrat.domain import DateTimeInterval
@@ -7,6 +6,7 @@ from .candle import Candle
 from .candle_size import CandleSize, CANDLE_SIZE_UNIT_MINUTE
 from coinrat.domain.pair import Pair
 from coinrat.domain.coinrat import ForEndUserException
+from coinrat.domain.number import Number
 
 
 class NoCandlesForMarketInStorageException(ForEndUserException):
@@ -35,7 +35,7 @@ class CandleStorage:
         pair: Pair,
         field: str,
         interval: DateTimeInterval = DateTimeInterval(None, None)
-    ) -> Decimal:
+    ) -> Number:
         raise NotImplementedError()
 
     def get_last_minute_candle(self, market_name: str, pair: Pair, current_time: datetime.datetime) -> Candle:
@@ -0,0 +1,76 @@
+from typing import Dict, List, Tuple
+
+import numpy
+
+from coinrat.domain.pair import serialize_pair
+from .candle import Candle, CANDLE_STORAGE_FIELD_MARKET, CANDLE_STORAGE_FIELD_PAIR, CANDLE_STORAGE_FIELD_TIME, \
+    CANDLE_STORAGE_FIELD_OPEN, CANDLE_STORAGE_FIELD_HIGH, CANDLE_STORAGE_FIELD_LOW, CANDLE_STORAGE_FIELD_CLOSE, \
+    CANDLE_STORAGE_FIELD_SIZE
+from .candle_size import serialize_candle_size
+
+# Weight of HA-Close(-k) in HA-Open(0) is 0.5^k, after 64 candles it is below precision of float64.
+HEIKIN_ASHI_OPEN_MEMORY = 64
+
+
+def calculate_heikin_ashi(
+    open_prices: numpy.ndarray,
+    high_prices: numpy.ndarray,
+    low_prices: numpy.ndarray,
+    close_prices: numpy.ndarray
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Heikin-Ashi OPEN, HIGH, LOW, CLOSE of whole series at once (see HeikinAshiCandle for formulas).
+    First candle of the series is initialized by HA-Open = (Open + Close) / 2.
+
+    HA-Open(0) = (HA-Open(-1) + HA-Close(-1)) / 2 unrolls to sum of 0.5^k * HA-Close(-k) (+ 0.5^n * HA-Open
+    of the first candle), so recursion is replaced by one convolution.
+    """
+    ha_close = (open_prices + high_prices + low_prices + close_prices) / 4
+    number_of_candles = len(ha_close)
+
+    ha_open = numpy.empty(number_of_candles)
+    if number_of_candles == 0:
+        return ha_open, ha_open.copy(), ha_open.copy(), ha_close
+
+    weights = 0.5 ** numpy.arange(1, HEIKIN_ASHI_OPEN_MEMORY + 1)
+    ha_open[0] = (open_prices[0] + close_prices[0]) / 2
+    ha_open[1:] = numpy.convolve(ha_close, weights)[:number_of_candles - 1]
+
+    initial_length = min(number_of_candles, HEIKIN_ASHI_OPEN_MEMORY + 1)
+    ha_open[1:initial_length] += ha_open[0] * 0.5 ** numpy.arange(1, initial_length)
+
+    ha_high = numpy.maximum(high_prices, numpy.maximum(ha_open, ha_close))
+    ha_low = numpy.minimum(low_prices, numpy.minimum(ha_open, ha_close))
+
+    return ha_open, ha_high, ha_low, ha_close
+
+
+def calculate_heikin_ashi_for_candles(
+    candles: List[Candle]
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    prices = numpy.array(
+        [[candle.open, candle.high, candle.low, candle.close] for candle in candles],
+        dtype=numpy.float64
+    ).reshape(-1, 4)
+
+    return calculate_heikin_ashi(prices[:, 0], prices[:, 1], prices[:, 2], prices[:, 3])
+
+
+def serialize_candles_as_heikin_ashi(candles: List[Candle]) -> List[Dict[str, str]]:
+    """The same format as serialize_candles() gives, but with Heikin-Ashi prices."""
+    ha_open, ha_high, ha_low, ha_close = calculate_heikin_ashi_for_candles(candles)
+
+    return [
+        {
+            CANDLE_STORAGE_FIELD_MARKET: candle.market_name,
+            CANDLE_STORAGE_FIELD_PAIR: serialize_pair(candle.pair),
+            CANDLE_STORAGE_FIELD_TIME: candle.time.isoformat(),
+            CANDLE_STORAGE_FIELD_OPEN: '{0:.8f}'.format(open_price),
+            CANDLE_STORAGE_FIELD_HIGH: '{0:.8f}'.format(high_price),
+            CANDLE_STORAGE_FIELD_LOW: '{0:.8f}'.format(low_price),
+            CANDLE_STORAGE_FIELD_CLOSE: '{0:.8f}'.format(close_price),
+            CANDLE_STORAGE_FIELD_SIZE: serialize_candle_size(candle.candle_size),
+        }
+        for candle, open_price, high_price, low_price, close_price
+        in zip(candles, ha_open.tolist(), ha_high.tolist(), ha_low.tolist(), ha_close.tolist())
+    ]
@@ -0,0 +1,88 @@
+import datetime
+from decimal import Decimal
+from typing import List, Union
+
+from coinrat.domain.pair import Pair
+from coinrat.domain.trade import Trade
+from .candle import Candle
+from .candle_resampler import get_candle_bucket_start
+from .candle_size import CandleSize, CANDLE_SIZE_UNIT_MINUTE
+
+ONE_MINUTE = datetime.timedelta(minutes=1)
+MINUTE_CANDLE_SIZE = CandleSize(CANDLE_SIZE_UNIT_MINUTE, 1)
+
+
+class MinuteCandleBuilder:
+    """
+    Aggregates trades of one pair (ordered by time) into minute candles. Minute is finished by the first trade
+    of a later minute or by close_minutes_until() (heartbeat of the stream, minute ends even when nothing is
+    traded). Minute without trades gets flat candle at the last price, so candles are continuous (strategies
+    expect it), nothing is produced before the first trade. Late trades of already finished minutes are ignored.
+    """
+
+    def __init__(self, market_name: str, pair: Pair) -> None:
+        self._market_name = market_name
+        self._pair = pair
+        self._minute_start: Union[datetime.datetime, None] = None
+        self._last_price: Union[Decimal, None] = None
+
+        # Prices of trades in the current minute, None when nothing was traded in it yet
+        self._open: Union[Decimal, None] = None
+        self._high: Union[Decimal, None] = None
+        self._low: Union[Decimal, None] = None
+
+    @property
+    def current_candle(self) -> Union[Candle, None]:
+        """Unfinished candle of the current minute (it changes with every trade)."""
+        if self._last_price is None:
+            return None
+
+        if self._open is None:
+            return self._create_candle(self._last_price, self._last_price, self._last_price)
+
+        return self._create_candle(self._open, self._high, self._low)
+
+    def add_trade(self, trade: Trade) -> List[Candle]:
+        """Returns minute candles finished by this trade."""
+        minute_start = get_candle_bucket_start(MINUTE_CANDLE_SIZE, trade.time)
+        if self._minute_start is not None and minute_start < self._minute_start:
+            return []
+
+        finished_candles = self.close_minutes_until(minute_start)
+        if self._minute_start is None:
+            self._minute_start = minute_start
+
+        if self._open is None:
+            self._open, self._high, self._low = trade.price, trade.price, trade.price
+        else:
+            self._high = max(self._high, trade.price)
+            self._low = min(self._low, trade.price)
+
+        self._last_price = trade.price
+
+        return finished_candles
+
+    def close_minutes_until(self, time: datetime.datetime) -> List[Candle]:
+        """Finishes all minutes which ended before (or at) given time and returns their candles."""
+        finished_candles: List[Candle] = []
+        if self._minute_start is None:
+            return finished_candles
+
+        while self._minute_start + ONE_MINUTE <= time:
+            finished_candles.append(self.current_candle)
+            self._minute_start += ONE_MINUTE
+            self._open, self._high, self._low = None, None, None
+
+        return finished_candles
+
+    def _create_candle(self, open_price: Decimal, high_price: Decimal, low_price: Decimal) -> Candle:
+        return Candle(
+            self._market_name,
+            self._pair,
+            self._minute_start,
+            open_price,
+            high_price,
+            low_price,
+            self._last_price,
+            MINUTE_CANDLE_SIZE
+        )
@@ -1,8 +1,9 @@
 import datetime
 from decimal import Decimal
 
-from coinrat.domain.candle import Candle
-from coinrat.domain.pair import Pair
+from coinrat.domain.candle import Candle, create_trusted_candle, CandleSize, CANDLE_SIZE_UNIT_HOUR, serialize_candle, serialize_candles, \
+    deserialize_candle, deserialize_candles
+from coinrat.domain.pair import Pair, deserialize_pair
 
 DUMMY_DATE = datetime.datetime(2017, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
 
@@ -49,3 +50,46 @@ def test_candle_wicks():
     candle = Candle('', Pair('USD', 'BTC'), DUMMY_DATE, Decimal('8000'), Decimal('8000'), Decimal('8000'), Decimal('8000'))
     assert candle.has_upper_wick() is False
     assert candle.has_lower_wick() is False
+
+
+def test_bulk_serialization_is_the_same_as_single():
+    pair = Pair('USD', 'BTC')
+    hour = CandleSize(CANDLE_SIZE_UNIT_HOUR, 1)
+    candles = [
+        Candle('bittrex', pair, DUMMY_DATE, Decimal('1000.1'), Decimal('2000'), Decimal('9'), Decimal('1500.1234567')),
+        Candle('bittrex', pair, DUMMY_DATE, Decimal('1'), Decimal('2'), Decimal('0.5'), Decimal('1.5'), hour),
+        Candle('bittrex', Pair('USD', 'ETH'), DUMMY_DATE, Decimal('1'), Decimal('2'), Decimal('0.5'), Decimal('1.5')),
+    ]
+
+    serialized = serialize_candles(candles)
+    assert [serialize_candle(candle) for candle in candles] == serialized
+    assert '1500.12345670' == serialized[0]['close']
+
+    serialized[0]['time'] = '2017-01-01T00:00:00Z'
+    del serialized[2]['size']
+    expected = [serialize_candle(deserialize_candle(row)) for row in serialized]
+    assert expected == serialize_candles(deserialize_candles(serialized))
+    assert '1-minute' == expected[2]['size']
+
+
+def test_trusted_candles_are_the_same_as_validated():
+    candle = Candle('bittrex', Pair('USD', 'BTC'), DUMMY_DATE, Decimal('1'), Decimal('2'), Decimal('0.5'), Decimal('1'))
+    trusted_candle = create_trusted_candle(
+        'bittrex',
+        Pair('USD', 'BTC'),
+        DUMMY_DATE,
+        Decimal('1'),
+        Decimal('2'),
+        Decimal('0.5'),
+        Decimal('1'),
+        CandleSize(CANDLE_SIZE_UNIT_HOUR, 1)
+    )
+    assert not hasattr(trusted_candle, '__dict__')
+    assert serialize_candle(candle)['close'] == serialize_candle(trusted_candle)['close']
+    assert '1-hour' == serialize_candle(trusted_candle)['size']
+
+    serialized = serialize_candles([candle, candle])
+    trusted_candles = deserialize_candles(serialized, is_trusted=True)
+    assert serialized == serialize_candles(trusted_candles)
+    assert trusted_candles[0].open is trusted_candles[1].close
+    assert trusted_candles[0].pair is deserialize_pair('USD_BTC')
@@ -0,0 +1,41 @@
+import datetime
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle.candle_coverage import calculate_candle_coverage
+from coinrat.domain.pair import Pair
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+START = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def create_time(minute: int) -> datetime.datetime:
+    return START + datetime.timedelta(minutes=minute)
+
+
+def test_candle_coverage_finds_gaps_on_edges_and_inside_of_interval():
+    candle_times = [create_time(minute) for minute in [-1, 2, 3, 3, 7, 8, 10]]
+    interval = DateTimeInterval(START, create_time(10))
+    coverage = calculate_candle_coverage('bittrex', BTC_USD_PAIR, interval, candle_times)
+
+    assert [(gap.since, gap.till) for gap in coverage.gaps] == [
+        (create_time(0), create_time(2)),
+        (create_time(4), create_time(7)),
+        (create_time(9), create_time(10)),
+    ]
+    assert coverage.number_of_expected_candles == 10
+    assert coverage.number_of_missing_candles == 6
+    assert coverage.ratio == 0.4
+    assert str(coverage) == 'bittrex USD_BTC [2018-01-01T00:00:00+00:00, 2018-01-01T00:10:00+00:00]: ' \
+                            + '40.00% of 10 minute candles present, 6 missing in 3 gaps'
+
+
+def test_candle_coverage_of_complete_and_empty_data():
+    interval = DateTimeInterval(START, create_time(3))
+
+    complete = calculate_candle_coverage('bittrex', BTC_USD_PAIR, interval, [create_time(m) for m in range(0, 3)])
+    assert complete.gaps == []
+    assert complete.ratio == 1.0
+
+    empty = calculate_candle_coverage('bittrex', BTC_USD_PAIR, interval, [])
+    assert [gap.number_of_missing_candles for gap in empty.gaps] == [3]
+    assert empty.ratio == 0.0
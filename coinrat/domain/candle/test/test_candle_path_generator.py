@@ -0,0 +1,62 @@
+import datetime
+from decimal import Decimal
+
+import numpy
+import pytest
+
+from coinrat.domain.candle import Candle
+from coinrat.domain.candle.candle_path_generator import CandlePathGenerator, create_candles_from_path, \
+    PATH_METHOD_BLOCK_BOOTSTRAP, PATH_METHOD_NOISE
+from coinrat.domain.pair import Pair
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+
+CANDLES = [
+    Candle(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        datetime.datetime(2017, 7, 2, 0, minute, 0, tzinfo=datetime.timezone.utc),
+        Decimal(8000 + 10 * minute),
+        Decimal(8030 + 10 * minute),
+        Decimal(7990 + 10 * minute),
+        Decimal(8010 + 10 * minute)
+    )
+    for minute in range(30)
+]
+
+
+@pytest.mark.parametrize('method', [PATH_METHOD_BLOCK_BOOTSTRAP, PATH_METHOD_NOISE])
+def test_generate(method: str):
+    generator = CandlePathGenerator(CANDLES)
+    paths = generator.generate(20, method, 7, 0.5, numpy.random.RandomState(42))
+
+    assert (20, 30, 4) == paths.shape
+    assert numpy.all(paths[:, :, 1] >= paths[:, :, [0, 3]].max(axis=2))
+    assert numpy.all(paths[:, :, 2] <= paths[:, :, [0, 3]].min(axis=2))
+
+    same_paths = generator.generate(20, method, 7, 0.5, numpy.random.RandomState(42))
+    assert numpy.allclose(paths, same_paths)
+
+
+def test_block_bootstrap_with_whole_history_block_reproduces_history():
+    paths = CandlePathGenerator(CANDLES).generate(3, PATH_METHOD_BLOCK_BOOTSTRAP, len(CANDLES))
+
+    for path in paths:
+        assert numpy.allclose([float(candle.close) for candle in CANDLES], path[:, 3])
+        assert numpy.allclose([float(candle.high) for candle in CANDLES], path[:, 1])
+
+
+def test_start_price():
+    paths = CandlePathGenerator(CANDLES, 4000).generate(1, PATH_METHOD_BLOCK_BOOTSTRAP, len(CANDLES))
+    assert pytest.approx(4000 * 8010 / 8000) == paths[0, 0, 3]
+
+
+def test_create_candles_from_path():
+    path = CandlePathGenerator(CANDLES).generate(1, PATH_METHOD_NOISE, noise=1.0)[0]
+    candles = create_candles_from_path(CANDLES, path)
+
+    assert 30 == len(candles)
+    assert CANDLES[5].time == candles[5].time
+    assert DUMMY_MARKET == candles[5].market_name
+    assert isinstance(candles[5].close, Decimal)
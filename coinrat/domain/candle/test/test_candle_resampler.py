@@ -0,0 +1,100 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from coinrat.domain.candle import Candle, CandleResampler, CandleSize, get_candle_bucket_start, \
+    CANDLE_SIZE_UNIT_MINUTE, CANDLE_SIZE_UNIT_HOUR, CANDLE_SIZE_UNIT_DAY
+from coinrat.domain.pair import Pair
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_DATE = datetime.datetime(2017, 7, 2, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def create_candle(minute: int, open_price: str, high: str, low: str, close: str) -> Candle:
+    return Candle(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        DUMMY_DATE + datetime.timedelta(minutes=minute),
+        Decimal(open_price),
+        Decimal(high),
+        Decimal(low),
+        Decimal(close)
+    )
+
+
+@pytest.mark.parametrize('expected_bucket_start, candle_size, time', [
+    (
+        datetime.datetime(2017, 7, 2, 10, 15, 0, tzinfo=datetime.timezone.utc),
+        CandleSize(CANDLE_SIZE_UNIT_MINUTE, 15),
+        datetime.datetime(2017, 7, 2, 10, 29, 59, tzinfo=datetime.timezone.utc),
+    ),
+    (
+        datetime.datetime(2017, 7, 2, 8, 0, 0, tzinfo=datetime.timezone.utc),
+        CandleSize(CANDLE_SIZE_UNIT_HOUR, 4),
+        datetime.datetime(2017, 7, 2, 10, 29, 0, tzinfo=datetime.timezone.utc),
+    ),
+    (
+        datetime.datetime(2017, 7, 2, 0, 0, 0, tzinfo=datetime.timezone.utc),
+        CandleSize(CANDLE_SIZE_UNIT_DAY, 1),
+        datetime.datetime(2017, 7, 2, 23, 59, 0, tzinfo=datetime.timezone.utc),
+    ),
+])
+def test_get_candle_bucket_start(
+    expected_bucket_start: datetime.datetime,
+    candle_size: CandleSize,
+    time: datetime.datetime
+):
+    assert expected_bucket_start == get_candle_bucket_start(candle_size, time)
+
+
+def test_resampler():
+    resampler = CandleResampler(CandleSize(CANDLE_SIZE_UNIT_MINUTE, 3))
+    assert resampler.current_candle is None
+
+    assert [] == resampler.add_candles([
+        create_candle(0, '10', '12', '9', '11'),
+        create_candle(1, '11', '15', '10', '14'),
+    ])
+    current_candle = resampler.current_candle
+    assert DUMMY_DATE == current_candle.time
+    assert 3 == current_candle.candle_size.size
+    assert (Decimal('10'), Decimal('15'), Decimal('9'), Decimal('14')) == \
+        (current_candle.open, current_candle.high, current_candle.low, current_candle.close)
+
+    finished_candles = resampler.add_candles([
+        create_candle(2, '14', '14', '5', '6'),
+        create_candle(3, '6', '7', '6', '7'),
+    ])
+    assert 1 == len(finished_candles)
+    assert (Decimal('10'), Decimal('15'), Decimal('5'), Decimal('6')) == \
+        (finished_candles[0].open, finished_candles[0].high, finished_candles[0].low, finished_candles[0].close)
+    assert DUMMY_DATE + datetime.timedelta(minutes=3) == resampler.current_candle.time
+    assert DUMMY_DATE + datetime.timedelta(minutes=3) == resampler.last_candle_time
+
+
+def test_resampler_replaces_last_candle_and_ignores_older_ones():
+    resampler = CandleResampler(CandleSize(CANDLE_SIZE_UNIT_MINUTE, 5))
+    resampler.add_candles([
+        create_candle(0, '10', '12', '9', '11'),
+        create_candle(1, '11', '30', '1', '14'),
+        create_candle(1, '11', '13', '10', '12'),
+        create_candle(0, '10', '100', '1', '11'),
+    ])
+
+    current_candle = resampler.current_candle
+    assert Decimal('13') == current_candle.high
+    assert Decimal('9') == current_candle.low
+    assert Decimal('12') == current_candle.close
+
+
+def test_resampler_skips_buckets_without_candles():
+    resampler = CandleResampler(CandleSize(CANDLE_SIZE_UNIT_MINUTE, 2))
+    finished_candles = resampler.add_candles([
+        create_candle(0, '10', '12', '9', '11'),
+        create_candle(7, '11', '13', '10', '12'),
+    ])
+
+    assert [DUMMY_DATE] == [candle.time for candle in finished_candles]
+    assert DUMMY_DATE + datetime.timedelta(minutes=6) == resampler.current_candle.time
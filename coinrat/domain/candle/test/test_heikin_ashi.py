@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+
+import numpy
+import pytest
+
+from coinrat.domain.candle import Candle, serialize_candles
+from coinrat.domain.candle.heikin_ashi import calculate_heikin_ashi, calculate_heikin_ashi_for_candles, \
+    serialize_candles_as_heikin_ashi
+from coinrat.domain.pair import Pair
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_DATE = datetime.datetime(2017, 7, 2, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def calculate_heikin_ashi_recursively(open_prices, high_prices, low_prices, close_prices):
+    ha_open, ha_high, ha_low, ha_close = [], [], [], []
+    for i in range(len(open_prices)):
+        ha_close.append((open_prices[i] + high_prices[i] + low_prices[i] + close_prices[i]) / 4)
+        if i == 0:
+            ha_open.append((open_prices[i] + close_prices[i]) / 2)
+        else:
+            ha_open.append((ha_open[i - 1] + ha_close[i - 1]) / 2)
+        ha_high.append(max(high_prices[i], ha_open[i], ha_close[i]))
+        ha_low.append(min(low_prices[i], ha_open[i], ha_close[i]))
+
+    return ha_open, ha_high, ha_low, ha_close
+
+
+@pytest.mark.parametrize('number_of_candles', [0, 1, 2, 64, 65, 500])
+def test_calculate_heikin_ashi(number_of_candles: int):
+    random_state = numpy.random.RandomState(42)
+    close_prices = 8000 * numpy.exp(numpy.cumsum(random_state.normal(0, 0.01, number_of_candles)))
+    open_prices = close_prices * (1 + random_state.normal(0, 0.005, number_of_candles))
+    high_prices = numpy.maximum(open_prices, close_prices) * 1.01
+    low_prices = numpy.minimum(open_prices, close_prices) * 0.99
+
+    expected = calculate_heikin_ashi_recursively(open_prices, high_prices, low_prices, close_prices)
+    result = calculate_heikin_ashi(open_prices, high_prices, low_prices, close_prices)
+
+    for expected_values, values in zip(expected, result):
+        assert number_of_candles == len(values)
+        assert numpy.allclose(expected_values, values, rtol=1e-12)
+
+
+def test_serialize_candles_as_heikin_ashi():
+    candles = [
+        Candle(
+            DUMMY_MARKET,
+            BTC_USD_PAIR,
+            DUMMY_DATE,
+            Decimal('2000'),
+            Decimal('4500'),
+            Decimal('1000'),
+            Decimal('3000')
+        ),
+        Candle(
+            DUMMY_MARKET,
+            BTC_USD_PAIR,
+            DUMMY_DATE + datetime.timedelta(minutes=1),
+            Decimal('3000'),
+            Decimal('3100'),
+            Decimal('2900'),
+            Decimal('2950')
+        ),
+    ]
+    serialized = serialize_candles_as_heikin_ashi(candles)
+
+    assert serialize_candles(candles)[1]['time'] == serialized[1]['time']
+    assert '2500.00000000' == serialized[0]['open']
+    assert '2625.00000000' == serialized[0]['close']
+    assert '2562.50000000' == serialized[1]['open']
+    assert '3100.00000000' == serialized[1]['high']
+    assert '2562.50000000' == serialized[1]['low']
+    assert '2987.50000000' == serialized[1]['close']
+    assert [] == serialize_candles_as_heikin_ashi([])
+
+
+def test_calculate_heikin_ashi_for_no_candles():
+    for values in calculate_heikin_ashi_for_candles([]):
+        assert 0 == len(values)
@@ -0,0 +1,60 @@
+import datetime
+from decimal import Decimal
+
+from coinrat.domain.candle.minute_candle_builder import MinuteCandleBuilder
+from coinrat.domain.pair import Pair
+from coinrat.domain.trade import Trade
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+START = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def create_time(minute: int, second: int = 0) -> datetime.datetime:
+    return START + datetime.timedelta(minutes=minute, seconds=second)
+
+
+def create_trade(minute: int, second: int, price: str) -> Trade:
+    return Trade('bittrex', BTC_USD_PAIR, create_time(minute, second), Decimal(price), Decimal('0.1'))
+
+
+def get_prices(candle):
+    return candle.time, candle.open, candle.high, candle.low, candle.close
+
+
+def test_trades_are_aggregated_into_minute_candles():
+    builder = MinuteCandleBuilder('bittrex', BTC_USD_PAIR)
+    assert builder.current_candle is None
+    assert builder.close_minutes_until(create_time(5)) == []
+
+    assert builder.add_trade(create_trade(0, 10, '100')) == []
+    assert builder.add_trade(create_trade(0, 20, '120')) == []
+    assert builder.add_trade(create_trade(0, 30, '90')) == []
+    assert get_prices(builder.current_candle) == (create_time(0), 100, 120, 90, 90)
+    assert builder.add_trade(create_trade(0, 40, '110')) == []
+
+    finished_candles = builder.add_trade(create_trade(1, 5, '111'))
+    assert [get_prices(candle) for candle in finished_candles] == [(create_time(0), 100, 120, 90, 110)]
+    assert finished_candles[0].market_name == 'bittrex'
+    assert get_prices(builder.current_candle) == (create_time(1), 111, 111, 111, 111)
+
+    # Late trade of finished minute
+    assert builder.add_trade(create_trade(0, 50, '1000')) == []
+    assert get_prices(builder.current_candle) == (create_time(1), 111, 111, 111, 111)
+
+
+def test_minutes_without_trades_are_closed_by_heartbeat_with_flat_candles():
+    builder = MinuteCandleBuilder('bittrex', BTC_USD_PAIR)
+    builder.add_trade(create_trade(0, 10, '100'))
+    builder.add_trade(create_trade(0, 50, '105'))
+
+    assert builder.close_minutes_until(create_time(0, 59)) == []
+    assert [get_prices(candle) for candle in builder.close_minutes_until(create_time(3))] == [
+        (create_time(0), 100, 105, 100, 105),
+        (create_time(1), 105, 105, 105, 105),
+        (create_time(2), 105, 105, 105, 105),
+    ]
+    assert get_prices(builder.current_candle) == (create_time(3), 105, 105, 105, 105)
+
+    finished_candles = builder.add_trade(create_trade(4, 30, '107'))
+    assert [get_prices(candle) for candle in finished_candles] == [(create_time(3), 105, 105, 105, 105)]
+    assert get_prices(builder.current_candle) == (create_time(4), 107, 107, 107, 107)
@@ -1,10 +1,13 @@
 from .configuration_structure import CONFIGURATION_STRUCTURE_TYPE_DECIMAL, CONFIGURATION_STRUCTURE_TYPE_INT, \
     CONFIGURATION_STRUCTURE_TYPE_STRING, format_data_to_python_types, CONFIGURATION_STRUCTURE_TYPE_CANDLE_SIZE
+from .configuration_search_space import create_configuration_search_space, iterate_configurations
 
 __all__ = [
     'CONFIGURATION_STRUCTURE_TYPE_DECIMAL',
     'CONFIGURATION_STRUCTURE_TYPE_INT',
     'CONFIGURATION_STRUCTURE_TYPE_STRING',
     'CONFIGURATION_STRUCTURE_TYPE_CANDLE_SIZE',
-    'format_data_to_python_types'
+    'format_data_to_python_types',
+    'create_configuration_search_space',
+    'iterate_configurations',
 ]
@@ -0,0 +1,57 @@
+import itertools
+from decimal import Decimal
+from typing import Dict, List
+
+from .configuration_structure import CONFIGURATION_STRUCTURE_TYPE_INT, CONFIGURATION_STRUCTURE_TYPE_DECIMAL, \
+    CONFIGURATION_STRUCTURE_TYPE_CANDLE_SIZE
+
+DEFAULT_SEARCH_FACTORS = ['0.25', '0.5', '1', '2', '4']
+DEFAULT_SEARCH_CANDLE_SIZES = ['5-minute', '15-minute', '30-minute', '1-hour', '4-hour', '12-hour', '1-day']
+
+
+def create_configuration_search_space(
+    configuration_structure: Dict[str, Dict[str, str]],
+    factors: List[str] = DEFAULT_SEARCH_FACTORS,
+    candle_sizes: List[str] = DEFAULT_SEARCH_CANDLE_SIZES
+) -> Dict[str, List[str]]:
+    """
+    Derives candidate values for every configuration field from its default value:
+        * numeric fields (int, Decimal) are multiplied by each of the factors,
+        * candle-size fields get all the candle sizes,
+        * other fields (and hidden ones) keep only their default value.
+
+    Values are strings, the same as in configuration JSON files.
+    """
+    space: Dict[str, List[str]] = {}
+
+    for key, structure in configuration_structure.items():
+        default = structure['default']
+        field_type = structure['type'].lstrip('?')
+
+        if structure.get('hidden') is True or default is None:
+            space[key] = [default]
+
+        elif field_type == CONFIGURATION_STRUCTURE_TYPE_INT:
+            values = [int(Decimal(default) * Decimal(factor)) for factor in factors]
+            space[key] = _unique([str(value) for value in values if value > 0])
+
+        elif field_type == CONFIGURATION_STRUCTURE_TYPE_DECIMAL:
+            space[key] = _unique([str(Decimal(default) * Decimal(factor)) for factor in factors])
+
+        elif field_type == CONFIGURATION_STRUCTURE_TYPE_CANDLE_SIZE:
+            space[key] = _unique([default] + candle_sizes)
+
+        else:
+            space[key] = [default]
+
+    return space
+
+
+def iterate_configurations(search_space: Dict[str, List[str]]) -> List[Dict[str, str]]:
+    """Cartesian product of all values in the search space."""
+    keys = sorted(search_space.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*[search_space[key] for key in keys])]
+
+
+def _unique(values: List[str]) -> List[str]:
+    return list(dict.fromkeys(values))
@@ -0,0 +1,31 @@
+from coinrat.domain.configuration_structure import create_configuration_search_space, iterate_configurations
+
+
+def test_create_configuration_search_space():
+    space = create_configuration_search_space({
+        'long_average_interval': {'type': 'int', 'default': '3600', 'title': 'Long-term'},
+        'buy_amount': {'type': 'Decimal', 'default': '0.5', 'title': 'Amount'},
+        'candle_size': {'type': 'candle_size', 'default': '1-minute', 'title': 'Candle size'},
+        'strategy_name': {'type': 'string', 'default': 'foo', 'title': 'Name'},
+        'secret': {'type': 'int', 'default': '10', 'title': 'Secret', 'hidden': True},
+        'nullable': {'type': '?int', 'default': None, 'title': 'Nullable'},
+    }, ['0.5', '1', '2'], ['5-minute', '1-hour'])
+
+    assert ['1800', '3600', '7200'] == space['long_average_interval']
+    assert ['0.25', '0.5', '1.0'] == space['buy_amount']
+    assert ['1-minute', '5-minute', '1-hour'] == space['candle_size']
+    assert ['foo'] == space['strategy_name']
+    assert ['10'] == space['secret']
+    assert [None] == space['nullable']
+
+
+def test_create_configuration_search_space_skips_non_positive_ints():
+    space = create_configuration_search_space({'delay': {'type': 'int', 'default': '1', 'title': 'Delay'}})
+    assert ['1', '2', '4'] == space['delay']
+
+
+def test_iterate_configurations():
+    configurations = iterate_configurations({'b': ['1', '2'], 'a': ['x', 'y', 'z']})
+    assert 6 == len(configurations)
+    assert {'a': 'x', 'b': '1'} == configurations[0]
+    assert {'a': 'z', 'b': '2'} == configurations[-1]
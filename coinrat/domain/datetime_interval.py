@@ -1,7 +1,8 @@
 import datetime
-import dateutil.parser
 from typing import Union, Dict
 
+from .datetime_parser import parse_utc_datetime
+
 
 class DateTimeInterval:
     def __init__(
@@ -54,8 +55,8 @@ def deserialize_datetime_interval(data: Dict[str, str]) -> DateTimeInterval:
     till = data['till']
 
     return DateTimeInterval(
-        dateutil.parser.parse(since).replace(tzinfo=datetime.timezone.utc) if since is not None else None,
-        dateutil.parser.parse(till).replace(tzinfo=datetime.timezone.utc) if till is not None else None
+        parse_utc_datetime(since) if since is not None else None,
+        parse_utc_datetime(till) if till is not None else None
     )
 
 
@@ -0,0 +1,13 @@
+from .indicator import Indicator, IndicatorValue, exponential_smoothing, get_prices_of_candles
+from .moving_average import SimpleMovingAverage, ExponentialMovingAverage
+from .relative_strength_index import RelativeStrengthIndex
+from .bollinger_bands import BollingerBands
+from .average_true_range import AverageTrueRange
+
+__all__ = [
+    'Indicator', 'IndicatorValue', 'exponential_smoothing', 'get_prices_of_candles',
+    'SimpleMovingAverage', 'ExponentialMovingAverage',
+    'RelativeStrengthIndex',
+    'BollingerBands',
+    'AverageTrueRange',
+]
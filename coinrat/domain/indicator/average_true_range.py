@@ -0,0 +1,78 @@
+from typing import Union
+
+import numpy
+
+from coinrat.domain.candle import Candle
+from .indicator import Indicator, exponential_smoothing
+
+HIGH_INDEX = 1
+LOW_INDEX = 2
+CLOSE_INDEX = 3
+
+
+class AverageTrueRange(Indicator):
+    """
+    Wilder's ATR. True range is the biggest of HIGH - LOW, |HIGH - previous CLOSE| and |LOW - previous CLOSE|,
+    the first ATR is simple average of first period true ranges and then smoothed by factor 1 / period.
+
+    @link https://en.wikipedia.org/wiki/Average_true_range
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        assert period > 0, 'Period must be positive.'
+
+        self._period = period
+        super().__init__()
+
+    @property
+    def key(self) -> str:
+        return 'atr({})'.format(self._period)
+
+    @property
+    def warm_up_period(self) -> int:
+        return 4 * self._period
+
+    @property
+    def value(self) -> Union[float, None]:
+        return self._value
+
+    def reset(self) -> None:
+        self._previous_close: Union[float, None] = None
+        self._count = 0
+        self._sum = 0.0
+        self._value: Union[float, None] = None
+
+    def update(self, candle: Candle) -> None:
+        high, low = float(candle.high), float(candle.low)
+
+        true_range = high - low
+        if self._previous_close is not None:
+            true_range = max(true_range, abs(high - self._previous_close), abs(low - self._previous_close))
+
+        self._previous_close = float(candle.close)
+        self._count += 1
+
+        if self._value is not None:
+            self._value = (self._value * (self._period - 1) + true_range) / self._period
+            return
+
+        self._sum += true_range
+        if self._count == self._period:
+            self._value = self._sum / self._period
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        result = numpy.full(len(prices), numpy.nan)
+        if len(prices) < self._period:
+            return result
+
+        high, low, close = prices[:, HIGH_INDEX], prices[:, LOW_INDEX], prices[:, CLOSE_INDEX]
+        true_ranges = high - low
+        true_ranges[1:] = numpy.maximum(
+            true_ranges[1:],
+            numpy.maximum(numpy.abs(high[1:] - close[:-1]), numpy.abs(low[1:] - close[:-1]))
+        )
+
+        initial = float(numpy.mean(true_ranges[:self._period]))
+        result[self._period - 1:] = exponential_smoothing(true_ranges[self._period - 1:], 1 / self._period, initial)
+
+        return result
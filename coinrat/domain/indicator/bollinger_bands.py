@@ -0,0 +1,86 @@
+import collections
+from typing import Deque, Tuple, Union
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+from coinrat.domain.candle import Candle, CANDLE_STORAGE_FIELD_CLOSE
+from .indicator import Indicator, PRICE_FIELDS, get_price
+
+
+class BollingerBands(Indicator):
+    """
+    Value is (LOWER, MIDDLE, UPPER) band. Middle band is simple moving average, the other two are shifted
+    by multiple of (population) standard deviation of the same window.
+
+    Incremental variance uses Welford's algorithm (adding and removing value from the window), so it does not
+    suffer from cancellation as sum of squares would for prices far from zero.
+    """
+
+    def __init__(self, period: int = 20, width: float = 2.0, field: str = CANDLE_STORAGE_FIELD_CLOSE) -> None:
+        assert period > 0, 'Period must be positive.'
+        assert field in PRICE_FIELDS, 'Unknown field: "{}"'.format(field)
+
+        self._period = period
+        self._width = width
+        self._field = field
+        super().__init__()
+
+    @property
+    def key(self) -> str:
+        return 'bollinger({},{},{})'.format(self._period, self._width, self._field)
+
+    @property
+    def warm_up_period(self) -> int:
+        return self._period
+
+    @property
+    def value(self) -> Union[Tuple[float, float, float], None]:
+        if len(self._window) < self._period:
+            return None
+
+        deviation = self._width * (max(self._squared_distances, 0.0) / self._period) ** 0.5
+        return self._mean - deviation, self._mean, self._mean + deviation
+
+    def reset(self) -> None:
+        self._window: Deque[float] = collections.deque()
+        self._mean = 0.0
+        self._squared_distances = 0.0
+
+    def update(self, candle: Candle) -> None:
+        price = get_price(candle, self._field)
+
+        if len(self._window) == self._period:
+            self._remove(self._window.popleft())
+
+        self._window.append(price)
+        delta = price - self._mean
+        self._mean += delta / len(self._window)
+        self._squared_distances += delta * (price - self._mean)
+
+    def _remove(self, price: float) -> None:
+        if len(self._window) == 0:
+            self._mean = 0.0
+            self._squared_distances = 0.0
+            return
+
+        delta = price - self._mean
+        self._mean -= delta / len(self._window)
+        self._squared_distances -= delta * (price - self._mean)
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        values = numpy.ascontiguousarray(prices[:, PRICE_FIELDS.index(self._field)])
+        result = numpy.full((len(values), 3), numpy.nan)
+
+        if len(values) >= self._period:
+            windows = as_strided(
+                values,
+                shape=(len(values) - self._period + 1, self._period),
+                strides=(values.strides[0], values.strides[0]),
+                writeable=False
+            )
+            mean = windows.mean(axis=1)
+            deviation = self._width * windows.std(axis=1)
+            result[self._period - 1:] = numpy.column_stack((mean - deviation, mean, mean + deviation))
+
+        return result
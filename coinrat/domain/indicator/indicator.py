@@ -0,0 +1,95 @@
+import math
+from typing import List, Union, Tuple
+
+import numpy
+
+from coinrat.domain.candle import Candle, CANDLE_STORAGE_FIELD_OPEN, CANDLE_STORAGE_FIELD_HIGH, \
+    CANDLE_STORAGE_FIELD_LOW, CANDLE_STORAGE_FIELD_CLOSE
+
+PRICE_FIELDS = [
+    CANDLE_STORAGE_FIELD_OPEN,
+    CANDLE_STORAGE_FIELD_HIGH,
+    CANDLE_STORAGE_FIELD_LOW,
+    CANDLE_STORAGE_FIELD_CLOSE,
+]
+
+IndicatorValue = Union[float, Tuple[float, ...], None]
+
+
+class Indicator:
+    """
+    Technical indicator that can be computed in two ways:
+        * incrementally - update() with every new (finished) candle is O(1), result is in value,
+        * in batch - calculate() over whole price arrays at once (numpy), NaN where indicator is not ready yet.
+
+    Both ways give the same numbers. Prices and values are floats, indicators are for signals, not for money.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    @property
+    def key(self) -> str:
+        """Identifies indicator with its parameters."""
+        raise NotImplementedError()
+
+    @property
+    def warm_up_period(self) -> int:
+        """Number of candles needed before value is ready (and reliable)."""
+        raise NotImplementedError()
+
+    @property
+    def value(self) -> IndicatorValue:
+        raise NotImplementedError()
+
+    def reset(self) -> None:
+        raise NotImplementedError()
+
+    def update(self, candle: Candle) -> None:
+        raise NotImplementedError()
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        """Prices have shape (number of candles, 4), columns are OPEN, HIGH, LOW, CLOSE."""
+        raise NotImplementedError()
+
+    def calculate_for_candles(self, candles: List[Candle]) -> numpy.ndarray:
+        return self.calculate(get_prices_of_candles(candles))
+
+
+def get_prices_of_candles(candles: List[Candle]) -> numpy.ndarray:
+    return numpy.array(
+        [[candle.open, candle.high, candle.low, candle.close] for candle in candles],
+        dtype=numpy.float64
+    ).reshape(-1, 4)
+
+
+def get_price(candle: Candle, field: str) -> float:
+    return float(getattr(candle, field))
+
+
+def exponential_smoothing(values: numpy.ndarray, alpha: float, initial: float) -> numpy.ndarray:
+    """
+    Vectorized: result[0] = initial, result[i] = (1 - alpha) * result[i - 1] + alpha * values[i].
+
+    Inside of a block, the recursion is unrolled into cumulative sum of values scaled by (1 - alpha)^-i. Blocks
+    are short enough for the scale not to exceed e^30, so precision is kept for any alpha.
+    """
+    result = numpy.empty(len(values))
+    if len(values) == 0:
+        return result
+
+    result[0] = initial
+    decay = 1 - alpha
+    if decay <= 0:
+        result[1:] = values[1:]
+        return result
+
+    block_size = max(1, int(30 / -math.log(decay)))
+    previous = initial
+    for start in range(1, len(values), block_size):
+        block = values[start:start + block_size]
+        powers = decay ** numpy.arange(1, len(block) + 1)
+        result[start:start + len(block)] = powers * (previous + alpha * numpy.cumsum(block / powers))
+        previous = result[start + len(block) - 1]
+
+    return result
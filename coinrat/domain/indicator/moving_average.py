@@ -0,0 +1,106 @@
+import collections
+from typing import Deque, Union
+
+import numpy
+
+from coinrat.domain.candle import Candle, CANDLE_STORAGE_FIELD_CLOSE
+from .indicator import Indicator, PRICE_FIELDS, get_price, exponential_smoothing
+
+
+class SimpleMovingAverage(Indicator):
+    def __init__(self, period: int, field: str = CANDLE_STORAGE_FIELD_CLOSE) -> None:
+        assert period > 0, 'Period must be positive.'
+        assert field in PRICE_FIELDS, 'Unknown field: "{}"'.format(field)
+
+        self._period = period
+        self._field = field
+        super().__init__()
+
+    @property
+    def key(self) -> str:
+        return 'sma({},{})'.format(self._period, self._field)
+
+    @property
+    def warm_up_period(self) -> int:
+        return self._period
+
+    @property
+    def value(self) -> Union[float, None]:
+        if len(self._window) < self._period:
+            return None
+
+        return self._sum / self._period
+
+    def reset(self) -> None:
+        self._window: Deque[float] = collections.deque()
+        self._sum = 0.0
+
+    def update(self, candle: Candle) -> None:
+        price = get_price(candle, self._field)
+        self._window.append(price)
+        self._sum += price
+
+        if len(self._window) > self._period:
+            self._sum -= self._window.popleft()
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        values = prices[:, PRICE_FIELDS.index(self._field)]
+        result = numpy.full(len(values), numpy.nan)
+
+        if len(values) >= self._period:
+            cumulative_sum = numpy.concatenate(([0.0], numpy.cumsum(values)))
+            result[self._period - 1:] = (cumulative_sum[self._period:] - cumulative_sum[:-self._period]) / self._period
+
+        return result
+
+
+class ExponentialMovingAverage(Indicator):
+    """Smoothing factor is 2 / (period + 1), first value is simple moving average of the first period candles."""
+
+    def __init__(self, period: int, field: str = CANDLE_STORAGE_FIELD_CLOSE) -> None:
+        assert period > 0, 'Period must be positive.'
+        assert field in PRICE_FIELDS, 'Unknown field: "{}"'.format(field)
+
+        self._period = period
+        self._field = field
+        self._alpha = 2 / (period + 1)
+        super().__init__()
+
+    @property
+    def key(self) -> str:
+        return 'ema({},{})'.format(self._period, self._field)
+
+    @property
+    def warm_up_period(self) -> int:
+        return 4 * self._period
+
+    @property
+    def value(self) -> Union[float, None]:
+        return self._value
+
+    def reset(self) -> None:
+        self._count = 0
+        self._sum = 0.0
+        self._value: Union[float, None] = None
+
+    def update(self, candle: Candle) -> None:
+        price = get_price(candle, self._field)
+        self._count += 1
+
+        if self._value is not None:
+            self._value = (1 - self._alpha) * self._value + self._alpha * price
+            return
+
+        self._sum += price
+        if self._count == self._period:
+            self._value = self._sum / self._period
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        values = prices[:, PRICE_FIELDS.index(self._field)]
+        result = numpy.full(len(values), numpy.nan)
+
+        if len(values) >= self._period:
+            initial = float(numpy.mean(values[:self._period]))
+            result[self._period - 1:] = exponential_smoothing(values[self._period - 1:], self._alpha, initial)
+
+        return result
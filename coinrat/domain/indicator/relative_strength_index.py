@@ -0,0 +1,101 @@
+from typing import Union
+
+import numpy
+
+from coinrat.domain.candle import Candle
+from .indicator import Indicator, exponential_smoothing
+
+CLOSE_INDEX = 3
+
+
+class RelativeStrengthIndex(Indicator):
+    """
+    Wilder's RSI of CLOSE prices, from 0 to 100. Average gain and loss start as simple averages of the first period
+    changes and are smoothed by factor 1 / period after that.
+
+    @link https://en.wikipedia.org/wiki/Relative_strength_index
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        assert period > 0, 'Period must be positive.'
+
+        self._period = period
+        super().__init__()
+
+    @property
+    def key(self) -> str:
+        return 'rsi({})'.format(self._period)
+
+    @property
+    def warm_up_period(self) -> int:
+        return 4 * self._period + 1
+
+    @property
+    def value(self) -> Union[float, None]:
+        if self._average_gain is None:
+            return None
+
+        return _calculate_rsi(self._average_gain, self._average_loss)
+
+    def reset(self) -> None:
+        self._previous_close: Union[float, None] = None
+        self._number_of_changes = 0
+        self._average_gain: Union[float, None] = None
+        self._average_loss: Union[float, None] = None
+        self._sum_of_gains = 0.0
+        self._sum_of_losses = 0.0
+
+    def update(self, candle: Candle) -> None:
+        close = float(candle.close)
+        if self._previous_close is None:
+            self._previous_close = close
+            return
+
+        change = close - self._previous_close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self._previous_close = close
+        self._number_of_changes += 1
+
+        if self._average_gain is not None:
+            self._average_gain = (self._average_gain * (self._period - 1) + gain) / self._period
+            self._average_loss = (self._average_loss * (self._period - 1) + loss) / self._period
+            return
+
+        self._sum_of_gains += gain
+        self._sum_of_losses += loss
+        if self._number_of_changes == self._period:
+            self._average_gain = self._sum_of_gains / self._period
+            self._average_loss = self._sum_of_losses / self._period
+
+    def calculate(self, prices: numpy.ndarray) -> numpy.ndarray:
+        result = numpy.full(len(prices), numpy.nan)
+        if len(prices) <= self._period:
+            return result
+
+        changes = numpy.diff(prices[:, CLOSE_INDEX])
+        gains, losses = numpy.maximum(changes, 0.0), numpy.maximum(-changes, 0.0)
+
+        alpha = 1 / self._period
+        average_gains = exponential_smoothing(
+            gains[self._period - 1:],
+            alpha,
+            float(numpy.mean(gains[:self._period]))
+        )
+        average_losses = exponential_smoothing(
+            losses[self._period - 1:],
+            alpha,
+            float(numpy.mean(losses[:self._period]))
+        )
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + average_gains / average_losses)
+        result[self._period:] = numpy.where(average_losses == 0, 100.0, rsi)
+
+        return result
+
+
+def _calculate_rsi(average_gain: float, average_loss: float) -> float:
+    if average_loss == 0:
+        return 100.0
+
+    return 100 - 100 / (1 + average_gain / average_loss)
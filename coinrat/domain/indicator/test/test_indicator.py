@@ -0,0 +1,112 @@
+import datetime
+from decimal import Decimal
+from typing import List
+
+import numpy
+import pytest
+
+from coinrat.domain.candle import Candle, CANDLE_STORAGE_FIELD_HIGH
+from coinrat.domain.indicator import Indicator, SimpleMovingAverage, ExponentialMovingAverage, \
+    RelativeStrengthIndex, BollingerBands, AverageTrueRange, exponential_smoothing, get_prices_of_candles
+from coinrat.domain.pair import Pair
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_DATE = datetime.datetime(2017, 7, 2, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def create_candles(number_of_candles: int) -> List[Candle]:
+    random_state = numpy.random.RandomState(42)
+    close_prices = 8000 * numpy.exp(numpy.cumsum(random_state.normal(0, 0.01, number_of_candles)))
+    open_prices = close_prices * (1 + random_state.normal(0, 0.005, number_of_candles))
+
+    return [
+        Candle(
+            DUMMY_MARKET,
+            BTC_USD_PAIR,
+            DUMMY_DATE + datetime.timedelta(minutes=minute),
+            Decimal('{0:.2f}'.format(open_price)),
+            Decimal('{0:.2f}'.format(max(open_price, close_price) * 1.01)),
+            Decimal('{0:.2f}'.format(min(open_price, close_price) * 0.99)),
+            Decimal('{0:.2f}'.format(close_price))
+        )
+        for minute, (open_price, close_price) in enumerate(zip(open_prices.tolist(), close_prices.tolist()))
+    ]
+
+
+@pytest.mark.parametrize('indicator', [
+    SimpleMovingAverage(1),
+    SimpleMovingAverage(20),
+    SimpleMovingAverage(20, CANDLE_STORAGE_FIELD_HIGH),
+    ExponentialMovingAverage(1),
+    ExponentialMovingAverage(12),
+    ExponentialMovingAverage(200),
+    RelativeStrengthIndex(14),
+    RelativeStrengthIndex(1),
+    BollingerBands(20, 2.0),
+    BollingerBands(1),
+    AverageTrueRange(14),
+    AverageTrueRange(1),
+])
+def test_incremental_and_batch_calculations_are_the_same(indicator: Indicator):
+    candles = create_candles(300)
+    batch_values = indicator.calculate_for_candles(candles)
+    assert len(candles) == len(batch_values)
+
+    for candle, batch_value in zip(candles, batch_values):
+        indicator.update(candle)
+        value = indicator.value
+
+        if numpy.all(numpy.isnan(batch_value)):
+            assert value is None
+        else:
+            assert numpy.allclose(numpy.array(value, dtype=numpy.float64), batch_value, rtol=1e-9)
+
+
+def test_simple_moving_average():
+    sma = SimpleMovingAverage(3)
+    values = sma.calculate(numpy.array([[0, 0, 0, price] for price in [1, 2, 3, 4, 5]], dtype=numpy.float64))
+    assert numpy.allclose([2, 3, 4], values[2:])
+    assert numpy.isnan(values[1])
+
+
+def test_relative_strength_index_without_losses():
+    rsi = RelativeStrengthIndex(2)
+    values = rsi.calculate(numpy.array([[0, 0, 0, price] for price in [1, 2, 3, 4]], dtype=numpy.float64))
+    assert numpy.allclose([100, 100], values[2:])
+
+
+def test_bollinger_bands():
+    values = BollingerBands(8, 2).calculate(
+        numpy.array([[0, 0, 0, price] for price in [2, 4, 4, 4, 5, 5, 7, 9]], dtype=numpy.float64)
+    )
+    assert numpy.allclose([1, 5, 9], values[-1])
+
+
+def test_exponential_smoothing():
+    values = numpy.arange(10000, dtype=numpy.float64)
+    expected = [5.0]
+    for value in values[1:]:
+        expected.append(0.99 * expected[-1] + 0.01 * value)
+
+    assert numpy.allclose(expected, exponential_smoothing(values, 0.01, 5.0), rtol=1e-12)
+    assert 0 == len(exponential_smoothing(numpy.array([]), 0.5, 1.0))
+
+
+def test_reset():
+    sma = SimpleMovingAverage(2)
+    for candle in create_candles(3):
+        sma.update(candle)
+    assert sma.value is not None
+
+    sma.reset()
+    assert sma.value is None
+
+
+def test_get_prices_of_candles():
+    candles = create_candles(2)
+    prices = get_prices_of_candles(candles)
+
+    assert (2, 4) == prices.shape
+    assert float(candles[1].low) == prices[1, 2]
+    assert (0, 4) == get_prices_of_candles([]).shape
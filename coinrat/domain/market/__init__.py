@@ -1,7 +1,11 @@
 from .market import Market, PairMarketInfo, MarketException
+from .ttl_cache import TtlCache, cached_with_ttl, invalidate_cached_method
 
 __all__ = [
     'Market',
     'PairMarketInfo',
     'MarketException',
+    'TtlCache',
+    'cached_with_ttl',
+    'invalidate_cached_method',
 ]
@@ -0,0 +1,101 @@
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List, Set
+
+from coinrat.domain import Balance
+from coinrat.domain.order import Order, OrderMarketInfo
+from coinrat.domain.pair import Pair
+from .market import Market, PairMarketInfo
+from .ttl_cache import TtlCache
+
+DEFAULT_BALANCE_CACHE_TTL = 5
+
+_BALANCES_CACHE_KEY = 'balances'
+
+
+class BalanceCachingMarket(Market):
+    """
+    Serves all balance reads (get_balance, get_balances, calculate_maximal_amount_to_buy/sell) from one
+    get_balances() call of the wrapped market. Cache is dropped after every place_order / cancel_order
+    (even failed, state of the account is unknown then), by invalidate_balances() (eg. on the start of every
+    tick) and after ttl seconds. Balances changed by another process (or by another strategy with its own
+    wrapper of the same market) are visible after the invalidation only.
+    """
+
+    def __init__(
+        self,
+        market: Market,
+        ttl: float = DEFAULT_BALANCE_CACHE_TTL,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._market = market
+        self._cache = TtlCache(ttl, monotonic_function)
+
+    @property
+    def name(self) -> str:
+        return self._market.name
+
+    @property
+    def numeric_backend(self) -> str:
+        return self._market.numeric_backend
+
+    @property
+    def transaction_taker_fee(self):
+        return self._market.transaction_taker_fee
+
+    @property
+    def transaction_maker_fee(self):
+        return self._market.transaction_maker_fee
+
+    def get_balance(self, currency: str) -> Balance:
+        balances = self._get_balances_by_currency()
+        if currency in balances:
+            return balances[currency]
+
+        # Markets do not have to list currencies without any balance
+        return self._market.get_balance(currency)
+
+    def get_balances(self) -> List[Balance]:
+        return list(self._get_balances_by_currency().values())
+
+    def get_current_price(self, pair: Pair) -> Decimal:
+        return self._market.get_current_price(pair)
+
+    def get_pair_market_info(self, pair: Pair) -> PairMarketInfo:
+        return self._market.get_pair_market_info(pair)
+
+    def place_order(self, order: Order) -> Order:
+        try:
+            return self._market.place_order(order)
+        finally:
+            self.invalidate_balances()
+
+    def get_order_status(self, order: Order) -> OrderMarketInfo:
+        return self._market.get_order_status(order)
+
+    def get_open_order_ids(self, pair: Pair) -> Set[str]:
+        return self._market.get_open_order_ids(pair)
+
+    def cancel_order(self, order_id: str) -> None:
+        try:
+            self._market.cancel_order(order_id)
+        finally:
+            self.invalidate_balances()
+
+    def get_all_tradable_pairs(self) -> List[Pair]:
+        return self._market.get_all_tradable_pairs()
+
+    def invalidate_balances(self) -> None:
+        self._cache.invalidate()
+
+    def _get_balances_by_currency(self) -> Dict[str, Balance]:
+        return self._cache.get(
+            _BALANCES_CACHE_KEY,
+            lambda: {balance.currency: balance for balance in self._market.get_balances()}
+        )
+
+
+def invalidate_balance_caches(markets: List[Market]) -> None:
+    for market in markets:
+        if isinstance(market, BalanceCachingMarket):
+            market.invalidate_balances()
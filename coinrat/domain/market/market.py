@@ -1,7 +1,8 @@
 from decimal import Decimal
-from typing import Union, Dict, List
+from typing import Union, Dict, List, Set
 
 from coinrat.domain import Balance
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL
 from coinrat.domain.order import Order, OrderMarketInfo
 from coinrat.domain.pair import Pair
 
@@ -36,6 +37,11 @@ class Market:
     def get_configuration_structure() -> Dict[str, Dict[str, str]]:
         raise NotImplementedError()
 
+    @property
+    def numeric_backend(self) -> str:
+        """Type of amounts and prices the market works with, only simulated markets can work with floats."""
+        return NUMERIC_BACKEND_DECIMAL
+
     @property
     def transaction_taker_fee(self):
         raise NotImplementedError()
@@ -62,6 +68,13 @@ class Market:
     def get_order_status(self, order: Order) -> OrderMarketInfo:
         raise NotImplementedError()
 
+    def get_open_order_ids(self, pair: Pair) -> Set[str]:
+        """
+        Ids (on the market) of all open orders of the pair, by one request (optional, markets which do not
+        support it are asked for status of every order, see: OrderFacade.reconcile_open_orders).
+        """
+        raise NotImplementedError()
+
     def cancel_order(self, order_id: str) -> None:
         raise NotImplementedError()
 
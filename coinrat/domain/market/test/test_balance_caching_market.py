@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from flexmock import flexmock
+
+from coinrat.domain import Balance
+from coinrat.domain.market.balance_caching_market import BalanceCachingMarket, invalidate_balance_caches
+from coinrat.domain.pair import Pair
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+
+
+def create_market_mock(number_of_balances_requests: int):
+    market = flexmock(name='bittrex')
+    market.should_receive('get_balances').and_return([
+        Balance('bittrex', 'USD', Decimal('1000')),
+        Balance('bittrex', 'BTC', Decimal('2')),
+    ]).times(number_of_balances_requests)
+    return market
+
+
+def test_balances_are_read_once_until_order_is_placed():
+    market = create_market_mock(2)
+    market.should_receive('get_balance').with_args('LTC').and_return(Balance('bittrex', 'LTC', Decimal('0'))).once()
+    market.should_receive('place_order').and_raise(ValueError).once()
+    caching_market = BalanceCachingMarket(market)
+
+    assert caching_market.calculate_maximal_amount_to_buy(BTC_USD_PAIR, Decimal('8000')) == Decimal('0.125')
+    assert caching_market.calculate_maximal_amount_to_sell(BTC_USD_PAIR) == Decimal('2')
+    assert len(caching_market.get_balances()) == 2
+    assert caching_market.get_balance('LTC').available_amount == Decimal('0')
+
+    try:
+        caching_market.place_order(flexmock())
+    except ValueError:
+        pass
+
+    assert caching_market.get_balance('BTC').available_amount == Decimal('2')
+
+
+def test_balances_cache_expires_and_is_invalidated_on_tick():
+    market = create_market_mock(3)
+    market.should_receive('get_balance').never()
+    clock = flexmock(now=0)
+    caching_market = BalanceCachingMarket(market, ttl=5, monotonic_function=lambda: clock.now)
+
+    caching_market.get_balance('USD')
+    clock.now = 5
+    caching_market.get_balance('USD')
+    caching_market.get_balance('BTC')
+
+    invalidate_balance_caches([market, caching_market])
+    caching_market.get_balance('USD')
@@ -0,0 +1,49 @@
+import pytest
+
+from coinrat.domain.market import TtlCache, cached_with_ttl, invalidate_cached_method
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_values_and_does_not_cache_exceptions():
+    clock = FakeClock()
+    cache = TtlCache(10, clock)
+    values = iter([1, 2, 3])
+
+    assert cache.get('markets', lambda: next(values)) == 1
+    clock.now = 9.9
+    assert cache.get('markets', lambda: next(values)) == 1
+    clock.now = 10
+    assert cache.get('markets', lambda: next(values)) == 2
+
+    with pytest.raises(ValueError):
+        cache.get('pairs', lambda: int('not a number'))
+    assert cache.get('pairs', lambda: next(values)) == 3
+
+
+class FakeMarket:
+    def __init__(self) -> None:
+        self.number_of_requests = 0
+
+    @cached_with_ttl(60)
+    def get_minimal_order_size(self, pair: str) -> str:
+        self.number_of_requests += 1
+        return '{} {}'.format(pair, self.number_of_requests)
+
+
+def test_cached_method_is_cached_per_instance_and_arguments():
+    market, other_market = FakeMarket(), FakeMarket()
+
+    assert market.get_minimal_order_size('USD_BTC') == 'USD_BTC 1'
+    assert market.get_minimal_order_size('USD_BTC') == 'USD_BTC 1'
+    assert market.get_minimal_order_size('USD_ETH') == 'USD_ETH 2'
+    assert other_market.get_minimal_order_size('USD_BTC') == 'USD_BTC 1'
+
+    invalidate_cached_method(market, 'get_minimal_order_size')
+    assert market.get_minimal_order_size('USD_BTC') == 'USD_BTC 3'
@@ -0,0 +1,71 @@
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+CACHE_ATTRIBUTE_PREFIX = '_ttl_cache_of_'
+
+
+class TtlCache:
+    """
+    Values are computed on the first access and kept for ttl seconds. Concurrent accesses of the same missing
+    key wait for one computation (market metadata are downloaded once). Exceptions are not cached.
+    """
+
+    def __init__(self, ttl: float, monotonic_function: Callable[[], float] = time.monotonic) -> None:
+        assert ttl > 0, 'TTL must be positive, {} given.'.format(ttl)
+
+        self._ttl = ttl
+        self._monotonic = monotonic_function
+        self._lock = threading.RLock()
+        self._values: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            now = self._monotonic()
+            if key in self._values:
+                expires_at, value = self._values[key]
+                if now < expires_at:
+                    return value
+
+            value = factory()
+            self._values[key] = (now + self._ttl, value)
+            return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._values = {}
+
+
+def cached_with_ttl(ttl: float) -> Callable:
+    """
+    Method decorator, results are cached per instance (and arguments, they must be hashable) for ttl seconds.
+    Usable for metadata of the market which rarely change (markets, minimal order sizes, tradable pairs), never
+    for balances, prices or orders. Cache of the method is dropped by invalidate_cached_method().
+    """
+
+    def decorator(method: Callable) -> Callable:
+        attribute = CACHE_ATTRIBUTE_PREFIX + method.__name__
+        creation_lock = threading.Lock()
+
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = getattr(self, attribute, None)
+            if cache is None:
+                with creation_lock:
+                    cache = getattr(self, attribute, None)
+                    if cache is None:
+                        cache = TtlCache(ttl)
+                        setattr(self, attribute, cache)
+
+            return cache.get(args, lambda: method(self, *args))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cached_method(instance: object, method_name: str) -> None:
+    cache = getattr(instance, CACHE_ATTRIBUTE_PREFIX + method_name, None)
+    if cache is not None:
+        cache.invalidate()
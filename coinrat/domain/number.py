@@ -1,4 +1,22 @@
 from decimal import Decimal
+from typing import Union
+
+NUMERIC_BACKEND_DECIMAL = 'decimal'
+NUMERIC_BACKEND_FLOAT = 'float'
+NUMERIC_BACKENDS = [NUMERIC_BACKEND_DECIMAL, NUMERIC_BACKEND_FLOAT]
+
+# Prices and amounts are Decimals. Floats (float64, numpy.float64 is subclass of float) are allowed only
+# in simulations running with float numeric backend, live markets always work with Decimals (orders for markets
+# with Decimal backend are checked by assert_decimals, see OrderFacade.create).
+NUMBER_TYPES = (Decimal, float)
+Number = Union[Decimal, float]  # Type of prices and amounts (annotations), see NUMBER_TYPES
+
+# Float backend makes replays about 5-30 % faster (replays are dominated by storages, not by Decimal arithmetic),
+# but it is not exact. Float64 has ~16 significant digits, rounding errors of prefix sums (means over weeks
+# of minute candles) and of balance updates stay well below this relative difference, so amounts and rates
+# of orders created by float replay match the Decimal replay within it. Decisions made on (nearly) equal values
+# (eg. crossing of two averages) can differ and replays diverge then, always compare number of created orders too.
+FLOAT_BACKEND_RELATIVE_TOLERANCE = 1e-9
 
 
 def to_decimal(value) -> Decimal:
@@ -9,3 +27,25 @@ def to_decimal(value) -> Decimal:
         return Decimal(value).quantize(Decimal('0.000000001'))
 
     raise ValueError('Provided value (of type: {}) is not valid for decimal conversion'.format(str(type(value))))
+
+
+def assert_decimals(*values) -> None:
+    for value in values:
+        assert isinstance(value, Decimal), 'Decimal expected, {} ({}) given.'.format(value, type(value).__name__)
+
+
+def to_numeric_backend(value: Decimal, numeric_backend: str) -> Number:
+    assert numeric_backend in NUMERIC_BACKENDS, 'Unknown numeric backend: "{}"'.format(numeric_backend)
+
+    if numeric_backend == NUMERIC_BACKEND_FLOAT:
+        return float(value)
+
+    return value
+
+
+def relative_difference(expected: Number, actual: Number) -> float:
+    expected, actual = float(expected), float(actual)
+    if expected == actual:
+        return 0.0
+
+    return abs(expected - actual) / max(abs(expected), abs(actual))
@@ -4,13 +4,14 @@ from .order import Order, OrderMarketInfo, ORDER_TYPE_LIMIT, ORDER_TYPE_MARKET,
     ORDER_FIELD_MARKET, ORDER_FIELD_DIRECTION, ORDER_FIELD_STATUS, ORDER_FIELD_PAIR, \
     ORDER_FIELD_ORDER_ID, ORDER_FIELD_ID_ON_MARKET, ORDER_FIELD_QUANTITY, \
     ORDER_FIELD_RATE, ORDER_FIELD_TYPE, ORDER_FIELD_CLOSED_AT, ORDER_FIELD_CANCELED_AT, ORDER_FIELD_CREATED_AT, \
-    serialize_order, serialize_orders, deserialize_order, deserialize_orders, \
+    serialize_order, serialize_orders, deserialize_order, deserialize_orders, create_trusted_order, \
     ORDER_FIELD_STRATEGY_RUN_ID
 from .order_storage import OrderStorage
 from .order_exporter import OrderExporter
 
 __all__ = [
     'Order',
+    'create_trusted_order',
     'serialize_order',
     'serialize_orders',
     'deserialize_order',
@@ -1,11 +1,13 @@
 import datetime
-import dateutil.parser
+import sys
 
 from decimal import Decimal
-from typing import Union, Dict, List
+from typing import Any, Callable, Union, Dict, List
 from uuid import UUID
 
 from coinrat.domain.coinrat import ForEndUserException
+from coinrat.domain.datetime_parser import parse_utc_datetime
+from coinrat.domain.number import NUMBER_TYPES, Number
 from coinrat.domain.pair import Pair, deserialize_pair, serialize_pair
 
 ORDER_TYPE_LIMIT = 'limit'
@@ -39,6 +41,15 @@ class NotEnoughBalanceToPerformOrderException(ForEndUserException):
 
 
 class Order:
+    __slots__ = (
+        '_order_id', '_strategy_run_id', '_market_name', '_created_at', '_direction', '_pair', '_type', '_quantity',
+        '_rate', '_id_on_market', '_status', '_closed_at', '_canceled_at'
+    )
+
+    # Amounts are Numbers, but typed as Decimals (the same way as prices of Candle)
+    _quantity: Any
+    _rate: Any
+
     def __init__(
         self,
         order_id: UUID,
@@ -48,8 +59,8 @@ class Order:
         created_at: datetime.datetime,
         pair: Pair,
         order_type: str,
-        quantity: Decimal,
-        rate: Union[Decimal, None] = None,
+        quantity: Number,
+        rate: Union[Number, None] = None,
         market_id: Union[str, None] = None,
         status: str = ORDER_STATUS_OPEN,
         closed_at: Union[datetime.datetime, None] = None,
@@ -59,10 +70,10 @@ class Order:
             ('Time must be in UTC and aware of its timezone ({})'.format(created_at.isoformat()))
 
         assert order_type in [ORDER_TYPE_LIMIT, ORDER_TYPE_MARKET], 'Unknown type of order: "{}".'.format(order_type)
-        assert isinstance(quantity, Decimal)
+        assert isinstance(quantity, NUMBER_TYPES)
 
         if order_type == ORDER_TYPE_LIMIT:
-            assert isinstance(rate, Decimal)
+            assert isinstance(rate, NUMBER_TYPES)
         if order_type == ORDER_TYPE_MARKET:
             assert rate is None, 'For market orders, rate must be None (does not make sense).'
 
@@ -192,6 +203,43 @@ class Order:
         )
 
 
+def create_trusted_order(
+    order_id: UUID,
+    strategy_run_id: UUID,
+    market_name: str,
+    direction: str,
+    created_at: datetime.datetime,
+    pair: Pair,
+    order_type: str,
+    quantity: Decimal,
+    rate: Union[Decimal, None],
+    market_id: Union[str, None],
+    status: str,
+    closed_at: Union[datetime.datetime, None],
+    canceled_at: Union[datetime.datetime, None]
+) -> Order:
+    """
+    Creates order without validation of its data. Use only for data that were validated before, typically orders
+    loaded from storage.
+    """
+    order = Order.__new__(Order)
+    order._order_id = order_id
+    order._strategy_run_id = strategy_run_id
+    order._market_name = market_name
+    order._direction = direction
+    order._created_at = created_at
+    order._pair = pair
+    order._type = order_type
+    order._quantity = quantity
+    order._rate = rate
+    order._id_on_market = market_id
+    order._status = status
+    order._closed_at = closed_at
+    order._canceled_at = canceled_at
+
+    return order
+
+
 def serialize_order(order: Order) -> Dict[str, Union[str, None]]:
     return {
         ORDER_FIELD_ORDER_ID: str(order.order_id),
@@ -211,25 +259,104 @@ def serialize_order(order: Order) -> Dict[str, Union[str, None]]:
 
 
 def serialize_orders(orders: List[Order]) -> List[Dict[str, Union[str, None]]]:
-    return list(map(serialize_order, orders))
+    """
+    The same output as serialize_order() for every order, but pairs and strategy run ids (usually shared by all
+    orders) are serialized only once and property calls are avoided.
+    """
+    serialized_pairs: Dict[int, str] = {}
+    serialized_strategy_run_ids: Dict[UUID, str] = {}
+    result = []
+
+    for order in orders:
+        serialized_pair = serialized_pairs.get(id(order._pair))
+        if serialized_pair is None:
+            serialized_pair = serialized_pairs[id(order._pair)] = serialize_pair(order._pair)
+
+        serialized_strategy_run_id = serialized_strategy_run_ids.get(order._strategy_run_id)
+        if serialized_strategy_run_id is None:
+            serialized_strategy_run_id = serialized_strategy_run_ids[order._strategy_run_id] = \
+                str(order._strategy_run_id)
+
+        result.append({
+            ORDER_FIELD_ORDER_ID: str(order._order_id),
+            ORDER_FIELD_STRATEGY_RUN_ID: serialized_strategy_run_id,
+            ORDER_FIELD_MARKET: order._market_name,
+            ORDER_FIELD_DIRECTION: order._direction,
+            ORDER_FIELD_CREATED_AT: order._created_at.isoformat(),
+            ORDER_FIELD_PAIR: serialized_pair,
+            ORDER_FIELD_TYPE: order._type,
+            ORDER_FIELD_QUANTITY: str(order._quantity),
+            ORDER_FIELD_RATE: str(order._rate),
+            ORDER_FIELD_ID_ON_MARKET: order._id_on_market,
+            ORDER_FIELD_STATUS: order._status,
+            ORDER_FIELD_CLOSED_AT: order._closed_at.isoformat() if order._closed_at is not None else None,
+            ORDER_FIELD_CANCELED_AT: order._canceled_at.isoformat() if order._canceled_at is not None else None,
+        })
+
+    return result
 
 
 def deserialize_order(serialized: Dict) -> Order:
+    return _deserialize_order(
+        serialized,
+        deserialize_pair(serialized[ORDER_FIELD_PAIR]),
+        UUID(serialized[ORDER_FIELD_STRATEGY_RUN_ID]),
+        Order
+    )
+
+
+def deserialize_orders(serialized_orders: List[Dict], is_trusted: bool = False) -> List[Order]:
+    """
+    The same as deserialize_order() for every row, pairs and strategy run ids are deserialized only once.
+    Trusted rows (coming from order storage) are not validated again.
+    """
+    create_order = create_trusted_order if is_trusted else Order
+    pairs: Dict[str, Pair] = {}
+    strategy_run_ids: Dict[str, UUID] = {}
+    result = []
+
+    for serialized in serialized_orders:
+        serialized_pair = serialized[ORDER_FIELD_PAIR]
+        if serialized_pair not in pairs:
+            pairs[serialized_pair] = deserialize_pair(serialized_pair)
+
+        serialized_strategy_run_id = serialized[ORDER_FIELD_STRATEGY_RUN_ID]
+        if serialized_strategy_run_id not in strategy_run_ids:
+            strategy_run_ids[serialized_strategy_run_id] = UUID(serialized_strategy_run_id)
+
+        result.append(
+            _deserialize_order(
+                serialized,
+                pairs[serialized_pair],
+                strategy_run_ids[serialized_strategy_run_id],
+                create_order
+            )
+        )
+
+    return result
+
+
+def _deserialize_order(
+    serialized: Dict,
+    pair: Pair,
+    strategy_run_id: UUID,
+    create_order: Callable[..., Order]
+) -> Order:
     closed_at = serialized[ORDER_FIELD_CLOSED_AT]
     if closed_at is not None:
-        closed_at = dateutil.parser.parse(closed_at).replace(tzinfo=datetime.timezone.utc)
+        closed_at = parse_utc_datetime(closed_at)
 
     canceled_at = serialized[ORDER_FIELD_CANCELED_AT]
     if canceled_at is not None:
-        canceled_at = dateutil.parser.parse(canceled_at).replace(tzinfo=datetime.timezone.utc)
+        canceled_at = parse_utc_datetime(canceled_at)
 
-    return Order(
+    return create_order(
         UUID(serialized[ORDER_FIELD_ORDER_ID]),
-        UUID(serialized[ORDER_FIELD_STRATEGY_RUN_ID]),
-        serialized[ORDER_FIELD_MARKET],
+        strategy_run_id,
+        sys.intern(serialized[ORDER_FIELD_MARKET]),
         serialized[ORDER_FIELD_DIRECTION],
-        dateutil.parser.parse(serialized[ORDER_FIELD_CREATED_AT]).replace(tzinfo=datetime.timezone.utc),
-        deserialize_pair(serialized[ORDER_FIELD_PAIR]),
+        parse_utc_datetime(serialized[ORDER_FIELD_CREATED_AT]),
+        pair,
         serialized[ORDER_FIELD_TYPE],
         Decimal(serialized[ORDER_FIELD_QUANTITY]),
         Decimal(serialized[ORDER_FIELD_RATE]),
@@ -240,10 +367,6 @@ def deserialize_order(serialized: Dict) -> Order:
     )
 
 
-def deserialize_orders(serialized_orders: List[Dict]) -> List[Order]:
-    return list(map(deserialize_order, serialized_orders))
-
-
 class OrderMarketInfo:
     def __init__(
         self,
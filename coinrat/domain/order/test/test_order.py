@@ -5,7 +5,8 @@ from uuid import UUID
 from decimal import Decimal
 
 from coinrat.domain.pair import Pair
-from coinrat.domain.order import Order, ORDER_TYPE_LIMIT, OrderMarketInfo, DIRECTION_BUY
+from coinrat.domain.order import Order, ORDER_TYPE_LIMIT, OrderMarketInfo, DIRECTION_BUY, serialize_order, \
+    serialize_orders, deserialize_order, deserialize_orders
 
 DUMMY_ORDER_OPEN = Order(
     UUID('16fd2706-8baf-433b-82eb-8c7fada847db'),
@@ -67,3 +68,23 @@ def test_order_info():
     assert DUMMY_ORDER_OPEN == order_info.order
     assert 'Order Id: "16fd2706-8baf-433b-82eb-8c7fada847db", OPEN, Closed at: "", Remaining quantity: "1"' \
            == str(order_info)
+
+
+def test_bulk_serialization_is_the_same_as_single():
+    closed_order: Order = copy.deepcopy(DUMMY_ORDER_OPEN)
+    closed_order.close(datetime.datetime(2017, 6, 7, 8, 9, 10, 123456, tzinfo=datetime.timezone.utc))
+    canceled_order: Order = copy.deepcopy(DUMMY_ORDER_OPEN)
+    canceled_order.cancel(datetime.datetime(2018, 9, 6, 3, 1, 0, tzinfo=datetime.timezone.utc))
+    orders = [DUMMY_ORDER_OPEN, closed_order, canceled_order]
+
+    serialized = serialize_orders(orders)
+    assert [serialize_order(order) for order in orders] == serialized
+
+    deserialized = deserialize_orders(serialized)
+    assert [serialize_order(deserialize_order(row)) for row in serialized] == serialize_orders(deserialized)
+    assert deserialized[0].strategy_run_id == deserialized[2].strategy_run_id
+    assert '2017-06-07T08:09:10.123456+00:00' == deserialized[1].closed_at.isoformat()
+
+    trusted = deserialize_orders(serialized, is_trusted=True)
+    assert serialized == serialize_orders(trusted)
+    assert not hasattr(trusted[0], '__dict__')
@@ -1,11 +1,18 @@
+import sys
+from typing import Dict
+
 from coinrat.domain.coinrat import ForEndUserException
 
+_pairs: Dict[str, 'Pair'] = {}
+
 
 class MarketPairDoesNotExistsException(ForEndUserException):
     pass
 
 
 class Pair:
+    __slots__ = ('_base_currency', '_market_currency')
+
     def __init__(self, base_currency: str, market_currency: str) -> None:
         assert base_currency != 'USDT', \
             'Some markets use USDT instead of USD, this is impl. detail of that market, use USD otherwise'
@@ -35,4 +42,9 @@ def serialize_pair(pair: Pair) -> str:
 
 
 def deserialize_pair(identifier: str) -> Pair:
-    return Pair(*identifier.split('_'))
+    """Pairs are immutable, so every identifier gives always the same instance (flyweight)."""
+    if identifier not in _pairs:
+        base_currency, market_currency = identifier.split('_')
+        _pairs[sys.intern(identifier)] = Pair(sys.intern(base_currency), sys.intern(market_currency))
+
+    return _pairs[identifier]
@@ -1,5 +1,6 @@
 from .portfolio_snapshot import PortfolioSnapshot, serialize_portfolio_snapshot
 from .portfolio_snapshot_storage import PortfolioSnapshotStorage
+from .equity_curve import EquityCurve, calculate_pair_portfolio_value
 
 __all__ = [
     'PortfolioSnapshot',
@@ -7,4 +8,7 @@ __all__ = [
     'serialize_portfolio_snapshot',
 
     'PortfolioSnapshotStorage',
+
+    'EquityCurve',
+    'calculate_pair_portfolio_value',
 ]
@@ -0,0 +1,64 @@
+import datetime
+from decimal import Decimal
+from typing import List, Tuple, Union
+
+from coinrat.domain import Balance
+from coinrat.domain.pair import Pair
+
+
+class EquityCurve:
+    """
+    Value of the portfolio in time (in BASE CURRENCY of the traded pair). Used to evaluate strategy runs
+    by their profit (PnL) and maximal drawdown.
+    """
+
+    def __init__(self) -> None:
+        self._points: List[Tuple[datetime.datetime, Decimal]] = []
+        self._peak: Union[Decimal, None] = None
+        self._max_drawdown = Decimal('0')
+
+    def record(self, time: datetime.datetime, value: Decimal) -> None:
+        self._points.append((time, value))
+
+        if self._peak is None or value > self._peak:
+            self._peak = value
+
+        if self._peak > 0:
+            self._max_drawdown = max(self._max_drawdown, (self._peak - value) / self._peak)
+
+    @property
+    def points(self) -> List[Tuple[datetime.datetime, Decimal]]:
+        return self._points
+
+    @property
+    def initial_value(self) -> Union[Decimal, None]:
+        return self._points[0][1] if self._points else None
+
+    @property
+    def final_value(self) -> Union[Decimal, None]:
+        return self._points[-1][1] if self._points else None
+
+    @property
+    def profit(self) -> Decimal:
+        if not self._points:
+            return Decimal('0')
+
+        return self.final_value - self.initial_value
+
+    @property
+    def max_drawdown(self) -> Decimal:
+        """Biggest relative drop from the previous peak, 0.1 means 10 %."""
+        return self._max_drawdown
+
+
+def calculate_pair_portfolio_value(balances: List[Balance], pair: Pair, market_currency_price: Decimal) -> Decimal:
+    """Value of the balances (only currencies of given pair are considered) in the BASE CURRENCY."""
+    # Float in simulations with float numeric backend
+    value = Decimal('0') if isinstance(market_currency_price, Decimal) else 0.0
+    for balance in balances:
+        if balance.currency == pair.base_currency:
+            value += balance.available_amount
+        elif balance.currency == pair.market_currency:
+            value += balance.available_amount * market_currency_price
+
+    return value
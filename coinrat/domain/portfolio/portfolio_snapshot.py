@@ -7,6 +7,8 @@ from coinrat.domain import Balance, serialize_balances
 
 
 class PortfolioSnapshot:
+    __slots__ = ('_time', '_market_name', '_strategy_run_id', '_order_id', '_balances')
+
     def __init__(
         self,
         time: datetime.datetime,
@@ -0,0 +1,33 @@
+import datetime
+from decimal import Decimal
+
+from coinrat.domain import Balance
+from coinrat.domain.pair import Pair
+from coinrat.domain.portfolio import EquityCurve, calculate_pair_portfolio_value
+
+DUMMY_TIME = datetime.datetime(2017, 11, 26, 10, 11, 12, tzinfo=datetime.timezone.utc)
+
+
+def test_equity_curve():
+    curve = EquityCurve()
+    assert curve.final_value is None
+    assert Decimal('0') == curve.profit
+    assert Decimal('0') == curve.max_drawdown
+
+    for minute, value in enumerate(['100', '120', '90', '110', '60', '130']):
+        curve.record(DUMMY_TIME + datetime.timedelta(minutes=minute), Decimal(value))
+
+    assert 6 == len(curve.points)
+    assert Decimal('100') == curve.initial_value
+    assert Decimal('130') == curve.final_value
+    assert Decimal('30') == curve.profit
+    assert Decimal('0.5') == curve.max_drawdown
+
+
+def test_calculate_pair_portfolio_value():
+    balances = [
+        Balance('dummy_market', 'USD', Decimal('1000')),
+        Balance('dummy_market', 'BTC', Decimal('0.5')),
+        Balance('dummy_market', 'LTC', Decimal('100')),
+    ]
+    assert Decimal('5000') == calculate_pair_portfolio_value(balances, Pair('USD', 'BTC'), Decimal('8000'))
@@ -1,10 +1,10 @@
 import datetime
-import dateutil.parser
 
 from typing import Dict, List, Union
 from uuid import UUID
 
-from coinrat.domain import DateTimeInterval, serialize_datetime_interval, deserialize_datetime_interval
+from coinrat.domain import DateTimeInterval, serialize_datetime_interval, deserialize_datetime_interval, \
+    parse_utc_datetime
 from coinrat.domain.pair import Pair, serialize_pair, deserialize_pair
 
 
@@ -83,7 +83,7 @@ def serialize_strategy_runs(strategy_runs: List[StrategyRun]) -> List[Dict[str,
 def deserialize_strategy_run(data: Dict) -> StrategyRun:
     return StrategyRun(
         UUID(data['strategy_run_id']),
-        dateutil.parser.parse(data['run_at']).replace(tzinfo=datetime.timezone.utc),
+        parse_utc_datetime(data['run_at']),
         deserialize_pair(data['pair']),
         deserialize_strategy_run_markets(data['markets']),
         data['strategy_name'],
@@ -1,20 +1,22 @@
 import logging
 
-import MySQLdb
 import datetime
 import json
-from typing import List
+from typing import List, TYPE_CHECKING
 from uuid import UUID
 
 from coinrat.domain import DateTimeInterval
 from coinrat.domain.pair import serialize_pair, deserialize_pair
 from .strategy_run import StrategyRun, serialize_strategy_run_markets, deserialize_strategy_run_markets
 
+if TYPE_CHECKING:  # pragma: no cover
+    import MySQLdb  # Connection is created (and MySQL client imported) by DI container only when used
+
 logger = logging.getLogger(__name__)
 
 
 class StrategyRunStorage:
-    def __init__(self, connection: MySQLdb.Connection) -> None:
+    def __init__(self, connection: 'MySQLdb.Connection') -> None:
         self._connection = connection
 
     def update(self, strategy_run: StrategyRun):
@@ -1,11 +1,34 @@
-from typing import List
+from typing import List, TYPE_CHECKING
 
+from .datetime_interval import DateTimeInterval
 from .pair.pair import Pair
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .candle.candle import Candle  # Candle package imports coinrat.domain (circular import)
+
 
 class MarketStateSynchronizer:
     def synchronize(self, market_name: str, pair: Pair) -> None:
         raise NotImplementedError()
 
+    def synchronize_pairs(self, market_name: str, pairs: List[Pair]) -> None:
+        """Synchronizes many pairs of the market at once (optional, not all synchronizers support it)."""
+        raise NotImplementedError()
+
+    def get_candles(self, market_name: str, pair: Pair, interval: DateTimeInterval) -> List['Candle']:
+        """
+        Minute candles of the closed interval from the history of the market, nothing is stored (optional, only
+        synchronizers with access to the history support it, used for backfill of gaps).
+        """
+        raise NotImplementedError()
+
+    @property
+    def is_candle_history_paged(self) -> bool:
+        """
+        False when get_candles() downloads the whole available history in one request regardless of the interval,
+        backfill then asks for all gaps at once instead of asking chunk by chunk.
+        """
+        return True
+
     def get_supported_markets(self) -> List[str]:
         raise NotImplementedError()
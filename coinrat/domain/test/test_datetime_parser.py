@@ -0,0 +1,24 @@
+import datetime
+
+import dateutil.parser
+import pytest
+
+from coinrat.domain import parse_utc_datetime
+
+
+@pytest.mark.parametrize('value', [
+    '2017-12-02T13:01:00+00:00',
+    '2017-12-02T13:01:00Z',
+    '2017-12-02T13:01:00',
+    '2017-12-02T13:01:00.123456+00:00',
+    '2017-12-02T13:01:00.123Z',
+    '2017-12-02T13:01:00.123456789Z',
+    '2017-12-02 13:01:00',
+    '2017-12-02',
+])
+def test_parse_utc_datetime_is_the_same_as_dateutil(value: str):
+    expected = dateutil.parser.parse(value).replace(tzinfo=datetime.timezone.utc)
+
+    result = parse_utc_datetime(value)
+    assert expected == result
+    assert expected.isoformat() == result.isoformat()
@@ -0,0 +1,7 @@
+from .trade import Trade
+from .trade_stream import TradeStream
+
+__all__ = [
+    'Trade',
+    'TradeStream',
+]
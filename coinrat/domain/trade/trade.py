@@ -0,0 +1,54 @@
+import datetime
+from decimal import Decimal
+
+from coinrat.domain.pair import Pair
+
+
+class Trade:
+    """One executed trade of the market (from the market's public stream of trades)."""
+
+    def __init__(
+        self,
+        market_name: str,
+        pair: Pair,
+        time: datetime.datetime,
+        price: Decimal,
+        quantity: Decimal
+    ) -> None:
+        assert '+00:00' in time.isoformat()[-6:], \
+            ('Time must be in UTC and aware of its timezone ({})'.format(time.isoformat()))
+
+        self._market_name = market_name
+        self._pair = pair
+        self._time = time
+        self._price = price
+        self._quantity = quantity
+
+    @property
+    def market_name(self) -> str:
+        return self._market_name
+
+    @property
+    def pair(self) -> Pair:
+        return self._pair
+
+    @property
+    def time(self) -> datetime.datetime:
+        return self._time
+
+    @property
+    def price(self) -> Decimal:
+        return self._price
+
+    @property
+    def quantity(self) -> Decimal:
+        return self._quantity
+
+    def __repr__(self) -> str:
+        return '{} {} {}: {} x {}'.format(
+            self._time.isoformat(),
+            self._market_name,
+            self._pair,
+            self._price,
+            self._quantity
+        )
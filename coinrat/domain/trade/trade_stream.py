@@ -0,0 +1,29 @@
+import datetime
+from typing import Callable, List
+
+from coinrat.domain.pair import Pair
+from .trade import Trade
+
+
+class TradeStream:
+    """
+    Push-based source of market data (websocket feed, replay of recorded data, ...). Unlike polled REST
+    endpoints, trades are delivered as soon as they happen.
+    """
+
+    def run(
+        self,
+        market_name: str,
+        pairs: List[Pair],
+        on_trade: Callable[[Trade], None],
+        on_heartbeat: Callable[[datetime.datetime], None]
+    ) -> None:
+        """
+        Blocks until the stream ends or stop() is called. on_trade is called for every trade (ordered by time
+        within the pair), on_heartbeat with current time of the stream at least every second, even when
+        nothing is traded (so minutes without trades can be closed).
+        """
+        raise NotImplementedError()
+
+    def stop(self) -> None:
+        raise NotImplementedError()
@@ -0,0 +1,9 @@
+class CandleEventListener:
+    """Waits for candles written (by synchronizers) into the storage for given markets and pair."""
+
+    def wait_for_new_candles(self, timeout: float) -> bool:
+        """Returns True when new candles were written, False when timeout (in seconds) expired first."""
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        raise NotImplementedError()
@@ -1,9 +1,20 @@
 EVENT_LAST_CANDLE_UPDATED = 'last_candle_updated'
+EVENT_CANDLES_UPDATED = 'candles_updated'  # Batch of candles of one storage, market and pair
 EVENT_NEW_ORDER = 'new_order'
 EVENT_NEW_STRATEGY_RUN = 'new_strategy_run'
 
 ALL_RABBIT_EVENTS = [
     EVENT_LAST_CANDLE_UPDATED,
+    EVENT_CANDLES_UPDATED,
     EVENT_NEW_ORDER,
     EVENT_NEW_STRATEGY_RUN,
 ]
+
+# Topic exchange to which EVENT_CANDLES_UPDATED is also published, so any number of listeners (e.g. live
+# strategies, see: RabbitCandleEventListener) can bind their own queues ('events' queue has only one consumer).
+CANDLE_EVENTS_EXCHANGE = 'candle_events'
+
+
+def create_candle_event_routing_key(candle_storage: str, market_name: str, pair: str) -> str:
+    """Pair is serialized pair (see: serialize_pair), '*' can be used as a wildcard for any part."""
+    return '{}.{}.{}'.format(candle_storage, market_name, pair)
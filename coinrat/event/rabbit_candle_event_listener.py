@@ -0,0 +1,59 @@
+import logging
+import time
+from typing import Callable, List
+
+import pika
+
+from .candle_event_listener import CandleEventListener
+from .event_types import CANDLE_EVENTS_EXCHANGE, create_candle_event_routing_key
+
+logger = logging.getLogger(__name__)
+
+
+class RabbitCandleEventListener(CandleEventListener):
+    """
+    Binds its own exclusive queue to the candle events exchange (see: RabbitEventEmitter.emit_new_candles).
+    Events which came during the tick are coalesced, next wait returns immediately, but only once.
+    """
+
+    def __init__(
+        self,
+        rabbit_connection: pika.BlockingConnection,
+        candle_storage: str,
+        market_names: List[str],
+        pair: str,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._connection = rabbit_connection
+        self._monotonic = monotonic_function
+        self._has_new_candles = False
+
+        self._channel = rabbit_connection.channel()
+        self._channel.exchange_declare(exchange=CANDLE_EVENTS_EXCHANGE, exchange_type='topic')
+        queue = self._channel.queue_declare(exclusive=True).method.queue
+        for market_name in market_names:
+            routing_key = create_candle_event_routing_key(candle_storage, market_name, pair)
+            self._channel.queue_bind(queue=queue, exchange=CANDLE_EVENTS_EXCHANGE, routing_key=routing_key)
+            logger.debug('Listening for candle events "{}".'.format(routing_key))
+
+        self._channel.basic_consume(self._on_message, queue=queue, no_ack=True)
+
+    def wait_for_new_candles(self, timeout: float) -> bool:
+        deadline = self._monotonic() + timeout
+        self._connection.process_data_events(time_limit=0)
+
+        while not self._has_new_candles:
+            remaining = deadline - self._monotonic()
+            if remaining <= 0:
+                return False
+
+            self._connection.process_data_events(time_limit=remaining)
+
+        self._has_new_candles = False
+        return True
+
+    def close(self) -> None:
+        self._channel.close()
+
+    def _on_message(self, channel, method, properties, body) -> None:
+        self._has_new_candles = True
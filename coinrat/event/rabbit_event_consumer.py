@@ -9,7 +9,8 @@ from coinrat.candle_storage_plugins import CandleStoragePlugins
 from coinrat.domain import DateTimeFactory, DateTimeInterval
 from coinrat.domain.order import deserialize_order
 from coinrat.domain.candle import Candle, CandleStorage
-from coinrat.event.event_types import EVENT_LAST_CANDLE_UPDATED, EVENT_NEW_ORDER, EVENT_NEW_STRATEGY_RUN
+from coinrat.event.event_types import EVENT_LAST_CANDLE_UPDATED, EVENT_CANDLES_UPDATED, EVENT_NEW_ORDER, \
+    EVENT_NEW_STRATEGY_RUN
 from coinrat.event.subscription_factory import create_subscription
 from coinrat.server.subscription_storage import SubscriptionStorage, LastCandleSubscription
 from coinrat.server.socket_server import SocketServer
@@ -101,7 +102,8 @@ class RabbitEventConsumer(threading.Thread):
             logger.info('[Rabbit] Event "%s", received -> NO SUBSCRIPTIONS | %r', event_name, event_data)
             return
 
-        if event_name == EVENT_LAST_CANDLE_UPDATED:
+        if event_name in [EVENT_LAST_CANDLE_UPDATED, EVENT_CANDLES_UPDATED]:
+            # Batch of any size means one lookup of the last candle per subscription
             candle_storage = self._candle_storage_plugins.get_candle_storage(event_data['storage'])
             for subscription in subscriptions:  # type: LastCandleSubscription
                 candle = self._find_last_candle_for_subscription(candle_storage, subscription)
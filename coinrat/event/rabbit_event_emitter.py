@@ -1,34 +1,69 @@
 import json
 import logging
+import threading
+
 import pika
 
+from collections import OrderedDict
 from typing import List, Dict
 
-from coinrat.domain.candle import Candle, serialize_candle
+from coinrat.domain.candle import Candle, serialize_candles
 from coinrat.domain.order import Order
 from coinrat.domain.order import serialize_order
+from coinrat.domain.pair import serialize_pair
 from coinrat.domain.portfolio import PortfolioSnapshot, serialize_portfolio_snapshot
 from coinrat.domain.strategy import StrategyRun
 from coinrat.domain.strategy import serialize_strategy_run
 from .event_emitter import EventEmitter
-from .event_types import EVENT_LAST_CANDLE_UPDATED, EVENT_NEW_ORDER, EVENT_NEW_STRATEGY_RUN
+from .event_types import EVENT_CANDLES_UPDATED, EVENT_NEW_ORDER, EVENT_NEW_STRATEGY_RUN, CANDLE_EVENTS_EXCHANGE, \
+    create_candle_event_routing_key
 
 logger = logging.getLogger(__name__)
 
 
 class RabbitEventEmitter(EventEmitter):
-    def __init__(self, rabbit_connection: pika.BlockingConnection) -> None:
+    """
+    Emitter is shared by threads of the process (synchronizers, strategies), pika's channel is not thread-safe.
+
+    New candles are published in batches, one message per storage, market and pair (into the events queue and into
+    the candle events exchange), so full resyncs and backfills of thousands of candles do not flood the broker.
+    With latest_candle_only, the batch contains only the last candle of the pair (consumers only need to know that
+    there is something new and load candles from the storage).
+    """
+
+    def __init__(self, rabbit_connection: pika.BlockingConnection, latest_candle_only: bool = False) -> None:
         super().__init__()
+        self._latest_candle_only = latest_candle_only
+        self._lock = threading.Lock()
         self.channel = rabbit_connection.channel()
         self.channel.queue_declare(queue='events')
+        self.channel.exchange_declare(exchange=CANDLE_EVENTS_EXCHANGE, exchange_type='topic')
 
     def emit_new_candles(self, candle_storage: str, candles: List[Candle]) -> None:
+        batches: Dict[str, List[Candle]] = OrderedDict()
         for candle in candles:
-            self.emit_event({
-                'event': EVENT_LAST_CANDLE_UPDATED,
-                'candle': serialize_candle(candle),
+            routing_key = create_candle_event_routing_key(
+                candle_storage,
+                candle.market_name,
+                serialize_pair(candle.pair)
+            )
+            batches.setdefault(routing_key, []).append(candle)
+
+        for routing_key, batch in batches.items():
+            if self._latest_candle_only:
+                batch = [max(batch, key=lambda candle: candle.time)]
+
+            event = {
+                'event': EVENT_CANDLES_UPDATED,
                 'storage': candle_storage,
-            })
+                'market': batch[0].market_name,
+                'pair': serialize_pair(batch[0].pair),
+                'candles': serialize_candles(batch),
+            }
+            logger.debug('Emitting %d candles of %s.', len(batch), routing_key)
+            body = json.dumps(event)  # The same message goes into the queue and into the exchange
+            self._publish('', 'events', body)
+            self._publish(CANDLE_EVENTS_EXCHANGE, routing_key, body)
 
     def emit_new_order(self, order_storage: str, order: Order, portfolio_snapshot: PortfolioSnapshot) -> None:
         data = serialize_order(order)
@@ -42,10 +77,14 @@ class RabbitEventEmitter(EventEmitter):
 
     def emit_event(self, event: Dict) -> None:
         logger.debug('Emitting event: %s', event)
-        self.channel.basic_publish(exchange='', routing_key='events', body=json.dumps(event))
+        self._publish('', 'events', json.dumps(event))
 
     def emit_new_strategy_run(self, strategy_run: StrategyRun):
         self.emit_event({
             'event': EVENT_NEW_STRATEGY_RUN,
             'strategy_run': serialize_strategy_run(strategy_run),
         })
+
+    def _publish(self, exchange: str, routing_key: str, body: str) -> None:
+        with self._lock:
+            self.channel.basic_publish(exchange=exchange, routing_key=routing_key, body=body)
@@ -0,0 +1,65 @@
+import datetime
+from typing import List
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage, CandleSize, CANDLE_SIZE_UNIT_MINUTE, create_trusted_candle
+from coinrat.domain.pair import Pair
+
+
+class FloatCandleStorage(CandleStorage):
+    """
+    Candle storage for simulations with float numeric backend (see: coinrat.domain.number). Prices of candles
+    and means from the wrapped storage are converted to floats, so all arithmetic of the strategy and the mocked
+    market runs on floats. Candles which already have float prices are returned as they are.
+    """
+
+    def __init__(self, storage: CandleStorage) -> None:
+        self._storage = storage
+
+    @property
+    def name(self) -> str:
+        return self._storage.name
+
+    def write_candle(self, candle: Candle) -> None:
+        self._storage.write_candle(candle)
+
+    def write_candles(self, candles: List[Candle]) -> None:
+        self._storage.write_candles(candles)
+
+    def find_by(
+        self,
+        market_name: str,
+        pair: Pair,
+        interval: DateTimeInterval = DateTimeInterval(None, None),
+        candle_size: CandleSize = CandleSize(CANDLE_SIZE_UNIT_MINUTE, 1)
+    ) -> List[Candle]:
+        return [convert_candle_to_float(candle) for candle in
+                self._storage.find_by(market_name, pair, interval, candle_size)]
+
+    def mean(
+        self,
+        market: str,
+        pair: Pair,
+        field: str,
+        interval: DateTimeInterval = DateTimeInterval(None, None)
+    ) -> float:
+        return float(self._storage.mean(market, pair, field, interval))
+
+    def get_last_minute_candle(self, market_name: str, pair: Pair, current_time: datetime.datetime) -> Candle:
+        return convert_candle_to_float(self._storage.get_last_minute_candle(market_name, pair, current_time))
+
+
+def convert_candle_to_float(candle: Candle) -> Candle:
+    if isinstance(candle.close, float):
+        return candle
+
+    return create_trusted_candle(
+        candle.market_name,
+        candle.pair,
+        candle.time,
+        float(candle.open),
+        float(candle.high),
+        float(candle.low),
+        float(candle.close),
+        candle.candle_size
+    )
@@ -1,7 +1,7 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 
 get_available_markets_spec = pluggy.HookspecMarker('coinrat_plugins')
 get_market_spec = pluggy.HookspecMarker('coinrat_plugins')
@@ -37,18 +37,16 @@ class MarketPluginDoesNotExistsException(Exception):
 
 
 class MarketPlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[MarketPluginSpecification],
-            plugins_loader('coinrat_market_plugins', MarketPluginSpecification)
-        )
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        # Available markets are not cached, mock plugin gets them in runtime
+        self._plugins = LazyPlugins('coinrat_market_plugins', MarketPluginSpecification, None, metadata_cache)
 
     def get_plugin(self, plugin_name: str) -> MarketPluginSpecification:
-        for plugin in self._plugins:
-            if plugin.get_name() == plugin_name:
-                return plugin
+        plugin = self._plugins.get_plugin(plugin_name)
+        if plugin is None:
+            raise MarketPluginDoesNotExistsException('Market plugin "{}" not found.'.format(plugin_name))
 
-        raise MarketPluginDoesNotExistsException('Market plugin "{}" not found.'.format(plugin_name))
+        return cast(MarketPluginSpecification, plugin)
 
     def get_available_market_plugins(self) -> List[MarketPluginSpecification]:
-        return list(self._plugins)
+        return cast(List[MarketPluginSpecification], self._plugins.get_plugins())
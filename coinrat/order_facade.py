@@ -5,7 +5,8 @@ import datetime
 
 from coinrat.domain import DateTimeInterval
 from coinrat.domain.market.market import Market, MarketException
-from coinrat.domain.order import Order, OrderStorage
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL, assert_decimals
+from coinrat.domain.order import Order, OrderStorage, ORDER_STATUS_OPEN
 from coinrat.domain.pair import Pair
 from coinrat.domain.portfolio import PortfolioSnapshot, PortfolioSnapshotStorage
 from coinrat.event.event_emitter import EventEmitter
@@ -25,6 +26,11 @@ class OrderFacade:
         self._event_emitter = event_emitter
 
     def create(self, market: Market, order: Order):
+        if market.numeric_backend == NUMERIC_BACKEND_DECIMAL:  # Floats are allowed in simulations only
+            assert_decimals(order.quantity)
+            if order.rate is not None:
+                assert_decimals(order.rate)
+
         portfolio_snapshot = PortfolioSnapshot(
             order.created_at,
             market.name,
@@ -60,6 +66,31 @@ class OrderFacade:
         self._order_storage.save_order(order)
         logger.info('Order "{}" has been successfully CLOSED.'.format(order.order_id))
 
+    def reconcile_open_orders(self, market: Market, pair: Pair) -> List[Order]:
+        """
+        Closes stored open orders of the pair which are not open on the market anymore, returns them. Open orders
+        are fetched from the market by one request, status (closing time) is requested only for the orders which
+        are not open anymore. Markets without Market.get_open_order_ids are asked for status of every order.
+        """
+        orders = self._order_storage.find_by(market_name=market.name, pair=pair, status=ORDER_STATUS_OPEN)
+        if not orders:
+            return []
+
+        try:
+            open_order_ids = market.get_open_order_ids(pair)
+            orders = [order for order in orders if order.id_on_market not in open_order_ids]
+        except NotImplementedError:
+            pass
+
+        closed_orders = []
+        for order in orders:
+            status = market.get_order_status(order)
+            if status.is_open is False:
+                self.close(order, status.closed_at)
+                closed_orders.append(order)
+
+        return closed_orders
+
     def cancel(self, market: Market, order: Order, canceled_at: datetime.datetime):
         try:
             market.cancel_order(order.id_on_market)
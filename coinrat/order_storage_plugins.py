@@ -1,7 +1,7 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 from coinrat.domain.order import OrderStorage
 
 get_available_order_storages_spec = pluggy.HookspecMarker('coinrat_plugins')
@@ -24,18 +24,20 @@ class OrderStorageNotProvidedByAnyPluginException(Exception):
 
 
 class OrderStoragePlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[OrderStoragePluginSpecification],
-            plugins_loader('coinrat_order_storage_plugins',OrderStoragePluginSpecification)
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        self._plugins = LazyPlugins(
+            'coinrat_order_storage_plugins',
+            OrderStoragePluginSpecification,
+            lambda plugin: plugin.get_available_order_storages(),
+            metadata_cache
         )
 
     def get_available_order_storages(self) -> List[str]:
-        return [storage_name for plugin in self._plugins for storage_name in plugin.get_available_order_storages()]
+        return self._plugins.get_provided_names()
 
     def get_order_storage(self, name: str) -> OrderStorage:
-        for plugin in self._plugins:
-            if name in plugin.get_available_order_storages():
-                return plugin.get_order_storage(name)
+        plugin = self._plugins.find_plugin_providing(name)
+        if plugin is None:
+            raise OrderStorageNotProvidedByAnyPluginException('Order storage "{}" not found.'.format(name))
 
-        raise OrderStorageNotProvidedByAnyPluginException('Order storage "{}" not found.'.format(name))
+        return cast(OrderStoragePluginSpecification, plugin).get_order_storage(name)
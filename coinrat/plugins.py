@@ -1,7 +1,13 @@
-from typing import Set
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, Union, cast
 
 import pluggy
 
+logger = logging.getLogger(__name__)
+
 get_name_spec = pluggy.HookspecMarker('coinrat_plugins')
 get_description_spec = pluggy.HookspecMarker('coinrat_plugins')
 
@@ -16,9 +22,171 @@ class PluginSpecification:
         raise NotImplementedError()
 
 
-def plugins_loader(entry_points_name: str, plugin_specification) -> Set[PluginSpecification]:
-    manager = pluggy.PluginManager('coinrat_plugins')
-    manager.add_hookspecs(plugin_specification)
-    manager.load_setuptools_entrypoints(entry_points_name)
-    manager.check_pending()
-    return manager.get_plugins()
+class PluginEntryPoint:
+    def __init__(self, name: str, value: str, version: str, load: Callable[[], Any]) -> None:
+        self.name = name
+        self.value = value
+        self.version = version
+        self.load = load
+
+
+def find_entry_points(entry_points_name: str) -> List[PluginEntryPoint]:
+    """Finds setuptools entry points of the group without importing them."""
+    try:
+        from importlib import metadata  # Python 3.8+, imports many times faster than pkg_resources
+    except ImportError:  # pragma: no cover
+        import pkg_resources
+        return [
+            PluginEntryPoint(
+                entry_point.name,
+                '{}:{}'.format(entry_point.module_name, '.'.join(entry_point.attrs)),
+                entry_point.dist.version if entry_point.dist is not None else '',
+                entry_point.load
+            )
+            for entry_point in pkg_resources.iter_entry_points(entry_points_name)
+        ]
+
+    all_entry_points = metadata.entry_points()
+    if hasattr(all_entry_points, 'select'):
+        entry_points = all_entry_points.select(group=entry_points_name)
+    else:  # pragma: no cover
+        entry_points = cast(Any, all_entry_points).get(entry_points_name, [])  # Python < 3.10 returns dict
+
+    plugin_entry_points = []
+    for entry_point in entry_points:
+        dist = getattr(entry_point, 'dist', None)  # Python < 3.10 entry points do not know their distribution
+        plugin_entry_points.append(PluginEntryPoint(
+            entry_point.name,
+            entry_point.value,
+            dist.version if dist is not None else '',
+            entry_point.load
+        ))
+
+    return plugin_entry_points
+
+
+class PluginMetadataCache:
+    """
+    Remembers names of plugins and names of things they provide (strategies, storages, ...) in JSON file, so
+    plugin modules (and their dependencies) do not need to be imported just to find out what they provide.
+
+    Entries are keyed by the entry point and version of its distribution, so upgraded plugin is inspected again.
+    Delete the file after changing plugin installed in development mode (its version does not change).
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self._file_path = file_path
+        self._data: Union[Dict[str, Dict], None] = None
+
+    def get(self, key: str) -> Union[Dict, None]:
+        return self._load().get(key)
+
+    def save(self, key: str, metadata: Dict) -> None:
+        data = self._load()
+        if data.get(key) == metadata:
+            return
+
+        data[key] = metadata
+        try:
+            # Written into temporary file first, so other processes never read half written file
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self._file_path)))
+            with os.fdopen(file_descriptor, 'w') as cache_file:
+                json.dump(data, cache_file, indent=2, sort_keys=True)
+            os.replace(temporary_path, self._file_path)
+        except OSError as e:
+            logger.warning('Plugin metadata cache "{}" not saved: {}'.format(self._file_path, e))
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._data is None:
+            self._data = {}
+            if os.path.isfile(self._file_path):
+                try:
+                    with open(self._file_path) as cache_file:
+                        self._data = json.load(cache_file)
+                except (OSError, ValueError) as e:
+                    logger.warning('Plugin metadata cache "{}" ignored: {}'.format(self._file_path, e))
+
+        return self._data
+
+
+class LazyPlugins:
+    """
+    Plugins registered under given setuptools entry point group. Entry points are discovered without importing
+    plugin modules (see: find_entry_points), plugin is imported (and registered into plugin manager) when it is
+    used for the first time.
+
+    Metadata of plugin (its name and names of provided things, given by get_provided_names) are read from
+    the metadata cache when possible, so listing of strategies, storages, ... does not import anything.
+    """
+
+    def __init__(
+        self,
+        entry_points_name: str,
+        plugin_specification,
+        get_provided_names: Union[Callable[[Any], List[str]], None] = None,
+        metadata_cache: Union[PluginMetadataCache, None] = None
+    ) -> None:
+        self._entry_points_name = entry_points_name
+        self._get_provided_names = get_provided_names
+        self._metadata_cache = metadata_cache
+
+        self._manager = pluggy.PluginManager('coinrat_plugins')
+        self._manager.add_hookspecs(plugin_specification)
+        self._entry_points = find_entry_points(entry_points_name)
+        self._plugins: Dict[str, PluginSpecification] = {}
+
+    def get_plugins(self) -> List[PluginSpecification]:
+        """Imports all plugins."""
+        return [self._load(entry_point) for entry_point in self._entry_points]
+
+    def get_plugin(self, plugin_name: str) -> Union[PluginSpecification, None]:
+        # Entry points are usually named after their plugin, that one is tried first
+        for entry_point in sorted(self._entry_points, key=lambda entry_point: entry_point.name != plugin_name):
+            if self._get_metadata(entry_point)['name'] == plugin_name:
+                return self._load(entry_point)
+
+        return None
+
+    def get_provided_names(self) -> List[str]:
+        return [name for entry_point in self._entry_points for name in self._get_metadata(entry_point)['provides']]
+
+    def find_plugin_providing(self, provided_name: str) -> Union[PluginSpecification, None]:
+        for entry_point in self._entry_points:
+            if provided_name in self._get_metadata(entry_point)['provides']:
+                plugin = self._load(entry_point)
+                if provided_name in self._get_metadata(entry_point)['provides']:  # Cached metadata can be outdated
+                    return plugin
+
+        return None
+
+    def _load(self, entry_point: PluginEntryPoint) -> PluginSpecification:
+        if entry_point.name not in self._plugins:
+            logger.debug('Loading plugin "{}" of "{}".'.format(entry_point.name, self._entry_points_name))
+            plugin = entry_point.load()
+            self._manager.register(plugin, name=entry_point.name)
+            self._manager.check_pending()
+            self._plugins[entry_point.name] = plugin
+
+            if self._metadata_cache is not None:
+                self._metadata_cache.save(self._get_cache_key(entry_point), self._get_metadata(entry_point))
+
+        return self._plugins[entry_point.name]
+
+    def _get_metadata(self, entry_point: PluginEntryPoint) -> Dict:
+        if entry_point.name in self._plugins:
+            plugin = self._plugins[entry_point.name]
+            return {
+                'name': plugin.get_name(),
+                'provides': self._get_provided_names(plugin) if self._get_provided_names is not None else [],
+            }
+
+        if self._metadata_cache is not None:
+            metadata = self._metadata_cache.get(self._get_cache_key(entry_point))
+            if metadata is not None:
+                return metadata
+
+        self._load(entry_point)
+        return self._get_metadata(entry_point)
+
+    def _get_cache_key(self, entry_point: PluginEntryPoint) -> str:
+        return '{} {} = {} {}'.format(self._entry_points_name, entry_point.name, entry_point.value, entry_point.version)
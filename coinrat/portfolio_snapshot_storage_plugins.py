@@ -1,7 +1,7 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 from .domain.portfolio import PortfolioSnapshotStorage
 
 get_available_portfolio_snapshot_storages_spec = pluggy.HookspecMarker('coinrat_plugins')
@@ -24,23 +24,22 @@ class PortfolioSnapshotStorageNotProvidedByAnyPluginException(Exception):
 
 
 class PortfolioSnapshotStoragePlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[PortfolioSnapshotStoragePluginSpecification],
-            plugins_loader('coinrat_portfolio_snapshot_storage_plugins', PortfolioSnapshotStoragePluginSpecification)
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        self._plugins = LazyPlugins(
+            'coinrat_portfolio_snapshot_storage_plugins',
+            PortfolioSnapshotStoragePluginSpecification,
+            lambda plugin: plugin.get_available_portfolio_snapshot_storages(),
+            metadata_cache
         )
 
     def get_available_portfolio_snapshot_storages(self) -> List[str]:
-        return [
-            storage_name for plugin in self._plugins \
-            for storage_name in plugin.get_available_portfolio_snapshot_storages()
-        ]
+        return self._plugins.get_provided_names()
 
     def get_portfolio_snapshot_storage(self, name: str) -> PortfolioSnapshotStorage:
-        for plugin in self._plugins:
-            if name in plugin.get_available_portfolio_snapshot_storages():
-                return plugin.get_portfolio_snapshot_storage(name)
+        plugin = self._plugins.find_plugin_providing(name)
+        if plugin is None:
+            raise PortfolioSnapshotStorageNotProvidedByAnyPluginException(
+                'PortfolioSnapshot storage "{}" not found.'.format(name)
+            )
 
-        raise PortfolioSnapshotStorageNotProvidedByAnyPluginException(
-            'PortfolioSnapshot storage "{}" not found.'.format(name)
-        )
+        return cast(PortfolioSnapshotStoragePluginSpecification, plugin).get_portfolio_snapshot_storage(name)
@@ -0,0 +1,121 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+
+# Lower number goes first
+PRIORITY_ORDER = 0  # Placing and cancelling of orders
+PRIORITY_ORDER_STATUS = 1
+PRIORITY_MARKET_DATA = 2  # Prices, candles, balances
+PRIORITY_METADATA = 3  # Markets, tradable pairs
+
+
+class _InFlightRequest:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Union[Exception, None] = None
+
+
+class RequestScheduler:
+    """
+    Client-side rate limiter shared by everything in the process which calls the same API (market, synchronizers,
+    socket server). Requests are limited by token bucket: requests_per_second on average, bursts of burst requests.
+    Waiting requests are executed by priority (orders before metadata), the same priority in order of arrival.
+    requests_per_second=None means no limit.
+
+    Identical requests (the same coalesce_key) issued while one is in flight wait for its result instead of calling
+    the API again, they get the same object (it must not be modified) or the same exception.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Union[float, None] = None,
+        burst: int = 1,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        assert requests_per_second is None or requests_per_second > 0, \
+            'Rate must be positive, {} given.'.format(requests_per_second)
+        assert burst >= 1, 'Burst must be at least 1, {} given.'.format(burst)
+
+        self._rate = requests_per_second
+        self._burst = burst
+        self._monotonic = monotonic_function
+        self._condition = threading.Condition()
+        self._tokens = float(burst)
+        self._updated_at = self._monotonic()
+        self._waiting: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._in_flight: Dict[Hashable, _InFlightRequest] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def call(
+        self,
+        priority: int,
+        function: Callable[..., Any],
+        *args,
+        coalesce_key: Union[Hashable, None] = None
+    ) -> Any:
+        if coalesce_key is None:
+            self._acquire(priority)
+            return function(*args)
+
+        with self._in_flight_lock:
+            in_flight_request = self._in_flight.get(coalesce_key)
+            is_leader = in_flight_request is None
+            if in_flight_request is None:
+                request = _InFlightRequest()
+                self._in_flight[coalesce_key] = request
+            else:
+                request = in_flight_request
+
+        if not is_leader:
+            request.done.wait()
+            if request.exception is not None:
+                raise request.exception
+            return request.result
+
+        try:
+            self._acquire(priority)
+            request.result = function(*args)
+            return request.result
+        except Exception as e:
+            request.exception = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[coalesce_key]
+            request.done.set()
+
+    def _acquire(self, priority: int) -> None:
+        rate = self._rate
+        if rate is None:
+            return
+
+        with self._condition:
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, entry)
+            self._condition.notify_all()  # Head of the queue could have changed
+
+            while True:
+                if self._waiting[0] != entry:
+                    self._condition.wait()
+                    continue
+
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    heapq.heappop(self._waiting)
+                    self._condition.notify_all()
+                    return
+
+                self._condition.wait((1 - self._tokens) / rate)
+
+    def _refill(self) -> None:
+        rate = self._rate
+        assert rate is not None, 'Without rate limit there are no tokens to refill.'
+
+        now = self._monotonic()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated_at) * rate)
+        self._updated_at = now
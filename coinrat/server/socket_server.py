@@ -12,6 +12,7 @@ from coinrat.domain import DateTimeFactory, serialize_balances, deserialize_date
 from coinrat.domain.pair import deserialize_pair, serialize_pair
 from coinrat.domain.order import Order, serialize_order, serialize_orders, ORDER_FIELD_ORDER_ID
 from coinrat.domain.candle import serialize_candles, Candle, serialize_candle, deserialize_candle_size
+from coinrat.domain.candle.heikin_ashi import serialize_candles_as_heikin_ashi
 from coinrat.domain.portfolio import serialize_portfolio_snapshot
 from coinrat.order_storage_plugins import OrderStoragePlugins
 from coinrat.candle_storage_plugins import CandleStoragePlugins
@@ -90,6 +91,9 @@ class SocketServer(threading.Thread):
                 candle_size=deserialize_candle_size(data['candle_size'])
             )
 
+            if data.get('heikin_ashi') is True:
+                return 'OK', serialize_candles_as_heikin_ashi(result_candles)
+
             return 'OK', serialize_candles(result_candles)
 
         @socket.on(EVENT_GET_MARKET_PLUGINS)
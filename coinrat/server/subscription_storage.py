@@ -3,8 +3,10 @@ from typing import Dict, List, Union
 
 from coinrat.domain import DateTimeInterval
 from coinrat.domain.pair import Pair
-from coinrat.event.event_types import EVENT_LAST_CANDLE_UPDATED, EVENT_NEW_ORDER, EVENT_NEW_STRATEGY_RUN
+from coinrat.event.event_types import EVENT_LAST_CANDLE_UPDATED, EVENT_CANDLES_UPDATED, EVENT_NEW_ORDER, \
+    EVENT_NEW_STRATEGY_RUN
 from coinrat.domain.candle import deserialize_candle, CandleSize
+from coinrat.domain.pair import deserialize_pair
 from coinrat.domain.order import deserialize_order
 
 logger = logging.getLogger(__name__)
@@ -35,17 +37,21 @@ class LastCandleSubscription(Subscription):
         self.candle_size = candle_size
 
     def is_subscribed_for(self, event_name: Union[str, None] = None, event_data: Union[Dict, None] = None) -> bool:
-        if event_name is not None and event_name != EVENT_LAST_CANDLE_UPDATED:
+        if event_name is not None and event_name not in [EVENT_LAST_CANDLE_UPDATED, EVENT_CANDLES_UPDATED]:
             return False
 
         if event_data is not None:
-            assert 'candle' in event_data
             assert 'storage' in event_data
-            candle = deserialize_candle(event_data['candle'])
+            if 'candle' in event_data:  # Event of one candle (from emitters before batching)
+                candle = deserialize_candle(event_data['candle'])
+                market_name, pair = candle.market_name, candle.pair
+            else:
+                assert 'market' in event_data and 'pair' in event_data
+                market_name, pair = event_data['market'], deserialize_pair(event_data['pair'])
 
             if (
-                candle.market_name != self.market_name
-                or not candle.pair.is_equal(self.pair)
+                market_name != self.market_name
+                or not pair.is_equal(self.pair)
                 or event_data['storage'] != self.storage_name
             ):
                 return False
@@ -8,7 +8,7 @@ from coinrat.domain.pair import Pair
 from coinrat.domain.candle import Candle, CandleSize, CANDLE_SIZE_UNIT_MINUTE, serialize_candle
 from coinrat.domain.order import serialize_order, Order, DIRECTION_SELL, ORDER_TYPE_LIMIT
 from coinrat.server.subscription_storage import SubscriptionStorage, NewOrderSubscription, LastCandleSubscription
-from coinrat.event.event_types import EVENT_NEW_ORDER, EVENT_LAST_CANDLE_UPDATED
+from coinrat.event.event_types import EVENT_NEW_ORDER, EVENT_LAST_CANDLE_UPDATED, EVENT_CANDLES_UPDATED
 
 
 def test_subscription_can_be_found():
@@ -92,6 +92,12 @@ def test_subscription_can_be_found():
         }
     ) == []
 
+    batch_event = {'storage': 'foo_storage', 'market': 'bar_market', 'pair': 'USD_BTC', 'candles': []}
+    assert storage.find_subscriptions_for_event(EVENT_CANDLES_UPDATED, batch_event)[0] == last_candle_subscription
+    assert storage.find_subscriptions_for_event(EVENT_CANDLES_UPDATED, dict(batch_event, pair='OMG_WTF')) == []
+    assert storage.find_subscriptions_for_event(EVENT_CANDLES_UPDATED, dict(batch_event, market='wtf_market')) == []
+    assert storage.find_subscriptions_for_event(EVENT_CANDLES_UPDATED, dict(batch_event, storage='gandalf')) == []
+
     order_suitable_for_subscription = _crate_serialized_order(Pair('USD', 'BTC'), 'bar_market', date_in_interval)
 
     assert storage.find_subscriptions_for_event(EVENT_NEW_ORDER)[0] == new_order_subscription
@@ -0,0 +1,211 @@
+import datetime
+import logging
+import math
+import uuid
+from decimal import Decimal
+from typing import Dict, List, Union
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage
+from coinrat.domain.market import Market
+from coinrat.domain.pair import Pair
+from coinrat.domain.portfolio import EquityCurve, calculate_pair_portfolio_value
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket, StrategyConfigurationException
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.order_facade import OrderFacade
+from coinrat.strategy_replayer import StrategyReplayer, StrategyReplay
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+
+OBJECTIVE_PROFIT = 'profit'
+OBJECTIVE_DRAWDOWN = 'drawdown'
+OBJECTIVES = [OBJECTIVE_PROFIT, OBJECTIVE_DRAWDOWN]
+
+DEFAULT_ETA = 3
+DEFAULT_MINIMAL_PREFIX = datetime.timedelta(hours=6)
+DEFAULT_WARM_UP = datetime.timedelta(days=5)
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigurationSearchResult:
+    def __init__(
+        self,
+        configuration: Dict[str, str],
+        equity_curve: EquityCurve,
+        evaluated_till: datetime.datetime,
+        objective: str
+    ) -> None:
+        self.configuration = configuration
+        self.equity_curve = equity_curve
+        self.evaluated_till = evaluated_till
+        self._objective = objective
+
+    @property
+    def final_balance(self) -> Union[Decimal, None]:
+        return self.equity_curve.final_value
+
+    @property
+    def profit(self) -> Decimal:
+        return self.equity_curve.profit
+
+    @property
+    def max_drawdown(self) -> Decimal:
+        return self.equity_curve.max_drawdown
+
+    @property
+    def score(self) -> Decimal:
+        """Higher is better."""
+        if self._objective == OBJECTIVE_DRAWDOWN:
+            return -self.max_drawdown
+
+        return self.profit
+
+    def __repr__(self) -> str:
+        return 'Profit: {0:.8f}, Drawdown: {1:.4f}, Evaluated till: {2}, Configuration: {3}'.format(
+            self.profit,
+            self.max_drawdown,
+            self.evaluated_till.isoformat(),
+            self.configuration
+        )
+
+
+class _Candidate:
+    def __init__(self, replay: StrategyReplay, result: ConfigurationSearchResult) -> None:
+        self.replay = replay
+        self.result = result
+
+    def advance(self, till: datetime.datetime) -> None:
+        def on_tick(market: Market, candle: Candle) -> None:
+            pair = self.replay.strategy_run.pair
+            value = calculate_pair_portfolio_value(market.get_balances(), pair, candle.average_price)
+            self.result.equity_curve.record(candle.time, value)
+
+        self.replay.advance(till, on_tick)
+        self.result.evaluated_till = till
+
+
+class StrategyConfigurationSearch:
+    """
+    Adaptive (successive-halving) search for the best strategy configuration.
+
+    All candidates are replayed over a short prefix of the interval first, the worst performers (by objective)
+    are dropped and only the survivors are replayed further. Each round prolongs the evaluated interval
+    by factor eta and keeps 1/eta of candidates, until survivors reach the end of the interval.
+    Replays continue where they stopped in the previous round, so no tick is simulated twice.
+
+    Candles are loaded from the candle storage only once and all replays run against in-memory storages.
+    """
+
+    def __init__(self, strategy_replayer: StrategyReplayer) -> None:
+        self._strategy_replayer = strategy_replayer
+
+    def search(
+        self,
+        strategy_name: str,
+        pair: Pair,
+        market_name: str,
+        interval: DateTimeInterval,
+        candle_storage: CandleStorage,
+        configurations: List[Dict[str, str]],
+        market_configuration: Union[Dict, None] = None,
+        objective: str = OBJECTIVE_PROFIT,
+        eta: int = DEFAULT_ETA,
+        minimal_prefix: datetime.timedelta = DEFAULT_MINIMAL_PREFIX,
+        warm_up: datetime.timedelta = DEFAULT_WARM_UP
+    ) -> List[ConfigurationSearchResult]:
+        assert interval.is_closed(), 'Configuration search needs closed interval.'
+        assert objective in OBJECTIVES, 'Unknown objective: "{}".'.format(objective)
+        assert eta >= 2, 'Eta must be at least 2.'
+
+        memory_candle_storage = CandleMemoryStorage()
+        memory_candle_storage.write_candles(candle_storage.find_by(
+            market_name,
+            pair,
+            DateTimeInterval(interval.since - warm_up, interval.till)
+        ))
+
+        candidates: List[_Candidate] = []
+        for configuration in configurations:
+            candidate = self._create_candidate(
+                strategy_name,
+                pair,
+                market_name,
+                interval,
+                memory_candle_storage,
+                configuration,
+                market_configuration if market_configuration is not None else {},
+                objective
+            )
+            if candidate is not None:
+                candidates.append(candidate)
+
+        results = [candidate.result for candidate in candidates]
+        prefixes = self._get_prefixes(interval, len(candidates), eta, minimal_prefix)
+
+        for rung, prefix in enumerate(prefixes):
+            till = interval.since + prefix
+            logger.info('Search round {}: {} candidates, replaying till {}.'.format(rung, len(candidates), till))
+
+            for candidate in candidates:
+                candidate.advance(till)
+
+            if rung < len(prefixes) - 1:
+                candidates.sort(key=lambda item: item.result.score, reverse=True)
+                candidates = candidates[:int(math.ceil(len(candidates) / eta))]
+
+        results.sort(key=lambda result: (result.evaluated_till, result.score), reverse=True)
+        return results
+
+    def _create_candidate(
+        self,
+        strategy_name: str,
+        pair: Pair,
+        market_name: str,
+        interval: DateTimeInterval,
+        candle_storage: CandleMemoryStorage,
+        configuration: Dict[str, str],
+        market_configuration: Dict,
+        objective: str
+    ) -> Union[_Candidate, None]:
+        order_storage = OrderMemoryStorage()
+        strategy_run = StrategyRun(
+            uuid.uuid4(),
+            interval.since,
+            pair,
+            [StrategyRunMarket('coinrat_mock', market_name, dict(market_configuration))],
+            strategy_name,
+            configuration,
+            interval,
+            candle_storage.name,
+            order_storage.name
+        )
+        order_facade = OrderFacade(order_storage, PortfolioSnapshotMemoryStorage(), NullEventEmitter())
+
+        try:
+            replay = self._strategy_replayer.create_replay(strategy_run, candle_storage, order_facade)
+        except (AssertionError, StrategyConfigurationException) as e:
+            logger.info('Skipping invalid configuration {}: {}'.format(configuration, str(e)))
+            return None
+
+        return _Candidate(replay, ConfigurationSearchResult(configuration, EquityCurve(), interval.since, objective))
+
+    @staticmethod
+    def _get_prefixes(
+        interval: DateTimeInterval,
+        number_of_candidates: int,
+        eta: int,
+        minimal_prefix: datetime.timedelta
+    ) -> List[datetime.timedelta]:
+        total = interval.till - interval.since
+
+        number_of_rungs = 1
+        while number_of_candidates > 1:
+            number_of_candidates = int(math.ceil(number_of_candidates / eta))
+            number_of_rungs += 1
+
+        while number_of_rungs > 1 and total / eta ** (number_of_rungs - 1) < minimal_prefix:
+            number_of_rungs -= 1
+
+        return [total / eta ** (number_of_rungs - 1 - rung) for rung in range(number_of_rungs)]
@@ -0,0 +1,223 @@
+import datetime
+import logging
+import multiprocessing
+import uuid
+from decimal import Decimal
+from typing import Dict, List, Union, Tuple
+
+import numpy
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage
+from coinrat.domain.candle.candle_path_generator import CandlePathGenerator, create_candles_from_path, \
+    PATH_METHOD_BLOCK_BOOTSTRAP
+from coinrat.domain.market import Market
+from coinrat.domain.pair import Pair
+from coinrat.domain.portfolio import EquityCurve, calculate_pair_portfolio_value
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.order_facade import OrderFacade
+from coinrat.strategy_replayer import StrategyReplayer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+
+DEFAULT_NUMBER_OF_PATHS = 1000
+DEFAULT_BLOCK_SIZE = 60
+DEFAULT_NOISE = 0.5
+DEFAULT_WARM_UP = datetime.timedelta(days=5)
+DEFAULT_BATCH_SIZE = 100
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+logger = logging.getLogger(__name__)
+
+_worker_strategy_replayer: Union[StrategyReplayer, None] = None
+_worker_simulation: Union['_Simulation', None] = None
+
+
+class MonteCarloPathResult:
+    def __init__(self, path_number: int, final_balance: Decimal, profit: Decimal, max_drawdown: Decimal) -> None:
+        self.path_number = path_number
+        self.final_balance = final_balance
+        self.profit = profit
+        self.max_drawdown = max_drawdown
+
+    def __repr__(self) -> str:
+        return 'Path {0}: Final balance: {1:.8f}, Drawdown: {2:.4f}'.format(
+            self.path_number,
+            self.final_balance,
+            self.max_drawdown
+        )
+
+
+class MonteCarloDistribution:
+    """Summary statistics of one measured value (final balance, drawdown, ...) over all simulated paths."""
+
+    def __init__(self, values: List[Decimal]) -> None:
+        assert len(values) > 0, 'Distribution needs at least one value.'
+
+        array = numpy.array([float(value) for value in values])
+        self.mean = float(numpy.mean(array))
+        self.std = float(numpy.std(array))
+        self.min = float(numpy.min(array))
+        self.max = float(numpy.max(array))
+        self.percentiles: Dict[int, float] = {
+            percentile: float(numpy.percentile(array, percentile)) for percentile in PERCENTILES
+        }
+
+    def __repr__(self) -> str:
+        return 'mean: {0:.4f}, std: {1:.4f}, min: {2:.4f}, {3}, max: {4:.4f}'.format(
+            self.mean,
+            self.std,
+            self.min,
+            ', '.join(['p{}: {:.4f}'.format(key, value) for key, value in sorted(self.percentiles.items())]),
+            self.max
+        )
+
+
+class MonteCarloResult:
+    def __init__(self, path_results: List[MonteCarloPathResult]) -> None:
+        self.path_results = path_results
+
+    @property
+    def final_balance(self) -> MonteCarloDistribution:
+        return MonteCarloDistribution([result.final_balance for result in self.path_results])
+
+    @property
+    def max_drawdown(self) -> MonteCarloDistribution:
+        return MonteCarloDistribution([result.max_drawdown for result in self.path_results])
+
+    @property
+    def probability_of_loss(self) -> float:
+        losses = [result for result in self.path_results if result.profit < 0]
+        return len(losses) / len(self.path_results)
+
+
+class StrategyMonteCarloSimulation:
+    """
+    Tests robustness of the strategy: instead of one replay over the historical candles, strategy is replayed
+    over many synthetic price paths generated from the history (see: CandlePathGenerator).
+
+    Paths are generated by numpy in batches and replayed in memory on the pool of processes. Each replay gets
+    real candles before the interval (so strategy can warm-up its indicators) followed by synthetic ones.
+    Workers get strategy replayer and history candles once (when the pool starts), tasks carry only the paths.
+    """
+
+    def __init__(self, strategy_replayer: StrategyReplayer) -> None:
+        self._strategy_replayer = strategy_replayer
+
+    def run(
+        self,
+        strategy_name: str,
+        pair: Pair,
+        market_name: str,
+        interval: DateTimeInterval,
+        candle_storage: CandleStorage,
+        strategy_configuration: Dict[str, str],
+        market_configuration: Union[Dict, None] = None,
+        number_of_paths: int = DEFAULT_NUMBER_OF_PATHS,
+        method: str = PATH_METHOD_BLOCK_BOOTSTRAP,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        noise: float = DEFAULT_NOISE,
+        number_of_processes: Union[int, None] = None,
+        seed: Union[int, None] = None,
+        warm_up: datetime.timedelta = DEFAULT_WARM_UP,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> MonteCarloResult:
+        assert interval.is_closed(), 'Monte-Carlo simulation needs closed interval.'
+        assert number_of_paths > 0, 'At least one path must be simulated.'
+
+        warm_up_candles = candle_storage.find_by(
+            market_name,
+            pair,
+            DateTimeInterval(interval.since - warm_up, interval.since)
+        )
+        candles = candle_storage.find_by(
+            market_name,
+            pair,
+            DateTimeInterval(interval.since - datetime.timedelta(seconds=1), interval.till)
+        )
+        start_price = float(warm_up_candles[-1].close) if len(warm_up_candles) > 0 else None
+        generator = CandlePathGenerator(candles, start_price)
+
+        strategy_run = StrategyRun(
+            uuid.uuid4(),
+            interval.since,
+            pair,
+            [StrategyRunMarket('coinrat_mock', market_name, market_configuration or {})],
+            strategy_name,
+            strategy_configuration,
+            interval,
+            'memory',
+            'memory'
+        )
+        random_state = numpy.random.RandomState(seed)
+        simulation = _Simulation(strategy_run, warm_up_candles, candles)
+
+        def iterate_tasks():
+            path_number = 0
+            while path_number < number_of_paths:
+                paths = generator.generate(
+                    min(batch_size, number_of_paths - path_number),
+                    method,
+                    block_size,
+                    noise,
+                    random_state
+                )
+                for path in paths:
+                    yield path_number, path
+                    path_number += 1
+
+        if number_of_processes == 1:
+            _initialize_worker(self._strategy_replayer, simulation)
+            path_results = [_replay_path(task) for task in iterate_tasks()]
+        else:
+            initial_arguments = (self._strategy_replayer, simulation)
+            with multiprocessing.Pool(number_of_processes, _initialize_worker, initial_arguments) as pool:
+                path_results = list(pool.imap(_replay_path, iterate_tasks()))
+
+        return MonteCarloResult(path_results)
+
+
+class _Simulation:
+    def __init__(self, strategy_run: StrategyRun, warm_up_candles: List[Candle], candles: List[Candle]) -> None:
+        self.strategy_run = strategy_run
+        self.warm_up_candles = warm_up_candles
+        self.candles = candles
+
+    def replay(self, strategy_replayer: StrategyReplayer, path: numpy.ndarray) -> EquityCurve:
+        candle_storage = CandleMemoryStorage()
+        candle_storage.write_candles(self.warm_up_candles)
+        candle_storage.write_candles(create_candles_from_path(self.candles, path))
+
+        equity_curve = EquityCurve()
+        order_facade = OrderFacade(OrderMemoryStorage(), PortfolioSnapshotMemoryStorage(), NullEventEmitter())
+        replay = strategy_replayer.create_replay(self.strategy_run, candle_storage, order_facade)
+
+        def on_tick(market: Market, candle: Candle) -> None:
+            value = calculate_pair_portfolio_value(market.get_balances(), self.strategy_run.pair, candle.average_price)
+            equity_curve.record(candle.time, value)
+
+        replay.advance(self.strategy_run.interval.till, on_tick)
+
+        return equity_curve
+
+
+def _initialize_worker(strategy_replayer: StrategyReplayer, simulation: _Simulation) -> None:
+    global _worker_strategy_replayer, _worker_simulation
+    _worker_strategy_replayer = strategy_replayer
+    _worker_simulation = simulation
+
+
+def _replay_path(task: Tuple[int, numpy.ndarray]) -> MonteCarloPathResult:
+    path_number, path = task
+    equity_curve = _worker_simulation.replay(_worker_strategy_replayer, path)
+    logger.debug('Path {} replayed.'.format(path_number))
+
+    return MonteCarloPathResult(
+        path_number,
+        equity_curve.final_value,
+        equity_curve.profit,
+        equity_curve.max_drawdown
+    )
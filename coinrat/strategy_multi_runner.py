@@ -0,0 +1,118 @@
+import asyncio
+import contextlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Union
+
+from coinrat.domain.strategy import StrategyRun
+from coinrat.strategy_standard_runner import StrategyStandardRunner
+from coinrat.tick_scheduler import TickScheduler, TICK_POLICY_SKIP
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class StrategyMultiRunner:
+    """
+    Runs many live strategies in one process. Every strategy run is a coroutine (with its own TickScheduler)
+    on a shared asyncio event loop. Strategies and markets are synchronous, so their creation and ticks run in
+    a thread pool of max_workers threads, which bounds the number of concurrent blocking calls (storages,
+    market APIs). Plugins, storages and market clients are shared by all strategies (see: StrategyStandardRunner).
+
+    Ticks of one strategy never overlap. Failed strategy run is passed to on_strategy_run_failed and stopped,
+    other strategies keep running. Ticks are run by StrategyStandardRunner.tick(), so tick profiler (if enabled)
+    measures ticks of all strategies together.
+    """
+
+    def __init__(
+        self,
+        strategy_standard_runner: StrategyStandardRunner,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        tick_offset: float = 0.0,
+        tick_policy: str = TICK_POLICY_SKIP
+    ) -> None:
+        assert max_workers > 0, 'At least one worker is needed, {} given.'.format(max_workers)
+
+        self._strategy_standard_runner = strategy_standard_runner
+        self._max_workers = max_workers
+        self._tick_offset = tick_offset
+        self._tick_policy = tick_policy
+        self._is_running = False
+
+    def run(
+        self,
+        strategy_runs: List[StrategyRun],
+        on_strategy_run_failed: Union[Callable[[StrategyRun, Exception], None], None] = None
+    ) -> None:
+        """Blocks until all strategy runs fail or stop() is called."""
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(self.run_async(strategy_runs, on_strategy_run_failed))
+        try:
+            loop.run_until_complete(task)
+        except KeyboardInterrupt:
+            # Running ticks are finished (and thread pool shut down) before the interruption is passed on
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                loop.run_until_complete(task)
+            raise
+        finally:
+            loop.close()
+
+    async def run_async(
+        self,
+        strategy_runs: List[StrategyRun],
+        on_strategy_run_failed: Union[Callable[[StrategyRun, Exception], None], None] = None
+    ) -> None:
+        self._is_running = True
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            await asyncio.gather(*[
+                self._run_strategy(strategy_run, executor, on_strategy_run_failed) for strategy_run in strategy_runs
+            ])
+        finally:
+            self._is_running = False
+            executor.shutdown(wait=True)
+
+    def stop(self) -> None:
+        """Strategies finish their current ticks and stop at their next tick boundary."""
+        self._is_running = False
+
+    async def _run_strategy(
+        self,
+        strategy_run: StrategyRun,
+        executor: ThreadPoolExecutor,
+        on_strategy_run_failed: Union[Callable[[StrategyRun, Exception], None], None]
+    ) -> None:
+        loop = asyncio.get_event_loop()
+        try:
+            strategy, markets = await loop.run_in_executor(
+                executor,
+                self._strategy_standard_runner.create_strategy,
+                strategy_run
+            )
+            tick_scheduler = TickScheduler(
+                strategy.get_seconds_delay_between_ticks(),
+                self._tick_offset,
+                self._tick_policy,
+                first_tick_immediately=True
+            )
+
+            while self._is_running:
+                await asyncio.sleep(tick_scheduler.get_seconds_until_next_tick())
+                if not self._is_running:
+                    break
+
+                tick_scheduler.start_tick()
+                await loop.run_in_executor(executor, self._strategy_standard_runner.tick, strategy, markets)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            logger.exception('Strategy run "{}" ({}) failed.'.format(
+                strategy_run.strategy_run_id,
+                strategy_run.strategy_name
+            ))
+            if on_strategy_run_failed is not None:
+                on_strategy_run_failed(strategy_run, e)
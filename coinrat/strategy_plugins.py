@@ -1,10 +1,10 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
 from coinrat.domain import DateTimeFactory
 from coinrat.domain.strategy import Strategy, StrategyRun
 from coinrat.order_facade import OrderFacade
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 from .domain.candle import CandleStorage
 
 get_available_strategies_spec = pluggy.HookspecMarker('coinrat_plugins')
@@ -32,21 +32,19 @@ class StrategyNotProvidedByAnyPluginException(Exception):
 
 
 class StrategyPlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[StrategyPluginSpecification],
-            plugins_loader('coinrat_strategy_plugins', StrategyPluginSpecification)
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        self._plugins = LazyPlugins(
+            'coinrat_strategy_plugins',
+            StrategyPluginSpecification,
+            lambda plugin: plugin.get_available_strategies(),
+            metadata_cache
         )
 
     def get_available_strategies(self) -> List[str]:
-        return [strategy_name for plugin in self._plugins for strategy_name in plugin.get_available_strategies()]
+        return self._plugins.get_provided_names()
 
     def get_strategy_class(self, name: str):
-        for plugin in self._plugins:
-            if name in plugin.get_available_strategies():
-                return plugin.get_strategy_class(name)
-
-        raise StrategyNotProvidedByAnyPluginException('Strategy "{}" not found.'.format(name))
+        return self._get_plugin_providing(name).get_strategy_class(name)
 
     def get_strategy(
         self,
@@ -56,14 +54,17 @@ class StrategyPlugins:
         datetime_factory: DateTimeFactory,
         strategy_run: StrategyRun
     ) -> Strategy:
-        for plugin in self._plugins:
-            if name in plugin.get_available_strategies():
-                return plugin.get_strategy(
-                    name,
-                    candle_storage,
-                    order_facade,
-                    datetime_factory,
-                    strategy_run
-                )
+        return self._get_plugin_providing(name).get_strategy(
+            name,
+            candle_storage,
+            order_facade,
+            datetime_factory,
+            strategy_run
+        )
+
+    def _get_plugin_providing(self, name: str) -> StrategyPluginSpecification:
+        plugin = self._plugins.find_plugin_providing(name)
+        if plugin is None:
+            raise StrategyNotProvidedByAnyPluginException('Strategy "{}" not found.'.format(name))
 
-        raise StrategyNotProvidedByAnyPluginException('Strategy "{}" not found.'.format(name))
+        return cast(StrategyPluginSpecification, plugin)
@@ -1,8 +1,9 @@
 import datetime
 import logging
-from typing import List
+from typing import List, Callable, Union, TYPE_CHECKING, cast
 
 from coinrat.domain import FrozenDateTimeFactory
+from coinrat.domain.candle import CandleStorage, Candle
 from coinrat.domain.market import Market
 from coinrat.domain.strategy import StrategyRun, StrategyRunner, SkipTickException, Strategy
 from coinrat.market_plugins import MarketPlugins
@@ -13,11 +14,69 @@ from coinrat.candle_storage_plugins import CandleStoragePlugins
 from coinrat.order_storage_plugins import OrderStoragePlugins
 from coinrat.event.event_emitter import EventEmitter
 from coinrat.domain.configuration_structure import format_data_to_python_types
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL, NUMERIC_BACKEND_FLOAT, NUMERIC_BACKENDS
+from coinrat.float_candle_storage import FloatCandleStorage
+from coinrat.tick_profiler import TickProfiler, COMPONENT_CANDLE_STORAGE, COMPONENT_ORDER_STORAGE, COMPONENT_MARKET
+
+if TYPE_CHECKING:  # pragma: no cover
+    from coinrat_mock.market import MockMarket  # Replays always run on mocked market (see create_replay)
 
 logger = logging.getLogger(__name__)
 
 
+class StrategyReplay:
+    """
+    One simulation of the strategy against the mocked market. Replay can be advanced step by step,
+    so it can be (for example) evaluated on shorter interval first and continued later.
+    """
+
+    def __init__(
+        self,
+        strategy_run: StrategyRun,
+        strategy: Strategy,
+        market: 'MockMarket',
+        candle_storage: CandleStorage,
+        datetime_factory: FrozenDateTimeFactory,
+        tick_profiler: Union[TickProfiler, None] = None
+    ) -> None:
+        self.strategy_run = strategy_run
+        self.strategy = strategy
+        self.market = market
+        self._candle_storage = candle_storage
+        self._datetime_factory = datetime_factory
+        self._tick_profiler = tick_profiler
+        self._tick_markets = [market if tick_profiler is None else tick_profiler.wrap(market, COMPONENT_MARKET)]
+
+    def now(self) -> datetime.datetime:
+        return self._datetime_factory.now()
+
+    def advance(self, till: datetime.datetime, on_tick: Union[Callable[[Market, Candle], None], None] = None) -> None:
+        while self._datetime_factory.now() < till:
+            current_candle = self._candle_storage.get_last_minute_candle(
+                self.market.name,
+                self.strategy_run.pair,
+                self._datetime_factory.now()
+            )
+            self.market.mock_current_price(self.strategy_run.pair, current_candle.average_price)
+            if self._tick_profiler is None:
+                _do_tick(self._tick_markets, self.strategy, self._datetime_factory.now())
+            else:
+                with self._tick_profiler.measure_tick():
+                    _do_tick(self._tick_markets, self.strategy, self._datetime_factory.now())
+
+            if on_tick is not None:
+                on_tick(self.market, current_candle)
+
+            self._datetime_factory.move(datetime.timedelta(seconds=self.strategy.get_seconds_delay_between_ticks()))
+
+
 class StrategyReplayer(StrategyRunner):
+    """
+    With float numeric backend, candles, mocked market balances and orders work with floats instead of Decimals.
+    It is faster, but results differ from the Decimal replay (see: FLOAT_BACKEND_RELATIVE_TOLERANCE). Meant for
+    in-memory simulations (configuration search, Monte Carlo), order storage must return orders as they were saved.
+    """
+
     def __init__(
         self,
         candle_storage_plugins: CandleStoragePlugins,
@@ -25,8 +84,12 @@ class StrategyReplayer(StrategyRunner):
         strategy_plugins: StrategyPlugins,
         market_plugins: MarketPlugins,
         portfolio_snapshot_storage_plugins: PortfolioSnapshotStoragePlugins,
-        event_emitter: EventEmitter
+        event_emitter: EventEmitter,
+        tick_profiler: Union[TickProfiler, None] = None,
+        numeric_backend: str = NUMERIC_BACKEND_DECIMAL
     ) -> None:
+        assert numeric_backend in NUMERIC_BACKENDS, 'Unknown numeric backend: "{}"'.format(numeric_backend)
+
         super().__init__()
         self._order_storage_plugins = orders_storage_plugins
         self._candle_storage_plugins = candle_storage_plugins
@@ -34,6 +97,8 @@ class StrategyReplayer(StrategyRunner):
         self._market_plugins = market_plugins
         self._portfolio_snapshot_storage_plugins = portfolio_snapshot_storage_plugins
         self._event_emitter = event_emitter
+        self._tick_profiler = tick_profiler
+        self._numeric_backend = numeric_backend
 
     def run(self, strategy_run: StrategyRun):
         assert strategy_run.interval.is_closed(), 'Strategy replayer cannot run simulation for non-closed interval'
@@ -41,16 +106,43 @@ class StrategyReplayer(StrategyRunner):
         order_storage = self._order_storage_plugins.get_order_storage(strategy_run.order_storage_name)
         candle_storage = self._candle_storage_plugins.get_candle_storage(strategy_run.candle_storage_name)
 
-        datetime_factory = FrozenDateTimeFactory(strategy_run.interval.since)
-
         # Todo: Make this configurable, see https://github.com/Achse/coinrat/issues/47
         portfolio_snapshot_storage = self._portfolio_snapshot_storage_plugins \
             .get_portfolio_snapshot_storage('influx_db')
 
+        if self._tick_profiler is not None:
+            self._tick_profiler.reset()
+            order_storage = self._tick_profiler.wrap(order_storage, COMPONENT_ORDER_STORAGE)
+
+        replay = self.create_replay(
+            strategy_run,
+            candle_storage,
+            OrderFacade(order_storage, portfolio_snapshot_storage, self._event_emitter)
+        )
+        replay.advance(strategy_run.interval.till)
+
+        if self._tick_profiler is not None:
+            self._tick_profiler.log_summary()
+
+    def create_replay(
+        self,
+        strategy_run: StrategyRun,
+        candle_storage: CandleStorage,
+        order_facade: OrderFacade
+    ) -> StrategyReplay:
+        datetime_factory = FrozenDateTimeFactory(strategy_run.interval.since)
+
+        if self._numeric_backend == NUMERIC_BACKEND_FLOAT:
+            candle_storage = FloatCandleStorage(candle_storage)
+
+        strategy_candle_storage = candle_storage
+        if self._tick_profiler is not None:
+            strategy_candle_storage = self._tick_profiler.wrap(candle_storage, COMPONENT_CANDLE_STORAGE)
+
         strategy = self._strategy_plugins.get_strategy(
             strategy_run.strategy_name,
-            candle_storage,
-            OrderFacade(order_storage, portfolio_snapshot_storage, self._event_emitter),
+            strategy_candle_storage,
+            order_facade,
             datetime_factory,
             strategy_run
         )
@@ -62,28 +154,21 @@ class StrategyReplayer(StrategyRunner):
         market_plugin = self._market_plugins.get_plugin(strategy_run_market.plugin_name)
         market_class = market_plugin.get_market_class(strategy_run_market.market_name)
 
-        market = market_plugin.get_market(
-            strategy_run_market.market_name,
-            datetime_factory,
-            format_data_to_python_types(
-                strategy_run_market.market_configuration,
-                market_class.get_configuration_structure()
-            )
+        market_configuration = format_data_to_python_types(
+            strategy_run_market.market_configuration,
+            market_class.get_configuration_structure()
+        )
+        market_configuration['mocked_numeric_backend'] = self._numeric_backend
+        market = cast(
+            'MockMarket',
+            market_plugin.get_market(strategy_run_market.market_name, datetime_factory, market_configuration)
         )
 
-        while datetime_factory.now() < strategy_run.interval.till:
-            current_candle = candle_storage.get_last_minute_candle(
-                market.name,
-                strategy_run.pair,
-                datetime_factory.now()
-            )
-            market.mock_current_price(strategy_run.pair, current_candle.average_price)
-            self._do_tick([market], strategy, datetime_factory.now())
-            datetime_factory.move(datetime.timedelta(seconds=strategy.get_seconds_delay_between_ticks()))
-
-    @staticmethod
-    def _do_tick(markets: List[Market], strategy: Strategy, tick_at: datetime.datetime) -> None:
-        try:
-            strategy.tick(markets)
-        except SkipTickException as e:
-            logger.warning('[{}]Exception during tick: {}'.format(tick_at.isoformat(), str(e)))
+        return StrategyReplay(strategy_run, strategy, market, candle_storage, datetime_factory, self._tick_profiler)
+
+
+def _do_tick(markets: List[Market], strategy: Strategy, tick_at: datetime.datetime) -> None:
+    try:
+        strategy.tick(markets)
+    except SkipTickException as e:
+        logger.warning('[{}]Exception during tick: {}'.format(tick_at.isoformat(), str(e)))
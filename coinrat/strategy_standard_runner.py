@@ -1,7 +1,12 @@
+import logging
 import time
+from typing import Callable, List, Tuple, Union
 
 from coinrat.domain import DateTimeFactory
-from coinrat.domain.strategy import StrategyRunner
+from coinrat.domain.market import Market
+from coinrat.domain.market.balance_caching_market import BalanceCachingMarket, DEFAULT_BALANCE_CACHE_TTL, \
+    invalidate_balance_caches
+from coinrat.domain.strategy import Strategy, StrategyRunner
 from coinrat.domain.strategy import StrategyRun
 from coinrat.market_plugins import MarketPlugins
 from coinrat.order_facade import OrderFacade
@@ -9,10 +14,29 @@ from coinrat.portfolio_snapshot_storage_plugins import PortfolioSnapshotStorageP
 from coinrat.strategy_plugins import StrategyPlugins
 from coinrat.candle_storage_plugins import CandleStoragePlugins
 from coinrat.order_storage_plugins import OrderStoragePlugins
+from coinrat.event.candle_event_listener import CandleEventListener
 from coinrat.event.event_emitter import EventEmitter
+from coinrat.tick_profiler import TickProfiler, COMPONENT_CANDLE_STORAGE, COMPONENT_ORDER_STORAGE, COMPONENT_MARKET
+from coinrat.tick_scheduler import TickScheduler, TICK_POLICY_SKIP
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FALLBACK_POLL_INTERVAL = 300
 
 
 class StrategyStandardRunner(StrategyRunner):
+    """
+    Runs the strategy live. Ticks are scheduled by TickScheduler at wall-clock boundaries given by the strategy's
+    delay between ticks (shifted by tick_offset seconds), the first tick happens right after start.
+
+    With candle_event_listener_factory, strategy ticks as soon as synchronizer writes new candles of its markets
+    (no polling of storages), or after fallback_poll_interval seconds without any candle. Ticks are at least
+    the strategy's delay between ticks apart (unfinished candles are written many times a minute), candles written
+    in between are coalesced into one tick.
+
+    Balances of markets are cached during the tick (see BalanceCachingMarket), balance_cache_ttl=0 turns it off.
+    """
+
     def __init__(
         self,
         candle_storage_plugins: CandleStoragePlugins,
@@ -21,7 +45,15 @@ class StrategyStandardRunner(StrategyRunner):
         market_plugins: MarketPlugins,
         portfolio_snapshot_storage_plugins: PortfolioSnapshotStoragePlugins,
         event_emitter: EventEmitter,
-        datetime_factory: DateTimeFactory
+        datetime_factory: DateTimeFactory,
+        tick_profiler: Union[TickProfiler, None] = None,
+        tick_offset: float = 0.0,
+        tick_policy: str = TICK_POLICY_SKIP,
+        candle_event_listener_factory: Union[Callable[[StrategyRun], CandleEventListener], None] = None,
+        fallback_poll_interval: float = DEFAULT_FALLBACK_POLL_INTERVAL,
+        balance_cache_ttl: float = DEFAULT_BALANCE_CACHE_TTL,
+        monotonic_function: Callable[[], float] = time.monotonic,
+        sleep_function: Callable[[float], None] = time.sleep
     ) -> None:
         super().__init__()
         self._portfolio_snapshot_storage_plugins = portfolio_snapshot_storage_plugins
@@ -31,8 +63,66 @@ class StrategyStandardRunner(StrategyRunner):
         self._market_plugins = market_plugins
         self._event_emitter = event_emitter
         self._datetime_factory = datetime_factory
+        self._tick_profiler = tick_profiler
+        self._tick_offset = tick_offset
+        self._tick_policy = tick_policy
+        self._candle_event_listener_factory = candle_event_listener_factory
+        self._fallback_poll_interval = fallback_poll_interval
+        self._balance_cache_ttl = balance_cache_ttl
+        self._monotonic = monotonic_function
+        self._sleep = sleep_function
 
     def run(self, strategy_run: StrategyRun):
+        strategy, markets = self.create_strategy(strategy_run)
+
+        if self._candle_event_listener_factory is not None:
+            self._run_on_candle_events(strategy_run, strategy, markets)
+            return
+
+        tick_scheduler = TickScheduler(
+            strategy.get_seconds_delay_between_ticks(),
+            self._tick_offset,
+            self._tick_policy,
+            first_tick_immediately=True
+        )
+
+        while True:
+            tick_scheduler.wait_for_next_tick()
+            self.tick(strategy, markets)
+
+    def _run_on_candle_events(self, strategy_run: StrategyRun, strategy: Strategy, markets: List[Market]) -> None:
+        candle_event_listener = self._candle_event_listener_factory(strategy_run)
+        min_tick_interval = strategy.get_seconds_delay_between_ticks()
+        try:
+            last_tick_at = self._monotonic()
+            self.tick(strategy, markets)
+
+            while True:
+                if not candle_event_listener.wait_for_new_candles(self._fallback_poll_interval):
+                    logger.debug('No new candles in {}s, fallback tick.'.format(self._fallback_poll_interval))
+
+                seconds_until_tick_allowed = last_tick_at + min_tick_interval - self._monotonic()
+                if seconds_until_tick_allowed > 0:
+                    self._sleep(seconds_until_tick_allowed)
+                    candle_event_listener.wait_for_new_candles(0)  # Candles written while sleeping are in this tick
+
+                last_tick_at = self._monotonic()
+                self.tick(strategy, markets)
+        finally:
+            candle_event_listener.close()
+
+    def tick(self, strategy: Strategy, markets: List[Market]) -> None:
+        """One tick of strategy created by create_strategy(), measured by tick profiler (if enabled)."""
+        invalidate_balance_caches(markets)
+        if self._tick_profiler is None:
+            strategy.tick(markets)
+        else:
+            with self._tick_profiler.measure_tick():
+                strategy.tick(markets)
+            self._tick_profiler.log_summary_if_due()
+
+    def create_strategy(self, strategy_run: StrategyRun) -> Tuple[Strategy, List[Market]]:
+        """Strategy and markets (with connected storages) of the strategy run, ready to tick."""
         order_storage = self._order_storage_plugins.get_order_storage(strategy_run.order_storage_name)
         candle_storage = self._candle_storage_plugins.get_candle_storage(strategy_run.candle_storage_name)
 
@@ -40,6 +130,10 @@ class StrategyStandardRunner(StrategyRunner):
         portfolio_snapshot_storage = self._portfolio_snapshot_storage_plugins \
             .get_portfolio_snapshot_storage('influx_db')
 
+        if self._tick_profiler is not None:
+            order_storage = self._tick_profiler.wrap(order_storage, COMPONENT_ORDER_STORAGE)
+            candle_storage = self._tick_profiler.wrap(candle_storage, COMPONENT_CANDLE_STORAGE)
+
         strategy = self._strategy_plugins.get_strategy(
             strategy_run.strategy_name,
             candle_storage,
@@ -58,6 +152,11 @@ class StrategyStandardRunner(StrategyRunner):
                 strategy_run_market.market_configuration
             ))
 
-        while True:
-            strategy.tick(markets)
-            time.sleep(int(strategy.get_seconds_delay_between_ticks()))
+        if self._tick_profiler is not None:
+            markets = [self._tick_profiler.wrap(market, COMPONENT_MARKET) for market in markets]
+
+        # Outside of the profiler, so profiler measures real calls of markets
+        if self._balance_cache_ttl > 0:
+            markets = [BalanceCachingMarket(market, self._balance_cache_ttl) for market in markets]
+
+        return strategy, markets
@@ -0,0 +1,99 @@
+import datetime
+import time
+from typing import Callable, Dict, List, Set
+
+from coinrat.domain import MarketStateSynchronizer
+from coinrat.domain.candle import Candle, CandleStorage
+from coinrat.domain.candle.minute_candle_builder import MinuteCandleBuilder
+from coinrat.domain.pair import Pair, serialize_pair
+from coinrat.domain.trade import Trade, TradeStream
+from coinrat.event.event_emitter import EventEmitter
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class StreamingSynchronizer(MarketStateSynchronizer):
+    """
+    Synchronizes candles from push-based stream of trades instead of polling of REST endpoints. Trades are
+    aggregated into minute candles in process (see: MinuteCandleBuilder). Finished candles are written and emitted
+    immediately, unfinished candles of the current minute every flush_interval seconds (storage overwrites candle
+    of the same time), so current price is available in under a second instead of after delay of polling.
+    """
+
+    def __init__(
+        self,
+        trade_stream: TradeStream,
+        storage: CandleStorage,
+        event_emitter: EventEmitter,
+        supported_markets: List[str],
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._trade_stream = trade_stream
+        self._storage = storage
+        self._event_emitter = event_emitter
+        self._supported_markets = supported_markets
+        self._flush_interval = flush_interval
+        self._monotonic = monotonic_function
+
+    def synchronize(self, market_name: str, pair: Pair) -> None:
+        self.synchronize_pairs(market_name, [pair])
+
+    def synchronize_pairs(self, market_name: str, pairs: List[Pair]) -> None:
+        """Blocks until the stream ends or stop() is called, all pairs are streamed by one connection."""
+        builders: Dict[str, MinuteCandleBuilder] = {
+            serialize_pair(pair): MinuteCandleBuilder(market_name, pair) for pair in pairs
+        }
+        changed_pairs: Set[str] = set()
+        last_flush_at = self._monotonic()
+
+        def flush_if_due() -> None:
+            nonlocal last_flush_at
+            if self._monotonic() - last_flush_at < self._flush_interval:
+                return
+
+            self._flush(builders, changed_pairs)
+            last_flush_at = self._monotonic()
+
+        def on_trade(trade: Trade) -> None:
+            serialized_pair = serialize_pair(trade.pair)
+            if serialized_pair not in builders:
+                return
+
+            self._write(builders[serialized_pair].add_trade(trade))
+            changed_pairs.add(serialized_pair)
+            flush_if_due()
+
+        def on_heartbeat(current_time: datetime.datetime) -> None:
+            finished_candles: List[Candle] = []
+            for serialized_pair, builder in builders.items():
+                closed_candles = builder.close_minutes_until(current_time)
+                if len(closed_candles) > 0:  # Last state of the minute is written with its finished candle
+                    changed_pairs.discard(serialized_pair)
+                    finished_candles += closed_candles
+
+            self._write(finished_candles)
+            flush_if_due()
+
+        try:
+            self._trade_stream.run(market_name, pairs, on_trade, on_heartbeat)
+        finally:
+            self._flush(builders, changed_pairs)
+
+    def stop(self) -> None:
+        self._trade_stream.stop()
+
+    def get_supported_markets(self) -> List[str]:
+        return self._supported_markets
+
+    def _flush(self, builders: Dict[str, MinuteCandleBuilder], changed_pairs: Set[str]) -> None:
+        candles = [builders[serialized_pair].current_candle for serialized_pair in sorted(changed_pairs)]
+        changed_pairs.clear()
+        self._write([candle for candle in candles if candle is not None])
+
+    def _write(self, candles: List[Candle]) -> None:
+        if len(candles) == 0:
+            return
+
+        self._storage.write_candles(candles)
+        self._event_emitter.emit_new_candles(self._storage.name, candles)
@@ -0,0 +1,180 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+from coinrat.domain import MarketStateSynchronizer
+from coinrat.domain.candle import CandleStorage
+from coinrat.domain.pair import Pair, deserialize_pair, serialize_pair
+from coinrat.event.event_emitter import EventEmitter
+from coinrat.synchronizer_plugins import SynchronizerPlugins
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_BACKOFF = 5
+DEFAULT_MAX_BACKOFF = 300
+
+
+class SynchronizationTarget:
+    def __init__(self, synchronizer_name: str, market_name: str, pair: Pair) -> None:
+        self._synchronizer_name = synchronizer_name
+        self._market_name = market_name
+        self._pair = pair
+
+    @property
+    def synchronizer_name(self) -> str:
+        return self._synchronizer_name
+
+    @property
+    def market_name(self) -> str:
+        return self._market_name
+
+    @property
+    def pair(self) -> Pair:
+        return self._pair
+
+    def __repr__(self) -> str:
+        return '{} {} {}'.format(self._synchronizer_name, self._market_name, serialize_pair(self._pair))
+
+
+def deserialize_synchronization_targets(data: List[Dict]) -> List[SynchronizationTarget]:
+    return [
+        SynchronizationTarget(target['synchronizer'], target['market'], deserialize_pair(target['pair']))
+        for target in data
+    ]
+
+
+class SynchronizerMultiRunner:
+    """
+    Runs many synchronizations in one process, every job in its own (daemon) thread. Targets of the same
+    synchronizer and market are synchronized by ONE synchronizer instance (one HTTP session / connection pool)
+    by its synchronize_pairs when synchronizer supports it, otherwise every pair has its own synchronize loop
+    (synchronizers still share clients of their plugin). Candle storage and event emitter are shared by all jobs.
+
+    Failed job does not affect the others, it is restarted after backoff (doubled on every consecutive failure,
+    up to max_backoff). Job which was running longer than max_backoff starts with initial_backoff again.
+    """
+
+    def __init__(
+        self,
+        synchronizer_plugins: SynchronizerPlugins,
+        initial_backoff: float = DEFAULT_INITIAL_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        assert 0 < initial_backoff <= max_backoff, \
+            'Backoff must be positive and initial <= max ({}, {} given).'.format(initial_backoff, max_backoff)
+
+        self._synchronizer_plugins = synchronizer_plugins
+        self._initial_backoff = initial_backoff
+        self._max_backoff = max_backoff
+        self._monotonic = monotonic_function
+        self._stop_event = threading.Event()
+
+    def run(
+        self,
+        targets: List[SynchronizationTarget],
+        candle_storage: CandleStorage,
+        event_emitter: EventEmitter
+    ) -> None:
+        """Blocks until all jobs finish (synchronizers with limited number of runs) or stop() is called."""
+        jobs = self._create_jobs(targets, candle_storage, event_emitter)
+        self._stop_event.clear()
+
+        # Running synchronization loops can not be interrupted, daemon threads do not block end of the process
+        threads = [
+            threading.Thread(target=self._run_job_with_backoff, args=(name, job), name=name, daemon=True)
+            for name, job in jobs
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for thread in threads:
+                while thread.is_alive() and not self._stop_event.is_set():
+                    thread.join(timeout=1)  # Join without timeout would block KeyboardInterrupt
+        finally:
+            self._stop_event.set()
+
+    def stop(self) -> None:
+        """Jobs waiting for restart are not restarted, run() returns."""
+        self._stop_event.set()
+
+    def _create_jobs(
+        self,
+        targets: List[SynchronizationTarget],
+        candle_storage: CandleStorage,
+        event_emitter: EventEmitter
+    ) -> List[Tuple[str, Callable[[], None]]]:
+        groups: Dict[Tuple[str, str], List[Pair]] = OrderedDict()
+        for target in targets:
+            groups.setdefault((target.synchronizer_name, target.market_name), []).append(target.pair)
+
+        jobs: List[Tuple[str, Callable[[], None]]] = []
+        for (synchronizer_name, market_name), pairs in groups.items():
+            synchronizer = self._get_synchronizer(synchronizer_name, market_name, candle_storage, event_emitter)
+            if len(pairs) > 1 and self._supports_many_pairs(synchronizer):
+                name = '{} {} ({} pairs)'.format(synchronizer_name, market_name, len(pairs))
+                jobs.append((name, self._create_synchronize_pairs_job(synchronizer, market_name, pairs)))
+                continue
+
+            for index, pair in enumerate(pairs):
+                if index > 0:  # Synchronizers (eg. Bittrex) keep state of the synchronized pair
+                    synchronizer = self._get_synchronizer(synchronizer_name, market_name, candle_storage, event_emitter)
+
+                name = '{} {} {}'.format(synchronizer_name, market_name, serialize_pair(pair))
+                jobs.append((name, self._create_synchronize_job(synchronizer, market_name, pair)))
+
+        return jobs
+
+    def _get_synchronizer(
+        self,
+        synchronizer_name: str,
+        market_name: str,
+        candle_storage: CandleStorage,
+        event_emitter: EventEmitter
+    ) -> MarketStateSynchronizer:
+        synchronizer = self._synchronizer_plugins.get_synchronizer(synchronizer_name, candle_storage, event_emitter)
+        if market_name not in synchronizer.get_supported_markets():
+            raise ValueError(
+                'Market "{}" is not supported by synchronizer "{}".'.format(market_name, synchronizer_name)
+            )
+
+        return synchronizer
+
+    @staticmethod
+    def _supports_many_pairs(synchronizer: MarketStateSynchronizer) -> bool:
+        return type(synchronizer).synchronize_pairs is not MarketStateSynchronizer.synchronize_pairs
+
+    @staticmethod
+    def _create_synchronize_pairs_job(
+        synchronizer: MarketStateSynchronizer,
+        market_name: str,
+        pairs: List[Pair]
+    ) -> Callable[[], None]:
+        return lambda: synchronizer.synchronize_pairs(market_name, pairs)
+
+    @staticmethod
+    def _create_synchronize_job(
+        synchronizer: MarketStateSynchronizer,
+        market_name: str,
+        pair: Pair
+    ) -> Callable[[], None]:
+        return lambda: synchronizer.synchronize(market_name, pair)
+
+    def _run_job_with_backoff(self, name: str, job: Callable[[], None]) -> None:
+        backoff = self._initial_backoff
+        while not self._stop_event.is_set():
+            started_at = self._monotonic()
+            try:
+                job()
+                logger.info('Synchronization "{}" finished.'.format(name))
+                return
+            except Exception:
+                if self._monotonic() - started_at > self._max_backoff:
+                    backoff = self._initial_backoff
+
+                logger.exception('Synchronization "{}" failed, restart in {} seconds.'.format(name, backoff))
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
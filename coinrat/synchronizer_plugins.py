@@ -1,8 +1,8 @@
 import pluggy
-from typing import List, Set, cast
+from typing import List, Union, cast
 
 from coinrat.event.event_emitter import EventEmitter
-from .plugins import PluginSpecification, plugins_loader
+from .plugins import PluginSpecification, PluginMetadataCache, LazyPlugins
 from .domain import MarketStateSynchronizer
 from .domain.candle import CandleStorage
 
@@ -31,16 +31,16 @@ class SynchronizerNotProvidedByAnyPluginException(Exception):
 
 
 class SynchronizerPlugins:
-    def __init__(self) -> None:
-        self._plugins = cast(
-            Set[SynchronizerPluginSpecification],
-            plugins_loader('coinrat_synchronizer_plugins', SynchronizerPluginSpecification)
+    def __init__(self, metadata_cache: Union[PluginMetadataCache, None] = None) -> None:
+        self._plugins = LazyPlugins(
+            'coinrat_synchronizer_plugins',
+            SynchronizerPluginSpecification,
+            lambda plugin: plugin.get_available_synchronizers(),
+            metadata_cache
         )
 
     def get_available_synchronizers(self) -> List[str]:
-        return [
-            synchronize_name for plugin in self._plugins for synchronize_name in plugin.get_available_synchronizers()
-        ]
+        return self._plugins.get_provided_names()
 
     def get_synchronizer(
         self,
@@ -48,8 +48,8 @@ class SynchronizerPlugins:
         storage: CandleStorage,
         event_emitter: EventEmitter
     ) -> MarketStateSynchronizer:
-        for plugin in self._plugins:
-            if synchronizer_name in plugin.get_available_synchronizers():
-                return plugin.get_synchronizer(synchronizer_name, storage, event_emitter)
+        plugin = self._plugins.find_plugin_providing(synchronizer_name)
+        if plugin is None:
+            raise SynchronizerNotProvidedByAnyPluginException('Synchronizer "{}" not found.'.format(synchronizer_name))
 
-        raise SynchronizerNotProvidedByAnyPluginException('Synchronizer "{}" not found.'.format(synchronizer_name))
+        return cast(SynchronizerPluginSpecification, plugin).get_synchronizer(synchronizer_name, storage, event_emitter)
@@ -0,0 +1,60 @@
+import datetime
+import math
+from decimal import Decimal
+from typing import List, cast
+
+from flexmock import flexmock
+
+from coinrat.candle_storage_plugins import CandleStoragePlugins
+from coinrat.domain.candle import Candle
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL
+from coinrat.domain.pair import Pair
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.market_plugins import MarketPlugins
+from coinrat.order_storage_plugins import OrderStoragePlugins
+from coinrat.portfolio_snapshot_storage_plugins import PortfolioSnapshotStoragePlugins
+from coinrat.strategy_plugins import StrategyPlugins
+from coinrat.strategy_replayer import StrategyReplayer
+from coinrat_double_crossover_strategy import strategy_plugin
+from coinrat_mock.plugin import MarketPlugin
+
+DUMMY_MARKET = 'bittrex'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+START = datetime.datetime(2017, 12, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def create_candles(number_of_minutes: int) -> List[Candle]:
+    """Sine wave with period of ~9.5 hours, prices are not whole numbers (rounding of float backend shows up)."""
+    candles = []
+    for minute in range(number_of_minutes):
+        price = Decimal(8000 + int(500 * math.sin(minute / 90))) + Decimal('0.12345678')
+        candles.append(Candle(
+            DUMMY_MARKET,
+            BTC_USD_PAIR,
+            START + datetime.timedelta(minutes=minute),
+            price,
+            price + Decimal('10.5'),
+            price - Decimal('10.25'),
+            price
+        ))
+
+    return candles
+
+
+def create_strategy_replayer(numeric_backend: str = NUMERIC_BACKEND_DECIMAL) -> StrategyReplayer:
+    """
+    Replayer of the double crossover strategy on mocked DUMMY_MARKET. Storages are not provided by plugins,
+    they must be given to create_replay().
+    """
+    market_plugin = MarketPlugin()
+    market_plugin.set_available_markets([DUMMY_MARKET])
+
+    return StrategyReplayer(
+        cast(CandleStoragePlugins, flexmock()),
+        cast(OrderStoragePlugins, flexmock()),
+        cast(StrategyPlugins, flexmock(get_strategy=strategy_plugin.get_strategy)),
+        cast(MarketPlugins, flexmock(get_plugin=lambda name: market_plugin)),
+        cast(PortfolioSnapshotStoragePlugins, flexmock()),
+        NullEventEmitter(),
+        numeric_backend=numeric_backend
+    )
@@ -0,0 +1,89 @@
+import datetime
+import threading
+from decimal import Decimal
+from typing import List
+
+import pytest
+
+from coinrat.candle_backfiller import CandleBackfiller
+from coinrat.domain import DateTimeInterval, MarketStateSynchronizer
+from coinrat.domain.candle import Candle
+from coinrat.domain.pair import Pair
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+START = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def create_candle(minute: int) -> Candle:
+    price = Decimal('8000')
+    return Candle('bittrex', BTC_USD_PAIR, START + datetime.timedelta(minutes=minute), price, price, price, price)
+
+
+class FakeHistorySynchronizer(MarketStateSynchronizer):
+    def __init__(self, available_minutes: List[int]) -> None:
+        self.requested_intervals: List[DateTimeInterval] = []
+        self._available_minutes = available_minutes
+        self._lock = threading.Lock()
+
+    def get_candles(self, market_name: str, pair: Pair, interval: DateTimeInterval) -> List[Candle]:
+        with self._lock:
+            self.requested_intervals.append(interval)
+
+        if interval.since == START + datetime.timedelta(minutes=18):
+            raise ConnectionError('Market is down.')
+
+        candles = [create_candle(minute) for minute in self._available_minutes]
+        return [candle for candle in candles if interval.since <= candle.time < interval.till]
+
+
+class FakeWholeHistorySynchronizer(FakeHistorySynchronizer):
+    @property
+    def is_candle_history_paged(self) -> bool:
+        return False
+
+
+def test_backfill_fills_gaps_in_chunks_and_failed_chunk_stays_as_gap():
+    storage = CandleMemoryStorage()
+    storage.write_candles([create_candle(minute) for minute in [0, 1, 8, 9]])
+    backfiller = CandleBackfiller(max_workers=3, max_minutes_per_request=4)
+    interval = DateTimeInterval(START, START + datetime.timedelta(minutes=24))
+
+    coverage = backfiller.get_coverage(storage, 'bittrex', BTC_USD_PAIR, interval)
+    assert coverage.number_of_missing_candles == 20
+
+    synchronizer = FakeHistorySynchronizer(list(range(0, 24)))
+    assert backfiller.backfill(synchronizer, storage, coverage) == 16
+
+    assert len(synchronizer.requested_intervals) == 6
+    coverage = backfiller.get_coverage(storage, 'bittrex', BTC_USD_PAIR, interval)
+    assert [(gap.since.minute, gap.till.minute) for gap in coverage.gaps] == [(18, 22)]
+
+
+def test_backfill_with_synchronizer_without_history_fails():
+    storage = CandleMemoryStorage()
+    backfiller = CandleBackfiller()
+    coverage = backfiller.get_coverage(
+        storage,
+        'bittrex',
+        BTC_USD_PAIR,
+        DateTimeInterval(START, START + datetime.timedelta(minutes=5))
+    )
+
+    with pytest.raises(NotImplementedError):
+        backfiller.backfill(MarketStateSynchronizer(), storage, coverage)
+
+
+def test_backfill_asks_synchronizer_without_paging_once_for_all_gaps():
+    storage = CandleMemoryStorage()
+    storage.write_candles([create_candle(minute) for minute in [0, 1, 8, 9]])
+    backfiller = CandleBackfiller(max_workers=3, max_minutes_per_request=4)
+    interval = DateTimeInterval(START, START + datetime.timedelta(minutes=16))
+    coverage = backfiller.get_coverage(storage, 'bittrex', BTC_USD_PAIR, interval)
+
+    synchronizer = FakeWholeHistorySynchronizer(list(range(0, 24)))
+    assert backfiller.backfill(synchronizer, storage, coverage) == 12
+
+    requested = [(requested.since.minute, requested.till.minute) for requested in synchronizer.requested_intervals]
+    assert requested == [(2, 16)], 'Whole history is downloaded by each request, one request is enough.'
+    assert backfiller.get_coverage(storage, 'bittrex', BTC_USD_PAIR, interval).gaps == []
@@ -0,0 +1,30 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ['MySQLdb', 'flask', 'influxdb', 'pika', 'pkg_resources', 'socketio']
+
+
+def get_imported_heavy_modules(code: str):
+    output = subprocess.check_output([
+        sys.executable,
+        '-c',
+        '{}\nimport json, sys\nprint(json.dumps([name for name in {} if name in sys.modules]))'.format(
+            code,
+            HEAVY_MODULES
+        )
+    ], universal_newlines=True)
+
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.mark.parametrize('code', [
+    'import coinrat.coinrat',
+    'import coinrat.strategy_replayer',
+    'import coinrat.strategy_monte_carlo',
+    'from coinrat.di_container_coinrat import DiContainerCoinrat\nDiContainerCoinrat().datetime_factory.now()',
+])
+def test_services_are_imported_only_when_used(code: str):
+    assert get_imported_heavy_modules(code) == []
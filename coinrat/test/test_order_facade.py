@@ -0,0 +1,50 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from coinrat.domain import CurrentUtcDateTimeFactory
+from coinrat.domain.number import Number
+from coinrat.domain.order import Order, DIRECTION_BUY, ORDER_TYPE_LIMIT
+from coinrat.domain.pair import Pair
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.order_facade import OrderFacade
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+from coinrat_mock.market import MockMarket
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_MARKET = 'yolo_market'
+
+
+def create_order(quantity: Number, rate: Number) -> Order:
+    return Order(
+        uuid.uuid4(),
+        uuid.uuid4(),
+        DUMMY_MARKET,
+        DIRECTION_BUY,
+        datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc),
+        BTC_USD_PAIR,
+        ORDER_TYPE_LIMIT,
+        quantity,
+        rate
+    )
+
+
+def create_order_facade() -> OrderFacade:
+    return OrderFacade(OrderMemoryStorage(), PortfolioSnapshotMemoryStorage(), NullEventEmitter())
+
+
+def test_orders_with_float_amounts_are_created_only_on_markets_with_float_numeric_backend():
+    decimal_market = MockMarket(CurrentUtcDateTimeFactory(), {'mocked_market_name': DUMMY_MARKET})
+    with pytest.raises(AssertionError):
+        create_order_facade().create(decimal_market, create_order(0.01, 8000.0))
+
+    create_order_facade().create(decimal_market, create_order(Decimal('0.01'), Decimal('8000')))
+
+    float_market = MockMarket(
+        CurrentUtcDateTimeFactory(),
+        {'mocked_market_name': DUMMY_MARKET, 'mocked_numeric_backend': 'float'}
+    )
+    create_order_facade().create(float_market, create_order(0.01, 8000.0))
@@ -1,3 +1,5 @@
+from typing import List
+
 import pytest
 from flexmock import flexmock
 
@@ -13,6 +15,8 @@ from coinrat.portfolio_snapshot_storage_plugins import PortfolioSnapshotStorageP
 from coinrat.strategy_plugins import StrategyPlugins, StrategyNotProvidedByAnyPluginException
 from coinrat.synchronizer_plugins import SynchronizerPlugins, SynchronizerNotProvidedByAnyPluginException
 from coinrat.order_storage_plugins import OrderStoragePlugins, OrderStorageNotProvidedByAnyPluginException
+import coinrat.plugins
+from coinrat.plugins import LazyPlugins, PluginMetadataCache, PluginSpecification, PluginEntryPoint
 
 
 def test_synchronizer_plugins():
@@ -76,3 +80,67 @@ def test_portfolio_snapshot_storage_plugins():
     assert isinstance(plugins.get_portfolio_snapshot_storage('influx_db'), PortfolioSnapshotStorage)
     with pytest.raises(PortfolioSnapshotStorageNotProvidedByAnyPluginException):
         plugins.get_portfolio_snapshot_storage('gandalf')
+
+
+class FakePlugin(PluginSpecification):
+    def __init__(self, name: str, provided_names: List[str]) -> None:
+        self._name = name
+        self.provided_names = provided_names
+
+    def get_name(self):
+        return self._name
+
+    def get_description(self):
+        return 'Fake plugin.'
+
+
+class FakeEntryPoint(PluginEntryPoint):
+    def __init__(self, name: str, plugin: FakePlugin) -> None:
+        super().__init__(name, '{}:plugin'.format(name), '1.0.0', self._load)
+        self.number_of_loads = 0
+        self._plugin = plugin
+
+    def _load(self) -> FakePlugin:
+        self.number_of_loads += 1
+        return self._plugin
+
+
+def create_lazy_plugins(entry_points: List[FakeEntryPoint], metadata_cache: PluginMetadataCache) -> LazyPlugins:
+    flexmock(coinrat.plugins).should_receive('find_entry_points').with_args('fake_plugins').and_return(entry_points)
+    return LazyPlugins('fake_plugins', PluginSpecification, lambda plugin: plugin.provided_names, metadata_cache)
+
+
+def test_lazy_plugins_are_imported_only_when_needed(tmpdir):
+    cache_file = str(tmpdir.join('plugin_metadata_cache.json'))
+    first = FakeEntryPoint('first', FakePlugin('first', ['a', 'b']))
+    second = FakeEntryPoint('second', FakePlugin('second_plugin', ['c']))
+
+    plugins = create_lazy_plugins([first, second], PluginMetadataCache(cache_file))
+    assert (0, 0) == (first.number_of_loads, second.number_of_loads)
+    assert plugins.find_plugin_providing('a').get_name() == 'first'
+    assert (1, 0) == (first.number_of_loads, second.number_of_loads)
+    assert ['a', 'b', 'c'] == plugins.get_provided_names()  # cache is empty, second plugin has to be imported
+    assert (1, 1) == (first.number_of_loads, second.number_of_loads)
+
+    first, second = FakeEntryPoint('first', first._plugin), FakeEntryPoint('second', second._plugin)
+    plugins = create_lazy_plugins([first, second], PluginMetadataCache(cache_file))
+    assert ['a', 'b', 'c'] == plugins.get_provided_names()
+    assert plugins.get_plugin('second_plugin').get_name() == 'second_plugin'
+    assert plugins.find_plugin_providing('gandalf') is None
+    assert (0, 1) == (first.number_of_loads, second.number_of_loads)
+
+
+def test_lazy_plugins_ignore_outdated_metadata_cache(tmpdir):
+    cache_file = str(tmpdir.join('plugin_metadata_cache.json'))
+    create_lazy_plugins([FakeEntryPoint('first', FakePlugin('first', ['a']))], PluginMetadataCache(cache_file)) \
+        .get_provided_names()
+
+    entry_point = FakeEntryPoint('first', FakePlugin('first', ['b']))
+    plugins = create_lazy_plugins([entry_point], PluginMetadataCache(cache_file))
+    assert ['a'] == plugins.get_provided_names()
+    assert plugins.find_plugin_providing('a') is None
+    assert ['b'] == plugins.get_provided_names()
+
+    entry_point = FakeEntryPoint('first', FakePlugin('first', ['b']))
+    assert ['b'] == create_lazy_plugins([entry_point], PluginMetadataCache(cache_file)).get_provided_names()
+    assert 0 == entry_point.number_of_loads
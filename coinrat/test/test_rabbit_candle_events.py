@@ -0,0 +1,120 @@
+import datetime
+import json
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+from flexmock import flexmock
+
+from coinrat.domain.candle import Candle
+from coinrat.domain.pair import Pair
+from coinrat.event.event_types import CANDLE_EVENTS_EXCHANGE, EVENT_CANDLES_UPDATED
+from coinrat.event.rabbit_candle_event_listener import RabbitCandleEventListener
+from coinrat.event.rabbit_event_emitter import RabbitEventEmitter
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_TIME = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.published: List[Tuple[str, str, str]] = []
+        self.bindings: List[str] = []
+        self.callback: Callable = None
+
+    def queue_declare(self, queue: str = '', exclusive: bool = False):
+        return flexmock(method=flexmock(queue=queue or 'generated-queue'))
+
+    def exchange_declare(self, exchange: str, exchange_type: str) -> None:
+        assert exchange_type == 'topic'
+
+    def queue_bind(self, queue: str, exchange: str, routing_key: str) -> None:
+        self.bindings.append(routing_key)
+
+    def basic_consume(self, callback: Callable, queue: str, no_ack: bool) -> None:
+        self.callback = callback
+
+    def basic_publish(self, exchange: str, routing_key: str, body: str) -> None:
+        self.published.append((exchange, routing_key, body))
+
+    def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    """Messages are delivered in process_data_events, time passes only when there is nothing to deliver."""
+
+    def __init__(self) -> None:
+        self.fake_channel = FakeChannel()
+        self.pending_messages: List[str] = []
+        self.now = 0.0
+
+    def channel(self) -> FakeChannel:
+        return self.fake_channel
+
+    def process_data_events(self, time_limit: float) -> None:
+        if not self.pending_messages:
+            self.now += time_limit
+            return
+
+        for message in self.pending_messages:
+            self.fake_channel.callback(self.fake_channel, None, None, message)
+        self.pending_messages = []
+
+
+def create_candle(market_name: str, minute: int) -> Candle:
+    price = Decimal('8000')
+    time = DUMMY_TIME + datetime.timedelta(minutes=minute)
+    return Candle(market_name, BTC_USD_PAIR, time, price, price, price, price)
+
+
+def test_emitter_publishes_one_batch_per_market_and_pair_into_queue_and_candle_events_exchange():
+    connection = FakeConnection()
+    emitter = RabbitEventEmitter(connection)
+
+    emitter.emit_new_candles('influx_db', [
+        create_candle('bittrex', 0),
+        create_candle('bitfinex', 0),
+        create_candle('bittrex', 1),
+    ])
+
+    events_queue = [message for message in connection.fake_channel.published if message[0] == '']
+    candle_events = [message for message in connection.fake_channel.published if message[0] == CANDLE_EVENTS_EXCHANGE]
+    assert [body for _, _, body in events_queue] == [body for _, _, body in candle_events]
+    assert [routing_key for _, routing_key, _ in candle_events] == [
+        'influx_db.bittrex.USD_BTC',
+        'influx_db.bitfinex.USD_BTC',
+    ]
+    event = json.loads(candle_events[0][2])
+    assert event['event'] == EVENT_CANDLES_UPDATED
+    assert (event['storage'], event['market'], event['pair']) == ('influx_db', 'bittrex', 'USD_BTC')
+    assert [candle['time'] for candle in event['candles']] == ['2018-01-01T00:00:00+00:00', '2018-01-01T00:01:00+00:00']
+
+
+def test_emitter_with_latest_candle_only_publishes_last_candle_of_the_pair():
+    connection = FakeConnection()
+    emitter = RabbitEventEmitter(connection, latest_candle_only=True)
+
+    emitter.emit_new_candles('influx_db', [create_candle('bittrex', minute) for minute in [3, 0, 5, 4]])
+
+    assert len(connection.fake_channel.published) == 2
+    event = json.loads(connection.fake_channel.published[0][2])
+    assert [candle['time'] for candle in event['candles']] == ['2018-01-01T00:05:00+00:00']
+
+
+def test_listener_wakes_up_on_candle_event_and_coalesces_events():
+    connection = FakeConnection()
+    listener = RabbitCandleEventListener(
+        connection,
+        'influx_db',
+        ['bittrex', 'bitfinex'],
+        'USD_BTC',
+        monotonic_function=lambda: connection.now
+    )
+    assert connection.fake_channel.bindings == ['influx_db.bittrex.USD_BTC', 'influx_db.bitfinex.USD_BTC']
+
+    connection.pending_messages = ['{}', '{}', '{}']
+    assert listener.wait_for_new_candles(300) is True
+    assert connection.now == 0
+
+    assert listener.wait_for_new_candles(300) is False
+    assert connection.now == 300
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import List
+
+from coinrat.request_scheduler import RequestScheduler, PRIORITY_ORDER, PRIORITY_METADATA, PRIORITY_MARKET_DATA
+
+
+def test_waiting_requests_are_executed_by_priority_within_rate_limit():
+    scheduler = RequestScheduler(requests_per_second=5, burst=1)
+    executed: List[str] = []
+    start = time.monotonic()
+    scheduler.call(PRIORITY_MARKET_DATA, executed.append, 'first')
+
+    metadata = threading.Thread(target=scheduler.call, args=(PRIORITY_METADATA, executed.append, 'markets'))
+    metadata.start()
+    time.sleep(0.05)
+    order = threading.Thread(target=scheduler.call, args=(PRIORITY_ORDER, executed.append, 'order'))
+    order.start()
+    metadata.join()
+    order.join()
+
+    assert executed == ['first', 'order', 'markets']
+    assert time.monotonic() - start >= 0.35
+
+
+def test_identical_requests_in_flight_are_coalesced():
+    scheduler = RequestScheduler()
+    release = threading.Event()
+    calls: List[str] = []
+    results: List[dict] = []
+
+    def get_ticker(market: str) -> dict:
+        calls.append(market)
+        release.wait()
+        return {'Last': '8000'}
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(scheduler.call(
+                PRIORITY_MARKET_DATA,
+                get_ticker,
+                'USDT-BTC',
+                coalesce_key=('get_ticker', 'USDT-BTC')
+            ))
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['USDT-BTC']
+    assert len(results) == 3 and results[0] is results[1] is results[2]
+
+    # Finished request is not cached
+    scheduler.call(PRIORITY_MARKET_DATA, get_ticker, 'USDT-BTC', coalesce_key=('get_ticker', 'USDT-BTC'))
+    assert len(calls) == 2
+
+
+def test_exception_of_coalesced_request_is_raised_to_all_callers():
+    scheduler = RequestScheduler()
+    release = threading.Event()
+    errors: List[str] = []
+
+    def get_balances() -> None:
+        release.wait()
+        raise ConnectionError('NO_API_RESPONSE')
+
+    def call() -> None:
+        try:
+            scheduler.call(PRIORITY_MARKET_DATA, get_balances, coalesce_key='get_balances')
+        except ConnectionError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == ['NO_API_RESPONSE', 'NO_API_RESPONSE']
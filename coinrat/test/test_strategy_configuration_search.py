@@ -0,0 +1,61 @@
+import datetime
+from decimal import Decimal
+
+from coinrat.domain import DateTimeInterval
+from coinrat.strategy_configuration_search import StrategyConfigurationSearch, OBJECTIVE_DRAWDOWN
+from coinrat.test.fixtures import DUMMY_MARKET, BTC_USD_PAIR, START, create_candles, create_strategy_replayer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+
+
+def create_search() -> StrategyConfigurationSearch:
+    return StrategyConfigurationSearch(create_strategy_replayer())
+
+
+def test_search():
+    candle_storage = CandleMemoryStorage()
+    candle_storage.write_candles(create_candles(16 * 60))
+
+    configurations = [
+        {'long_average_interval': str(long), 'short_average_interval': str(short), 'delay': '60'}
+        for long, short in [(3600, 900), (7200, 1800), (1800, 450), (600, 3600)]
+    ]
+
+    results = create_search().search(
+        'double_crossover',
+        BTC_USD_PAIR,
+        DUMMY_MARKET,
+        DateTimeInterval(START + datetime.timedelta(hours=2), START + datetime.timedelta(hours=11)),
+        candle_storage,
+        configurations,
+        objective=OBJECTIVE_DRAWDOWN,
+        minimal_prefix=datetime.timedelta(hours=1),
+        warm_up=datetime.timedelta(hours=2)
+    )
+
+    assert 3 == len(results), 'Configuration with short interval longer than long one must be skipped.'
+    assert START + datetime.timedelta(hours=11) == results[0].evaluated_till
+    assert START + datetime.timedelta(hours=11) > results[-1].evaluated_till
+    assert results[0].max_drawdown >= Decimal('0')
+    assert Decimal('1000') == results[0].equity_curve.initial_value
+
+
+def test_get_prefixes():
+    interval = DateTimeInterval(START, START + datetime.timedelta(days=9))
+
+    assert [
+        datetime.timedelta(days=1),
+        datetime.timedelta(days=3),
+        datetime.timedelta(days=9),
+    ] == StrategyConfigurationSearch._get_prefixes(interval, 27, 3, datetime.timedelta(hours=12))
+
+    assert [datetime.timedelta(days=9)] == StrategyConfigurationSearch._get_prefixes(
+        interval,
+        1,
+        3,
+        datetime.timedelta(hours=6)
+    )
+
+    assert [
+        datetime.timedelta(days=3),
+        datetime.timedelta(days=9),
+    ] == StrategyConfigurationSearch._get_prefixes(interval, 27, 3, datetime.timedelta(days=2))
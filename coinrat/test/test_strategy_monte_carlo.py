@@ -0,0 +1,54 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle.candle_path_generator import PATH_METHOD_BLOCK_BOOTSTRAP, PATH_METHOD_NOISE
+from coinrat.strategy_monte_carlo import StrategyMonteCarloSimulation, MonteCarloDistribution
+from coinrat.test.fixtures import DUMMY_MARKET, BTC_USD_PAIR, START, create_candles, create_strategy_replayer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+
+
+def create_simulation() -> StrategyMonteCarloSimulation:
+    return StrategyMonteCarloSimulation(create_strategy_replayer())
+
+
+@pytest.mark.parametrize('method,number_of_processes', [
+    (PATH_METHOD_BLOCK_BOOTSTRAP, 1),
+    (PATH_METHOD_NOISE, 1),
+    (PATH_METHOD_BLOCK_BOOTSTRAP, 2),
+])
+def test_run(method: str, number_of_processes: int):
+    candle_storage = CandleMemoryStorage()
+    candle_storage.write_candles(create_candles(6 * 60))
+
+    result = create_simulation().run(
+        'double_crossover',
+        BTC_USD_PAIR,
+        DUMMY_MARKET,
+        DateTimeInterval(START + datetime.timedelta(hours=2), START + datetime.timedelta(hours=5)),
+        candle_storage,
+        {'long_average_interval': '3600', 'short_average_interval': '900', 'delay': '60'},
+        number_of_paths=5,
+        method=method,
+        number_of_processes=number_of_processes,
+        seed=42,
+        warm_up=datetime.timedelta(hours=2),
+        batch_size=2
+    )
+
+    assert [0, 1, 2, 3, 4] == [path_result.path_number for path_result in result.path_results]
+    assert result.final_balance.min <= result.final_balance.percentiles[50] <= result.final_balance.max
+    assert result.max_drawdown.min >= 0
+    assert 0 <= result.probability_of_loss <= 1
+
+
+def test_distribution():
+    distribution = MonteCarloDistribution([Decimal(value) for value in range(1, 102)])
+
+    assert 51 == distribution.mean
+    assert 1 == distribution.min
+    assert 101 == distribution.max
+    assert 6 == distribution.percentiles[5]
+    assert 96 == distribution.percentiles[95]
@@ -0,0 +1,77 @@
+import datetime
+import threading
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.pair import Pair
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
+from coinrat.strategy_multi_runner import StrategyMultiRunner
+
+NOW = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeStrategy:
+    def __init__(self, name: str, ticks_log: List[Tuple[str, str]], on_tick: Callable[[], None]) -> None:
+        self._name = name
+        self._ticks_log = ticks_log
+        self._on_tick = on_tick
+
+    def get_seconds_delay_between_ticks(self) -> float:
+        return 0.01
+
+    def tick(self, markets: List) -> None:
+        if self._name == 'failing':
+            raise ValueError('Market is closed.')
+
+        self._ticks_log.append((self._name, threading.current_thread().name))
+        self._on_tick()
+
+
+class FakeStrategyStandardRunner:
+    def __init__(self) -> None:
+        self.ticks_log: List[Tuple[str, str]] = []
+        self.on_tick: Callable[[], None] = lambda: None
+
+    def create_strategy(self, strategy_run: StrategyRun) -> Tuple[FakeStrategy, List]:
+        return FakeStrategy(strategy_run.strategy_name, self.ticks_log, lambda: self.on_tick()), []
+
+    def tick(self, strategy: FakeStrategy, markets: List) -> None:
+        strategy.tick(markets)
+
+
+def create_strategy_run(strategy_name: str) -> StrategyRun:
+    return StrategyRun(
+        uuid.uuid4(),
+        NOW,
+        Pair('USD', 'BTC'),
+        [StrategyRunMarket('coinrat_mock', 'bittrex', {})],
+        strategy_name,
+        {},
+        DateTimeInterval(NOW, None),
+        'memory',
+        'memory'
+    )
+
+
+def test_strategies_tick_on_shared_loop_until_stopped():
+    standard_runner = FakeStrategyStandardRunner()
+    multi_runner = StrategyMultiRunner(standard_runner, max_workers=2)
+    strategy_runs = [create_strategy_run('first'), create_strategy_run('second'), create_strategy_run('failing')]
+
+    failures: Dict[str, str] = {}
+
+    def on_strategy_run_failed(strategy_run: StrategyRun, exception: Exception) -> None:
+        failures[strategy_run.strategy_name] = str(exception)
+
+    def stop_after_ten_ticks() -> None:
+        if len(standard_runner.ticks_log) >= 10:
+            multi_runner.stop()
+
+    standard_runner.on_tick = stop_after_ten_ticks
+    multi_runner.run(strategy_runs, on_strategy_run_failed)
+
+    assert failures == {'failing': 'Market is closed.'}
+    assert {name for name, _ in standard_runner.ticks_log} == {'first', 'second'}
+    assert len({thread_name for _, thread_name in standard_runner.ticks_log}) <= 2
+    assert threading.current_thread().name not in {thread_name for _, thread_name in standard_runner.ticks_log}
@@ -0,0 +1,58 @@
+import datetime
+import uuid
+from decimal import Decimal
+from typing import List
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL, NUMERIC_BACKEND_FLOAT, FLOAT_BACKEND_RELATIVE_TOLERANCE, \
+    relative_difference
+from coinrat.domain.order import Order
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.order_facade import OrderFacade
+from coinrat.test.fixtures import DUMMY_MARKET, BTC_USD_PAIR, START, create_candles, create_strategy_replayer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+
+
+def replay(numeric_backend: str) -> List[Order]:
+    replayer = create_strategy_replayer(numeric_backend)
+
+    candle_storage = CandleMemoryStorage()
+    candle_storage.write_candles(create_candles(24 * 60))
+    order_storage = OrderMemoryStorage()
+
+    since = START + datetime.timedelta(hours=2)
+    till = START + datetime.timedelta(hours=24)
+    interval = DateTimeInterval(since, till)
+    strategy_run = StrategyRun(
+        uuid.uuid4(),
+        since,
+        BTC_USD_PAIR,
+        [StrategyRunMarket('coinrat_mock', DUMMY_MARKET, {})],
+        'double_crossover',
+        {'long_average_interval': '3600', 'short_average_interval': '900', 'delay': '60'},
+        interval,
+        'memory',
+        'memory'
+    )
+    order_facade = OrderFacade(order_storage, PortfolioSnapshotMemoryStorage(), NullEventEmitter())
+    replayer.create_replay(strategy_run, candle_storage, order_facade).advance(till)
+
+    return order_storage.find_by(DUMMY_MARKET, BTC_USD_PAIR)
+
+
+def test_float_numeric_backend_matches_decimal_within_tolerance():
+    decimal_orders = replay(NUMERIC_BACKEND_DECIMAL)
+    float_orders = replay(NUMERIC_BACKEND_FLOAT)
+
+    assert len(decimal_orders) > 2
+    assert len(decimal_orders) == len(float_orders)
+    for decimal_order, float_order in zip(decimal_orders, float_orders):
+        assert isinstance(decimal_order.quantity, Decimal)
+        assert isinstance(float_order.quantity, float)
+        assert decimal_order.is_buy() == float_order.is_buy()
+        assert decimal_order.created_at == float_order.created_at
+        assert relative_difference(decimal_order.rate, float_order.rate) < FLOAT_BACKEND_RELATIVE_TOLERANCE
+        assert relative_difference(decimal_order.quantity, float_order.quantity) < FLOAT_BACKEND_RELATIVE_TOLERANCE
@@ -0,0 +1,110 @@
+import datetime
+import uuid
+from typing import Any, List, cast
+
+import pytest
+from flexmock import flexmock
+
+from coinrat.domain import DateTimeInterval, CurrentUtcDateTimeFactory
+from coinrat.domain.pair import Pair
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
+from coinrat.event.candle_event_listener import CandleEventListener
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.strategy_standard_runner import StrategyStandardRunner
+
+NOW = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        assert seconds > 0
+        self.now += seconds
+
+
+class EndOfEvents(Exception):
+    pass
+
+
+class FakeCandleEventListener(CandleEventListener):
+    """Candle events come at given times, events which came until now are coalesced (as in Rabbit listener)."""
+
+    def __init__(self, clock: FakeClock, event_times: List[float]) -> None:
+        self._clock = clock
+        self._event_times = event_times
+        self.is_closed = False
+
+    def wait_for_new_candles(self, timeout: float) -> bool:
+        if len(self._event_times) == 0:
+            if timeout > 0:
+                raise EndOfEvents()
+            return False
+
+        if self._event_times[0] > self._clock.now + timeout:
+            self._clock.now += timeout
+            return False
+
+        self._clock.now = max(self._clock.now, self._event_times[0])
+        self._event_times = [event_time for event_time in self._event_times if event_time > self._clock.now]
+        return True
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+class FakeStrategy:
+    def __init__(self, clock: FakeClock) -> None:
+        self._clock = clock
+        self.tick_times: List[float] = []
+
+    def get_seconds_delay_between_ticks(self) -> float:
+        return 60
+
+    def tick(self, markets: List) -> None:
+        self.tick_times.append(self._clock.now)
+
+
+def create_strategy_run() -> StrategyRun:
+    return StrategyRun(
+        uuid.uuid4(),
+        NOW,
+        Pair('USD', 'BTC'),
+        [StrategyRunMarket('coinrat_mock', 'bittrex', {})],
+        'fake_strategy',
+        {},
+        DateTimeInterval(NOW, None),
+        'memory',
+        'memory'
+    )
+
+
+def test_candle_events_within_strategy_delay_are_handled_by_one_tick():
+    clock = FakeClock()
+    strategy = FakeStrategy(clock)
+    listener = FakeCandleEventListener(clock, [0.5 * index for index in range(120)])  # Unfinished candle every 0.5s
+
+    runner = StrategyStandardRunner(
+        cast(Any, None),
+        cast(Any, None),
+        cast(Any, None),
+        cast(Any, None),
+        cast(Any, None),
+        NullEventEmitter(),
+        CurrentUtcDateTimeFactory(),
+        candle_event_listener_factory=lambda strategy_run: listener,
+        fallback_poll_interval=300,
+        monotonic_function=clock.monotonic,
+        sleep_function=clock.sleep
+    )
+    flexmock(runner).should_receive('create_strategy').and_return((strategy, []))
+
+    with pytest.raises(EndOfEvents):
+        runner.run(create_strategy_run())
+
+    assert strategy.tick_times == [0, 60]
+    assert listener.is_closed
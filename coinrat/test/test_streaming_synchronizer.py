@@ -0,0 +1,111 @@
+import datetime
+from decimal import Decimal
+from typing import Callable, List
+
+from flexmock import flexmock
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, serialize_candles
+from coinrat.domain.pair import Pair
+from coinrat.domain.trade import Trade, TradeStream
+from coinrat.streaming_synchronizer import StreamingSynchronizer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_mock.trade_stream import ReplayTradeStream, create_trades_from_candles
+
+BTC_USD_PAIR = Pair('USD', 'BTC')
+ETH_USD_PAIR = Pair('USD', 'ETH')
+START = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def create_candle(pair: Pair, minute: int, open_price: int, close_price: int) -> Candle:
+    return Candle(
+        'bittrex',
+        pair,
+        START + datetime.timedelta(minutes=minute),
+        Decimal(open_price),
+        Decimal(max(open_price, close_price) + 5),
+        Decimal(min(open_price, close_price) - 5),
+        Decimal(close_price)
+    )
+
+
+class ScriptedTradeStream(TradeStream):
+    def __init__(self, script: Callable[[Callable, Callable], None]) -> None:
+        self._script = script
+
+    def run(self, market_name: str, pairs: List[Pair], on_trade: Callable, on_heartbeat: Callable) -> None:
+        self._script(on_trade, on_heartbeat)
+
+
+def test_replayed_trades_are_synchronized_into_the_same_candles():
+    candles = [
+        create_candle(BTC_USD_PAIR, 0, 8000, 8010),
+        create_candle(BTC_USD_PAIR, 1, 8010, 7990),
+        create_candle(BTC_USD_PAIR, 3, 7990, 7995),
+        create_candle(ETH_USD_PAIR, 0, 1000, 990),
+        create_candle(ETH_USD_PAIR, 1, 990, 991),
+        create_candle(Pair('USD', 'LTC'), 0, 200, 201),
+    ]
+    storage = CandleMemoryStorage()
+    emitted_candles = []
+    event_emitter = flexmock(emit_new_candles=lambda storage_name, new_candles: emitted_candles.extend(new_candles))
+    synchronizer = StreamingSynchronizer(
+        ReplayTradeStream(create_trades_from_candles(candles)),
+        storage,
+        event_emitter,
+        ['bittrex']
+    )
+
+    synchronizer.synchronize_pairs('bittrex', [BTC_USD_PAIR, ETH_USD_PAIR])
+
+    btc_candles = storage.find_by('bittrex', BTC_USD_PAIR, DateTimeInterval(None, None))
+    # Minute without trades continues with the last price
+    flat_candle = Candle('bittrex', BTC_USD_PAIR, START + datetime.timedelta(minutes=2), *[Decimal(7990)] * 4)
+    assert serialize_candles(btc_candles) == serialize_candles(candles[0:2] + [flat_candle] + candles[2:3])
+    eth_candles = storage.find_by('bittrex', ETH_USD_PAIR, DateTimeInterval(None, None))
+    assert serialize_candles(eth_candles) == serialize_candles(candles[3:5])
+    assert len(emitted_candles) == 6
+    assert synchronizer.get_supported_markets() == ['bittrex']
+
+
+def test_unfinished_candle_is_flushed_every_flush_interval():
+    now = [0.0]
+    storage = CandleMemoryStorage()
+    written_candles = []
+    event_emitter = flexmock(emit_new_candles=lambda storage_name, new_candles: written_candles.append(new_candles))
+
+    def create_trade(second: int, price: int) -> Trade:
+        return Trade('bittrex', BTC_USD_PAIR, START + datetime.timedelta(seconds=second), Decimal(price), Decimal(1))
+
+    def script(on_trade, on_heartbeat) -> None:
+        on_trade(create_trade(1, 100))
+        now[0] = 0.3
+        on_trade(create_trade(2, 110))
+        assert written_candles == []
+
+        now[0] = 0.6
+        on_heartbeat(START + datetime.timedelta(seconds=3))
+        assert [(candle.open, candle.close) for candle in written_candles[0]] == [(100, 110)]
+
+        now[0] = 0.9
+        on_trade(create_trade(4, 90))
+        now[0] = 1.2
+        on_heartbeat(START + datetime.timedelta(minutes=1))
+        assert [(candle.open, candle.close) for candle in written_candles[1]] == [(100, 90)]
+
+        now[0] = 1.8
+        on_heartbeat(START + datetime.timedelta(minutes=1, seconds=1))
+        assert len(written_candles) == 2  # Nothing was traded since the last flush
+
+    synchronizer = StreamingSynchronizer(
+        ScriptedTradeStream(script),
+        storage,
+        event_emitter,
+        ['bittrex'],
+        flush_interval=0.5,
+        monotonic_function=lambda: now[0]
+    )
+    synchronizer.synchronize('bittrex', BTC_USD_PAIR)
+
+    assert len(written_candles) == 2
+    assert storage.find_by('bittrex', BTC_USD_PAIR)[0].close == Decimal(90)
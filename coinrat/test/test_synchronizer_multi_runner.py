@@ -0,0 +1,71 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from coinrat.domain import MarketStateSynchronizer
+from coinrat.domain.pair import Pair
+from coinrat.synchronizer_multi_runner import SynchronizerMultiRunner, deserialize_synchronization_targets
+
+
+class FakeSynchronizer(MarketStateSynchronizer):
+    def __init__(self, log: List[Tuple], failures: Dict[str, int]) -> None:
+        self._log = log
+        self._failures = failures
+
+    def synchronize(self, market_name: str, pair: Pair) -> None:
+        self._log.append(('synchronize', id(self), pair.market_currency))
+        self._fail_if_planned(pair.market_currency)
+
+    def get_supported_markets(self) -> List[str]:
+        return ['bittrex']
+
+    def _fail_if_planned(self, key: str) -> None:
+        if self._failures.get(key, 0) > 0:
+            self._failures[key] -= 1
+            raise ConnectionError('Storage is down.')
+
+
+class FakeManyPairsSynchronizer(FakeSynchronizer):
+    def synchronize_pairs(self, market_name: str, pairs: List[Pair]) -> None:
+        self._log.append(('synchronize_pairs', id(self), tuple(pair.market_currency for pair in pairs)))
+
+
+class FakeSynchronizerPlugins:
+    def __init__(self, failures: Dict[str, int]) -> None:
+        self.log: List[Tuple] = []
+        self._failures = failures
+        self._synchronizers: List[FakeSynchronizer] = []  # Keeps instances alive, their ids are unique
+
+    def get_synchronizer(self, synchronizer_name: str, storage, event_emitter) -> MarketStateSynchronizer:
+        synchronizer_class = FakeManyPairsSynchronizer if synchronizer_name == 'many_pairs' else FakeSynchronizer
+        synchronizer = synchronizer_class(self.log, self._failures)
+        self._synchronizers.append(synchronizer)
+        return synchronizer
+
+
+def test_targets_are_grouped_and_failed_target_is_restarted_with_backoff():
+    plugins = FakeSynchronizerPlugins({'ETH': 2})
+    runner = SynchronizerMultiRunner(plugins, initial_backoff=0.01, max_backoff=0.02)
+    targets = deserialize_synchronization_targets([
+        {'synchronizer': 'many_pairs', 'market': 'bittrex', 'pair': 'USD_BTC'},
+        {'synchronizer': 'single_pair', 'market': 'bittrex', 'pair': 'USD_BTC'},
+        {'synchronizer': 'many_pairs', 'market': 'bittrex', 'pair': 'USD_LTC'},
+        {'synchronizer': 'single_pair', 'market': 'bittrex', 'pair': 'USD_ETH'},
+    ])
+
+    runner.run(targets, None, None)
+
+    assert [entry for entry in plugins.log if entry[0] == 'synchronize_pairs'][0][2] == ('BTC', 'LTC')
+    single_pair_calls = [entry for entry in plugins.log if entry[0] == 'synchronize']
+    assert sorted(currency for _, _, currency in single_pair_calls) == ['BTC', 'ETH', 'ETH', 'ETH']
+    assert len({synchronizer_id for _, synchronizer_id, _ in single_pair_calls}) == 2
+
+
+def test_unsupported_market_is_rejected_before_start():
+    runner = SynchronizerMultiRunner(FakeSynchronizerPlugins({}))
+    targets = deserialize_synchronization_targets([
+        {'synchronizer': 'single_pair', 'market': 'kraken', 'pair': 'USD_BTC'},
+    ])
+
+    with pytest.raises(ValueError):
+        runner.run(targets, None, None)
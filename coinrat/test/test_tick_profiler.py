@@ -0,0 +1,96 @@
+import logging
+import threading
+
+import pytest
+
+from coinrat.tick_profiler import TickProfiler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SlowStorage:
+    def __init__(self, clock: FakeClock) -> None:
+        self._clock = clock
+        self.name = 'slow'
+
+    def find_by(self, duration: float) -> str:
+        self._clock.now += duration
+        return 'candles'
+
+
+def test_tick_profiler_records_calls_made_during_tick():
+    clock = FakeClock()
+    profiler = TickProfiler(time_function=clock)
+    storage = profiler.wrap(SlowStorage(clock), 'candle_storage')
+
+    assert storage.name == 'slow'
+    assert storage.find_by(5.0) == 'candles'  # outside of tick, not recorded
+
+    for _ in range(2):
+        with profiler.measure_tick():
+            storage.find_by(1.0)
+            storage.find_by(2.0)
+            clock.now += 0.5
+
+    summary = profiler.get_summary()
+    assert summary.number_of_ticks == 2
+    assert summary.ticks.total_time == pytest.approx(7.0)
+    assert summary.ticks.max_time == pytest.approx(3.5)
+    assert list(summary.calls.keys()) == ['candle_storage.find_by']
+    assert summary.calls['candle_storage.find_by'].count == 4
+    assert summary.calls['candle_storage.find_by'].total_time == pytest.approx(6.0)
+    assert summary.calls['candle_storage.find_by'].max_time == pytest.approx(2.0)
+    assert summary.strategy_time == pytest.approx(1.0)
+    assert 'candle_storage.find_by: 4 calls (2.00 per tick)' in repr(summary)
+
+
+def test_tick_profiler_records_only_calls_of_thread_in_tick():
+    clock = FakeClock()
+    profiler = TickProfiler(time_function=clock)
+    storage = profiler.wrap(SlowStorage(clock), 'candle_storage')
+    tick_started = threading.Event()
+    other_thread_finished = threading.Event()
+
+    def tick() -> None:
+        with profiler.measure_tick():
+            tick_started.set()
+            other_thread_finished.wait(5)
+            storage.find_by(1.0)
+
+    tick_thread = threading.Thread(target=tick)
+    tick_thread.start()
+    tick_started.wait(5)
+    storage.find_by(5.0)  # concurrently with the tick, but not in it
+    other_thread_finished.set()
+    tick_thread.join(5)
+
+    summary = profiler.get_summary()
+    assert summary.number_of_ticks == 1
+    assert summary.calls['candle_storage.find_by'].count == 1
+    assert summary.calls['candle_storage.find_by'].total_time == pytest.approx(1.0)
+
+
+def test_tick_profiler_summary_is_logged_periodically(caplog):
+    clock = FakeClock()
+    profiler = TickProfiler(summary_interval=10, time_function=clock)
+
+    with caplog.at_level(logging.INFO, logger='coinrat.tick_profiler'):
+        with profiler.measure_tick():
+            clock.now += 4
+        profiler.log_summary_if_due()
+        assert len(caplog.records) == 0
+
+        with profiler.measure_tick():
+            clock.now += 7
+        profiler.log_summary_if_due()
+        assert len(caplog.records) == 1
+        assert 'Tick profile: 2 ticks' in caplog.records[0].getMessage()
+
+    assert profiler.get_summary().number_of_ticks == 0
+    assert repr(profiler.get_summary()) == 'Tick profile: no ticks.'
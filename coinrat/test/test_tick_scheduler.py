@@ -0,0 +1,87 @@
+import pytest
+
+from coinrat.tick_scheduler import TickScheduler, TICK_POLICY_SKIP, TICK_POLICY_CATCH_UP
+
+
+class FakeClock:
+    """Monotonic clock starts at 0, wall-clock is shifted by wall_clock_shift."""
+
+    def __init__(self, wall_clock_shift: float) -> None:
+        self.now = 0.0
+        self.wall_clock_shift = wall_clock_shift
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def wall_clock(self) -> float:
+        return self.now + self.wall_clock_shift
+
+    def sleep(self, seconds: float) -> None:
+        assert seconds >= 0
+        self.now += seconds
+
+
+def create_tick_scheduler(clock: FakeClock, period: float, offset: float, policy: str) -> TickScheduler:
+    return TickScheduler(
+        period,
+        offset,
+        policy,
+        monotonic_function=clock.monotonic,
+        wall_clock_function=clock.wall_clock,
+        sleep_function=clock.sleep
+    )
+
+
+def test_ticks_are_aligned_to_boundaries_and_do_not_drift():
+    clock = FakeClock(1514764800 + 23.5)  # 2018-01-01 00:00:23.5
+    scheduler = create_tick_scheduler(clock, 60, 2, TICK_POLICY_SKIP)
+
+    tick_times = []
+    for tick_duration in [1.5, 0.25, 10, 0.5]:
+        assert scheduler.wait_for_next_tick() == 0
+        tick_times.append(clock.wall_clock() % 60)
+        clock.now += tick_duration
+
+    assert tick_times == [2, 2, 2, 2]
+    assert clock.now == pytest.approx(38.5 + 3 * 60 + 0.5)
+
+
+def test_first_tick_is_immediate_and_next_ticks_are_aligned_to_boundaries():
+    clock = FakeClock(1514764800 + 23.5)  # 2018-01-01 00:00:23.5
+    scheduler = TickScheduler(
+        86400,
+        2,
+        TICK_POLICY_SKIP,
+        first_tick_immediately=True,
+        monotonic_function=clock.monotonic,
+        wall_clock_function=clock.wall_clock,
+        sleep_function=clock.sleep
+    )
+
+    assert scheduler.get_seconds_until_next_tick() == 0
+    assert scheduler.wait_for_next_tick() == 0
+    assert clock.now == 0
+
+    clock.now += 5
+    assert scheduler.get_seconds_until_next_tick() == pytest.approx(86400 - 23.5 + 2 - 5)
+    assert scheduler.wait_for_next_tick() == 0
+    assert clock.wall_clock() % 86400 == pytest.approx(2)
+    assert scheduler.number_of_ticks == 2
+
+
+@pytest.mark.parametrize(['policy', 'expected_lags', 'expected_skipped'], [
+    (TICK_POLICY_SKIP, [0, 10, 0, 0], 2),
+    (TICK_POLICY_CATCH_UP, [0, 130, 70, 10], 0),
+])
+def test_slow_tick_is_skipped_or_caught_up(policy: str, expected_lags, expected_skipped: int):
+    clock = FakeClock(0)
+    scheduler = create_tick_scheduler(clock, 60, 0, policy)
+
+    lags = []
+    for tick_duration in [190, 0, 0, 0]:
+        lags.append(scheduler.wait_for_next_tick())
+        clock.now += tick_duration
+
+    assert lags == expected_lags
+    assert scheduler.max_lag == max(expected_lags)
+    assert scheduler.number_of_skipped_ticks == expected_skipped
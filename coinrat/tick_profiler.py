@@ -0,0 +1,173 @@
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_CANDLE_STORAGE = 'candle_storage'
+COMPONENT_ORDER_STORAGE = 'order_storage'
+COMPONENT_MARKET = 'market'
+
+
+class CallStatistics:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+
+class TickProfileSummary:
+    def __init__(self, number_of_ticks: int, ticks: CallStatistics, calls: Dict[str, CallStatistics]) -> None:
+        self.number_of_ticks = number_of_ticks
+        self.ticks = ticks
+        self.calls = calls
+
+    @property
+    def strategy_time(self) -> float:
+        """Time spent in strategy's own code (tick time without time of profiled calls)."""
+        return self.ticks.total_time - sum([statistics.total_time for statistics in self.calls.values()])
+
+    def __repr__(self) -> str:
+        if self.number_of_ticks == 0:
+            return 'Tick profile: no ticks.'
+
+        lines = [
+            ('Tick profile: {0} ticks, {1:.3f}s total, {2:.6f}s per tick (max {3:.6f}s), '
+             + 'strategy itself {4:.6f}s per tick').format(
+                self.number_of_ticks,
+                self.ticks.total_time,
+                self.ticks.total_time / self.number_of_ticks,
+                self.ticks.max_time,
+                self.strategy_time / self.number_of_ticks
+            )
+        ]
+        for name, statistics in sorted(self.calls.items(), key=lambda item: item[1].total_time, reverse=True):
+            lines.append(
+                '    {0}: {1} calls ({2:.2f} per tick), {3:.6f}s per tick, {4:.6f}s per call (max {5:.6f}s)'.format(
+                    name,
+                    statistics.count,
+                    statistics.count / self.number_of_ticks,
+                    statistics.total_time / self.number_of_ticks,
+                    statistics.total_time / statistics.count,
+                    statistics.max_time
+                )
+            )
+
+        return '\n'.join(lines)
+
+
+class TickProfiler:
+    """
+    Measures how long strategy ticks take and how the time is split among candle storage, order storage and
+    market calls (objects are wrapped by wrap()). Only calls made during a tick (in the thread running the tick)
+    are counted, so ticks of many strategies can run concurrently in different threads.
+
+    Summary is logged at the end of replay, in live mode every summary_interval seconds.
+    """
+
+    def __init__(
+        self,
+        summary_interval: Union[float, None] = None,
+        time_function: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self._summary_interval = summary_interval
+        self._time = time_function
+        self._lock = threading.RLock()
+        self._thread_state = threading.local()
+        self._last_summary_at = self._time()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._number_of_ticks = 0
+            self._ticks = CallStatistics()
+            self._calls: Dict[str, CallStatistics] = {}
+
+    def wrap(self, target: Any, component: str) -> Any:
+        return _ProfiledProxy(target, component, self)
+
+    @contextlib.contextmanager
+    def measure_tick(self) -> Iterator[None]:
+        start = self._time()
+        self._thread_state.is_in_tick = True
+        try:
+            yield
+        finally:
+            self._thread_state.is_in_tick = False
+            duration = self._time() - start
+            with self._lock:
+                self._number_of_ticks += 1
+                self._ticks.record(duration)
+
+    def record_call(self, name: str, duration: float) -> None:
+        if not getattr(self._thread_state, 'is_in_tick', False):
+            return
+
+        with self._lock:
+            if name not in self._calls:
+                self._calls[name] = CallStatistics()
+
+            self._calls[name].record(duration)
+
+    def get_summary(self) -> TickProfileSummary:
+        with self._lock:
+            return TickProfileSummary(self._number_of_ticks, self._ticks, self._calls)
+
+    def log_summary(self) -> None:
+        logger.info(self.get_summary())
+
+    def log_summary_if_due(self) -> None:
+        """Logs summary of the last period and starts a new one."""
+        with self._lock:
+            if self._summary_interval is None or self._time() - self._last_summary_at < self._summary_interval:
+                return
+
+            summary = self.get_summary()
+            self.reset()
+            self._last_summary_at = self._time()
+
+        logger.info(summary)
+
+    def time(self) -> float:
+        return self._time()
+
+
+class _ProfiledProxy:
+    """Forwards everything to the target object, calls of its methods are measured."""
+
+    def __init__(self, target: Any, component: str, profiler: TickProfiler) -> None:
+        self._target = target
+        self._component = component
+        self._profiler = profiler
+        self._methods: Dict[str, Callable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._methods:
+            return self._methods[name]
+
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        call_name = '{}.{}'.format(self._component, name)
+        profiler = self._profiler
+
+        def profiled_method(*args, **kwargs):
+            start = profiler.time()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                profiler.record_call(call_name, profiler.time() - start)
+
+        self._methods[name] = profiled_method
+        return profiled_method
+
+    def __repr__(self) -> str:
+        return repr(self._target)
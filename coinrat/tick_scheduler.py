@@ -0,0 +1,117 @@
+import logging
+import math
+import time
+from typing import Callable, Union
+
+logger = logging.getLogger(__name__)
+
+TICK_POLICY_SKIP = 'skip'
+TICK_POLICY_CATCH_UP = 'catch_up'
+TICK_POLICIES = [TICK_POLICY_SKIP, TICK_POLICY_CATCH_UP]
+
+
+class TickScheduler:
+    """
+    Schedules live strategy ticks at wall-clock boundaries: multiples of the period (since the Unix epoch)
+    shifted by offset. With period of 60 seconds and offset of 2 seconds ticks happen 2 seconds after every minute
+    candle closes (synchronizers get the time to store it), no matter how long the ticks take.
+
+    Deadlines are kept on the monotonic clock (wall-clock is read only once, to find the first boundary), so system
+    clock adjustments do not shift or bunch the ticks. Lag (how late the tick started) is reported. When the tick
+    takes longer than the period, missed ticks are skipped (TICK_POLICY_SKIP, next tick at the next boundary) or
+    executed immediately one after another (TICK_POLICY_CATCH_UP).
+
+    With first_tick_immediately, the first tick is due right away (strategy started in the middle of a long period
+    does not wait for up to the whole period), the following ticks are at the boundaries.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        offset: float = 0.0,
+        policy: str = TICK_POLICY_SKIP,
+        first_tick_immediately: bool = False,
+        lag_warning_threshold: Union[float, None] = None,
+        monotonic_function: Callable[[], float] = time.monotonic,
+        wall_clock_function: Callable[[], float] = time.time,
+        sleep_function: Callable[[float], None] = time.sleep
+    ) -> None:
+        assert period > 0, 'Period must be positive, {} given.'.format(period)
+        assert policy in TICK_POLICIES, 'Unknown tick policy: "{}"'.format(policy)
+
+        self._period = period
+        self._offset = offset % period
+        self._policy = policy
+        self._first_tick_immediately = first_tick_immediately
+        self._lag_warning_threshold = lag_warning_threshold if lag_warning_threshold is not None else period / 2
+        self._monotonic = monotonic_function
+        self._wall_clock = wall_clock_function
+        self._sleep = sleep_function
+
+        self._next_deadline: Union[float, None] = None
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.number_of_ticks = 0
+        self.number_of_skipped_ticks = 0
+
+    def wait_for_next_tick(self) -> float:
+        """Sleeps until the next tick is due. Returns lag of the tick in seconds."""
+        seconds_until_next_tick = self.get_seconds_until_next_tick()
+        if seconds_until_next_tick > 0:
+            self._sleep(seconds_until_next_tick)
+
+        return self.start_tick()
+
+    def get_seconds_until_next_tick(self) -> float:
+        """For callers which wait on their own (e.g. asyncio.sleep), start_tick() must be called after the wait."""
+        if self._next_deadline is None:
+            if self._first_tick_immediately:
+                return 0.0
+            self._next_deadline = self._get_first_deadline()
+
+        return max(0.0, self._next_deadline - self._monotonic())
+
+    def start_tick(self) -> float:
+        """Marks the tick as started, returns its lag in seconds."""
+        if self._next_deadline is None:
+            self._next_deadline = self._get_first_deadline()
+            if self._first_tick_immediately:
+                if self._next_deadline <= self._monotonic():  # Started exactly at the boundary
+                    self._next_deadline += self._period
+                self._record_lag(0.0)
+                return 0.0
+
+        now = self._monotonic()
+        if self._policy == TICK_POLICY_SKIP and now - self._next_deadline >= self._period:
+            self._skip_missed_ticks(now)
+
+        lag = now - self._next_deadline
+        self._next_deadline += self._period
+        self._record_lag(lag)
+
+        return lag
+
+    def _get_first_deadline(self) -> float:
+        wall_clock_now = self._wall_clock()
+        monotonic_now = self._monotonic()
+
+        boundary = math.ceil((wall_clock_now - self._offset) / self._period) * self._period + self._offset
+        return monotonic_now + (boundary - wall_clock_now)
+
+    def _skip_missed_ticks(self, now: float) -> None:
+        """Moves the deadline to the last boundary before now."""
+        skipped = math.floor((now - self._next_deadline) / self._period)
+        logger.warning('Tick is {:.3f}s late, {} missed tick(s) skipped.'.format(now - self._next_deadline, skipped))
+
+        self._next_deadline += skipped * self._period
+        self.number_of_skipped_ticks += skipped
+
+    def _record_lag(self, lag: float) -> None:
+        self.number_of_ticks += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+        if lag > self._lag_warning_threshold:
+            logger.warning('Tick started {:.3f}s after its boundary.'.format(lag))
+        else:
+            logger.debug('Tick started {:.3f}s after its boundary.'.format(lag))
@@ -1,25 +1,48 @@
 import datetime
 import logging
+from collections import OrderedDict
+
 import dateutil.parser
 
-from typing import Dict, List
+from typing import Dict, List, Set, Union
 from bittrex.bittrex import Bittrex, API_V1_1, API_V2_0, TICKINTERVAL_ONEMIN
 
 from decimal import Decimal
 from coinrat.domain import Balance
 from coinrat.domain.pair import Pair, MarketPairDoesNotExistsException
 from coinrat.domain.candle import Candle
-from coinrat.domain.market import Market, PairMarketInfo, MarketException
+from coinrat.domain.number import assert_decimals
+from coinrat.domain.market import Market, PairMarketInfo, MarketException, cached_with_ttl
 from coinrat.domain.order import Order, ORDER_TYPE_MARKET, ORDER_TYPE_LIMIT, NotEnoughBalanceToPerformOrderException, \
     OrderMarketInfo
+from coinrat.request_scheduler import RequestScheduler, PRIORITY_ORDER, PRIORITY_ORDER_STATUS, PRIORITY_MARKET_DATA, \
+    PRIORITY_METADATA
 
 MARKET_NAME = 'bittrex'
 
+# Markets (their minimal trade sizes) are needed for every order, they change rarely
+MARKETS_METADATA_TTL = 600
+
+# Bittrex allows about 60 API calls per minute
+DEFAULT_REQUESTS_PER_SECOND = 1
+DEFAULT_REQUESTS_BURST = 5
+
 
 class BittrexMarket(Market):
-    def __init__(self, client_v1: Bittrex, client_v2: Bittrex) -> None:
+    """
+    All requests go through request_scheduler (rate limit shared by strategies, synchronizer and socket server of
+    the process, orders first, identical concurrent requests coalesced).
+    """
+
+    def __init__(
+        self,
+        client_v1: Bittrex,
+        client_v2: Bittrex,
+        request_scheduler: Union[RequestScheduler, None] = None
+    ) -> None:
         self._client_v1 = client_v1
         self._client_v2 = client_v2
+        self._request_scheduler = request_scheduler if request_scheduler is not None else RequestScheduler()
 
     @staticmethod
     def get_configuration_structure() -> Dict[str, Dict[str, str]]:
@@ -39,13 +62,22 @@ class BittrexMarket(Market):
 
     def get_balance(self, currency: str) -> Balance:
         currency = self._convert_currency_code_to_bittrex_format(currency)
-        result = self._client_v2.get_balance(currency)
+        result = self._request_scheduler.call(
+            PRIORITY_MARKET_DATA,
+            self._client_v2.get_balance,
+            currency,
+            coalesce_key=('get_balance', currency)
+        )
         self._validate_result(result)
 
         return Balance(self.name, currency, Decimal(result['result']['Available']))
 
     def get_balances(self) -> List[Balance]:
-        result = self._client_v2.get_balances()
+        result = self._request_scheduler.call(
+            PRIORITY_MARKET_DATA,
+            self._client_v2.get_balances,
+            coalesce_key=('get_balances',)
+        )
         self._validate_result(result)
 
         return list(map(
@@ -59,7 +91,12 @@ class BittrexMarket(Market):
 
     def get_current_price(self, pair: Pair) -> Decimal:
         market = self._format_market_pair(pair)
-        result = self._client_v1.get_ticker(market)
+        result = self._request_scheduler.call(
+            PRIORITY_MARKET_DATA,
+            self._client_v1.get_ticker,
+            market,
+            coalesce_key=('get_ticker', market)
+        )
         self._validate_result(result)
 
         return Decimal(result['result']['Last'])
@@ -74,11 +111,9 @@ class BittrexMarket(Market):
 
     def get_pair_market_info(self, pair: Pair) -> PairMarketInfo:
         market = self._format_market_pair(pair)
-        result = self._client_v1.get_markets()
-        self._validate_result(result)
-        for market_data in result['result']:
-            if market_data['MarketName'] == market:
-                return PairMarketInfo(pair, Decimal(market_data['MinTradeSize']))
+        markets = self._get_markets_by_name()
+        if market in markets:
+            return PairMarketInfo(pair, Decimal(markets[market]['MinTradeSize']))
 
         raise MarketPairDoesNotExistsException(
             'MarketPair "{}" not found on the "{}".'.format(market, self.name)
@@ -95,10 +130,23 @@ class BittrexMarket(Market):
             raise NotImplementedError('Bittrex does not support MARKET orders.')
 
         elif order.type == ORDER_TYPE_LIMIT:
+            assert_decimals(order.quantity, order.rate)  # Float rounding must not get into real orders
             if order.is_sell():
-                result = self._client_v1.sell_limit(market, float(order.quantity), float(order.rate))
+                result = self._request_scheduler.call(
+                    PRIORITY_ORDER,
+                    self._client_v1.sell_limit,
+                    market,
+                    float(order.quantity),
+                    float(order.rate)
+                )
             elif order.is_buy():
-                result = self._client_v1.buy_limit(market, float(order.quantity), float(order.rate))
+                result = self._request_scheduler.call(
+                    PRIORITY_ORDER,
+                    self._client_v1.buy_limit,
+                    market,
+                    float(order.quantity),
+                    float(order.rate)
+                )
             else:
                 raise ValueError('Unknown order direction: {}'.format(order._direction))
 
@@ -110,7 +158,12 @@ class BittrexMarket(Market):
             raise ValueError('Unknown order type: {}'.format(order.type))
 
     def get_order_status(self, order: Order) -> OrderMarketInfo:
-        result = self._client_v2.get_order(order.id_on_market)
+        result = self._request_scheduler.call(
+            PRIORITY_ORDER_STATUS,
+            self._client_v2.get_order,
+            order.id_on_market,
+            coalesce_key=('get_order', order.id_on_market)
+        )
         self._validate_result(result)
         info_data = result['result']
 
@@ -120,14 +173,25 @@ class BittrexMarket(Market):
 
         return OrderMarketInfo(order, info_data['IsOpen'], closed_at, Decimal(str(info_data['QuantityRemaining'])))
 
+    def get_open_order_ids(self, pair: Pair) -> Set[str]:
+        market = self._format_market_pair(pair)
+        result = self._request_scheduler.call(
+            PRIORITY_ORDER_STATUS,
+            self._client_v1.get_open_orders,
+            market,
+            coalesce_key=('get_open_orders', market)
+        )
+        self._validate_result(result)
+
+        return {order_data['OrderUuid'] for order_data in result['result']}
+
     def cancel_order(self, order_id: str) -> None:
-        result = self._client_v1.cancel(order_id)
+        result = self._request_scheduler.call(PRIORITY_ORDER, self._client_v1.cancel, order_id)
         self._validate_result(result)
 
     def get_all_tradable_pairs(self) -> List[Pair]:
-        raw_pairs = self._client_v1.get_markets()['result']
         result = []
-        for raw_pair in raw_pairs:
+        for raw_pair in self._get_markets_by_name().values():
             if raw_pair['IsActive']:
                 base_currency = self._normalize_currency_code(raw_pair['BaseCurrency'])
                 market_currency = self._normalize_currency_code(raw_pair['MarketCurrency'])
@@ -136,6 +200,18 @@ class BittrexMarket(Market):
 
         return result
 
+    @cached_with_ttl(MARKETS_METADATA_TTL)
+    def _get_markets_by_name(self) -> Dict[str, Dict]:
+        """Whole list of markets is downloaded at once, indexed by market name (e.g. "USDT-BTC")."""
+        result = self._request_scheduler.call(
+            PRIORITY_METADATA,
+            self._client_v1.get_markets,
+            coalesce_key=('get_markets',)
+        )
+        self._validate_result(result)
+
+        return OrderedDict((market_data['MarketName'], market_data) for market_data in result['result'])
+
     @staticmethod
     def _normalize_currency_code(currency_code: str) -> str:
         if currency_code == 'USDT':
@@ -151,11 +227,17 @@ class BittrexMarket(Market):
 
     def _get_sorted_candles_from_api(self, pair: Pair):
         market = self._format_market_pair(pair)
-        result = self._client_v2.get_candles(market, TICKINTERVAL_ONEMIN)
+        result = self._request_scheduler.call(
+            PRIORITY_MARKET_DATA,
+            self._client_v2.get_candles,
+            market,
+            TICKINTERVAL_ONEMIN,
+            coalesce_key=('get_candles', market)
+        )
         self._validate_result(result)
-        result = result['result']
-        result.sort(key=lambda candle: candle['T'])
-        return result
+
+        # Coalesced result is shared by callers, it is not sorted in place
+        return sorted(result['result'], key=lambda candle: candle['T'])
 
     def _create_candle_from_raw_ticker_data(self, pair: Pair, candle: Dict[str, str]) -> Candle:
         return Candle(
@@ -185,5 +267,14 @@ class BittrexMarket(Market):
         return 'USDT' if currency == 'USD' else currency
 
 
-def bittrex_market_factory(key: str, secret: str) -> BittrexMarket:
-    return BittrexMarket(Bittrex(key, secret, api_version=API_V1_1), Bittrex(key, secret, api_version=API_V2_0))
+def bittrex_market_factory(
+    key: str,
+    secret: str,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    burst: int = DEFAULT_REQUESTS_BURST
+) -> BittrexMarket:
+    return BittrexMarket(
+        Bittrex(key, secret, api_version=API_V1_1),
+        Bittrex(key, secret, api_version=API_V2_0),
+        RequestScheduler(requests_per_second, burst)
+    )
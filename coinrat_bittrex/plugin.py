@@ -4,7 +4,8 @@ from coinrat.market_plugins import MarketPluginSpecification
 from coinrat.synchronizer_plugins import SynchronizerPluginSpecification
 from .synchronizer import BittrexSynchronizer
 
-from .market import bittrex_market_factory, MARKET_NAME, BittrexMarket
+from .market import bittrex_market_factory, MARKET_NAME, BittrexMarket, DEFAULT_REQUESTS_PER_SECOND, \
+    DEFAULT_REQUESTS_BURST
 
 get_name_impl = pluggy.HookimplMarker('market_plugins')
 get_available_markets_spec = pluggy.HookimplMarker('market_plugins')
@@ -16,7 +17,13 @@ does_support_market_impl = pluggy.HookimplMarker('market_plugins')
 PLUGIN_NAME = 'coinrat_bittrex'
 SYNCHRONIZER_NAME = 'bittrex'
 
-bittrex_market = bittrex_market_factory(os.environ.get('BITREX_KEY'), os.environ.get('BITREX_SECRET'))
+# One market (and its rate limit) is shared by strategies and the synchronizer of the process
+bittrex_market = bittrex_market_factory(
+    os.environ.get('BITREX_KEY'),
+    os.environ.get('BITREX_SECRET'),
+    float(os.environ.get('BITTREX_REQUESTS_PER_SECOND', DEFAULT_REQUESTS_PER_SECOND)),
+    int(os.environ.get('BITTREX_REQUESTS_BURST', DEFAULT_REQUESTS_BURST))
+)
 get_available_synchronizers_spec = pluggy.HookimplMarker('synchronizer_plugins')
 get_synchronizer_impl = pluggy.HookimplMarker('synchronizer_plugins')
 
@@ -1,10 +1,11 @@
+import datetime
 import logging
 import time
 import traceback
-from typing import Union, List
+from typing import Dict, Tuple, Union, List
 
-from coinrat.domain import MarketStateSynchronizer
-from coinrat.domain.candle import CandleStorage
+from coinrat.domain import MarketStateSynchronizer, DateTimeFactory, CurrentUtcDateTimeFactory, DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage, NoCandlesForMarketInStorageException
 from coinrat.domain.market import MarketException
 from coinrat.domain.pair import Pair
 from coinrat.event.event_emitter import EventEmitter
@@ -12,22 +13,35 @@ from .market import BittrexMarket, MARKET_NAME
 
 logger = logging.getLogger(__name__)
 
+# Last minute candles can still change (minute has not ended when they were fetched), they are fetched every run
+NUMBER_OF_LAST_CANDLES = 3
+
 
 class BittrexSynchronizer(MarketStateSynchronizer):
+    """
+    Writes only new or changed candles: time of the last persisted candle and prices of the last written
+    candles are remembered, unchanged candles are neither written nor emitted. Full history is loaded only
+    into empty storage, after start / error only candles since the last persisted one are written.
+    """
+
     def __init__(
         self,
         market: BittrexMarket,
         storage: CandleStorage,
         event_emitter: EventEmitter,
         delay: int = 60,
-        number_of_runs: Union[int, None] = None
+        number_of_runs: Union[int, None] = None,
+        datetime_factory: DateTimeFactory = CurrentUtcDateTimeFactory()
     ) -> None:
         self._market = market
         self._storage = storage
         self._event_emitter = event_emitter
         self._delay = delay
         self._number_of_runs = number_of_runs
+        self._datetime_factory = datetime_factory
         self._needs_resync_of_historical_data = True
+        self._last_persisted_time: Union[datetime.datetime, None] = None
+        self._last_written_prices: Dict[datetime.datetime, Tuple] = {}
 
     def synchronize(self, market_name: str, pair: Pair):
         if market_name != MARKET_NAME:
@@ -37,14 +51,9 @@ class BittrexSynchronizer(MarketStateSynchronizer):
 
             try:
                 if self._needs_resync_of_historical_data:
-                    logger.info('Resync of all available history (on start / after error)')
-                    candles = self._market.get_candles(pair)
-                    self._storage.write_candles(candles)
-
+                    self._resync_historical_data(pair)
                 else:
-                    candles = self._market.get_last_minute_candles(pair, 3)
-                    self._storage.write_candles(candles)
-                    self._event_emitter.emit_new_candles(self._storage.name, candles)
+                    self._write_new_candles(self._market.get_last_minute_candles(pair, NUMBER_OF_LAST_CANDLES))
 
                 self._needs_resync_of_historical_data = False
 
@@ -59,5 +68,63 @@ class BittrexSynchronizer(MarketStateSynchronizer):
 
             time.sleep(self._delay)
 
+    def get_candles(self, market_name: str, pair: Pair, interval: DateTimeInterval) -> List[Candle]:
+        """Bittrex provides only last ~10 days of minute candles and always all of them (one request)."""
+        if market_name != MARKET_NAME:
+            raise ValueError('BittrexSynchronizer does not support market "{}".'.format(market_name))
+
+        return [
+            candle for candle in self._market.get_candles(pair) if interval.since <= candle.time < interval.till
+        ]
+
+    @property
+    def is_candle_history_paged(self) -> bool:
+        return False
+
     def get_supported_markets(self) -> List[str]:
         return [MARKET_NAME]
+
+    def _resync_historical_data(self, pair: Pair) -> None:
+        if self._last_persisted_time is None:
+            try:
+                last_candle = self._storage.get_last_minute_candle(MARKET_NAME, pair, self._datetime_factory.now())
+                self._last_persisted_time = last_candle.time
+            except NoCandlesForMarketInStorageException:
+                logger.info('Load of all available history (storage is empty)')
+                self._write_new_candles(self._market.get_candles(pair), emit_events=False)
+                return
+
+        logger.info('Resync of history since {} (on start / after error)'.format(self._last_persisted_time.isoformat()))
+        self._write_new_candles(self._market.get_candles(pair))
+
+    def _write_new_candles(self, candles: List[Candle], emit_events: bool = True) -> None:
+        new_candles = [candle for candle in candles if self._is_new_or_changed(candle)]
+        if not new_candles:
+            return
+
+        self._storage.write_candles(new_candles)
+        if emit_events:
+            self._event_emitter.emit_new_candles(self._storage.name, new_candles)
+
+        for candle in new_candles:
+            self._last_written_prices[candle.time] = self._get_prices(candle)
+
+        self._last_persisted_time = max(new_candles[-1].time, self._last_persisted_time or new_candles[-1].time)
+
+        # Only candles which can still change are needed for deduplication
+        for candle_time in sorted(self._last_written_prices.keys())[:-NUMBER_OF_LAST_CANDLES]:
+            del self._last_written_prices[candle_time]
+
+    def _is_new_or_changed(self, candle: Candle) -> bool:
+        if self._last_persisted_time is None or candle.time > self._last_persisted_time:
+            return True
+
+        if candle.time in self._last_written_prices:
+            return self._last_written_prices[candle.time] != self._get_prices(candle)
+
+        # Persisted before this process started (or forgotten), the last persisted one can still change
+        return candle.time == self._last_persisted_time
+
+    @staticmethod
+    def _get_prices(candle: Candle) -> Tuple:
+        return candle.open, candle.high, candle.low, candle.close
@@ -73,6 +73,18 @@ def test_place_order():
     assert 'abcd' == order.id_on_market
 
 
+def test_order_with_float_amounts_is_not_placed():
+    client_v1 = mock_client_v1()
+    client_v1.should_receive('buy_limit').never()
+    market = BittrexMarket(client_v1, mock_client_v2())
+
+    order = copy.deepcopy(DUMMY_LIMIT_BUY_ORDER)
+    order._quantity = 1.0
+
+    with pytest.raises(AssertionError):
+        market.place_order(order)
+
+
 def test_market_order_not_implemented():
     market = BittrexMarket(mock_client_v1(), mock_client_v2())
 
@@ -99,6 +111,33 @@ def test_not_enough_balance():
         market.place_order(order)
 
 
+def test_markets_are_downloaded_once_for_many_orders():
+    client_v1 = flexmock()
+    client_v1 \
+        .should_receive('get_markets') \
+        .and_return({'success': True, 'result': [MARKET_USDT_BTC_DATA]}) \
+        .once()
+    client_v1.should_receive('buy_limit').and_return({'success': True, 'result': {'uuid': 'abcd'}}).twice()
+
+    market = BittrexMarket(client_v1, mock_client_v2())
+    market.place_order(copy.deepcopy(DUMMY_LIMIT_BUY_ORDER))
+    market.place_order(copy.deepcopy(DUMMY_LIMIT_BUY_ORDER))
+
+    assert [str(pair) for pair in market.get_all_tradable_pairs()] == [str(BTC_USD_PAIR)]
+
+
+def test_get_open_order_ids():
+    client_v1 = flexmock()
+    client_v1 \
+        .should_receive('get_open_orders') \
+        .with_args('USDT-BTC') \
+        .and_return({'success': True, 'result': [{'OrderUuid': 'abcd'}, {'OrderUuid': 'efgh'}]}) \
+        .once()
+
+    market = BittrexMarket(client_v1, mock_client_v2())
+    assert market.get_open_order_ids(BTC_USD_PAIR) == {'abcd', 'efgh'}
+
+
 def test_cancel_order():
     client_v1 = mock_client_v1()
     client_v1.should_receive('cancel').with_args('abcd').and_return({'success': True}).once()
@@ -6,32 +6,32 @@ from flexmock import flexmock
 from coinrat.domain.market import MarketException
 from coinrat_bittrex.synchronizer import BittrexSynchronizer
 from coinrat.domain.pair import Pair
-from coinrat.domain.candle import Candle
+from coinrat.domain.candle import Candle, NoCandlesForMarketInStorageException
 from coinrat.event.event_emitter import EventEmitter
 
 BTC_USD_PAIR = Pair('USD', 'BTC')
-DUMMY_CANDLE = Candle(
-    '',
-    BTC_USD_PAIR,
-    datetime.datetime(2017, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc),
-    Decimal('8000'),
-    Decimal('8000'),
-    Decimal('8000'),
-    Decimal('8000')
-)
 
 
 def test_synchronize_success():
     market = flexmock(name='yolo_market')
-    market.should_receive('get_candles').and_return([DUMMY_CANDLE, DUMMY_CANDLE])
-    market.should_receive('get_last_minute_candles').and_return(DUMMY_CANDLE)
+    market.should_receive('get_candles').and_return([create_candle(0), create_candle(1)])
+    market.should_receive('get_last_minute_candles').and_return([create_candle(0), create_candle(1), create_candle(2)])
 
     storage = flexmock(name='yolo_storage')
-    storage.should_receive('write_candles').times(2)
+    storage.should_receive('get_last_minute_candle').and_raise(NoCandlesForMarketInStorageException)
+    written_candles = []
+    storage.should_receive('write_candles').replace_with(written_candles.append).times(2)
 
-    synchronizer = BittrexSynchronizer(market, storage, create_emitter_mock(), delay=0, number_of_runs=2)
+    emitter = create_emitter_mock()
+    emitted_candles = []
+    emitter.should_receive('emit_new_candles').replace_with(lambda storage, candles: emitted_candles.append(candles))
+
+    synchronizer = BittrexSynchronizer(market, storage, emitter, delay=0, number_of_runs=2)
     synchronizer.synchronize('bittrex', BTC_USD_PAIR)
 
+    assert [[candle.time.minute for candle in candles] for candles in written_candles] == [[0, 1], [2]]
+    assert [[candle.time.minute for candle in candles] for candles in emitted_candles] == [[2]]
+
 
 def test_synchronize_recover_from_error():
     market = flexmock(name='yolo_market')
@@ -39,12 +39,45 @@ def test_synchronize_recover_from_error():
     market.should_receive('get_last_minute_candles').and_raise(MarketException()).times(1)
 
     storage = flexmock(name='yolo_storage')
-    storage.should_receive('write_candles')
+    storage.should_receive('get_last_minute_candle').and_return(create_candle(0))
+    storage.should_receive('write_candles').never()
 
     synchronizer = BittrexSynchronizer(market, storage, create_emitter_mock(), delay=0, number_of_runs=3)
     synchronizer.synchronize('bittrex', BTC_USD_PAIR)
 
 
+def test_synchronize_writes_only_new_or_changed_candles():
+    market = flexmock(name='yolo_market')
+    market.should_receive('get_candles').and_return([create_candle(minute) for minute in range(0, 5)])
+    market.should_receive('get_last_minute_candles').and_return(
+        [create_candle(3), create_candle(4, Decimal('8100')), create_candle(5)]
+    ).and_return(
+        [create_candle(4, Decimal('8100')), create_candle(5), create_candle(6)]
+    )
+
+    storage = flexmock(name='yolo_storage')
+    storage.should_receive('get_last_minute_candle').and_return(create_candle(2))
+    written_candles = []
+    storage.should_receive('write_candles').replace_with(written_candles.append)
+
+    synchronizer = BittrexSynchronizer(market, storage, create_emitter_mock(), delay=0, number_of_runs=3)
+    synchronizer.synchronize('bittrex', BTC_USD_PAIR)
+
+    assert [[candle.time.minute for candle in candles] for candles in written_candles] == [[2, 3, 4], [4, 5], [6]]
+
+
+def create_candle(minute: int, close: Decimal = Decimal('8000')) -> Candle:
+    return Candle(
+        'bittrex',
+        BTC_USD_PAIR,
+        datetime.datetime(2017, 1, 1, 0, minute, 0, tzinfo=datetime.timezone.utc),
+        Decimal('8000'),
+        max(close, Decimal('8000')),
+        min(close, Decimal('8000')),
+        close
+    )
+
+
 def create_emitter_mock() -> EventEmitter:
     emitter_mock = flexmock()
     emitter_mock.should_receive('emit_new_candles')
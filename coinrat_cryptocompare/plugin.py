@@ -1,8 +1,12 @@
+import os
+
 import pluggy
 import requests
 
 from coinrat.synchronizer_plugins import SynchronizerPluginSpecification
-from .synchronizer import CryptocompareSynchronizer, SYNCHRONIZER_NAME
+from coinrat.request_scheduler import RequestScheduler
+from .synchronizer import CryptocompareSynchronizer, SYNCHRONIZER_NAME, DEFAULT_MAX_WORKERS, \
+    DEFAULT_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_BURST
 
 get_name_impl = pluggy.HookimplMarker('synchronizer_plugins')
 get_available_synchronizers_spec = pluggy.HookimplMarker('synchronizer_plugins')
@@ -10,6 +14,12 @@ get_synchronizer_impl = pluggy.HookimplMarker('synchronizer_plugins')
 
 PACKAGE_NAME = 'coinrat_cryptocompare'
 
+# Rate limit is shared by all synchronizers of the process (see: synchronize_many)
+request_scheduler = RequestScheduler(
+    float(os.environ.get('CRYPTOCOMPARE_REQUESTS_PER_SECOND', DEFAULT_REQUESTS_PER_SECOND)),
+    DEFAULT_REQUESTS_BURST
+)
+
 
 class SynchronizerPlugin(SynchronizerPluginSpecification):
     @get_name_impl
@@ -23,7 +33,11 @@ class SynchronizerPlugin(SynchronizerPluginSpecification):
     @get_synchronizer_impl
     def get_synchronizer(self, synchronizer_name, storage, event_emitter):
         if synchronizer_name == SYNCHRONIZER_NAME:
-            return CryptocompareSynchronizer(storage, event_emitter, requests.session())
+            session = requests.session()
+            # Pairs are synchronized concurrently (see: synchronize_pairs), every worker needs its connection
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=DEFAULT_MAX_WORKERS)
+            session.mount('https://', adapter)
+            return CryptocompareSynchronizer(storage, event_emitter, session, request_scheduler=request_scheduler)
 
         raise ValueError('Synchronizer "{}" not supported by this plugin.'.format(synchronizer_name))
 
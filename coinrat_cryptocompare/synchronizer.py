@@ -1,19 +1,30 @@
 import time, logging
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Union
 from decimal import Decimal
 
 from requests import Session, RequestException, TooManyRedirects
-from coinrat.domain import MarketStateSynchronizer
-from coinrat.domain.candle import Candle, CandleStorage
-from coinrat.domain.pair import Pair
+from coinrat.domain import MarketStateSynchronizer, DateTimeFactory, CurrentUtcDateTimeFactory, DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage, NoCandlesForMarketInStorageException
+from coinrat.domain.pair import Pair, serialize_pair
 from coinrat.event.event_emitter import EventEmitter
+from coinrat.request_scheduler import RequestScheduler, PRIORITY_MARKET_DATA, PRIORITY_METADATA
+from coinrat.tick_scheduler import TickScheduler
 
 SYNCHRONIZER_NAME = 'cryptocompare'
 
 MINUTE_CANDLE_URL = 'https://min-api.cryptocompare.com/data/histominute?fsym={}&tsym={}&limit=1&aggregate=1&e={}'
+MINUTE_CANDLES_URL = 'https://min-api.cryptocompare.com/data/histominute' \
+                     + '?fsym={}&tsym={}&limit={}&aggregate=1&e={}&toTs={}'
 ALL_EXCHANGES_URL = 'https://min-api.cryptocompare.com/data/all/exchanges'
 
+MAX_CANDLES_PER_REQUEST = 2000
+MAX_BACKFILL_MINUTES = 7 * 24 * 60  # Cryptocompare keeps minute candles of last 7 days only
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_REQUESTS_PER_SECOND = 10
+DEFAULT_REQUESTS_BURST = DEFAULT_MAX_WORKERS
+
 MARKET_MAP = {
     'bittrex': 'BitTrex'
 }
@@ -32,7 +43,9 @@ class CryptocompareSynchronizer(MarketStateSynchronizer):
         delay: int = 30,
         number_of_runs: Union[int, None] = None,
         time_to_sleep_after_error: int = 10,
-        max_number_of_retries: Union[int, None] = None
+        max_number_of_retries: Union[int, None] = None,
+        datetime_factory: DateTimeFactory = CurrentUtcDateTimeFactory(),
+        request_scheduler: Union[RequestScheduler, None] = None
     ) -> None:
         self._storage = storage
         self._event_emitter = event_emitter
@@ -42,12 +55,13 @@ class CryptocompareSynchronizer(MarketStateSynchronizer):
         self._time_to_sleep_after_error = time_to_sleep_after_error
         self._default_max_number_of_retries = max_number_of_retries
         self._max_number_of_retries = max_number_of_retries
+        self._datetime_factory = datetime_factory
+        self._request_scheduler = request_scheduler if request_scheduler is not None else RequestScheduler()
+        self._exchanges: Union[Dict[str, str], None] = None
+        self._last_candle_times: Dict[str, Union[datetime, None]] = {}
 
     def synchronize(self, market_name: str, pair: Pair) -> None:
-        markets = self._get_all_exchanges()
-        if market_name not in markets:
-            raise ValueError('Market "{}" not supported by Cryptocompare.'.format(market_name))
-        cryptocompare_exchange_name = markets[market_name]
+        cryptocompare_exchange_name = self._get_cryptocompare_exchange_name(market_name)
 
         while self._number_of_runs is None or self._number_of_runs > 0:
             url = MINUTE_CANDLE_URL.format(pair.market_currency, pair.base_currency, cryptocompare_exchange_name)
@@ -64,30 +78,154 @@ class CryptocompareSynchronizer(MarketStateSynchronizer):
 
             time.sleep(self._delay)
 
+    def synchronize_pairs(self, market_name: str, pairs: List[Pair], max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Synchronizes many pairs at once, pairs are requested concurrently (session should have pool of
+        max_workers connections). Every delay seconds (aligned to wall-clock, see TickScheduler) only candles
+        missing since the last stored candle of the pair are requested, one request per pair. Gap (e.g. after
+        outage) is detected on startup and after errors from the storage and backfilled in big batches.
+        Errors of one pair do not stop the others, failed pair is retried in the next run.
+        """
+        cryptocompare_exchange_name = self._get_cryptocompare_exchange_name(market_name)
+        tick_scheduler = TickScheduler(self._delay)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while self._number_of_runs is None or self._number_of_runs > 0:
+                list(executor.map(
+                    lambda pair: self._synchronize_pair_safely(market_name, cryptocompare_exchange_name, pair),
+                    pairs
+                ))
+
+                if self._number_of_runs is not None:
+                    self._number_of_runs -= 1
+                    if self._number_of_runs == 0:
+                        break
+
+                tick_scheduler.wait_for_next_tick()
+
+    def get_candles(self, market_name: str, pair: Pair, interval: DateTimeInterval) -> List[Candle]:
+        """Minute candles of the last 7 days only (history kept by Cryptocompare), requests are not retried."""
+        cryptocompare_exchange_name = self._get_cryptocompare_exchange_name(market_name)
+        last_minute = interval.till - timedelta(minutes=1)
+        number_of_minutes = int((last_minute - interval.since).total_seconds() // 60)
+        if number_of_minutes < 0:
+            return []
+
+        candles = self._get_minute_candles(
+            market_name,
+            cryptocompare_exchange_name,
+            pair,
+            number_of_minutes,
+            last_minute
+        )
+        return [candle for candle in candles if interval.since <= candle.time < interval.till]
+
     def get_supported_markets(self) -> List[str]:
         return list(self._get_all_exchanges().keys())
 
+    def _get_cryptocompare_exchange_name(self, market_name: str) -> str:
+        markets = self._get_all_exchanges()
+        if market_name not in markets:
+            raise ValueError('Market "{}" not supported by Cryptocompare.'.format(market_name))
+
+        return markets[market_name]
+
     def _get_all_exchanges(self) -> Dict[str, str]:
-        response = self._session.get(ALL_EXCHANGES_URL)
-        data: Dict = response.json()
+        if self._exchanges is None:
+            response = self._request_scheduler.call(
+                PRIORITY_METADATA,
+                self._session.get,
+                ALL_EXCHANGES_URL,
+                coalesce_key=ALL_EXCHANGES_URL
+            )
+            data: Dict = response.json()
 
-        result = {}
-        for key, items in data.items():
-            result[key.lower()] = key
+            self._exchanges = {}
+            for key, items in data.items():
+                self._exchanges[key.lower()] = key
 
-        return result
+        return self._exchanges
+
+    def _synchronize_pair_safely(self, market_name: str, cryptocompare_exchange_name: str, pair: Pair) -> None:
+        try:
+            self._synchronize_pair(market_name, cryptocompare_exchange_name, pair)
+        except Exception:  # Also errors of the storage or of the event emitter, other pairs keep synchronizing
+            logging.exception('Synchronization of pair "{}" failed.'.format(serialize_pair(pair)))
+            self._last_candle_times[serialize_pair(pair)] = None  # Gap is detected from the storage again
+
+    def _synchronize_pair(self, market_name: str, cryptocompare_exchange_name: str, pair: Pair) -> None:
+        key = serialize_pair(pair)
+        if self._last_candle_times.get(key) is None:
+            self._last_candle_times[key] = self._get_last_stored_candle_time(market_name, pair)
+
+        now = self._datetime_factory.now()
+        last_candle_time = self._last_candle_times[key]
+        if last_candle_time is None:
+            number_of_minutes = MAX_BACKFILL_MINUTES
+        else:
+            # Last stored candle is requested again, it could have been stored before its minute ended
+            number_of_minutes = min(MAX_BACKFILL_MINUTES, int((now - last_candle_time).total_seconds() // 60))
+
+        candles = self._get_minute_candles(market_name, cryptocompare_exchange_name, pair, number_of_minutes, now)
+        if last_candle_time is not None:
+            candles = [candle for candle in candles if candle.time >= last_candle_time]
+
+        if not candles:
+            return
+
+        if number_of_minutes > 1:
+            logging.info('Pair "{}": {} minute candles synchronized (since {}).'.format(
+                key,
+                len(candles),
+                candles[0].time.isoformat()
+            ))
+
+        self._storage.write_candles(candles)
+        self._event_emitter.emit_new_candles(self._storage.name, candles)
+        self._last_candle_times[key] = candles[-1].time
+
+    def _get_last_stored_candle_time(self, market_name: str, pair: Pair) -> Union[datetime, None]:
+        try:
+            return self._storage.get_last_minute_candle(market_name, pair, self._datetime_factory.now()).time
+        except NoCandlesForMarketInStorageException:
+            return None
+
+    def _get_minute_candles(
+        self,
+        market_name: str,
+        cryptocompare_exchange_name: str,
+        pair: Pair,
+        number_of_minutes: int,
+        now: datetime
+    ) -> List[Candle]:
+        """Candles of last number_of_minutes minutes and of the current minute, oldest first."""
+        candles: List[Candle] = []
+        to_timestamp = int(now.timestamp())
+        remaining = number_of_minutes + 1
+        while remaining > 0:
+            limit = max(1, min(MAX_CANDLES_PER_REQUEST, remaining - 1))  # Cryptocompare returns limit + 1 candles
+            url = MINUTE_CANDLES_URL.format(
+                pair.market_currency,
+                pair.base_currency,
+                limit,
+                cryptocompare_exchange_name,
+                to_timestamp
+            )
+            batch = [self._create_candle_from_raw(market_name, pair, data) for data in self._request_data(url)['Data']]
+            new_candles = [candle for candle in batch if not candles or candle.time < candles[0].time]
+            if not new_candles:  # Beginning of the history of the pair
+                break
+
+            candles = new_candles[-remaining:] + candles
+            remaining -= len(new_candles)
+            to_timestamp = int((batch[0].time - timedelta(minutes=1)).timestamp())
+
+        return candles
 
     def get_data_from_cryptocompare(self, url: str) -> Dict:
         while True:
             try:
-                response = self._session.get(url)
-                if response.status_code != 200:
-                    raise CryptocompareRequestException(response.text)
-
-                json_data = response.json()
-                if json_data['Response'] != 'Success':
-                    raise CryptocompareRequestException(response.text)
-
+                json_data = self._request_data(url)
                 self._reset_number_of_retries()
 
                 return json_data
@@ -101,6 +239,20 @@ class CryptocompareSynchronizer(MarketStateSynchronizer):
                 time.sleep(self._time_to_sleep_after_error)
                 self._count_connection_error_retry()
 
+    def _request_data(self, url: str) -> Dict:
+        return self._request_scheduler.call(PRIORITY_MARKET_DATA, self._get_json, url, coalesce_key=url)
+
+    def _get_json(self, url: str) -> Dict:
+        response = self._session.get(url)
+        if response.status_code != 200:
+            raise CryptocompareRequestException(response.text)
+
+        json_data = response.json()
+        if json_data['Response'] != 'Success':
+            raise CryptocompareRequestException(response.text)
+
+        return json_data
+
     @staticmethod
     def _create_candle_from_raw(market_name: str, pair: Pair, candles_data: Dict) -> Candle:
         return Candle(
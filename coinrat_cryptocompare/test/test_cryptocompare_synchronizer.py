@@ -1,6 +1,13 @@
+import datetime
+from decimal import Decimal
+from typing import Dict, List
+
 import pytest
 from flexmock import flexmock
 
+from coinrat.domain import FrozenDateTimeFactory
+from coinrat.domain.candle import Candle
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
 from coinrat_cryptocompare.synchronizer import CryptocompareSynchronizer, CryptocompareRequestException, \
     ALL_EXCHANGES_URL
 from coinrat.domain.pair import Pair
@@ -103,3 +110,91 @@ def mock_storage(write_candles_call_count: int):
     storage.should_receive('write_candles')#.times(write_candles_call_count)
 
     return storage
+
+
+class FakeCryptocompareSession:
+    """Generates minute candles for requested pairs (see: MINUTE_CANDLES_URL), counts requests."""
+
+    def __init__(self, failing_currency: str) -> None:
+        self._failing_currency = failing_currency
+        self.requested_limits: Dict[str, List[int]] = {}
+
+    def get(self, url: str):
+        if url == ALL_EXCHANGES_URL:
+            return flexmock(status_code=200, json=lambda: {'BitTrex': {}})
+
+        query = dict(parameter.split('=') for parameter in url.split('?')[1].split('&'))
+        if query['fsym'] == self._failing_currency:
+            return flexmock(status_code=500, text='Internal Server Error')
+
+        limit, to_timestamp = int(query['limit']), int(query['toTs'])
+        self.requested_limits.setdefault(query['fsym'], []).append(limit)
+        last_minute = to_timestamp - to_timestamp % 60
+        data = [
+            dict(DUMMY_CANDLE_DATA[0], time=last_minute - minutes * 60) for minutes in range(limit, -1, -1)
+        ]
+        return flexmock(status_code=200, json=lambda: {'Response': 'Success', 'Data': data})
+
+
+def test_synchronize_pairs_backfills_gaps_and_isolates_errors():
+    now = datetime.datetime(2017, 11, 25, 12, 0, 30, tzinfo=datetime.timezone.utc)
+    storage = CandleMemoryStorage()
+    storage.write_candle(Candle(
+        'bittrex',
+        BTC_USD_PAIR,
+        now - datetime.timedelta(minutes=3, seconds=30),
+        Decimal('8000'),
+        Decimal('8000'),
+        Decimal('8000'),
+        Decimal('8000')
+    ))
+    session = FakeCryptocompareSession(failing_currency='LTC')
+
+    synchronizer = CryptocompareSynchronizer(
+        storage,
+        create_event_emitter_mock(),
+        session,
+        number_of_runs=1,
+        datetime_factory=FrozenDateTimeFactory(now)
+    )
+    synchronizer.synchronize_pairs('bittrex', [BTC_USD_PAIR, Pair('USD', 'LTC'), Pair('USD', 'ETH')])
+
+    assert session.requested_limits == {'BTC': [3], 'ETH': [2000, 2000, 2000, 2000, 2000, 75]}
+    assert len(storage.find_by('bittrex', BTC_USD_PAIR)) == 4
+    assert storage.find_by('bittrex', BTC_USD_PAIR)[0].close != Decimal('8000')  # Last stored candle is updated
+
+    eth_candles = storage.find_by('bittrex', Pair('USD', 'ETH'))
+    assert len(eth_candles) == 7 * 24 * 60 + 1
+    assert eth_candles[-1].time == datetime.datetime(2017, 11, 25, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    assert all([
+        (eth_candles[i + 1].time - eth_candles[i].time).total_seconds() == 60 for i in range(len(eth_candles) - 1)
+    ])
+    assert storage.find_by('bittrex', Pair('USD', 'LTC')) == []
+
+
+class FailingCandleStorage(CandleMemoryStorage):
+    def __init__(self, failing_currency: str) -> None:
+        super().__init__()
+        self._failing_currency = failing_currency
+
+    def write_candles(self, candles: List[Candle]) -> None:
+        if any([candle.pair.market_currency == self._failing_currency for candle in candles]):
+            raise IOError('Storage is not available.')
+
+        super().write_candles(candles)
+
+
+def test_synchronize_pairs_isolates_storage_errors():
+    now = datetime.datetime(2017, 11, 25, 12, 0, 30, tzinfo=datetime.timezone.utc)
+    storage = FailingCandleStorage(failing_currency='ETH')
+    synchronizer = CryptocompareSynchronizer(
+        storage,
+        create_event_emitter_mock(),
+        FakeCryptocompareSession(failing_currency=''),
+        number_of_runs=1,
+        datetime_factory=FrozenDateTimeFactory(now)
+    )
+    synchronizer.synchronize_pairs('bittrex', [Pair('USD', 'ETH'), BTC_USD_PAIR])
+
+    assert storage.find_by('bittrex', Pair('USD', 'ETH')) == []
+    assert len(storage.find_by('bittrex', BTC_USD_PAIR)) == 7 * 24 * 60 + 1
@@ -4,10 +4,9 @@ import uuid
 from typing import Union, Tuple, List, Dict
 from decimal import Decimal
 
-import math
-
 from coinrat.domain.market import Market
 from coinrat.domain import DateTimeFactory, DateTimeInterval
+from coinrat.domain.number import Number
 from coinrat.domain.strategy import Strategy, StrategyConfigurationException, StrategyRun, SkipTickException
 from coinrat.domain.candle import CandleStorage, CANDLE_STORAGE_FIELD_CLOSE, NoCandlesForMarketInStorageException
 from coinrat.domain.order import Order, DIRECTION_SELL, DIRECTION_BUY, ORDER_STATUS_OPEN, \
@@ -118,15 +117,7 @@ class DoubleCrossoverStrategy(Strategy):
         }
 
     def _check_and_process_open_orders(self, market: Market):
-        orders = self._order_facade.find_by(
-            market_name=market.name,
-            pair=self._strategy_run.pair,
-            status=ORDER_STATUS_OPEN
-        )
-        for order in orders:
-            status = market.get_order_status(order)
-            if status.is_open is False:
-                self._order_facade.close(order, status.closed_at)
+        self._order_facade.reconcile_open_orders(market, self._strategy_run.pair)
 
     def _check_for_signal_and_trade(self, market: Market):
         signal = self._check_for_signal(market)
@@ -191,14 +182,13 @@ class DoubleCrossoverStrategy(Strategy):
         return Signal(SIGNAL_BUY, average_price) if current_sign == 1 else Signal(SIGNAL_SELL, average_price)
 
     @staticmethod
-    def _calculate_sign_of_change(long_average: Decimal, short_average: Decimal) -> int:
-        diff = short_average - long_average
-        if diff == 0:
+    def _calculate_sign_of_change(long_average: Number, short_average: Number) -> int:
+        if short_average == long_average:
             return 0
 
-        return int(math.copysign(1, float(diff)))
+        return 1 if short_average > long_average else -1
 
-    def _get_averages(self, market: Market) -> Tuple[Decimal, Decimal]:
+    def _get_averages(self, market: Market) -> Tuple[Number, Number]:
         now = self._datetime_factory.now()
 
         long_average = self._candle_storage.mean(
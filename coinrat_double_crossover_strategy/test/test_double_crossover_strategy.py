@@ -1,6 +1,7 @@
+import copy
 import datetime
 import logging
-from typing import List, Union, Tuple
+from typing import List, Set, Union, Tuple
 from uuid import UUID
 
 import pytest
@@ -11,6 +12,7 @@ from coinrat.domain import CurrentUtcDateTimeFactory, DateTimeInterval
 from coinrat.domain.strategy import StrategyConfigurationException, StrategyRun
 from coinrat.domain.pair import Pair
 from coinrat.domain.market import Market
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL
 from coinrat.domain.order import ORDER_TYPE_LIMIT, Order, OrderMarketInfo, DIRECTION_BUY, DIRECTION_SELL, \
     NotEnoughBalanceToPerformOrderException, ORDER_STATUS_CLOSED, ORDER_STATUS_OPEN, OrderStorage
 from coinrat.order_facade import OrderFacade
@@ -256,14 +258,46 @@ def test_closes_open_orders_if_closed_on_market(expected_save_order_called: int,
     strategy.tick([market])
 
 
+@pytest.mark.parametrize(['open_order_ids', 'expected_save_order_called'],
+    [
+        (set(), 1),
+        ({DUMMY_OPEN_ORDER.id_on_market}, 0),
+    ]
+)
+def test_open_orders_are_reconciled_by_one_request(open_order_ids: Set[str], expected_save_order_called: int):
+    candle_storage = flexmock()
+    candle_storage.should_receive('mean').and_return(8000).and_return(7900)
+    candle_storage.should_receive('get_last_minute_candle').and_return(flexmock(average_price=Decimal(Decimal('8000'))))
+
+    order_storage = create_order_storage_mock()
+    order_storage.should_receive('find_by').and_return([copy.deepcopy(DUMMY_OPEN_ORDER)])
+    order_storage.should_receive('delete')
+    order_storage.should_receive('save_order').times(expected_save_order_called)
+
+    market = create_market_mock()
+    market.should_receive('get_open_order_ids').with_args(BTC_USD_PAIR).and_return(open_order_ids).once()
+    market.should_receive('get_order_status').and_return(CLOSED_ORDER_INFO).times(expected_save_order_called)
+    market.should_receive('get_balances').and_return([])
+
+    strategy = DoubleCrossoverStrategy(
+        candle_storage,
+        OrderFacade(order_storage, create_portfolio_snapshot_mock(), create_event_emitter_mock()),
+        CurrentUtcDateTimeFactory(),
+        STRATEGY_RUN
+    )
+    strategy.tick([market])
+
+
 def create_market_mock() -> Union[Market, Mock]:
     market = flexmock(
         transaction_taker_fee=Decimal('0.0025'),
         transaction_makerfee=Decimal('0.0025'),
-        name=DUMMY_MARKET_NAME
+        name=DUMMY_MARKET_NAME,
+        numeric_backend=NUMERIC_BACKEND_DECIMAL
     )
     market.should_receive('calculate_maximal_amount_to_buy').and_return(Decimal('1'))
     market.should_receive('calculate_maximal_amount_to_sell').and_return(Decimal('1'))
+    market.should_receive('get_open_order_ids').and_raise(NotImplementedError)
     return market
 
 
@@ -1,5 +1,3 @@
-import numpy
-
 from coinrat.domain.candle import Candle
 
 
@@ -12,6 +10,7 @@ class HeikinAshiCandle(Candle):
 
     See: http://stockcharts.com/school/doku.php?id=chart_school:chart_analysis:heikin_ashi
     """
+    __slots__ = ()
 
     def __repr__(self):
         return super().__repr__() + ' (Heikin-Ashi)'
@@ -37,9 +36,8 @@ def create_initial_heikin_ashi_candle(candle: Candle) -> HeikinAshiCandle:
 def candle_to_heikin_ashi(candle: Candle, previous: HeikinAshiCandle) -> HeikinAshiCandle:
     heikin_close = (candle.open + candle.high + candle.low + candle.close) / 4
     heikin_open = (previous.open + previous.close) / 2
-    elements = numpy.array([candle.high, candle.low, heikin_open, heikin_close])
-    heikin_high = elements.max(0)
-    heikin_low = elements.min(0)
+    heikin_high = max(candle.high, candle.low, heikin_open, heikin_close)
+    heikin_low = min(candle.high, candle.low, heikin_open, heikin_close)
 
     return HeikinAshiCandle(
         candle.market_name,
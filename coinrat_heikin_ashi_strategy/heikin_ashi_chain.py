@@ -0,0 +1,62 @@
+import datetime
+from typing import List, Union
+
+from coinrat.domain.candle import Candle, CandleSize, CandleResampler
+from coinrat_heikin_ashi_strategy.heikin_ashi_candle import HeikinAshiCandle, candle_to_heikin_ashi, \
+    create_initial_heikin_ashi_candle
+
+
+class HeikinAshiChainBuilder:
+    """
+    Builds the chain of Heikin-Ashi candles from minute candles as they arrive.
+
+    Only the last two finished HA candles and the current (unfinished) one are kept. The very first finished candle
+    only initializes the chain (see: create_initial_heikin_ashi_candle), so chain is ready after three finished
+    candles and one unfinished.
+    """
+
+    def __init__(self, candle_size: CandleSize) -> None:
+        self._resampler = CandleResampler(candle_size)
+        self._number_of_finished_candles = 0
+        self._first_previous_candle: Union[HeikinAshiCandle, None] = None
+        self._second_previous_candle: Union[HeikinAshiCandle, None] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._number_of_finished_candles >= 3 and self._resampler.current_candle is not None
+
+    @property
+    def last_candle_time(self) -> Union[datetime.datetime, None]:
+        return self._resampler.last_candle_time
+
+    @property
+    def first_previous_candle(self) -> Union[HeikinAshiCandle, None]:
+        return self._first_previous_candle
+
+    @property
+    def second_previous_candle(self) -> Union[HeikinAshiCandle, None]:
+        return self._second_previous_candle
+
+    @property
+    def current_unfinished_candle(self) -> Union[HeikinAshiCandle, None]:
+        current_candle = self._resampler.current_candle
+        if current_candle is None or self._first_previous_candle is None:
+            return None
+
+        return candle_to_heikin_ashi(current_candle, self._first_previous_candle)
+
+    def add_candles(self, candles: List[Candle]) -> int:
+        """Returns number of newly finished Heikin-Ashi candles."""
+        finished_candles = self._resampler.add_candles(candles)
+
+        for candle in finished_candles:
+            if self._first_previous_candle is None:
+                heikin_ashi_candle = create_initial_heikin_ashi_candle(candle)
+            else:
+                heikin_ashi_candle = candle_to_heikin_ashi(candle, self._first_previous_candle)
+
+            self._second_previous_candle = self._first_previous_candle
+            self._first_previous_candle = heikin_ashi_candle
+            self._number_of_finished_candles += 1
+
+        return len(finished_candles)
@@ -1,3 +1,4 @@
+import datetime
 import logging
 import uuid
 from typing import Union, List, Dict, cast
@@ -7,13 +8,12 @@ from decimal import Decimal
 from coinrat.domain import DateTimeFactory, DateTimeInterval
 from coinrat.domain.market import Market
 from coinrat.domain.strategy import Strategy, StrategyRun, SkipTickException
-from coinrat.domain.candle import CandleStorage, deserialize_candle_size, CandleSize
+from coinrat.domain.candle import CandleStorage, deserialize_candle_size, CandleSize, get_candle_bucket_start
 from coinrat.domain.order import Order, DIRECTION_SELL, DIRECTION_BUY, ORDER_TYPE_LIMIT, \
     NotEnoughBalanceToPerformOrderException
 from coinrat.domain.configuration_structure import CONFIGURATION_STRUCTURE_TYPE_CANDLE_SIZE
 from coinrat.order_facade import OrderFacade
-from coinrat_heikin_ashi_strategy.heikin_ashi_candle import HeikinAshiCandle, candle_to_heikin_ashi, \
-    create_initial_heikin_ashi_candle
+from coinrat_heikin_ashi_strategy.heikin_ashi_chain import HeikinAshiChainBuilder
 from coinrat.domain.configuration_structure import format_data_to_python_types
 
 logger = logging.getLogger(__name__)
@@ -44,9 +44,7 @@ class HeikinAshiStrategy(Strategy):
         self._candle_size = cast(CandleSize, configuration['candle_size'])
         self._strategy_ticker = 0
 
-        self._first_previous_candle: Union[HeikinAshiCandle, None] = None
-        self._second_previous_candle: Union[HeikinAshiCandle, None] = None
-        self._current_unfinished_candle: Union[HeikinAshiCandle, None] = None
+        self._heikin_ashi_chain = HeikinAshiChainBuilder(self._candle_size)
         self._trend = 0
         self._strategy_run = strategy_run
 
@@ -64,57 +62,25 @@ class HeikinAshiStrategy(Strategy):
     def first_tick_initialize_strategy_data(self, markets: List[Market]) -> None:
         market = self.get_market(markets)
 
-        current_time = self._datetime_factory.now()
-        interval = DateTimeInterval(current_time - 4 * self._candle_size.get_as_time_delta(), current_time)
+        since = get_candle_bucket_start(self._candle_size, self._datetime_factory.now()) \
+            - 4 * self._candle_size.get_as_time_delta()
 
-        candles = self._candle_storage.find_by(
-            market_name=market.name,
-            pair=self._strategy_run.pair,
-            interval=interval,
-            candle_size=self._candle_size
-        )
+        self._heikin_ashi_chain = HeikinAshiChainBuilder(self._candle_size)
+        self._feed_new_candles(market, since)
 
-        if len(candles) not in [4, 5]:
+        if not self._heikin_ashi_chain.is_ready:
             raise SkipTickException(
-                'Expected to get at 4 or 5 candles, but only {} given. Do you have enough data?'.format(len(candles))
+                'Expected to get at least 4 candles, but not enough given. Do you have enough data?'
             )
 
-        if len(candles) == 5:  # First and last candle can be cut in half, we dont need the first half-candle.
-            candles.pop(0)
-
-        first_candle = create_initial_heikin_ashi_candle(candles[0])
-        self._second_previous_candle = candle_to_heikin_ashi(candles[1], first_candle)
-        self._first_previous_candle = candle_to_heikin_ashi(candles[2], self._second_previous_candle)
-        self._current_unfinished_candle = candle_to_heikin_ashi(candles[3], self._first_previous_candle)
-
     def _tick(self, markets: List[Market]) -> None:
-
         market = self.get_market(markets)
-        current_time = self._datetime_factory.now()
-        interval = DateTimeInterval(current_time - 2 * self._candle_size.get_as_time_delta(), current_time)
-
-        candles = self._candle_storage.find_by(
-            market_name=market.name,
-            pair=self._strategy_run.pair,
-            interval=interval,
-            candle_size=self._candle_size
-        )
-
-        if len(candles) not in [2, 3]:
-            raise SkipTickException(
-                'Expected to get at 2 or 3 candles, but only {} given. Do you have enough data?'.format(len(candles))
-            )
-
-        if len(candles) == 3:  # First and last candle can be cut in half, we don't need the first half-candle.
-            candles.pop(0)
 
         self.update_trend()
 
-        if candles[0].time == self._current_unfinished_candle.time:
-            self._second_previous_candle = self._first_previous_candle
-            self._first_previous_candle = candle_to_heikin_ashi(candles[0], self._first_previous_candle)
-            self._current_unfinished_candle = candle_to_heikin_ashi(candles[1], self._first_previous_candle)
+        number_of_finished_candles = self._feed_new_candles(market, self._heikin_ashi_chain.last_candle_time)
 
+        if number_of_finished_candles > 0:
             self.log_tick()
 
             try:
@@ -124,23 +90,39 @@ class HeikinAshiStrategy(Strategy):
                 # just ignores buy/sell and waits for next signal.
                 logger.warning(str(e))
 
+    def _feed_new_candles(self, market: Market, since: datetime.datetime) -> int:
+        """
+        Only minute candles since the last consumed one are loaded (the last one again, it could have changed),
+        bigger candles are aggregated in memory.
+        """
+        candles = self._candle_storage.find_by(
+            market_name=market.name,
+            pair=self._strategy_run.pair,
+            interval=DateTimeInterval(since - datetime.timedelta(seconds=1), self._datetime_factory.now())
+        )
+
+        return self._heikin_ashi_chain.add_candles(candles)
+
     def update_trend(self):
-        if self._second_previous_candle.is_bearish() and self._trend > -5:
+        second_previous_candle = self._heikin_ashi_chain.second_previous_candle
+        if second_previous_candle.is_bearish() and self._trend > -5:
             self._trend -= 1
-        if self._second_previous_candle.is_bullish() and self._trend < 5:
+        if second_previous_candle.is_bullish() and self._trend < 5:
             self._trend += 1
 
     def check_for_buy_or_sell(self, market: Market) -> None:
+        first_previous_candle = self._heikin_ashi_chain.first_previous_candle
+        second_previous_candle = self._heikin_ashi_chain.second_previous_candle
         if (
             self._trend >= 5
-            and self._first_previous_candle.is_bearish()
-            and self._second_previous_candle.is_bearish()
+            and first_previous_candle.is_bearish()
+            and second_previous_candle.is_bearish()
         ):
             self.create_order(market, DIRECTION_SELL)
         if (
             self._trend <= -5
-            and self._first_previous_candle.is_bullish()
-            and self._second_previous_candle.is_bullish()
+            and first_previous_candle.is_bullish()
+            and second_previous_candle.is_bullish()
         ):
             self.create_order(market, DIRECTION_BUY)
 
@@ -165,11 +147,11 @@ class HeikinAshiStrategy(Strategy):
     def log_tick(self) -> None:
         logger.info(
             '[{0}] {1} | Trend: {2}, HA_Candle(-1): {3}, HA_Candle(0): {4}`, '.format(
-                self._current_unfinished_candle.time.isoformat(),
+                self._heikin_ashi_chain.current_unfinished_candle.time.isoformat(),
                 self._strategy_ticker,
                 self._trend,
-                'BEAR' if self._first_previous_candle.is_bearish() else 'BULL',
-                'BEAR' if self._second_previous_candle.is_bearish() else 'BULL'
+                'BEAR' if self._heikin_ashi_chain.first_previous_candle.is_bearish() else 'BULL',
+                'BEAR' if self._heikin_ashi_chain.second_previous_candle.is_bearish() else 'BULL'
             )
         )
 
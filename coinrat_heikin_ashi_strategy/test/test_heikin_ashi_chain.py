@@ -0,0 +1,55 @@
+import datetime
+import math
+from decimal import Decimal
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleSize, CANDLE_SIZE_UNIT_MINUTE
+from coinrat.domain.pair import Pair
+from coinrat_heikin_ashi_strategy.heikin_ashi_candle import create_initial_heikin_ashi_candle, candle_to_heikin_ashi
+from coinrat_heikin_ashi_strategy.heikin_ashi_chain import HeikinAshiChainBuilder
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+DUMMY_DATE = datetime.datetime(2017, 7, 2, 0, 0, 0, tzinfo=datetime.timezone.utc)
+CANDLE_SIZE = CandleSize(CANDLE_SIZE_UNIT_MINUTE, 10)
+
+CANDLES = [
+    Candle(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        DUMMY_DATE + datetime.timedelta(minutes=minute),
+        Decimal(8000 + int(100 * math.sin(minute / 7))),
+        Decimal(8100 + int(100 * math.sin(minute / 7))),
+        Decimal(7900 + int(100 * math.sin(minute / 7))),
+        Decimal(8000 + int(100 * math.sin((minute + 1) / 7)))
+    )
+    for minute in range(45)
+]
+
+
+def test_chain_is_not_ready_without_enough_candles():
+    chain = HeikinAshiChainBuilder(CANDLE_SIZE)
+    assert 2 == chain.add_candles(CANDLES[:25])
+    assert chain.is_ready is False
+    assert chain.second_previous_candle is not None
+
+
+def test_chain_matches_heikin_ashi_of_grouped_candles():
+    storage = CandleMemoryStorage()
+    storage.write_candles(CANDLES)
+    grouped_candles = storage.find_by(DUMMY_MARKET, BTC_USD_PAIR, DateTimeInterval(None, None), CANDLE_SIZE)
+
+    heikin_ashi_candles = [create_initial_heikin_ashi_candle(grouped_candles[0])]
+    for candle in grouped_candles[1:]:
+        heikin_ashi_candles.append(candle_to_heikin_ashi(candle, heikin_ashi_candles[-1]))
+
+    chain = HeikinAshiChainBuilder(CANDLE_SIZE)
+    assert 3 == chain.add_candles(CANDLES[:35])
+    assert 1 == chain.add_candles(CANDLES[30:45])
+
+    assert chain.is_ready
+    assert str(heikin_ashi_candles[2]) == str(chain.second_previous_candle)
+    assert str(heikin_ashi_candles[3]) == str(chain.first_previous_candle)
+    assert str(heikin_ashi_candles[4]) == str(chain.current_unfinished_candle)
+    assert CANDLES[44].time == chain.last_candle_time
@@ -10,7 +10,7 @@ from coinrat.domain.pair import Pair, serialize_pair
 from coinrat.domain.candle import Candle, CandleStorage, \
     CANDLE_STORAGE_FIELD_HIGH, CANDLE_STORAGE_FIELD_OPEN, CANDLE_STORAGE_FIELD_CLOSE, CANDLE_STORAGE_FIELD_LOW, \
     NoCandlesForMarketInStorageException, CANDLE_STORAGE_FIELD_MARKET, CANDLE_STORAGE_FIELD_PAIR, CandleSize, \
-    CANDLE_SIZE_UNIT_MINUTE, serialize_candle_size, CANDLE_STORAGE_FIELD_SIZE, deserialize_candle, \
+    CANDLE_SIZE_UNIT_MINUTE, serialize_candle_size, CANDLE_STORAGE_FIELD_SIZE, deserialize_candles, \
     CANDLE_SIZE_UNIT_DAY, CANDLE_SIZE_UNIT_HOUR
 
 CANDLE_STORAGE_NAME = 'influx_db'
@@ -82,7 +82,7 @@ class CandleInnoDbStorage(CandleStorage):
         pair: Pair,
         candle_size: CandleSize
     ) -> List[Candle]:
-        candles = []
+        raw_candles = []
         for raw_candle in data:
             if (raw_candle[CANDLE_STORAGE_FIELD_OPEN] is None
                 and raw_candle[CANDLE_STORAGE_FIELD_OPEN] is None
@@ -91,10 +91,11 @@ class CandleInnoDbStorage(CandleStorage):
             ):
                 continue
 
-            raw_candle = CandleInnoDbStorage._fix_fields_in_raw_candle(raw_candle, market_name, pair, candle_size)
-            candles.append(deserialize_candle(raw_candle))
+            raw_candles.append(
+                CandleInnoDbStorage._fix_fields_in_raw_candle(raw_candle, market_name, pair, candle_size)
+            )
 
-        return candles
+        return deserialize_candles(raw_candles, is_trusted=True)
 
     @staticmethod
     def _fix_fields_in_raw_candle(raw_candle: Dict, market_name: str, pair: Pair, candle_size: CandleSize) -> Dict:
@@ -122,7 +123,7 @@ class CandleInnoDbStorage(CandleStorage):
         result = list(result.get_points())
         self._validate_result_has_some_data(market_name, result)
 
-        return deserialize_candle(result[0])
+        return deserialize_candles(result, is_trusted=True)[0]
 
     def mean(
         self,
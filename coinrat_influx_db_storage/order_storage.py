@@ -3,14 +3,12 @@ from uuid import UUID
 
 from decimal import Decimal
 
-import datetime
-import dateutil.parser
 from influxdb import InfluxDBClient
 from influxdb.resultset import ResultSet
 
-from coinrat.domain import DateTimeInterval
-from coinrat.domain.pair import Pair, serialize_pair
-from coinrat.domain.order import OrderStorage, Order, POSSIBLE_ORDER_STATUSES
+from coinrat.domain import DateTimeInterval, parse_utc_datetime
+from coinrat.domain.pair import Pair, serialize_pair, deserialize_pair
+from coinrat.domain.order import OrderStorage, Order, POSSIBLE_ORDER_STATUSES, create_trusted_order
 from coinrat.domain.order import ORDER_FIELD_MARKET, ORDER_FIELD_PAIR, ORDER_FIELD_STATUS, \
     ORDER_FIELD_DIRECTION, ORDER_FIELD_ORDER_ID, ORDER_FIELD_QUANTITY, ORDER_FIELD_CANCELED_AT, \
     ORDER_FIELD_RATE, ORDER_FIELD_ID_ON_MARKET, ORDER_FIELD_TYPE, ORDER_FIELD_CLOSED_AT, \
@@ -121,23 +119,21 @@ class OrderInnoDbStorage(OrderStorage):
 
     @staticmethod
     def _create_order_from_serialized(row: Dict[str, Union[str, int, float, bool]]) -> Order:
-        pair_data = str(row[ORDER_FIELD_PAIR]).split('_')
-
         closed_at = None
         if ORDER_FIELD_CLOSED_AT in row and row[ORDER_FIELD_CLOSED_AT] is not None:
-            closed_at = dateutil.parser.parse(str(row[ORDER_FIELD_CLOSED_AT])).replace(tzinfo=datetime.timezone.utc)
+            closed_at = parse_utc_datetime(str(row[ORDER_FIELD_CLOSED_AT]))
 
         canceled_at = None
         if ORDER_FIELD_CANCELED_AT in row and row[ORDER_FIELD_CANCELED_AT] is not None:
-            canceled_at = dateutil.parser.parse(str(row[ORDER_FIELD_CANCELED_AT])).replace(tzinfo=datetime.timezone.utc)
+            canceled_at = parse_utc_datetime(str(row[ORDER_FIELD_CANCELED_AT]))
 
-        return Order(
+        return create_trusted_order(
             UUID(str(row[ORDER_FIELD_ORDER_ID])),
             UUID(str(row[ORDER_FIELD_STRATEGY_RUN_ID])),
             str(row[ORDER_FIELD_MARKET]),
             str(row[ORDER_FIELD_DIRECTION]),
-            dateutil.parser.parse(str(row['time'])).replace(tzinfo=datetime.timezone.utc),
-            Pair(pair_data[0], pair_data[1]),
+            parse_utc_datetime(str(row['time'])),
+            deserialize_pair(str(row[ORDER_FIELD_PAIR])),
             str(row[ORDER_FIELD_TYPE]),
             Decimal(row[ORDER_FIELD_QUANTITY]),
             Decimal(row[ORDER_FIELD_RATE]) if ORDER_FIELD_RATE in row and row[ORDER_FIELD_RATE] is not None else None,
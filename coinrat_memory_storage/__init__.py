@@ -0,0 +1,3 @@
+from .plugin import candle_storage_plugin, order_storage_plugin, portfolio_snapshot_storage_plugin
+
+__all__ = ['candle_storage_plugin', 'order_storage_plugin', 'portfolio_snapshot_storage_plugin']
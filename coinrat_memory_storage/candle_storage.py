@@ -0,0 +1,176 @@
+import bisect
+import datetime
+import logging
+from decimal import Decimal
+from typing import List, Dict, Tuple, cast
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.pair import Pair, serialize_pair
+from coinrat.domain.candle import Candle, CandleStorage, CandleSize, CandleResampler, \
+    NoCandlesForMarketInStorageException, CANDLE_SIZE_UNIT_MINUTE, CANDLE_STORAGE_FIELD_OPEN, \
+    CANDLE_STORAGE_FIELD_CLOSE, CANDLE_STORAGE_FIELD_LOW, CANDLE_STORAGE_FIELD_HIGH
+
+CANDLE_STORAGE_NAME = 'memory'
+
+CANDLE_FIELDS = [
+    CANDLE_STORAGE_FIELD_OPEN,
+    CANDLE_STORAGE_FIELD_CLOSE,
+    CANDLE_STORAGE_FIELD_LOW,
+    CANDLE_STORAGE_FIELD_HIGH,
+]
+
+logger = logging.getLogger(__name__)
+
+
+class _CandleSeries:
+    """Candles of one market and pair, sorted by time, with lazily computed prefix sums for fast means."""
+
+    def __init__(self) -> None:
+        self._candles_by_time: Dict[datetime.datetime, Candle] = {}
+        self._candles: List[Candle] = []
+        self._timestamps: List[float] = []
+        self._prefix_sums: Dict[str, List[Decimal]] = {}
+        self._is_dirty = False
+
+    def write(self, candle: Candle) -> None:
+        self._candles_by_time[candle.time] = candle
+        self._is_dirty = True
+
+    @property
+    def candles(self) -> List[Candle]:
+        self._refresh()
+        return self._candles
+
+    @property
+    def timestamps(self) -> List[float]:
+        self._refresh()
+        return self._timestamps
+
+    def get_prefix_sums(self, field: str) -> List[Decimal]:
+        self._refresh()
+        if field not in self._prefix_sums:
+            # Candles of simulations with float numeric backend have float prices (typed as Decimals, see: Candle)
+            is_float = len(self._candles) > 0 and isinstance(getattr(self._candles[0], field), float)
+            prefix_sums = [cast(Decimal, 0.0) if is_float else Decimal('0')]
+            for candle in self._candles:
+                prefix_sums.append(prefix_sums[-1] + getattr(candle, field))
+            self._prefix_sums[field] = prefix_sums
+
+        return self._prefix_sums[field]
+
+    def _refresh(self) -> None:
+        if not self._is_dirty:
+            return
+
+        self._candles = sorted(self._candles_by_time.values(), key=lambda candle: candle.time)
+        self._timestamps = [candle.time.timestamp() for candle in self._candles]
+        self._prefix_sums = {}
+        self._is_dirty = False
+
+
+class CandleMemoryStorage(CandleStorage):
+    """
+    Keeps candles in process memory. Meant for simulations (replays, configuration searches, ...) where candles
+    are loaded once from persistent storage and then queried many times.
+
+    Bigger candles are aggregated from stored minute candles the same way as InfluxDB does it
+    (buckets are aligned to the Unix epoch).
+    """
+
+    def __init__(self) -> None:
+        self._series: Dict[Tuple[str, str], _CandleSeries] = {}
+
+    @property
+    def name(self) -> str:
+        return CANDLE_STORAGE_NAME
+
+    def write_candle(self, candle: Candle) -> None:
+        self.write_candles([candle])
+
+    def write_candles(self, candles: List[Candle]) -> None:
+        if len(candles) == 0:
+            return
+
+        for candle in candles:
+            self._get_series(candle.market_name, candle.pair).write(candle)
+
+        logger.debug('Into market "{}", {} candles inserted'.format(candles[0].market_name, len(candles)))
+
+    def find_by(
+        self,
+        market_name: str,
+        pair: Pair,
+        interval: DateTimeInterval = DateTimeInterval(None, None),
+        candle_size: CandleSize = CandleSize(CANDLE_SIZE_UNIT_MINUTE, 1)
+    ) -> List[Candle]:
+        series = self._get_series(market_name, pair)
+        lower, upper = self._get_bounds(series, interval)
+        candles = series.candles[lower:upper]
+
+        if candle_size.is_one_minute():
+            return candles
+
+        return self._aggregate(candles, candle_size)
+
+    def mean(
+        self,
+        market_name: str,
+        pair: Pair,
+        field: str,
+        interval: DateTimeInterval = DateTimeInterval(None, None)
+    ) -> Decimal:
+        assert field in CANDLE_FIELDS, 'Unknown field: "{}"'.format(field)
+
+        series = self._get_series(market_name, pair)
+        lower, upper = self._get_bounds(series, interval)
+        self._validate_has_some_data(market_name, upper - lower)
+
+        prefix_sums = series.get_prefix_sums(field)
+        return (prefix_sums[upper] - prefix_sums[lower]) / (upper - lower)
+
+    def get_last_minute_candle(self, market_name: str, pair: Pair, current_time: datetime.datetime) -> Candle:
+        series = self._get_series(market_name, pair)
+        index = bisect.bisect_right(series.timestamps, current_time.timestamp())
+        self._validate_has_some_data(market_name, index)
+
+        return series.candles[index - 1]
+
+    def _get_series(self, market_name: str, pair: Pair) -> _CandleSeries:
+        key = (market_name, serialize_pair(pair))
+        if key not in self._series:
+            self._series[key] = _CandleSeries()
+
+        return self._series[key]
+
+    @staticmethod
+    def _get_bounds(series: _CandleSeries, interval: DateTimeInterval) -> Tuple[int, int]:
+        """Both sides of the interval are exclusive (the same behaviour as in InfluxDB storage)."""
+        timestamps = series.timestamps
+
+        lower = 0
+        if interval.since is not None:
+            lower = bisect.bisect_right(timestamps, interval.since.timestamp())
+
+        upper = len(timestamps)
+        if interval.till is not None:
+            upper = bisect.bisect_left(timestamps, interval.till.timestamp())
+
+        return lower, max(lower, upper)
+
+    @staticmethod
+    def _aggregate(candles: List[Candle], candle_size: CandleSize) -> List[Candle]:
+        resampler = CandleResampler(candle_size)
+        result = resampler.add_candles(candles)
+
+        if resampler.current_candle is not None:
+            result.append(resampler.current_candle)
+
+        return result
+
+    @staticmethod
+    def _validate_has_some_data(market_name: str, number_of_candles: int) -> None:
+        if number_of_candles == 0:
+            raise NoCandlesForMarketInStorageException(
+                'For market "{}" no candles in storage "{}".'.format(market_name, CANDLE_STORAGE_NAME)
+            )
+
@@ -0,0 +1,61 @@
+from typing import Dict, List, Union
+from uuid import UUID
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.pair import Pair
+from coinrat.domain.order import OrderStorage, Order, POSSIBLE_ORDER_STATUSES
+
+ORDER_STORAGE_NAME = 'memory'
+
+
+class OrderMemoryStorage(OrderStorage):
+    def __init__(self, name: str = ORDER_STORAGE_NAME) -> None:
+        self._name = name
+        self._orders: Dict[str, Order] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def save_order(self, order: Order) -> None:
+        self._orders[str(order.order_id)] = order
+
+    def find_by(
+        self,
+        market_name: str,
+        pair: Pair,
+        status: Union[str, None] = None,
+        direction: Union[str, None] = None,
+        interval: DateTimeInterval = DateTimeInterval(None, None),
+        strategy_run_id: Union[str, None] = None
+    ) -> List[Order]:
+        assert status in POSSIBLE_ORDER_STATUSES or status is None, 'Invalid status: "{}"'.format(status)
+
+        result = []
+        for order in self._get_sorted_orders():
+            if (
+                order.market_name != market_name
+                or not order.pair.is_equal(pair)
+                or status is not None and order._status != status
+                or direction is not None and order._direction != direction
+                or not interval.contains(order.created_at)
+                or strategy_run_id is not None and str(order.strategy_run_id) != str(strategy_run_id)
+            ):
+                continue
+
+            result.append(order)
+
+        return result
+
+    def find_last_order(self, market_name: str, pair: Pair) -> Union[Order, None]:
+        orders = self.find_by(market_name, pair)
+        if len(orders) == 0:
+            return None
+
+        return orders[-1]
+
+    def delete(self, order_id: Union[UUID, str]) -> None:
+        self._orders.pop(str(order_id), None)
+
+    def _get_sorted_orders(self) -> List[Order]:
+        return sorted(self._orders.values(), key=lambda order: order.created_at)
@@ -0,0 +1,86 @@
+import pluggy
+
+from coinrat.candle_storage_plugins import CandleStoragePluginSpecification
+from coinrat.order_storage_plugins import OrderStoragePluginSpecification
+from coinrat.portfolio_snapshot_storage_plugins import PortfolioSnapshotStoragePluginSpecification
+from .candle_storage import CandleMemoryStorage, CANDLE_STORAGE_NAME
+from .order_storage import OrderMemoryStorage, ORDER_STORAGE_NAME
+from .portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage, PORTFOLIO_SNAPSHOT_STORAGE_NAME
+
+get_name_impl = pluggy.HookimplMarker('storage_plugins')
+
+get_available_candle_storages_impl = pluggy.HookimplMarker('storage_plugins')
+get_candle_storage_impl = pluggy.HookimplMarker('storage_plugins')
+
+get_available_order_storages_impl = pluggy.HookimplMarker('storage_plugins')
+get_order_storage_impl = pluggy.HookimplMarker('storage_plugins')
+
+get_available_portfolio_snapshot_storages_impl = pluggy.HookimplMarker('storage_plugins')
+get_portfolio_snapshot_storage_impl = pluggy.HookimplMarker('storage_plugins')
+
+PACKAGE_NAME = 'coinrat_memory_storage'
+
+
+class CandleStoragePlugin(CandleStoragePluginSpecification):
+    def __init__(self) -> None:
+        self._storage = CandleMemoryStorage()
+
+    @get_name_impl
+    def get_name(self):
+        return PACKAGE_NAME
+
+    @get_available_candle_storages_impl
+    def get_available_candle_storages(self):
+        return [CANDLE_STORAGE_NAME]
+
+    @get_candle_storage_impl
+    def get_candle_storage(self, name):
+        if name == CANDLE_STORAGE_NAME:
+            return self._storage
+
+        raise ValueError('Candle storage "{}" not supported by this plugin.'.format(name))
+
+
+class OrderStoragePlugin(OrderStoragePluginSpecification):
+    def __init__(self) -> None:
+        self._storage = OrderMemoryStorage()
+
+    @get_name_impl
+    def get_name(self):
+        return PACKAGE_NAME
+
+    @get_available_order_storages_impl
+    def get_available_order_storages(self):
+        return [ORDER_STORAGE_NAME]
+
+    @get_order_storage_impl
+    def get_order_storage(self, name):
+        if name == ORDER_STORAGE_NAME:
+            return self._storage
+
+        raise ValueError('Order storage "{}" not supported by this plugin.'.format(name))
+
+
+class PortfolioSnapshotStoragePlugin(PortfolioSnapshotStoragePluginSpecification):
+    def __init__(self) -> None:
+        self._storage = PortfolioSnapshotMemoryStorage()
+
+    @get_name_impl
+    def get_name(self):
+        return PACKAGE_NAME
+
+    @get_available_portfolio_snapshot_storages_impl
+    def get_available_portfolio_snapshot_storages(self):
+        return [PORTFOLIO_SNAPSHOT_STORAGE_NAME]
+
+    @get_portfolio_snapshot_storage_impl
+    def get_portfolio_snapshot_storage(self, name):
+        if name == PORTFOLIO_SNAPSHOT_STORAGE_NAME:
+            return self._storage
+
+        raise ValueError('Portfolio snapshot storage "{}" not supported by this plugin.'.format(name))
+
+
+candle_storage_plugin = CandleStoragePlugin()
+order_storage_plugin = OrderStoragePlugin()
+portfolio_snapshot_storage_plugin = PortfolioSnapshotStoragePlugin()
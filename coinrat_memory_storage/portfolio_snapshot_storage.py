@@ -0,0 +1,34 @@
+from typing import Dict
+from uuid import UUID
+
+from coinrat.domain.portfolio import PortfolioSnapshotStorage, PortfolioSnapshot
+
+PORTFOLIO_SNAPSHOT_STORAGE_NAME = 'memory'
+
+
+class InvalidDataForOrderError(Exception):
+    pass
+
+
+class PortfolioSnapshotMemoryStorage(PortfolioSnapshotStorage):
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, PortfolioSnapshot] = {}
+
+    @property
+    def name(self) -> str:
+        return PORTFOLIO_SNAPSHOT_STORAGE_NAME
+
+    def save(self, portfolio_snapshot: PortfolioSnapshot) -> None:
+        self._snapshots[str(portfolio_snapshot.order_id)] = portfolio_snapshot
+
+    def get_for_order(self, order_id: UUID) -> PortfolioSnapshot:
+        if str(order_id) not in self._snapshots:
+            raise InvalidDataForOrderError('Number of snapshots for order {} is 0. Exactly one needed.'.format(order_id))
+
+        return self._snapshots[str(order_id)]
+
+    def get_for_strategy_run(self, strategy_run_id: UUID) -> Dict[str, PortfolioSnapshot]:
+        return {
+            order_id: snapshot for order_id, snapshot in self._snapshots.items()
+            if str(snapshot.strategy_run_id) == str(strategy_run_id)
+        }
@@ -0,0 +1,95 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleSize, NoCandlesForMarketInStorageException, CANDLE_SIZE_UNIT_MINUTE, \
+    CANDLE_STORAGE_FIELD_CLOSE
+from coinrat.domain.pair import Pair
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+
+DUMMY_MARKET = 'dummy_market_name'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+
+
+def create_candle(minute: int, close: str) -> Candle:
+    return Candle(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        datetime.datetime(2017, 7, 2, 0, minute, 0, tzinfo=datetime.timezone.utc),
+        Decimal('8000'),
+        Decimal('8100'),
+        Decimal('7900'),
+        Decimal(close)
+    )
+
+
+@pytest.fixture
+def storage() -> CandleMemoryStorage:
+    storage = CandleMemoryStorage()
+    storage.write_candles([create_candle(minute, str(8000 + minute)) for minute in [3, 0, 2, 1, 4, 5]])
+    return storage
+
+
+def test_find_by(storage: CandleMemoryStorage):
+    candles = storage.find_by(DUMMY_MARKET, BTC_USD_PAIR)
+    assert [0, 1, 2, 3, 4, 5] == [candle.time.minute for candle in candles]
+
+    candles = storage.find_by(DUMMY_MARKET, BTC_USD_PAIR, DateTimeInterval(
+        datetime.datetime(2017, 7, 2, 0, 1, 0, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2017, 7, 2, 0, 4, 0, tzinfo=datetime.timezone.utc)
+    ))
+    assert [2, 3] == [candle.time.minute for candle in candles]
+
+    assert [] == storage.find_by('unknown_market', BTC_USD_PAIR)
+    assert [] == storage.find_by(DUMMY_MARKET, Pair('USD', 'LTC'))
+
+
+def test_find_by_aggregates_bigger_candles(storage: CandleMemoryStorage):
+    candles = storage.find_by(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        DateTimeInterval(None, None),
+        CandleSize(CANDLE_SIZE_UNIT_MINUTE, 2)
+    )
+    assert 3 == len(candles)
+    assert datetime.datetime(2017, 7, 2, 0, 2, 0, tzinfo=datetime.timezone.utc) == candles[1].time
+    assert Decimal('8003') == candles[1].close
+    assert 2 == candles[1].candle_size.size
+
+
+def test_rewrite_candle(storage: CandleMemoryStorage):
+    storage.write_candle(create_candle(2, '1000'))
+    candles = storage.find_by(DUMMY_MARKET, BTC_USD_PAIR)
+    assert 6 == len(candles)
+    assert Decimal('1000') == candles[2].close
+
+
+def test_mean(storage: CandleMemoryStorage):
+    assert Decimal('8002.5') == storage.mean(DUMMY_MARKET, BTC_USD_PAIR, CANDLE_STORAGE_FIELD_CLOSE)
+
+    mean = storage.mean(DUMMY_MARKET, BTC_USD_PAIR, CANDLE_STORAGE_FIELD_CLOSE, DateTimeInterval(
+        datetime.datetime(2017, 7, 2, 0, 3, 0, tzinfo=datetime.timezone.utc),
+        None
+    ))
+    assert Decimal('8004.5') == mean
+
+    with pytest.raises(NoCandlesForMarketInStorageException):
+        storage.mean('unknown_market', BTC_USD_PAIR, CANDLE_STORAGE_FIELD_CLOSE)
+
+
+def test_get_last_minute_candle(storage: CandleMemoryStorage):
+    candle = storage.get_last_minute_candle(
+        DUMMY_MARKET,
+        BTC_USD_PAIR,
+        datetime.datetime(2017, 7, 2, 0, 3, 30, tzinfo=datetime.timezone.utc)
+    )
+    assert 3 == candle.time.minute
+
+    with pytest.raises(NoCandlesForMarketInStorageException):
+        storage.get_last_minute_candle(
+            DUMMY_MARKET,
+            BTC_USD_PAIR,
+            datetime.datetime(2017, 7, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+        )
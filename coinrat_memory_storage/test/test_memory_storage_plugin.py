@@ -0,0 +1,29 @@
+import pytest
+
+from coinrat_memory_storage import candle_storage_plugin, order_storage_plugin, portfolio_snapshot_storage_plugin
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+
+
+def test_plugin():
+    assert 'coinrat_memory_storage' == candle_storage_plugin.get_name()
+    assert ['memory'] == candle_storage_plugin.get_available_candle_storages()
+    assert isinstance(candle_storage_plugin.get_candle_storage('memory'), CandleMemoryStorage)
+    with pytest.raises(ValueError):
+        candle_storage_plugin.get_candle_storage('gandalf')
+
+    assert 'coinrat_memory_storage' == order_storage_plugin.get_name()
+    assert ['memory'] == order_storage_plugin.get_available_order_storages()
+    assert isinstance(order_storage_plugin.get_order_storage('memory'), OrderMemoryStorage)
+    with pytest.raises(ValueError):
+        order_storage_plugin.get_order_storage('gandalf')
+
+    assert 'coinrat_memory_storage' == portfolio_snapshot_storage_plugin.get_name()
+    assert ['memory'] == portfolio_snapshot_storage_plugin.get_available_portfolio_snapshot_storages()
+    assert isinstance(
+        portfolio_snapshot_storage_plugin.get_portfolio_snapshot_storage('memory'),
+        PortfolioSnapshotMemoryStorage
+    )
+    with pytest.raises(ValueError):
+        portfolio_snapshot_storage_plugin.get_portfolio_snapshot_storage('gandalf')
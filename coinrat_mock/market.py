@@ -1,7 +1,9 @@
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, cast
 
 from coinrat.domain import Balance, DateTimeFactory
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL, NUMERIC_BACKEND_FLOAT, FLOAT_BACKEND_RELATIVE_TOLERANCE, \
+    to_numeric_backend, Number
 from coinrat.domain.pair import Pair, serialize_pair
 from coinrat.domain.market import Market, PairMarketInfo
 from coinrat.domain.order import ORDER_TYPE_LIMIT, Order, OrderMarketInfo, ORDER_TYPE_MARKET, \
@@ -37,16 +39,24 @@ class MockMarket(Market):
 
             'mocked_transaction_taker_fee': Decimal('0.0025'),
             'mocked_transaction_maker_fee': Decimal('0.001'),
+
+            # Balances and fees are floats with 'float' backend (set by strategy replayer for fast simulations),
+            # see: coinrat.domain.number
+            'mocked_numeric_backend': 'decimal',
         }
 
     """
 
     def __init__(self, datetime_factory: DateTimeFactory, configuration: Dict) -> None:
         self._datetime_factory = datetime_factory
-        self._transaction_maker_fee: Decimal = DEFAULT_TRANSACTION_FEE
-        self._transaction_taker_fee: Decimal = DEFAULT_TRANSACTION_FEE
-        self._balances: Dict[str, Decimal] = {}
-        self._current_prices: Dict[str, Decimal] = {}
+        self._transaction_maker_fee: Number = DEFAULT_TRANSACTION_FEE
+        self._transaction_taker_fee: Number = DEFAULT_TRANSACTION_FEE
+        # Balances, prices and fees are floats with float numeric backend, they are never mixed with Decimals
+        # (amounts and rates of orders are floats too), so they are cast to Decimal API of the market
+        self._balances: Dict[str, Number] = {}
+        self._current_prices: Dict[str, Number] = {}
+        self._numeric_backend = configuration.get('mocked_numeric_backend', NUMERIC_BACKEND_DECIMAL)
+        self._zero = to_numeric_backend(Decimal('0'), self._numeric_backend)
 
         self.init_by_configuration(configuration)
         self._name = configuration['mocked_market_name']
@@ -60,15 +70,15 @@ class MockMarket(Market):
         mocked_base_currency = configuration['mocked_base_currency'] \
             if 'mocked_base_currency' in configuration \
             else DEFAULT_BASE_CURRENCY
-        self._balances[mocked_base_currency] = mocked_base_currency_balance
+        self._balances[mocked_base_currency] = to_numeric_backend(mocked_base_currency_balance, self._numeric_backend)
 
-        if 'mocked_transaction_maker_fee' in configuration:
-            assert isinstance(configuration['mocked_transaction_maker_fee'], Decimal)
-            self._transaction_maker_fee = configuration['mocked_transaction_maker_fee']
+        maker_fee: Decimal = configuration.get('mocked_transaction_maker_fee', DEFAULT_TRANSACTION_FEE)
+        assert isinstance(maker_fee, Decimal)
+        self._transaction_maker_fee = to_numeric_backend(maker_fee, self._numeric_backend)
 
-        if 'mocked_transaction_taker_fee' in configuration:
-            assert isinstance(configuration['mocked_transaction_taker_fee'], Decimal)
-            self._transaction_taker_fee = configuration['mocked_transaction_taker_fee']
+        taker_fee: Decimal = configuration.get('mocked_transaction_taker_fee', DEFAULT_TRANSACTION_FEE)
+        assert isinstance(taker_fee, Decimal)
+        self._transaction_taker_fee = to_numeric_backend(taker_fee, self._numeric_backend)
 
     @staticmethod
     def get_configuration_structure() -> Dict[str, Dict[str, str]]:
@@ -120,32 +130,36 @@ class MockMarket(Market):
     def name(self) -> str:
         return self._name
 
+    @property
+    def numeric_backend(self) -> str:
+        return self._numeric_backend
+
     @property
     def transaction_taker_fee(self) -> Decimal:
-        return self._transaction_taker_fee
+        return cast(Decimal, self._transaction_taker_fee)
 
     @property
-    def transaction_maker_fee(self):
-        return self._transaction_maker_fee
+    def transaction_maker_fee(self) -> Decimal:
+        return cast(Decimal, self._transaction_maker_fee)
 
     def get_balance(self, currency: str) -> Balance:
         if currency not in self._balances:
-            self._balances[currency] = Decimal('0')
+            self._balances[currency] = self._zero
 
-        return Balance(self._name, currency, self._balances[currency])
+        return Balance(self._name, currency, cast(Decimal, self._balances[currency]))
 
     def get_balances(self) -> List[Balance]:
         result = []
         for currency, available_amount in self._balances.items():
-            result.append(Balance(self.name, currency, available_amount))
+            result.append(Balance(self.name, currency, cast(Decimal, available_amount)))
 
         return result
 
-    def mock_current_price(self, pair: Pair, value: Decimal) -> None:
+    def mock_current_price(self, pair: Pair, value: Number) -> None:
         self._current_prices[serialize_pair(pair)] = value
 
     def get_current_price(self, pair: Pair) -> Decimal:
-        return self._current_prices[serialize_pair(pair)]
+        return cast(Decimal, self._current_prices[serialize_pair(pair)])
 
     def place_order(self, order: Order) -> Order:
         fee = self._calculate_fee(order)
@@ -177,9 +191,9 @@ class MockMarket(Market):
 
     def _initialize_balances(self, pair: Pair) -> None:
         if pair.base_currency not in self._balances:
-            self._balances[pair.base_currency] = Decimal('0')
+            self._balances[pair.base_currency] = self._zero
         if pair.market_currency not in self._balances:
-            self._balances[pair.market_currency] = Decimal('0')
+            self._balances[pair.market_currency] = self._zero
 
     def _process_buy(self, fee: Decimal, order: Order) -> None:
         max_to_buy = self.calculate_maximal_amount_to_buy(order.pair, order.rate)
@@ -187,8 +201,8 @@ class MockMarket(Market):
             raise NotEnoughBalanceToPerformOrderException(
                 'Max to buy is {}, you want to buy {}'.format(max_to_buy, order.quantity)
             )
-        self._balances[order.pair.base_currency] -= order.quantity * order.rate
-        self._balances[order.pair.market_currency] += order.quantity * (1 - fee)
+        self._withdraw(order.pair.base_currency, order.quantity * order.rate)
+        self._deposit(order.pair.market_currency, order.quantity * (1 - fee))
 
     def _process_sell(self, fee: Decimal, order: Order) -> None:
         max_to_sell = self.calculate_maximal_amount_to_sell(order.pair)
@@ -196,14 +210,27 @@ class MockMarket(Market):
             raise NotEnoughBalanceToPerformOrderException(
                 'Max to sell is {}, you want to sell {}'.format(max_to_sell, order.quantity)
             )
-        self._balances[order.pair.base_currency] += order.quantity * order.rate * (1 - fee)
-        self._balances[order.pair.market_currency] -= order.quantity
+        self._deposit(order.pair.base_currency, order.quantity * order.rate * (1 - fee))
+        self._withdraw(order.pair.market_currency, order.quantity)
+
+    def _deposit(self, currency: str, amount: Decimal) -> None:
+        self._balances[currency] = cast(Decimal, self._balances[currency]) + amount
+
+    def _withdraw(self, currency: str, amount: Decimal) -> None:
+        balance: Number = cast(Decimal, self._balances[currency]) - amount
+
+        # Spending of the whole balance leaves rounding dust with floats, it would be used by the next order
+        if self._numeric_backend == NUMERIC_BACKEND_FLOAT \
+                and abs(float(balance)) <= float(self._balances[currency]) * FLOAT_BACKEND_RELATIVE_TOLERANCE:
+            balance = self._zero
+
+        self._balances[currency] = balance
 
-    def _calculate_fee(self, order: Order):
+    def _calculate_fee(self, order: Order) -> Decimal:
         if order.type == ORDER_TYPE_LIMIT:
-            return self._transaction_maker_fee
+            return self.transaction_maker_fee
 
         elif order.type == ORDER_TYPE_MARKET:
-            return self._transaction_taker_fee
+            return self.transaction_taker_fee
 
         raise ValueError('{} is not valid order type'.format(order.type))
@@ -1,8 +1,14 @@
+import json
+import os
 from typing import List
 
 import pluggy
+from coinrat.domain.candle import deserialize_candles
 from coinrat.market_plugins import MarketPluginSpecification
+from coinrat.streaming_synchronizer import StreamingSynchronizer
+from coinrat.synchronizer_plugins import SynchronizerPluginSpecification
 from .market import MockMarket
+from .trade_stream import ReplayTradeStream, create_trades_from_candles
 
 get_name_impl = pluggy.HookimplMarker('market_plugins')
 get_description_impl = pluggy.HookimplMarker('market_plugins')
@@ -10,8 +16,11 @@ get_available_markets_spec = pluggy.HookimplMarker('market_plugins')
 get_market_impl = pluggy.HookimplMarker('market_plugins')
 get_market_class_impl = pluggy.HookimplMarker('market_plugins')
 does_support_market_impl = pluggy.HookimplMarker('market_plugins')
+get_available_synchronizers_spec = pluggy.HookimplMarker('synchronizer_plugins')
+get_synchronizer_impl = pluggy.HookimplMarker('synchronizer_plugins')
 
 PLUGIN_NAME = 'coinrat_mock'
+FAKE_FEED_SYNCHRONIZER_NAME = 'fake_feed'
 
 
 class MarketPlugin(MarketPluginSpecification):
@@ -55,3 +64,37 @@ class MarketPlugin(MarketPluginSpecification):
 
 
 market_plugin = MarketPlugin()
+
+
+class SynchronizerPlugin(SynchronizerPluginSpecification):
+    @get_name_impl
+    def get_name(self):
+        return PLUGIN_NAME
+
+    @get_available_synchronizers_spec
+    def get_available_synchronizers(self):
+        return [FAKE_FEED_SYNCHRONIZER_NAME]
+
+    @get_synchronizer_impl
+    def get_synchronizer(self, synchronizer_name, storage, event_emitter):
+        if synchronizer_name != FAKE_FEED_SYNCHRONIZER_NAME:
+            raise ValueError('Synchronizer "{}" not supported by this plugin.'.format(synchronizer_name))
+
+        candles_file = os.environ.get('FAKE_FEED_CANDLES_FILE')
+        if not candles_file:  # Empty value (see .env_example) means not configured too
+            raise ValueError('Fake feed needs FAKE_FEED_CANDLES_FILE (candles exported by export_candles command).')
+
+        with open(candles_file) as json_file:
+            candles = deserialize_candles(json.load(json_file))
+
+        speed = os.environ.get('FAKE_FEED_SPEED')
+        trade_stream = ReplayTradeStream(
+            create_trades_from_candles(candles),
+            float(speed) if speed else None
+        )
+        markets = sorted({candle.market_name for candle in candles})
+
+        return StreamingSynchronizer(trade_stream, storage, event_emitter, markets)
+
+
+synchronizer_plugin = SynchronizerPlugin()
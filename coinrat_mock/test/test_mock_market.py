@@ -97,3 +97,21 @@ def test_mock_market_current_price():
         market.get_current_price(BTC_USD_PAIR)
     market.mock_current_price(BTC_USD_PAIR, Decimal('9854.458'))
     assert market.get_current_price(BTC_USD_PAIR) == Decimal('9854.458')
+
+
+def test_market_with_float_numeric_backend():
+    market = MockMarket(
+        CurrentUtcDateTimeFactory(),
+        {'mocked_market_name': 'yolo_market', 'mocked_numeric_backend': 'float'}
+    )
+    assert market.get_balance('USD').available_amount == 1000.0
+    assert isinstance(market.get_balance('USD').available_amount, float)
+    assert isinstance(market.get_balance('BTC').available_amount, float)
+    assert isinstance(market.transaction_maker_fee, float)
+
+    rate = 7653.07009626  # 1000 - 1000 / rate * rate leaves 1.1e-13 with floats
+    market.place_order(create_order(quantity=market.calculate_maximal_amount_to_buy(BTC_USD_PAIR, rate), rate=rate))
+    assert market.get_balance('USD').available_amount == 0.0  # rounding dust is cleared
+
+    with pytest.raises(NotEnoughBalanceToPerformOrderException):
+        market.place_order(create_order(quantity=market.calculate_maximal_amount_to_buy(BTC_USD_PAIR, rate), rate=rate))
@@ -1,9 +1,20 @@
+import datetime
+import json
+from decimal import Decimal
+
 import pytest
 from flexmock import flexmock
 
-from coinrat_mock import market_plugin
+from coinrat.domain.candle import Candle, serialize_candles
+from coinrat.domain.pair import Pair
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.streaming_synchronizer import StreamingSynchronizer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_mock import market_plugin, synchronizer_plugin
 from coinrat_mock.market import MockMarket
 
+START = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 def test_mock_market_plugin():
     assert 'coinrat_mock' == market_plugin.get_name()
@@ -20,3 +31,31 @@ def test_mock_market_plugin():
     assert market_plugin.does_support_market('gandalf') is True
     assert isinstance(market_plugin.get_market('gandalf', flexmock(), {}), MockMarket)
     assert MockMarket == market_plugin.get_market_class('gandalf')
+
+
+def test_fake_feed_synchronizer_plugin(tmpdir, monkeypatch):
+    candles = [Candle('bittrex', Pair('USD', 'BTC'), START, Decimal(100), Decimal(110), Decimal(90), Decimal(105))]
+    candles_file = tmpdir.join('candles.json')
+    candles_file.write(json.dumps(serialize_candles(candles)))
+
+    assert 'coinrat_mock' == synchronizer_plugin.get_name()
+    assert ['fake_feed'] == synchronizer_plugin.get_available_synchronizers()
+    with pytest.raises(ValueError):
+        synchronizer_plugin.get_synchronizer('gandalf', flexmock(), flexmock())
+
+    monkeypatch.delenv('FAKE_FEED_CANDLES_FILE', raising=False)
+    with pytest.raises(ValueError):
+        synchronizer_plugin.get_synchronizer('fake_feed', flexmock(), flexmock())
+    monkeypatch.setenv('FAKE_FEED_CANDLES_FILE', '')
+    with pytest.raises(ValueError):
+        synchronizer_plugin.get_synchronizer('fake_feed', flexmock(), flexmock())
+
+    monkeypatch.setenv('FAKE_FEED_CANDLES_FILE', str(candles_file))
+    monkeypatch.setenv('FAKE_FEED_SPEED', '')
+    storage = CandleMemoryStorage()
+    synchronizer = synchronizer_plugin.get_synchronizer('fake_feed', storage, NullEventEmitter())
+    assert isinstance(synchronizer, StreamingSynchronizer)
+    assert ['bittrex'] == synchronizer.get_supported_markets()
+
+    synchronizer.synchronize('bittrex', Pair('USD', 'BTC'))
+    assert serialize_candles(candles) == serialize_candles(storage.find_by('bittrex', Pair('USD', 'BTC')))
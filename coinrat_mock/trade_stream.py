@@ -0,0 +1,101 @@
+import datetime
+import threading
+import time
+from decimal import Decimal
+from typing import Callable, List, Union
+
+from coinrat.domain.candle import Candle
+from coinrat.domain.pair import Pair, serialize_pair
+from coinrat.domain.trade import Trade, TradeStream
+
+ONE_SECOND = datetime.timedelta(seconds=1)
+
+# Candles have no volume, it is not needed for building of candles
+TRADE_QUANTITY = Decimal('0')
+
+
+class ReplayTradeStream(TradeStream):
+    """
+    Local fake feed, replays recorded trades in the pace they happened multiplied by speed (speed=60 replays hour
+    in a minute), speed=None replays as fast as possible (tests, benchmarks). Heartbeats go with time of the stream
+    every second of real time.
+    """
+
+    def __init__(
+        self,
+        trades: List[Trade],
+        speed: Union[float, None] = None,
+        monotonic_function: Callable[[], float] = time.monotonic
+    ) -> None:
+        assert speed is None or speed > 0, 'Speed must be positive, {} given.'.format(speed)
+
+        self._trades = sorted(trades, key=lambda trade: trade.time)
+        self._speed = speed
+        self._monotonic = monotonic_function
+        self._stop_event = threading.Event()
+
+    def run(
+        self,
+        market_name: str,
+        pairs: List[Pair],
+        on_trade: Callable[[Trade], None],
+        on_heartbeat: Callable[[datetime.datetime], None]
+    ) -> None:
+        self._stop_event.clear()
+        serialized_pairs = {serialize_pair(pair) for pair in pairs}
+        stream_time: Union[datetime.datetime, None] = None
+        last_heartbeat_at = self._monotonic()
+
+        for trade in self._trades:
+            if trade.market_name != market_name or serialize_pair(trade.pair) not in serialized_pairs:
+                continue
+
+            if stream_time is not None and self._speed is not None:
+                stream_time = self._wait_until(stream_time, trade.time, on_heartbeat)
+
+            if self._stop_event.is_set():
+                return
+
+            on_trade(trade)
+            stream_time = trade.time
+
+            if self._monotonic() - last_heartbeat_at >= 1:
+                on_heartbeat(stream_time)
+                last_heartbeat_at = self._monotonic()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def _wait_until(
+        self,
+        stream_time: datetime.datetime,
+        till: datetime.datetime,
+        on_heartbeat: Callable[[datetime.datetime], None]
+    ) -> datetime.datetime:
+        while stream_time < till:
+            step = min(till - stream_time, ONE_SECOND * self._speed)
+            if self._stop_event.wait(step.total_seconds() / self._speed):
+                break
+
+            stream_time += step
+            on_heartbeat(stream_time)
+
+        return stream_time
+
+
+def create_trades_from_candles(candles: List[Candle]) -> List[Trade]:
+    """
+    Four trades per candle (open, low and high in order of the movement, close), candles built from them are
+    the same as the original ones.
+    """
+    trades = []
+    for candle in candles:
+        prices = [candle.open, candle.low, candle.high, candle.close] if candle.is_bullish() \
+            else [candle.open, candle.high, candle.low, candle.close]
+
+        # Spread within the first minute of the candle, so minute candles are rebuilt into the same ones
+        for index, price in enumerate(prices):
+            trade_time = candle.time + datetime.timedelta(seconds=15 * index)
+            trades.append(Trade(candle.market_name, candle.pair, trade_time, price, TRADE_QUANTITY))
+
+    return sorted(trades, key=lambda trade: trade.time)
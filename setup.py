@@ -30,16 +30,20 @@ setup(
         ],
         'coinrat_candle_storage_plugins': [
             'coinrat_influx_db_storage = coinrat_influx_db_storage:candle_storage_plugin',
+            'coinrat_memory_storage = coinrat_memory_storage:candle_storage_plugin',
         ],
         'coinrat_order_storage_plugins': [
             'coinrat_influx_db_storage = coinrat_influx_db_storage:order_storage_plugin',
+            'coinrat_memory_storage = coinrat_memory_storage:order_storage_plugin',
         ],
         'coinrat_portfolio_snapshot_storage_plugins': [
             'coinrat_influx_db_storage = coinrat_influx_db_storage:portfolio_snapshot_storage_plugin',
+            'coinrat_memory_storage = coinrat_memory_storage:portfolio_snapshot_storage_plugin',
         ],
         'coinrat_synchronizer_plugins': [
             'coinrat_bittrex = coinrat_bittrex:synchronizer_plugin',
             'coinrat_cryptocompare = coinrat_cryptocompare:synchronizer_plugin',
+            'coinrat_mock = coinrat_mock:synchronizer_plugin',
         ],
         'coinrat_strategy_plugins': [
             'coinrat_double_crossover_strategy = coinrat_double_crossover_strategy:strategy_plugin',
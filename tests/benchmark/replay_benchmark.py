@@ -0,0 +1,379 @@
+"""
+Replay throughput benchmark.
+
+Replays the snapshot_replay dataset and bigger synthetic datasets with every available strategy plugin and reports
+ticks, candles (returned by candle storage) and created orders per second. Result can be compared with a baseline
+(JSON file saved by --save_baseline), regressions bigger than tolerance make the script fail.
+
+    python tests/benchmark/replay_benchmark.py --compare tests/benchmark/baseline.json
+
+Storage "influx_db" needs local InfluxDB (database coinrat_benchmark is created and dropped).
+With --numeric_backend float, orders of every replay are also compared with the Decimal replay, the largest
+relative difference of order quantities and rates is reported (must be within FLOAT_BACKEND_RELATIVE_TOLERANCE).
+Numbers depend on the machine, compare only runs from the same machine (re-save baseline when it changes).
+"""
+import contextlib
+import datetime
+import json
+import logging
+import math
+import os
+import sys
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Tuple, Union, cast
+
+import click
+import numpy
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, CandleStorage, CandleExporter
+from coinrat.domain.number import NUMERIC_BACKEND_DECIMAL, NUMERIC_BACKEND_FLOAT, NUMERIC_BACKENDS, \
+    FLOAT_BACKEND_RELATIVE_TOLERANCE, Number, relative_difference
+from coinrat.domain.order import Order, OrderStorage
+from coinrat.domain.pair import Pair
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.float_candle_storage import convert_candle_to_float
+from coinrat.market_plugins import MarketPlugins
+from coinrat.order_facade import OrderFacade
+from coinrat.strategy_plugins import StrategyPlugins
+from coinrat.strategy_replayer import StrategyReplayer
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_memory_storage.order_storage import OrderMemoryStorage
+from coinrat_memory_storage.portfolio_snapshot_storage import PortfolioSnapshotMemoryStorage
+import coinrat_mock
+
+MARKET_NAME = 'bittrex'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+
+STORAGE_MEMORY = 'memory'
+STORAGE_INFLUX_DB = 'influx_db'
+STORAGES = [STORAGE_MEMORY, STORAGE_INFLUX_DB]
+
+INFLUX_DB_DATABASE = 'coinrat_benchmark'
+
+STRATEGY_CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    'double_crossover': {'long_average_interval': '3600', 'short_average_interval': '900', 'delay': '30'},
+    'heikin_ashi': {'candle_size': '5-minute'},
+}
+
+DEFAULT_TOLERANCE = 0.2
+DUST_QUANTITY = Decimal('0.00000001')
+DEFAULT_REPEAT = 5
+
+SNAPSHOT_DATASET_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) + '/../snapshot_replay'
+SYNTHETIC_START = datetime.datetime(2018, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+SYNTHETIC_WARM_UP = datetime.timedelta(days=1)
+
+DATASETS = {
+    'double_crossover_strategy_1': DateTimeInterval(
+        datetime.datetime(2017, 12, 2, 14, 0, 0, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2017, 12, 2, 22, 0, 0, tzinfo=datetime.timezone.utc)
+    ),
+    'synthetic_7_days': DateTimeInterval(
+        SYNTHETIC_START + SYNTHETIC_WARM_UP,
+        SYNTHETIC_START + datetime.timedelta(days=7)
+    ),
+    'synthetic_30_days': DateTimeInterval(
+        SYNTHETIC_START + SYNTHETIC_WARM_UP,
+        SYNTHETIC_START + datetime.timedelta(days=30)
+    ),
+}
+
+
+class CandleCountingStorage(CandleStorage):
+    """Counts candles returned by the storage (those are the candles deserialized for the strategy)."""
+
+    def __init__(self, storage: CandleStorage) -> None:
+        self._storage = storage
+        self.number_of_candles = 0
+
+    @property
+    def name(self) -> str:
+        return self._storage.name
+
+    def write_candle(self, candle: Candle) -> None:
+        self._storage.write_candle(candle)
+
+    def write_candles(self, candles: List[Candle]) -> None:
+        self._storage.write_candles(candles)
+
+    def find_by(self, *args, **kwargs) -> List[Candle]:
+        candles = self._storage.find_by(*args, **kwargs)
+        self.number_of_candles += len(candles)
+        return candles
+
+    def mean(self, *args, **kwargs) -> Number:
+        return self._storage.mean(*args, **kwargs)
+
+    def get_last_minute_candle(self, *args, **kwargs) -> Candle:
+        self.number_of_candles += 1
+        return self._storage.get_last_minute_candle(*args, **kwargs)
+
+
+def create_synthetic_candles(number_of_days: int, seed: int = 42) -> List[Candle]:
+    """Random walk with daily seasonality, deterministic for the given seed."""
+    number_of_minutes = number_of_days * 24 * 60
+    random_state = numpy.random.RandomState(seed)
+
+    returns = random_state.normal(0, 0.001, number_of_minutes)
+    returns += 0.0005 * numpy.sin(numpy.arange(number_of_minutes) * 2 * math.pi / (24 * 60))
+    closes = 8000 * numpy.exp(numpy.cumsum(returns))
+    opens = numpy.concatenate(([8000.0], closes[:-1]))
+    spreads = numpy.abs(random_state.normal(0, 2, number_of_minutes))
+
+    candles = []
+    for minute in range(number_of_minutes):
+        open_price, close_price = float(opens[minute]), float(closes[minute])
+        candles.append(Candle(
+            MARKET_NAME,
+            BTC_USD_PAIR,
+            SYNTHETIC_START + datetime.timedelta(minutes=minute),
+            Decimal('{:.8f}'.format(open_price)),
+            Decimal('{:.8f}'.format(max(open_price, close_price) + spreads[minute])),
+            Decimal('{:.8f}'.format(min(open_price, close_price) - spreads[minute])),
+            Decimal('{:.8f}'.format(close_price))
+        ))
+
+    return candles
+
+
+def load_dataset(dataset: str, candle_storage: CandleStorage, numeric_backend: str) -> None:
+    if dataset.startswith('synthetic_'):
+        candles = create_synthetic_candles(int(dataset.split('_')[1]))
+    else:
+        memory_storage = CandleMemoryStorage()
+        CandleExporter(memory_storage).import_from_file(
+            '{}/{}/candles.json'.format(SNAPSHOT_DATASET_DIRECTORY, dataset)
+        )
+        candles = memory_storage.find_by(MARKET_NAME, BTC_USD_PAIR)
+
+    # Memory storage keeps float candles as they are (no conversion during replay), InfluxDB stores floats anyway
+    if numeric_backend == NUMERIC_BACKEND_FLOAT and isinstance(candle_storage, CandleMemoryStorage):
+        candles = [convert_candle_to_float(candle) for candle in candles]
+
+    candle_storage.write_candles(candles)
+
+
+@contextlib.contextmanager
+def create_storages(storage: str) -> Iterator[Tuple[CandleStorage, OrderStorage]]:
+    if storage == STORAGE_MEMORY:
+        yield CandleMemoryStorage(), OrderMemoryStorage()
+        return
+
+    from influxdb import InfluxDBClient
+    from coinrat_influx_db_storage.candle_storage import CandleInnoDbStorage
+    from coinrat_influx_db_storage.order_storage import OrderInnoDbStorage
+
+    influx = InfluxDBClient()
+    influx.create_database(INFLUX_DB_DATABASE)
+    influx._database = INFLUX_DB_DATABASE
+    try:
+        yield CandleInnoDbStorage(influx), OrderInnoDbStorage(influx, 'benchmark_orders')
+    finally:
+        influx.drop_database(INFLUX_DB_DATABASE)
+
+
+def create_replayer(numeric_backend: str = NUMERIC_BACKEND_DECIMAL) -> StrategyReplayer:
+    market_plugins = MarketPlugins()
+    mock_plugin = cast(coinrat_mock.plugin.MarketPlugin, market_plugins.get_plugin('coinrat_mock'))
+    mock_plugin.set_available_markets([MARKET_NAME])
+
+    return StrategyReplayer(
+        cast(Any, None),
+        cast(Any, None),
+        StrategyPlugins(),
+        market_plugins,
+        cast(Any, None),
+        NullEventEmitter(),
+        numeric_backend=numeric_backend
+    )
+
+
+def run_benchmark(
+    replayer: StrategyReplayer,
+    dataset: str,
+    storage: str,
+    strategy_name: str,
+    numeric_backend: str = NUMERIC_BACKEND_DECIMAL
+) -> Tuple[Dict[str, Union[int, float]], List[Order]]:
+    interval = DATASETS[dataset]
+
+    with create_storages(storage) as (candle_storage, order_storage):
+        load_dataset(dataset, candle_storage, numeric_backend)
+        counting_candle_storage = CandleCountingStorage(candle_storage)
+
+        strategy_run = StrategyRun(
+            uuid.uuid4(),
+            interval.since,
+            BTC_USD_PAIR,
+            [StrategyRunMarket('coinrat_mock', MARKET_NAME, {})],
+            strategy_name,
+            STRATEGY_CONFIGURATIONS.get(strategy_name, {}),
+            interval,
+            storage,
+            storage
+        )
+        replay = replayer.create_replay(
+            strategy_run,
+            counting_candle_storage,
+            OrderFacade(order_storage, PortfolioSnapshotMemoryStorage(), NullEventEmitter())
+        )
+
+        number_of_ticks = 0
+
+        def on_tick(market, candle) -> None:
+            nonlocal number_of_ticks
+            number_of_ticks += 1
+
+        start = time.perf_counter()
+        replay.advance(interval.till, on_tick)
+        duration = time.perf_counter() - start
+
+        orders = order_storage.find_by(MARKET_NAME, BTC_USD_PAIR)
+        number_of_orders = len(orders)
+
+        return {
+            'ticks': number_of_ticks,
+            'candles': counting_candle_storage.number_of_candles,
+            'orders': number_of_orders,
+            'seconds': duration,
+            'ticks_per_second': number_of_ticks / duration,
+            'candles_per_second': counting_candle_storage.number_of_candles / duration,
+            'orders_per_second': number_of_orders / duration,
+        }, orders
+
+
+def compare_orders(decimal_orders: List[Order], float_orders: List[Order]) -> Union[float, None]:
+    """
+    Largest relative difference of quantities and rates, None if replays created different orders.
+    Orders of rounding dust (balance left after the whole balance was spent, the mocked market clears it
+    with floats) are ignored.
+    """
+    decimal_orders = [order for order in decimal_orders if abs(order.quantity) >= DUST_QUANTITY]
+    float_orders = [order for order in float_orders if abs(order.quantity) >= DUST_QUANTITY]
+    if len(decimal_orders) != len(float_orders):
+        return None
+
+    differences = [0.0]
+    for decimal_order, float_order in zip(decimal_orders, float_orders):
+        if decimal_order.is_buy() != float_order.is_buy() or decimal_order.created_at != float_order.created_at:
+            return None
+
+        differences.append(relative_difference(decimal_order.quantity, float_order.quantity))
+        differences.append(relative_difference(decimal_order.rate, float_order.rate))
+
+    return max(differences)
+
+
+def compare_with_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    Returns list of regressions: slower by more than tolerance, or different number of ticks/orders (behaviour
+    changed, throughput is not comparable then). With the same counts all metrics change by the same ratio.
+    """
+    regressions = []
+    for key, result in sorted(results.items()):
+        if key not in baseline:
+            click.echo('{}: not in baseline'.format(key))
+            continue
+
+        counts_changed = False
+        for count in ['ticks', 'orders']:
+            if result[count] != baseline[key][count]:
+                counts_changed = True
+                regressions.append('{}: {} changed {} -> {}'.format(key, count, baseline[key][count], result[count]))
+
+        if counts_changed:
+            continue
+
+        ratio = result['ticks_per_second'] / baseline[key]['ticks_per_second']
+        click.echo('{}: {:.1f} ticks/s (baseline {:.1f}, {:+.1%})'.format(
+            key,
+            result['ticks_per_second'],
+            baseline[key]['ticks_per_second'],
+            ratio - 1
+        ))
+        if ratio < 1 - tolerance:
+            regressions.append('{}: throughput dropped by {:.1%}'.format(key, 1 - ratio))
+
+    return regressions
+
+
+@click.command(help='Measures replay throughput of strategy plugins.')
+@click.option('--dataset', 'datasets', multiple=True, type=click.Choice(list(DATASETS.keys())), help='All by default.')
+@click.option('--strategy', 'strategies', multiple=True, help='All available strategies by default.')
+@click.option('--storage', type=click.Choice(STORAGES), default=STORAGE_MEMORY)
+@click.option('--compare', 'baseline_file', default=None, help='Baseline JSON file to compare results with.')
+@click.option('--repeat', type=int, default=DEFAULT_REPEAT, help='Every replay is repeated, the fastest run is used.')
+@click.option('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='Allowed relative slowdown.')
+@click.option('--save_baseline', default=None, help='Save results as baseline into the file.')
+@click.option('--numeric_backend', type=click.Choice(NUMERIC_BACKENDS), default=NUMERIC_BACKEND_DECIMAL)
+def main(
+    datasets: Tuple[str, ...],
+    strategies: Tuple[str, ...],
+    storage: str,
+    baseline_file: Union[str, None],
+    repeat: int,
+    tolerance: float,
+    save_baseline: Union[str, None],
+    numeric_backend: str
+) -> None:
+    logging.disable(logging.WARNING)
+
+    replayer = create_replayer(numeric_backend)
+    strategy_names = list(strategies) or StrategyPlugins().get_available_strategies()
+
+    results: Dict[str, Dict] = {}
+    numeric_differences: List[str] = []
+    for dataset in datasets or DATASETS.keys():
+        for strategy_name in strategy_names:
+            key = '{}/{}/{}'.format(dataset, storage, strategy_name)
+            if numeric_backend != NUMERIC_BACKEND_DECIMAL:
+                key += '/' + numeric_backend
+
+            runs = [run_benchmark(replayer, dataset, storage, strategy_name, numeric_backend) for _ in range(repeat)]
+            results[key] = min([result for result, _ in runs], key=lambda run: run['seconds'])
+            click.echo('{}: {} ticks, {:.1f} ticks/s, {:.1f} candles/s, {:.1f} orders/s'.format(
+                key,
+                results[key]['ticks'],
+                results[key]['ticks_per_second'],
+                results[key]['candles_per_second'],
+                results[key]['orders_per_second']
+            ))
+
+            if numeric_backend == NUMERIC_BACKEND_FLOAT:
+                _, decimal_orders = run_benchmark(create_replayer(), dataset, storage, strategy_name)
+                difference = compare_orders(decimal_orders, runs[0][1])
+                click.echo('{}: orders differ from Decimal replay by {}'.format(
+                    key,
+                    'different orders' if difference is None else '{:.2e}'.format(difference)
+                ))
+                if difference is None or difference > FLOAT_BACKEND_RELATIVE_TOLERANCE:
+                    numeric_differences.append(key)
+
+    if save_baseline is not None:
+        with open(save_baseline, 'w') as baseline_output:
+            json.dump(results, baseline_output, indent=2, sort_keys=True)
+
+    if baseline_file is not None:
+        with open(baseline_file) as baseline_input:
+            regressions = compare_with_baseline(results, json.load(baseline_input), tolerance)
+
+        for regression in regressions:
+            click.echo('REGRESSION {}'.format(regression), err=True)
+
+        if len(regressions) > 0:
+            sys.exit(1)
+
+    if len(numeric_differences) > 0:
+        click.echo('Float replay out of tolerance {}: {}'.format(
+            FLOAT_BACKEND_RELATIVE_TOLERANCE,
+            ', '.join(numeric_differences)
+        ), err=True)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Serialization microbenchmarks.
+
+Measures (de)serialization of candles, orders, portfolio snapshots and strategy runs at realistic volumes
+(week of minute candles, orders and snapshots of a long simulation, ...). Single-item functions are measured
+item by item (as event emitter and socket server use them), bulk variants on the whole list. Bulk variants are
+checked to give the same (JSON) output as the single-item ones.
+
+    python tests/benchmark/serialization_benchmark.py
+"""
+import datetime
+import json
+import timeit
+import uuid
+from decimal import Decimal
+from typing import Callable, List, Tuple
+
+import click
+
+from coinrat.domain import Balance, DateTimeInterval
+from coinrat.domain.candle import Candle, serialize_candle, serialize_candles, deserialize_candle, \
+    deserialize_candles
+from coinrat.domain.order import Order, ORDER_TYPE_LIMIT, DIRECTION_BUY, DIRECTION_SELL, serialize_order, \
+    serialize_orders, deserialize_order, deserialize_orders
+from coinrat.domain.pair import Pair
+from coinrat.domain.portfolio import PortfolioSnapshot, serialize_portfolio_snapshot
+from coinrat.domain.strategy import StrategyRun, StrategyRunMarket, serialize_strategy_run, deserialize_strategy_run
+
+MARKET_NAME = 'bittrex'
+BTC_USD_PAIR = Pair('USD', 'BTC')
+START = datetime.datetime(2018, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+DEFAULT_NUMBER_OF_CANDLES = 7 * 24 * 60
+DEFAULT_NUMBER_OF_ORDERS = 1000
+DEFAULT_NUMBER_OF_STRATEGY_RUNS = 100
+DEFAULT_REPEAT = 5
+
+
+def create_candles(number_of_candles: int) -> List[Candle]:
+    candles = []
+    for minute in range(number_of_candles):
+        price = Decimal(8000 + minute % 500) + Decimal('0.12345678')
+        candles.append(Candle(
+            MARKET_NAME,
+            BTC_USD_PAIR,
+            START + datetime.timedelta(minutes=minute),
+            price,
+            price + Decimal('10.5'),
+            price - Decimal('10.25'),
+            price + Decimal('1')
+        ))
+
+    return candles
+
+
+def create_orders(number_of_orders: int) -> List[Order]:
+    strategy_run_id = uuid.uuid4()
+    return [
+        Order(
+            uuid.uuid4(),
+            strategy_run_id,
+            MARKET_NAME,
+            DIRECTION_BUY if number % 2 == 0 else DIRECTION_SELL,
+            START + datetime.timedelta(minutes=number),
+            BTC_USD_PAIR,
+            ORDER_TYPE_LIMIT,
+            Decimal('0.01'),
+            Decimal('8000.12345678'),
+            'id-{}'.format(number)
+        )
+        for number in range(number_of_orders)
+    ]
+
+
+def create_portfolio_snapshots(orders: List[Order]) -> List[PortfolioSnapshot]:
+    return [
+        PortfolioSnapshot(
+            order.created_at,
+            order.market_name,
+            order.order_id,
+            order.strategy_run_id,
+            [Balance(MARKET_NAME, 'USD', Decimal('1000.5')), Balance(MARKET_NAME, 'BTC', Decimal('0.125'))]
+        )
+        for order in orders
+    ]
+
+
+def create_strategy_runs(number_of_strategy_runs: int) -> List[StrategyRun]:
+    return [
+        StrategyRun(
+            uuid.uuid4(),
+            START + datetime.timedelta(hours=number, microseconds=123456),
+            BTC_USD_PAIR,
+            [StrategyRunMarket('coinrat_mock', MARKET_NAME, {'mocked_base_currency_balance': '1000'})],
+            'double_crossover',
+            {'long_average_interval': '3600', 'short_average_interval': '900'},
+            DateTimeInterval(START, START + datetime.timedelta(days=1)),
+            'influx_db',
+            'influx_db_orders-A'
+        )
+        for number in range(number_of_strategy_runs)
+    ]
+
+
+def measure(function: Callable[[], object], number_of_items: int, repeat: int) -> float:
+    """Microseconds per item (best of repeat)."""
+    return min(timeit.repeat(function, number=1, repeat=repeat)) / number_of_items * 1000000
+
+
+def assert_same_output(first: object, second: object) -> None:
+    assert json.dumps(first, sort_keys=True) == json.dumps(second, sort_keys=True), 'Bulk variant output differs.'
+
+
+def run_benchmarks(number_of_candles: int, number_of_orders: int, number_of_runs: int, repeat: int) -> List[Tuple]:
+    candles = create_candles(number_of_candles)
+    serialized_candles = serialize_candles(candles)
+    assert_same_output(serialized_candles, [serialize_candle(candle) for candle in candles])
+    assert_same_output(
+        serialize_candles(deserialize_candles(serialized_candles)),
+        [serialize_candle(deserialize_candle(row)) for row in serialized_candles]
+    )
+
+    orders = create_orders(number_of_orders)
+    serialized_orders = serialize_orders(orders)
+    assert_same_output(serialized_orders, [serialize_order(order) for order in orders])
+    assert_same_output(
+        serialize_orders(deserialize_orders(serialized_orders)),
+        [serialize_order(deserialize_order(row)) for row in serialized_orders]
+    )
+
+    snapshots = create_portfolio_snapshots(orders)
+    strategy_runs = create_strategy_runs(number_of_runs)
+    serialized_strategy_runs = [serialize_strategy_run(strategy_run) for strategy_run in strategy_runs]
+
+    return [
+        ('serialize_candle', len(candles), measure(
+            lambda: [serialize_candle(candle) for candle in candles], len(candles), repeat
+        )),
+        ('serialize_candles', len(candles), measure(lambda: serialize_candles(candles), len(candles), repeat)),
+        ('deserialize_candle', len(candles), measure(
+            lambda: [deserialize_candle(row) for row in serialized_candles], len(candles), repeat
+        )),
+        ('deserialize_candles', len(candles), measure(
+            lambda: deserialize_candles(serialized_candles), len(candles), repeat
+        )),
+        ('serialize_order', len(orders), measure(
+            lambda: [serialize_order(order) for order in orders], len(orders), repeat
+        )),
+        ('serialize_orders', len(orders), measure(lambda: serialize_orders(orders), len(orders), repeat)),
+        ('deserialize_order', len(orders), measure(
+            lambda: [deserialize_order(row) for row in serialized_orders], len(orders), repeat
+        )),
+        ('deserialize_orders', len(orders), measure(
+            lambda: deserialize_orders(serialized_orders), len(orders), repeat
+        )),
+        ('serialize_portfolio_snapshot', len(snapshots), measure(
+            lambda: [serialize_portfolio_snapshot(snapshot) for snapshot in snapshots], len(snapshots), repeat
+        )),
+        ('serialize_strategy_run', len(strategy_runs), measure(
+            lambda: [serialize_strategy_run(strategy_run) for strategy_run in strategy_runs], len(strategy_runs), repeat
+        )),
+        ('deserialize_strategy_run', len(strategy_runs), measure(
+            lambda: [deserialize_strategy_run(row) for row in serialized_strategy_runs], len(strategy_runs), repeat
+        )),
+    ]
+
+
+@click.command(help='Measures (de)serialization of domain objects.')
+@click.option('--candles', type=int, default=DEFAULT_NUMBER_OF_CANDLES, help='Number of candles.')
+@click.option('--orders', type=int, default=DEFAULT_NUMBER_OF_ORDERS, help='Number of orders and snapshots.')
+@click.option('--strategy_runs', type=int, default=DEFAULT_NUMBER_OF_STRATEGY_RUNS, help='Number of strategy runs.')
+@click.option('--repeat', type=int, default=DEFAULT_REPEAT, help='Every measurement is repeated, best is used.')
+def main(candles: int, orders: int, strategy_runs: int, repeat: int) -> None:
+    for name, number_of_items, microseconds in run_benchmarks(candles, orders, strategy_runs, repeat):
+        click.echo('{:<30} {:>8} items {:>10.2f} us/item'.format(name, number_of_items, microseconds))
+
+
+if __name__ == '__main__':
+    main()
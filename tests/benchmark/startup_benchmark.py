@@ -0,0 +1,137 @@
+"""
+Startup (import time) benchmark.
+
+Every target module is imported in a fresh interpreter with `python -X importtime` (Python 3.7+), cumulative
+import time of the target and the slowest modules are reported. Results are checked against the budget
+(JSON file): maximal import time in milliseconds and modules which must not be imported by the target at all
+(e.g. replay workers must not pay for MySQL, RabbitMQ or Socket.IO clients). Exceeded budget makes the script fail.
+
+    python tests/benchmark/startup_benchmark.py --budget tests/benchmark/startup_budget.json
+
+Numbers depend on the machine, the list of forbidden modules does not.
+"""
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple, Union
+
+import click
+
+DEFAULT_TARGETS = [
+    'coinrat.coinrat',
+    'coinrat.strategy_replayer',
+    'coinrat.strategy_configuration_search',
+    'coinrat.strategy_monte_carlo',
+]
+DEFAULT_REPEAT = 5
+DEFAULT_TOP = 10
+
+IMPORT_TIME_LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+
+class ImportTimeResult:
+    def __init__(self, target: str, total_ms: float, modules: Dict[str, Tuple[float, float]]) -> None:
+        self.target = target
+        self.total_ms = total_ms
+        self.modules = modules  # name -> (self ms, cumulative ms)
+
+    def get_slowest_modules(self, count: int) -> List[Tuple[str, float, float]]:
+        modules = [(name, self_ms, cumulative_ms) for name, (self_ms, cumulative_ms) in self.modules.items()]
+        return sorted(modules, key=lambda module: module[1], reverse=True)[:count]
+
+
+def measure_import_time(target: str) -> ImportTimeResult:
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(target)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    if process.returncode != 0:
+        raise click.ClickException('Import of "{}" failed:\n{}'.format(target, process.stderr))
+
+    return parse_import_time_output(target, process.stderr)
+
+
+def parse_import_time_output(target: str, output: str) -> ImportTimeResult:
+    """
+    Total is a sum of cumulative times of top-level imports done after the interpreter started (site module
+    and everything imported by it is excluded, it is paid by every Python process).
+    """
+    modules: Dict[str, Tuple[float, float]] = {}
+    total_ms = 0.0
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+
+        self_us, cumulative_us, indentation, name = match.groups()
+        if name == 'site':
+            modules = {}
+            total_ms = 0.0
+            continue
+
+        modules[name] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+        if len(indentation) == 1:
+            total_ms += int(cumulative_us) / 1000
+
+    return ImportTimeResult(target, total_ms, modules)
+
+
+def check_budget(result: ImportTimeResult, budget: Dict) -> List[str]:
+    if result.target not in budget:
+        click.echo('{}: not in budget'.format(result.target))
+        return []
+
+    violations = []
+    target_budget = budget[result.target]
+    if result.total_ms > target_budget['max_ms']:
+        violations.append('{}: {:.1f} ms is over budget {} ms'.format(
+            result.target,
+            result.total_ms,
+            target_budget['max_ms']
+        ))
+
+    for module_name in target_budget.get('forbidden_modules', []):
+        if module_name in result.modules:
+            violations.append('{}: imports forbidden module "{}"'.format(result.target, module_name))
+
+    return violations
+
+
+@click.command(help='Measures import time of coinrat entry points (CLI, replay workers, ...).')
+@click.option('--target', 'targets', multiple=True, help='Module to be imported, {} by default.'.format(
+    ', '.join(DEFAULT_TARGETS)
+))
+@click.option('--repeat', type=int, default=DEFAULT_REPEAT, help='Every import is repeated, the fastest is used.')
+@click.option('--top', type=int, default=DEFAULT_TOP, help='Number of the slowest modules shown (by self time).')
+@click.option('--budget', 'budget_file', default=None, help='Budget JSON file to check results with.')
+def main(targets: Tuple[str], repeat: int, top: int, budget_file: Union[str, None]) -> None:
+    if sys.version_info < (3, 7):
+        raise click.ClickException('-X importtime needs Python 3.7+.')
+
+    budget = {}
+    if budget_file is not None:
+        with open(budget_file) as budget_input:
+            budget = json.load(budget_input)
+
+    violations = []
+    for target in (targets or DEFAULT_TARGETS):
+        result = min([measure_import_time(target) for _ in range(repeat)], key=lambda result: result.total_ms)
+        click.echo('{}: {:.1f} ms, {} modules'.format(target, result.total_ms, len(result.modules)))
+        for name, self_ms, cumulative_ms in result.get_slowest_modules(top):
+            click.echo('    {:<60} {:>8.1f} ms (cumulative {:.1f} ms)'.format(name, self_ms, cumulative_ms))
+
+        if budget_file is not None:
+            violations += check_budget(result, budget)
+
+    for violation in violations:
+        click.echo('OVER BUDGET {}'.format(violation), err=True)
+
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
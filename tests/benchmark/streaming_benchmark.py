@@ -0,0 +1,87 @@
+"""
+Streaming synchronizer benchmark.
+
+Replays trades (four per minute candle) of many pairs by the local fake feed as fast as possible through
+StreamingSynchronizer into the memory storage and measures throughput of the whole pipeline (building of candles,
+writes of finished and unfinished candles). Stored candles are checked to be the same as the replayed ones.
+
+    python tests/benchmark/streaming_benchmark.py
+"""
+import datetime
+import time
+from decimal import Decimal
+from typing import List
+
+import click
+
+from coinrat.domain import DateTimeInterval
+from coinrat.domain.candle import Candle, serialize_candles
+from coinrat.domain.pair import Pair
+from coinrat.event.null_event_emitter import NullEventEmitter
+from coinrat.streaming_synchronizer import StreamingSynchronizer, DEFAULT_FLUSH_INTERVAL
+from coinrat_memory_storage.candle_storage import CandleMemoryStorage
+from coinrat_mock.trade_stream import ReplayTradeStream, create_trades_from_candles
+
+MARKET_NAME = 'bittrex'
+START = datetime.datetime(2018, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc)
+
+DEFAULT_NUMBER_OF_CANDLES = 24 * 60
+DEFAULT_NUMBER_OF_PAIRS = 10
+
+
+def create_candles(pair: Pair, number_of_candles: int) -> List[Candle]:
+    candles = []
+    for minute in range(number_of_candles):
+        price = Decimal(8000 + minute % 500) + Decimal('0.12345678')
+        close = price + Decimal('1') if minute % 2 == 0 else price - Decimal('1')
+        candles.append(Candle(
+            MARKET_NAME,
+            pair,
+            START + datetime.timedelta(minutes=minute),
+            price,
+            price + Decimal('10.5'),
+            price - Decimal('10.25'),
+            close
+        ))
+
+    return candles
+
+
+@click.command(help='Measures throughput of the streaming synchronizer fed by the local fake feed.')
+@click.option('--candles', type=int, default=DEFAULT_NUMBER_OF_CANDLES, help='Number of minute candles per pair.')
+@click.option('--pairs', type=int, default=DEFAULT_NUMBER_OF_PAIRS, help='Number of pairs.')
+@click.option('--flush_interval', type=float, default=DEFAULT_FLUSH_INTERVAL, help='Flush of unfinished candles.')
+def main(candles: int, pairs: int, flush_interval: float) -> None:
+    pair_objects = [Pair('USD', 'COIN{}'.format(index)) for index in range(pairs)]
+    candles_by_pair = {str(pair): create_candles(pair, candles) for pair in pair_objects}
+    all_candles = [candle for pair_candles in candles_by_pair.values() for candle in pair_candles]
+    trades = create_trades_from_candles(all_candles)
+
+    storage = CandleMemoryStorage()
+    synchronizer = StreamingSynchronizer(
+        ReplayTradeStream(trades),
+        storage,
+        NullEventEmitter(),
+        [MARKET_NAME],
+        flush_interval
+    )
+
+    started_at = time.perf_counter()
+    synchronizer.synchronize_pairs(MARKET_NAME, pair_objects)
+    duration = time.perf_counter() - started_at
+
+    for pair in pair_objects:
+        stored_candles = storage.find_by(MARKET_NAME, pair, DateTimeInterval(None, None))
+        assert serialize_candles(stored_candles) == serialize_candles(candles_by_pair[str(pair)]), \
+            'Stored candles of {} differ from the replayed ones.'.format(pair)
+
+    click.echo('{:>10} trades {:>10.2f} s {:>12.0f} trades/s {:>10.2f} us/trade'.format(
+        len(trades),
+        duration,
+        len(trades) / duration,
+        duration / len(trades) * 1000000
+    ))
+
+
+if __name__ == '__main__':
+    main()